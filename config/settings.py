@@ -11,6 +11,8 @@ load_dotenv()
 # 프로젝트 경로
 BASE_DIR = Path(__file__).parent.parent
 RESULTS_DIR = BASE_DIR / "notes" / "daily_briefing"
+DATA_DIR = BASE_DIR / "data"  # 로컬 수집 데이터 저장소 (git 제외)
+REPORTS_DIR = BASE_DIR / "results"  # 주간/월간 리포트
 
 # API 키
 DART_API_KEY = os.getenv("DART_API_KEY", "")
@@ -26,6 +28,101 @@ AI_TEMPERATURE = 0.3  # 낮을수록 일관된 분석, 높을수록 창의적
 # 관심 종목 리스트
 WATCHLIST_STOCKS = os.getenv("WATCHLIST_STOCKS", "005930,000660").split(",")
 
+# 브리핑 프로필 (python main.py --profiles): 사용자/포트폴리오별 브리핑
+# 시장 공통 데이터는 브리핑 유형별 1회, 종목별 데이터는 전체 프로필 관심 종목 합집합으로 1회 수집 후 프로필별 병렬 렌더링
+# BRIEFING_PROFILES_FILE(JSON)이 있으면 그 정의를 사용 (형식: config/profiles.example.json, 읽기는 scripts/profiles.py)
+#   프로필 이름(키): 영문/숫자/_/- 만 허용 (저장 폴더 이름으로 사용)
+#   watchlist: 관심 종목 (없으면 WATCHLIST_STOCKS) / keywords: 뉴스 필터 키워드 (없으면 전체 뉴스)
+#   sections: 포함할 섹션 dart/krx/ecos/news/intraday/correlation (없으면 브리핑 plan 전체)
+#   output_dir: 저장 폴더 (프로젝트 기준 상대 경로 가능, 없으면 RESULTS_DIR/profiles/<이름>)
+BRIEFING_PROFILES_FILE = BASE_DIR / os.getenv("BRIEFING_PROFILES_FILE", "config/profiles.json")  # 상대 경로는 프로젝트 기준
+PROFILE_RENDER_WORKERS = int(os.getenv("PROFILE_RENDER_WORKERS", "4"))  # 프로필 동시 렌더링 수 (AI 분석 포함)
+
+# 공용 HTTP 전송 계층 (collectors/transport.py)
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))        # 요청 타임아웃(초)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))           # 일시 오류 재시도 횟수
+HTTP_BACKOFF_SEC = float(os.getenv("HTTP_BACKOFF_SEC", "0.5"))  # 재시도 대기 기본값(초, 지수 증가 + 지터)
+HTTP_POOL_SIZE = 10                                          # 호스트별 유지 연결 수
+HTTP_USER_AGENT = "Mozilla/5.0 (compatible; investment-briefing-bot/1.0)"
+
+# 소스별 호출 제한 (collectors/rate_limit.py): 소스 → (초당 호출 수, 버스트, 일일 한도)
+# DART Open API 일일 한도 20,000회 / pykrx는 KRX 웹 조회이므로 보수적으로 제한
+RATE_LIMITS = {
+    "dart": (5, 10, int(os.getenv("DART_DAILY_QUOTA", "20000"))),
+    "krx": (2, 5, None),
+    "ecos": (5, 10, None),
+    "fred": (2, 5, None),
+    "news": (2, 5, None),
+}
+
+# 소스별 서킷 브레이커 (collectors/health.py): 연속 실패 시 냉각 시간 동안 호출 생략
+HEALTH_FAILURE_THRESHOLD = int(os.getenv("HEALTH_FAILURE_THRESHOLD", "3"))  # open 전환 연속 실패 횟수
+HEALTH_COOLDOWN_SEC = int(os.getenv("HEALTH_COOLDOWN_SEC", "1800"))         # 시험 호출까지 대기(초)
+
+# KRX 평일 휴장일 (미래 구간 달력용. 과거 구간은 pykrx 실제 거래일로 자동 보정)
+# 임시공휴일 등 추가 휴장일은 KRX_EXTRA_HOLIDAYS=YYYY-MM-DD,... 로 지정
+# 연도별로 빠짐없이 관리 (목록에 있는 연도만 규칙 달력 범위에 포함, 없는 연도는 경고 후 제외)
+# 미래 연도는 대체공휴일 포함 예상치 → KRX 공식 휴장일 발표 후 KRX_EXTRA_HOLIDAYS로 보정
+KRX_HOLIDAYS = [
+    # 2024
+    "2024-01-01", "2024-02-09", "2024-02-12", "2024-03-01", "2024-04-10",
+    "2024-05-01", "2024-05-06", "2024-05-15", "2024-06-06", "2024-08-15",
+    "2024-09-16", "2024-09-17", "2024-09-18", "2024-10-01", "2024-10-03",
+    "2024-10-09", "2024-12-25", "2024-12-31",
+    # 2025
+    "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+    "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+    "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+    "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+    # 2026
+    "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+    "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+    "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+    "2026-12-31",
+    # 2027
+    "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05",
+    "2027-05-13", "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16",
+    "2027-10-04", "2027-10-11", "2027-12-27", "2027-12-31",
+] + [d for d in os.getenv("KRX_EXTRA_HOLIDAYS", "").split(",") if d]
+
+# 개장/폐장 시각이 다른 거래일 (연초 개장일, 수능일: 1시간 늦게 개장)
+KRX_SPECIAL_HOURS = {
+    "2025-01-02": ("10:00", "15:30"),
+    "2025-11-13": ("10:00", "16:30"),
+    "2026-01-02": ("10:00", "15:30"),
+    "2026-11-19": ("10:00", "16:30"),
+}
+
+# 장중 스냅샷 수집 설정 (미드데이 브리핑용)
+INTRADAY_INTERVAL_SEC = int(os.getenv("INTRADAY_INTERVAL_SEC", "60"))  # 폴링 간격(초)
+INTRADAY_BUFFER_SIZE = int(os.getenv("INTRADAY_BUFFER_SIZE", "120"))   # 메모리 보관 스냅샷 수
+INTRADAY_END_TIME = os.getenv("INTRADAY_END_TIME", "12:30")            # 수집 종료 → 미드데이 브리핑 생성
+
+# 조건부 알림 설정 (python scripts/main.py --watch)
+ALERT_MOVE_LEVELS = [float(x) for x in os.getenv("ALERT_MOVE_LEVELS", "3,5").split(",")]  # 등락률 ±% 단계
+ALERT_SPREAD_PCT = float(os.getenv("ALERT_SPREAD_PCT", "5"))          # 고저 스프레드 %
+ALERT_SINKS = os.getenv("ALERT_SINKS", "stdout,file").split(",")      # stdout / file / webhook
+ALERT_WEBHOOK_URL = os.getenv("ALERT_WEBHOOK_URL", "http://localhost:8765/alerts")
+ALERT_SINK_QUEUE_SIZE = int(os.getenv("ALERT_SINK_QUEUE_SIZE", "100"))  # sink별 전달 대기 알림 수 (초과 시 버림)
+ALERT_POLL_INTERVALS = {  # 소스별 (기본, 최소, 최대) 폴링 간격(초)
+    "krx": (30, 10, 120),
+    "dart": (60, 20, 300),
+    "news": (120, 30, 600),
+}
+
+# 브리핑 출력 sink (scripts/briefing_sinks.py): 저장한 브리핑을 sink별 스레드 / 큐로 비동기 발행
+BRIEFING_SINKS = os.getenv("BRIEFING_SINKS", "json,html").split(",")  # file / json / html / webhook (빈 값이면 발행 안 함)
+BRIEFING_SINK_DIR = BASE_DIR / os.getenv("BRIEFING_SINK_DIR", "data/published")  # file/json/html 출력 폴더
+BRIEFING_WEBHOOK_URL = os.getenv("BRIEFING_WEBHOOK_URL", "http://localhost:8765/briefings")
+BRIEFING_SINK_SETTINGS = {
+    "queue_size": 16,           # sink별 대기 큐 크기 (가득 차면 해당 sink 전달만 건너뜀)
+    "retries": 3,               # 전달 실패 시 재시도 횟수
+    "backoff": 2.0,             # 재시도 대기 기본값(초), n번째 재시도는 backoff * 2^(n-1)
+    "timeout": 5,               # webhook 요청 타임아웃(초)
+    "webhook_max_chars": 4000,  # webhook 본문 최대 글자 수 (메신저 메시지 제한)
+    "flush_timeout": 30,        # 실행 종료 전 대기 중인 전달을 기다리는 최대 시간(초)
+}
+
 # 뉴스 RSS 피드 URL
 NEWS_RSS_FEEDS = {
     "한국경제": "https://www.hankyung.com/feed/all-news",
@@ -33,6 +130,10 @@ NEWS_RSS_FEEDS = {
     "이데일리": "https://rss.edaily.co.kr/edaily_economy.xml",
 }
 
+# ECOS 조회 (collectors/ecos_store.py): 받은 구간은 data/ecos.sqlite3에 누적, 부족한 구간만 페이지 조회
+ECOS_PAGE_SIZE = int(os.getenv("ECOS_PAGE_SIZE", "1000"))       # 요청 1회 행 수
+ECOS_FETCH_WORKERS = int(os.getenv("ECOS_FETCH_WORKERS", "4"))  # 페이지 동시 조회 수 (호출 제한은 RATE_LIMITS["ecos"])
+
 # ECOS 통계 코드 (자주 사용하는 지표)
 ECOS_STAT_CODES = {
     "기준금리": "722Y001",      # 한국은행 기준금리
@@ -41,6 +142,17 @@ ECOS_STAT_CODES = {
 }
 
 # 브리핑 유형별 설정
+# plan: 브리핑 템플릿에 필요한 수집만 선언 (키가 없는 수집기는 실행하지 않음)
+#   dart.count_all: 관심 종목 외 전체 공시 목록 조회 (전체 공시 건수 표시용)
+#   krx.breadth / krx.market_cap: 전종목 스냅샷(시장 내부) / 시가총액 bulk 조회
+#   krx.indicators: 관심 종목 기술적 지표 (조회한 일봉으로 data/indicators.npz 상태 증분 갱신)
+#   krx.universe: 전종목 스냅샷(장 마감 시세)을 전종목 행렬(data/universe/)에 기록 (추가 조회 없음, breadth 필요)
+#   krx.screener: 같은 스냅샷으로 전종목 스크리너 실행 (SCREENER_SETTINGS, 추가 조회 없음)
+#   krx.sectors: 업종/테마 지수 계열별 bulk 조회 → 히트맵 (SECTOR_SETTINGS, 저장소에 없는 거래일만)
+#   ecos: 조회할 지표 키 (EcosCollector.INDICATORS / US_SERIES)
+#   intraday: 장중 스냅샷 요약 (미드데이)
+#   correlation: 관심 종목 환율·금리 민감도 변화 (CORRELATION_SETTINGS, 장 마감 후)
+# python scripts/main.py --type X --plan 으로 예상 호출 확인
 BRIEFING_SETTINGS = {
     "morning": {
         "max_disclosures": 20,
@@ -50,6 +162,15 @@ BRIEFING_SETTINGS = {
         "title": "모닝 브리핑",
         "file_suffix": "모닝브리핑",
         "description": "장 시작 전 투자 준비",
+        "plan": {
+            "dart": {"count_all": False},
+            "krx": {"breadth": True, "market_cap": True, "indicators": True,
+                    "universe": True, "screener": True, "sectors": True},
+            # 월별/저빈도 지표(기준금리, 미국 기준금리)는 모닝에서만 조회
+            "ecos": ["base_rate", "bond_3y", "fed_funds", "us10y",
+                     "usd_krw", "jpy_krw", "eur_krw", "gbp_krw"],
+            "news": {},
+        },
     },
     "midday": {
         "max_disclosures": 20,
@@ -59,6 +180,13 @@ BRIEFING_SETTINGS = {
         "title": "미드데이 브리핑",
         "file_suffix": "미드데이브리핑",
         "description": "장중 시장 점검",
+        "plan": {
+            "dart": {"count_all": False},
+            "krx": {"breadth": True, "market_cap": False, "indicators": True},
+            "ecos": ["bond_3y", "usd_krw"],
+            "news": {},
+            "intraday": {},
+        },
     },
     "aftermarket": {
         "max_disclosures": 20,
@@ -68,5 +196,90 @@ BRIEFING_SETTINGS = {
         "title": "애프터 마켓 브리핑",
         "file_suffix": "애프터마켓브리핑",
         "description": "금일 시장 마감 요약",
+        "plan": {
+            "dart": {"count_all": True},
+            "krx": {"breadth": True, "market_cap": True, "indicators": True,
+                    "universe": True, "screener": True, "sectors": True},
+            "ecos": ["bond_3y", "usd_krw", "jpy_krw", "eur_krw", "gbp_krw"],
+            "news": {},
+            "correlation": {},
+        },
+    },
+}
+
+# 브리핑 데이터 수집 작업별 제한 시간(초, 수집 시작 기준). 없는 작업은 "default"
+# krx / sectors / correlation은 KRX 호출 제한(RATE_LIMITS["krx"])을 공유하는 직렬 호출이 많아
+# 저장소가 빈 첫 실행(지표 이력 재적재, 업종 지수 6거래일 x 계열, 업종 분류)도 끝날 수 있게 길게 둠
+COLLECT_TIMEOUTS = {
+    "default": 30,
+    "krx": 90,
+    "sectors": 90,
+    "correlation": 90,
+}
+
+# 주간/월간 리포트 설정 (python scripts/main.py --report weekly|monthly)
+# 외부 API 재조회 없이 브리핑 아카이브(data/briefings.sqlite3)만 집계
+REPORT_SETTINGS = {
+    "weekly": {
+        "title": "주간 리뷰",
+        "file_suffix": "주간리뷰",
+        "top_disclosures": 10,
+    },
+    "monthly": {
+        "title": "월간 리뷰",
+        "file_suffix": "월간리뷰",
+        "top_disclosures": 15,
+    },
+}
+
+# 교차 자산 롤링 상관 / 베타 (브리핑 plan의 "correlation")
+# 관심 종목 × factors 일간 변화율로 단기 / 장기 창 상관을 data/correlation.npz에 증분 갱신
+CORRELATION_SETTINGS = {
+    "short_window": 20,             # 단기 창 (거래일)
+    "long_window": 60,              # 장기 창 (거래일)
+    # kospi: 시장 베타, 나머지: EcosCollector 지표 키 (금리는 변화폭 %p 기준)
+    "factors": ["kospi", "usd_krw", "jpy_krw", "eur_krw", "bond_3y", "us10y"],
+    "corr_shift": 0.4,              # 단기 vs 장기 상관 차이가 이 이상이면 민감도 변화로 표시
+    "min_corr": 0.3,                # 두 창 모두 상관이 이보다 약하면 표시 생략
+}
+
+# 전종목 스크리너 (브리핑 plan의 krx.screener, python scripts/main.py --screen)
+# 규칙 문법은 scripts/analytics/screener.py 참고. 이력 함수는 전종목 행렬(data/universe/) 사용
+SCREENER_SETTINGS = {
+    "top": 5,                       # 규칙별 표시 종목 수 (거래대금 순)
+    "rules": {
+        "거래량 급증": "volume_ratio(20) >= 3 and value >= 5e9",
+        "52주 신고가": "close > max_close(250) and value >= 1e9",
+        "52주 신저가": "close < min_close(250) and value >= 1e9",
+        "갭 상승": "gap_pct >= 3 and value >= 5e9",
+        "갭 하락": "gap_pct <= -3 and value >= 5e9",
+        "시총 1~5조 강세": "market_cap between 1e12 5e12 and change_pct >= 5",
+    },
+}
+
+# 업종 / 테마 지수 히트맵 (브리핑 plan의 krx.sectors, data/sectors.sqlite3)
+SECTOR_SETTINGS = {
+    "families": ["KOSPI", "KOSDAQ", "테마"],  # 지수 계열 (계열별 bulk 1회 = 계열 내 전체 지수)
+    "theme_families": ["테마"],                # 모든 지수를 테마로 보는 계열
+    "weekly_sessions": 5,           # 주간 등락률 기준 (N거래일 전 종가 대비)
+    "top": 5,                       # 테마 / 주간 업종 상위·하위 표시 개수
+    "member_refresh_days": 30,      # 종목 업종 분류 재조회 주기 (일)
+}
+
+# 모의투자 규칙 백테스트 (python scripts/main.py --backtest)
+BACKTEST_SETTINGS = {
+    "initial_cash": 10_000_000,     # 초기 자금 (종목 수로 균등 배분)
+    "years": 3,                     # 기본 조회 기간(년)
+    "commission_rate": 0.00015,     # 매수/매도 수수료
+    "sell_tax_rate": 0.0020,        # 매도 증권거래세
+    "slippage_rate": 0.0005,        # 슬리피지
+    "workers": int(os.getenv("BACKTEST_WORKERS", "0")),  # 스윕 프로세스 수 (0이면 CPU 수)
+    # --sweep 파라미터 조합 (StrategyParams 필드 → 후보 값)
+    "sweep": {
+        "entry_window": [5, 20, 60],
+        "exit_window": [0, 20],
+        "splits": [1, 3],
+        "stop_loss_pct": [5, 10],
+        "take_profit_pct": [10, 20, 0],
     },
 }
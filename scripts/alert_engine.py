@@ -0,0 +1,464 @@
+"""
+조건부 알림 엔진
+
+기존 수집기(KRX/DART/뉴스)를 소스별 적응형 간격으로 계속 폴링하면서,
+새로 들어온 관측값마다 알림 규칙을 바로 평가해 조건 충족 시 알림을 보냅니다.
+- KRX: 관심 종목 등락률 단계(기본 ±3%, ±5%) 돌파, 고저 스프레드 5% 이상
+- DART: 관심 종목 신규 공시
+- 뉴스: 관심 종목명이 포함된 신규 기사
+
+알림은 sink(stdout / JSONL 파일 / 로컬 webhook)로 전달됩니다.
+sink마다 전용 스레드와 크기 제한 큐를 두어 느린 webhook이 폴링 루프를 막지 않습니다.
+"""
+import sys
+import heapq
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from datetime import date, datetime
+from typing import Callable, Iterable, Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    DATA_DIR, WATCHLIST_STOCKS,
+    ALERT_MOVE_LEVELS, ALERT_SPREAD_PCT, ALERT_SINKS, ALERT_WEBHOOK_URL, ALERT_SINK_QUEUE_SIZE,
+    ALERT_POLL_INTERVALS,
+)
+from collectors import DartCollector, KrxCollector, NewsCollector, Article, Disclosure
+from collectors.trading_calendar import now_kst, today_kst
+from collectors.transport import get_transport
+
+
+@dataclass(slots=True)
+class Alert:
+    """알림 1건"""
+    source: str
+    rule: str
+    key: str
+    message: str
+    timestamp: str = field(default_factory=lambda: now_kst().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+# =========================
+# 관측값 (소스 → 규칙)
+# =========================
+
+@dataclass(slots=True)
+class QuoteObservation:
+    """관심 종목 현재가 관측값"""
+    ticker: str
+    name: str
+    close: float
+    change_pct: float
+    spread_pct: float
+
+
+# =========================
+# 규칙
+# =========================
+
+class DailyOnce:
+    """하루 1회 알림용 발생 기록. KST 날짜가 바뀌면 비움"""
+
+    def __init__(self, today: Callable[[], date] = today_kst):
+        self.today = today
+        self.day: Optional[date] = None
+        self.keys: set = set()
+
+    def first(self, key) -> bool:
+        """오늘 처음 보는 key면 기록하고 True"""
+        day = self.today()
+        if day != self.day:
+            self.day = day
+            self.keys.clear()
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+
+class PriceMoveRule:
+    """등락률이 단계(±levels%)를 새로 돌파하면 알림. 종목·방향·단계별 하루 1회"""
+
+    name = "price_move"
+
+    def __init__(self, levels: Iterable[float] = ALERT_MOVE_LEVELS):
+        self.levels = sorted(levels)
+        self._fired = DailyOnce()
+
+    def evaluate(self, obs) -> list[Alert]:
+        if not isinstance(obs, QuoteObservation):
+            return []
+
+        direction = 1 if obs.change_pct >= 0 else -1
+        crossed = [lvl for lvl in self.levels if abs(obs.change_pct) >= lvl]
+        if not crossed:
+            return []
+
+        level = crossed[-1]
+        if not self._fired.first((obs.ticker, direction, level)):
+            return []
+        word = "급등" if direction > 0 else "급락"
+        return [Alert(
+            source="krx",
+            rule=self.name,
+            key=f"{obs.ticker}:{direction * level:+g}",
+            message=f"{obs.name}({obs.ticker}) {word} {obs.change_pct:+.2f}% "
+                    f"(±{level:g}% 돌파, 현재가 {obs.close:,.0f}원)",
+        )]
+
+
+class SpreadRule:
+    """고저 스프레드가 기준 이상이면 알림. 종목별 하루 1회"""
+
+    name = "wide_spread"
+
+    def __init__(self, threshold_pct: float = ALERT_SPREAD_PCT):
+        self.threshold_pct = threshold_pct
+        self._fired = DailyOnce()
+
+    def evaluate(self, obs) -> list[Alert]:
+        if not isinstance(obs, QuoteObservation) or obs.spread_pct < self.threshold_pct:
+            return []
+        if not self._fired.first(obs.ticker):
+            return []
+        return [Alert(
+            source="krx",
+            rule=self.name,
+            key=obs.ticker,
+            message=f"{obs.name}({obs.ticker}) 고저 스프레드 {obs.spread_pct:.2f}% "
+                    f"(기준 {self.threshold_pct:g}%)",
+        )]
+
+
+class DisclosureRule:
+    """관심 종목 신규 공시 알림"""
+
+    name = "new_disclosure"
+
+    def evaluate(self, obs) -> list[Alert]:
+        if not isinstance(obs, Disclosure):
+            return []
+        return [Alert(
+            source="dart",
+            rule=self.name,
+            key=obs.rcept_no,
+            message=f"[공시] {obs.corp_name}: {obs.report_nm.strip()}",
+        )]
+
+
+class NewsMentionRule:
+    """관심 종목명이 제목에 포함된 신규 기사 알림"""
+
+    name = "news_mention"
+
+    def __init__(self, names: dict[str, str]):
+        """
+        Args:
+            names: 종목 코드 → 종목명
+        """
+        self.names = names
+
+    def evaluate(self, obs) -> list[Alert]:
+        if not isinstance(obs, Article):
+            return []
+        return [
+            Alert(
+                source="news",
+                rule=self.name,
+                key=f"{ticker}:{obs.link}",
+                message=f"[뉴스] {name}: {obs.title} - {obs.source}",
+            )
+            for ticker, name in self.names.items()
+            if name and name in obs.title
+        ]
+
+
+# =========================
+# 알림 출력 (sink)
+# =========================
+
+class StdoutSink:
+    """콘솔 출력"""
+
+    def emit(self, alert: Alert) -> None:
+        print(f"  [알림 {alert.timestamp}] {alert.message}")
+
+
+class FileSink:
+    """JSON Lines 파일에 누적 기록 (path 미지정 시 알림 날짜별 data/alerts/YYYY-MM-DD.jsonl)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+
+    def path_for(self, alert: Alert) -> Path:
+        return self.path or DATA_DIR / "alerts" / f"{alert.timestamp[:10]}.jsonl"
+
+    def emit(self, alert: Alert) -> None:
+        path = self.path_for(alert)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(alert), ensure_ascii=False) + "\n")
+
+
+class WebhookSink:
+    """로컬 webhook으로 POST (메신저 연동 대용)"""
+
+    def __init__(self, url: str = ALERT_WEBHOOK_URL, timeout: float = 3):
+        self.url = url
+        self.timeout = timeout
+        self.http = get_transport()
+
+    def emit(self, alert: Alert) -> None:
+        self.http.post(self.url, json=asdict(alert), timeout=self.timeout)
+
+
+SINK_TYPES = {
+    "stdout": StdoutSink,
+    "file": FileSink,
+    "webhook": WebhookSink,
+}
+
+
+def build_sinks(names: Iterable[str] = ALERT_SINKS) -> list:
+    """설정된 이름 목록으로 sink 생성"""
+    sinks = []
+    for name in names:
+        name = name.strip()
+        if name not in SINK_TYPES:
+            print(f"  [경고] 알 수 없는 알림 sink: {name}")
+            continue
+        sinks.append(SINK_TYPES[name]())
+    return sinks
+
+
+class SinkWorker:
+    """sink 1개 전용 스레드 + 크기 제한 큐. 폴링 루프는 큐에 넣고 바로 돌아감"""
+
+    def __init__(self, sink, queue_size: int = ALERT_SINK_QUEUE_SIZE):
+        self.sink = sink
+        self.name = type(sink).__name__
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name=f"alert-sink-{self.name}", daemon=True)
+        self.thread.start()
+
+    def offer(self, alert: Alert) -> bool:
+        """대기 없이 큐에 추가 (가득 차면 버리고 False)"""
+        try:
+            self.queue.put_nowait(alert)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"  [경고] 알림 sink {self.name} 대기열이 가득 차 알림을 버립니다: {alert.key}")
+            return False
+
+    def _run(self) -> None:
+        while True:
+            alert = self.queue.get()
+            try:
+                self.sink.emit(alert)
+            except Exception as e:
+                print(f"  [경고] 알림 전달 실패 ({self.name}): {e}")
+            finally:
+                self.queue.task_done()
+
+    def join(self, timeout: float) -> bool:
+        """큐가 빌 때까지 최대 timeout초 대기. 다 보냈으면 True"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+
+# =========================
+# 소스 (적응형 폴링)
+# =========================
+
+class PollingSource:
+    """
+    적응형 간격 폴링 소스
+
+    새 관측값이 있으면 간격을 절반으로 줄이고(최소 min_interval),
+    없으면 1.5배로 늘립니다(최대 max_interval).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[], list],
+        interval: float,
+        min_interval: float,
+        max_interval: float
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def poll(self) -> list:
+        """관측값 조회 후 다음 간격 조정"""
+        try:
+            observations = self.fetch()
+        except Exception as e:
+            print(f"  [경고] {self.name} 폴링 실패: {e}")
+            observations = []
+
+        if observations:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+        return observations
+
+
+class AlertEngine:
+    """소스 폴링 → 규칙 평가 → sink 전달 루프"""
+
+    def __init__(
+        self,
+        krx: Optional[KrxCollector] = None,
+        dart: Optional[DartCollector] = None,
+        news: Optional[NewsCollector] = None,
+        tickers: Optional[list[str]] = None,
+        sinks: Optional[list] = None
+    ):
+        self.krx = krx or KrxCollector()
+        self.dart = dart or DartCollector()
+        self.news = news or NewsCollector()
+        self.tickers = list(tickers if tickers is not None else WATCHLIST_STOCKS)
+        self.sinks = sinks if sinks is not None else build_sinks()
+        self.workers = [SinkWorker(sink) for sink in self.sinks]
+
+        names = {ticker: self.krx.get_ticker_name(ticker) for ticker in self.tickers}
+        self.news.ticker_names = names
+        self.rules = [PriceMoveRule(), SpreadRule(), DisclosureRule(), NewsMentionRule(names)]
+
+        self._quotes: dict[str, tuple[float, float, float]] = {}
+        self._seen_disclosures: set[str] = set()
+        self._seen_articles: set[str] = set()
+        self._primed: set[str] = set()
+
+        self.sources = []
+        if self.krx.is_available():
+            self.sources.append(PollingSource("krx", self._fetch_quotes, *ALERT_POLL_INTERVALS["krx"]))
+        if self.dart.is_available():
+            self.sources.append(PollingSource("dart", self._fetch_disclosures, *ALERT_POLL_INTERVALS["dart"]))
+        if self.news.is_available():
+            self.sources.append(PollingSource("news", self._fetch_articles, *ALERT_POLL_INTERVALS["news"]))
+
+    # ----- 소스별 조회 (이전 대비 새 관측값만 반환) -----
+
+    def _fetch_quotes(self) -> list[QuoteObservation]:
+        snapshot = self.krx.get_market_snapshot(with_cap=False)
+        if snapshot.empty:
+            return []
+
+        rows = snapshot.reindex(self.tickers).dropna(subset=["close"])
+        low = rows["low"].where(rows["low"] > 0)
+        rows["spread_pct"] = ((rows["high"] - low) / low * 100).fillna(0)
+
+        observations = []
+        for ticker, row in rows.iterrows():
+            state = (float(row["close"]), float(row["change_pct"]), float(row["spread_pct"]))
+            if self._quotes.get(ticker) == state:
+                continue
+            self._quotes[ticker] = state
+            observations.append(QuoteObservation(
+                ticker=ticker,
+                name=self.krx.get_ticker_name(ticker),
+                close=float(row["close"]),
+                change_pct=float(row["change_pct"]),
+                spread_pct=float(row["spread_pct"]),
+            ))
+        return observations
+
+    def _fetch_disclosures(self) -> list[Disclosure]:
+        disclosures = self.dart.get_watchlist_disclosures(days_back=0)
+        new = [d for d in disclosures if d.rcept_no not in self._seen_disclosures]
+        self._seen_disclosures.update(d.rcept_no for d in new)
+        return self._skip_first("dart", new)
+
+    def _fetch_articles(self) -> list[Article]:
+        articles = self.news.get_investment_news(max_hours=6)
+        new = [a for a in articles if a.link not in self._seen_articles]
+        self._seen_articles.update(a.link for a in new)
+        return self._skip_first("news", new)
+
+    def _skip_first(self, name: str, observations: list) -> list:
+        """시작 시점에 이미 있던 공시/기사는 알림 대상에서 제외"""
+        if name not in self._primed:
+            self._primed.add(name)
+            return []
+        return observations
+
+    # ----- 평가 / 전달 -----
+
+    def process(self, observations: list) -> list[Alert]:
+        """관측값마다 모든 규칙을 평가하고 발생한 알림을 sink로 전달"""
+        alerts = []
+        for obs in observations:
+            for rule in self.rules:
+                alerts.extend(rule.evaluate(obs))
+
+        for alert in alerts:
+            for worker in self.workers:
+                worker.offer(alert)
+        return alerts
+
+    def flush(self, timeout: float = 10) -> None:
+        """sink별 대기 중인 알림 전달을 최대 timeout초 기다림"""
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            if not worker.join(max(0.0, deadline - time.monotonic())):
+                print(f"  [경고] 알림 sink {worker.name} 미전달 {worker.queue.unfinished_tasks}건")
+
+    def run(self, until: Optional[datetime] = None) -> None:
+        """
+        소스별 다음 폴링 시각 순으로 계속 실행 (Ctrl+C 또는 until 시각까지)
+
+        Args:
+            until: 종료 시각. None이면 중단할 때까지
+        """
+        if not self.sources:
+            print("사용 가능한 알림 소스가 없습니다. (pykrx / DART API 키 / feedparser 확인)")
+            return
+
+        print(f"알림 감시 시작: {', '.join(s.name for s in self.sources)} "
+              f"| sink: {', '.join(type(s).__name__ for s in self.sinks)}")
+
+        now = time.monotonic()
+        due = [(now, i) for i in range(len(self.sources))]
+        heapq.heapify(due)
+
+        try:
+            while due:
+                if until is not None and now_kst() >= until:
+                    break
+                at, i = heapq.heappop(due)
+                time.sleep(max(0.0, at - time.monotonic()))
+
+                source = self.sources[i]
+                self.process(source.poll())
+                heapq.heappush(due, (time.monotonic() + source.interval, i))
+        except KeyboardInterrupt:
+            print("알림 감시 종료")
+        finally:
+            self.flush()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    engine = AlertEngine(sinks=[StdoutSink()])
+    for source in engine.sources:
+        observations = source.poll()
+        print(f"{source.name}: 관측 {len(observations)}건 → 다음 간격 {source.interval:.0f}초")
+        engine.process(observations)
+    engine.flush()
@@ -0,0 +1,11 @@
+from .market_breadth import compute_market_breadth, format_market_breadth
+from .disclosure_classifier import DisclosureClassifier, get_classifier, format_disclosure_rollup
+from .news_clustering import StoryCluster, cluster_articles
+from .period_stats import compute_period_stats, compute_level_changes
+
+__all__ = [
+    "compute_market_breadth", "format_market_breadth",
+    "DisclosureClassifier", "get_classifier", "format_disclosure_rollup",
+    "StoryCluster", "cluster_articles",
+    "compute_period_stats", "compute_level_changes",
+]
@@ -0,0 +1,307 @@
+"""
+모의투자 규칙 백테스트 엔진
+
+일봉 OHLCV 가격 행렬(날짜 × 종목)로 분할 매수 / 손절 / 익절 규칙을 검증합니다.
+- 신호(이동평균 돌파/이탈)는 전 종목 2차원 배열 연산으로 미리 계산
+- 체결/포지션/수수료·세금/손익은 날짜 루프 1회, 각 날짜는 종목 벡터 연산 (종목별 루프 없음)
+- 신호는 당일 종가로 판단해 다음 거래일 시가에 체결 (미래 데이터 참조 방지)
+- 손절/익절은 장중 고가/저가로 판정, 갭 발생 시 시가 체결
+
+종목마다 초기 자금을 균등 배분한 독립 계좌(슬리브)로 운용하고 합산 평가금액으로 성과를 냅니다.
+"""
+from dataclasses import asdict, dataclass, field, replace
+from typing import Optional
+
+import numpy as np
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass(slots=True)
+class PriceMatrix:
+    """날짜 × 종목 가격 행렬 (거래가 없는 날은 NaN)"""
+    dates: np.ndarray          # datetime64[D] (T,)
+    tickers: list[str]         # (N,)
+    open: np.ndarray           # float64 (T, N)
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.close.shape
+
+    @classmethod
+    def from_bars(cls, bars: dict[str, np.ndarray]) -> "PriceMatrix":
+        """
+        종목별 OHLCV 배열(records.OHLCV_DTYPE)을 날짜 합집합 기준 행렬로 정렬
+
+        Args:
+            bars: 종목 코드 → OHLCV structured array
+        """
+        bars = {ticker: b for ticker, b in bars.items() if len(b)}
+        tickers = list(bars)
+        dates = np.unique(np.concatenate([b["date"] for b in bars.values()])) if bars else np.empty(0, "datetime64[D]")
+
+        matrices = {name: np.full((len(dates), len(tickers)), np.nan) for name in ("open", "high", "low", "close")}
+        for col, b in enumerate(bars.values()):
+            rows = np.searchsorted(dates, b["date"])
+            for name, matrix in matrices.items():
+                matrix[rows, col] = b[name]
+        return cls(dates=dates, tickers=tickers, **matrices)
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyParams:
+    """
+    매매 규칙
+
+    entry_window: 종가가 N일 이동평균을 상향 돌파하면 다음 날 시가에 1차 매수
+    exit_window: 종가가 N일 이동평균을 하향 이탈하면 다음 날 시가에 전량 매도 (0이면 미사용)
+    splits: 분할 매수 횟수 (종목 배분 자금을 splits등분)
+    split_step_pct: 직전 매수가 대비 이만큼 하락하면 추가 매수
+    stop_loss_pct / take_profit_pct: 평균 단가 대비 손절 / 익절 (0이면 미사용)
+    """
+    entry_window: int = 20
+    exit_window: int = 0
+    splits: int = 1
+    split_step_pct: float = 5.0
+    stop_loss_pct: float = 10.0
+    take_profit_pct: float = 20.0
+
+
+@dataclass(frozen=True, slots=True)
+class CostModel:
+    """거래 비용 (비율)"""
+    commission_rate: float = 0.00015   # 매수/매도 수수료
+    sell_tax_rate: float = 0.0020      # 매도 시 증권거래세
+    slippage_rate: float = 0.0005      # 체결가 불리 방향 슬리피지
+
+
+@dataclass(slots=True)
+class BacktestResult:
+    """백테스트 결과"""
+    params: StrategyParams
+    equity: np.ndarray                 # 일별 합산 평가금액 (T,)
+    ticker_pnl: np.ndarray             # 종목별 손익 (N,)
+    trade_pnl: np.ndarray              # 청산 거래별 실현 손익
+    exits: dict[str, int] = field(default_factory=dict)  # 청산 사유별 횟수
+    costs: float = 0.0                 # 수수료 + 세금 + 슬리피지 합계
+
+    @property
+    def total_return_pct(self) -> float:
+        return (self.equity[-1] / self.equity[0] - 1) * 100 if len(self.equity) else 0.0
+
+    @property
+    def mdd_pct(self) -> float:
+        if not len(self.equity):
+            return 0.0
+        return float((self.equity / np.maximum.accumulate(self.equity) - 1).min() * 100)
+
+    @property
+    def sharpe(self) -> float:
+        returns = np.diff(self.equity) / self.equity[:-1]
+        std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+        return float(returns.mean() / std * np.sqrt(TRADING_DAYS_PER_YEAR)) if std else 0.0
+
+    @property
+    def win_rate_pct(self) -> float:
+        return float((self.trade_pnl > 0).mean() * 100) if len(self.trade_pnl) else 0.0
+
+    def summary(self) -> dict:
+        """파라미터 + 주요 성과 (스윕 결과 비교용)"""
+        return {
+            **asdict(self.params),
+            "return_pct": round(self.total_return_pct, 2),
+            "mdd_pct": round(self.mdd_pct, 2),
+            "sharpe": round(self.sharpe, 2),
+            "trades": int(len(self.trade_pnl)),
+            "win_rate_pct": round(self.win_rate_pct, 1),
+            "costs": round(self.costs),
+        }
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """열별 단순 이동평균 (NaN 구간 포함 창은 NaN)"""
+    out = np.full(values.shape, np.nan)
+    if window <= 0 or len(values) < window:
+        return out
+    filled = np.nan_to_num(values)
+    csum = np.cumsum(filled, axis=0)
+    csum = np.vstack([np.zeros((1, values.shape[1])), csum])
+    counts = np.cumsum(~np.isnan(values), axis=0)
+    counts = np.vstack([np.zeros((1, values.shape[1])), counts])
+    full = (counts[window:] - counts[:-window]) == window
+    out[window - 1:] = np.where(full, (csum[window:] - csum[:-window]) / window, np.nan)
+    return out
+
+
+def compute_signals(close: np.ndarray, params: StrategyParams) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (진입 신호, 청산 신호) 2차원 bool 배열 (T, N)
+
+    진입: 종가가 entry_window 이동평균을 상향 돌파한 날
+    청산: 종가가 exit_window 이동평균을 하향 이탈한 날
+    """
+    with np.errstate(invalid="ignore"):
+        ma = moving_average(close, params.entry_window)
+        above = close > ma
+        entry = np.zeros_like(above)
+        entry[1:] = above[1:] & ~above[:-1] & ~np.isnan(ma[:-1])
+
+        exit_ = np.zeros_like(above)
+        if params.exit_window > 0:
+            ma_exit = moving_average(close, params.exit_window)
+            below = close < ma_exit
+            exit_[1:] = below[1:] & ~below[:-1] & ~np.isnan(ma_exit[:-1])
+    return entry, exit_
+
+
+def run_backtest(
+    prices: PriceMatrix,
+    params: StrategyParams = StrategyParams(),
+    costs: CostModel = CostModel(),
+    initial_cash: float = 10_000_000
+) -> BacktestResult:
+    """
+    백테스트 실행
+
+    Args:
+        prices: 날짜 × 종목 가격 행렬
+        params: 매매 규칙
+        costs: 거래 비용
+        initial_cash: 초기 자금 (종목 수로 균등 배분)
+
+    Returns:
+        BacktestResult
+    """
+    T, N = prices.shape
+    O, H, L, C = prices.open, prices.high, prices.low, prices.close
+    entry_sig, exit_sig = compute_signals(C, params)
+
+    splits = max(params.splits, 1)
+    sleeve = initial_cash / max(N, 1)
+    tranche = sleeve / splits
+    buy_mult = (1 + costs.slippage_rate) * (1 + costs.commission_rate)
+    sell_mult = (1 - costs.slippage_rate) * (1 - costs.commission_rate - costs.sell_tax_rate)
+
+    cash = np.full(N, sleeve)
+    shares = np.zeros(N)
+    cost_basis = np.zeros(N)       # 보유 수량 매수 총액 (비용 포함)
+    filled = np.zeros(N, dtype=int)  # 분할 매수 체결 횟수
+    last_fill = np.full(N, np.nan)   # 직전 매수가
+    last_close = np.full(N, np.nan)  # 평가용 (거래 없는 날은 직전 종가)
+
+    equity = np.empty(T)
+    trade_pnl: list[np.ndarray] = []
+    exits = {"signal": 0, "stop_loss": 0, "take_profit": 0, "end": 0}
+    total_cost = 0.0
+
+    def sell(mask: np.ndarray, price: np.ndarray, reason: str) -> None:
+        nonlocal total_cost
+        if not mask.any():
+            return
+        gross = shares[mask] * price[mask]
+        proceeds = gross * sell_mult
+        total_cost += float((gross - proceeds).sum())
+        trade_pnl.append(proceeds - cost_basis[mask])
+        cash[mask] += proceeds
+        shares[mask] = 0
+        cost_basis[mask] = 0
+        filled[mask] = 0
+        last_fill[mask] = np.nan
+        exits[reason] += int(mask.sum())
+
+    def buy(mask: np.ndarray, price: np.ndarray) -> None:
+        nonlocal total_cost
+        if not mask.any():
+            return
+        budget = np.minimum(tranche, cash[mask])
+        qty = np.floor(budget / (price[mask] * buy_mult))
+        spent = qty * price[mask] * buy_mult
+        total_cost += float((spent - qty * price[mask]).sum())
+        bought = qty > 0
+        idx = np.flatnonzero(mask)[bought]
+        cash[idx] -= spent[bought]
+        shares[idx] += qty[bought]
+        cost_basis[idx] += spent[bought]
+        filled[idx] += 1
+        last_fill[idx] = price[mask][bought]
+
+    with np.errstate(invalid="ignore"):
+        for t in range(T):
+            trading = ~np.isnan(O[t])
+            held = shares > 0
+
+            if t > 0:
+                # 1) 전일 종가 청산 신호 → 시가 매도
+                sell(held & trading & exit_sig[t - 1], O[t], "signal")
+                held = shares > 0
+
+                # 2) 장중 손절 / 익절 (평균 단가 기준, 갭이면 시가)
+                avg = np.where(held, cost_basis / np.maximum(shares, 1), np.nan)
+                if params.stop_loss_pct > 0:
+                    stop = avg * (1 - params.stop_loss_pct / 100)
+                    hit = held & trading & (L[t] <= stop)
+                    sell(hit, np.minimum(O[t], stop), "stop_loss")
+                    held = shares > 0
+                if params.take_profit_pct > 0:
+                    target = avg * (1 + params.take_profit_pct / 100)
+                    hit = held & trading & (H[t] >= target)
+                    sell(hit, np.maximum(O[t], target), "take_profit")
+                    held = shares > 0
+
+                # 3) 전일 종가 진입 신호 → 시가 1차 매수
+                buy(~held & trading & entry_sig[t - 1], O[t])
+
+                # 4) 분할 추가 매수: 직전 매수가 대비 split_step_pct 하락 시 (당일 신규 매수 제외)
+                if splits > 1:
+                    trigger = last_fill * (1 - params.split_step_pct / 100)
+                    add = held & trading & (filled < splits) & (L[t] <= trigger)
+                    buy(add, np.minimum(O[t], trigger))
+
+            last_close = np.where(np.isnan(C[t]), last_close, C[t])
+            equity[t] = cash.sum() + np.nansum(shares * last_close)
+
+    # 기간 말 보유분은 마지막 종가로 평가 청산 (성과 집계용)
+    held = shares > 0
+    sell(held, np.nan_to_num(last_close), "end")
+
+    pnl = np.concatenate(trade_pnl) if trade_pnl else np.empty(0)
+    return BacktestResult(
+        params=params,
+        equity=equity,
+        ticker_pnl=cash - sleeve,
+        trade_pnl=pnl,
+        exits=exits,
+        costs=total_cost,
+    )
+
+
+def param_grid(base: StrategyParams = StrategyParams(), **choices) -> list[StrategyParams]:
+    """
+    파라미터 조합 목록
+
+    예: param_grid(splits=[1, 3], stop_loss_pct=[5, 10]) → 4개 조합
+    """
+    grid = [base]
+    for name, values in choices.items():
+        grid = [replace(params, **{name: value}) for params in grid for value in values]
+    return grid
+
+
+def format_backtest(result: BacktestResult, tickers: Optional[list[str]] = None, names: Optional[dict] = None) -> str:
+    """백테스트 결과 요약 (콘솔 출력용)"""
+    summary = result.summary()
+    lines = [
+        f"총 수익률: {summary['return_pct']:+.2f}% | MDD: {summary['mdd_pct']:.2f}% | 샤프: {summary['sharpe']:.2f}",
+        f"거래: {summary['trades']}회 (승률 {summary['win_rate_pct']:.1f}%) | 비용: {summary['costs']:,.0f}원",
+        "청산 사유: " + " · ".join(f"{reason} {count}" for reason, count in result.exits.items() if count),
+    ]
+    if tickers:
+        names = names or {}
+        lines.append("")
+        for ticker, pnl in sorted(zip(tickers, result.ticker_pnl), key=lambda row: -row[1]):
+            lines.append(f"- {names.get(ticker, ticker)}({ticker}): {pnl:+,.0f}원")
+    return "\n".join(lines)
@@ -0,0 +1,323 @@
+"""
+교차 자산 롤링 상관 / 베타 / 공분산
+
+관심 종목, 지수, 환율, 금리 일간 변화율을 거래일 기준으로 맞춘 행렬(날짜 × 자산)에서
+창 크기 N의 공분산 행렬을 계산합니다.
+- 전체 구간: 외적 누적합(cumsum)으로 모든 창을 한 번에 벡터 계산 (rolling_covariance)
+- 일별 갱신: 링 버퍼 + 합계/외적 합계 상태로 새 거래일 1행만 반영 (RollingCovariance, O(자산 수²))
+
+베타는 beta[i, j] = cov(i, j) / var(j) (자산 i의 요인 j 민감도)입니다.
+"""
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 상관계수 변화 판단 기준 (단기 창 vs 장기 창)
+CORR_SHIFT = 0.4
+# 변화를 보고할 최소 상관 크기 (둘 다 이보다 약하면 잡음으로 간주)
+CORR_MIN = 0.3
+
+
+def _moments(count: np.ndarray, sums: np.ndarray, outer: np.ndarray) -> np.ndarray:
+    """(표본 수, 합계, 외적 합계) → 표본 공분산 (표본 2개 미만이면 NaN)"""
+    count = np.asarray(count, dtype=float)[..., None, None]
+    mean = sums / np.maximum(count[..., 0], 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = (outer - count * mean[..., :, None] * mean[..., None, :]) / (count - 1)
+    return np.where(count >= 2, cov, np.nan)
+
+
+def correlation_from_cov(cov: np.ndarray) -> np.ndarray:
+    std = np.sqrt(np.diagonal(cov, axis1=-2, axis2=-1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return cov / (std[..., :, None] * std[..., None, :])
+
+
+def beta_from_cov(cov: np.ndarray) -> np.ndarray:
+    var = np.diagonal(cov, axis1=-2, axis2=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return cov / var[..., None, :]
+
+
+def rolling_covariance(returns: np.ndarray, window: int) -> np.ndarray:
+    """
+    전체 구간 롤링 공분산 (모든 창 벡터 계산)
+
+    Args:
+        returns: (T, K) 일간 변화율 (NaN은 0으로 처리)
+        window: 창 크기
+
+    Returns:
+        (T, K, K) 공분산. 창이 다 차기 전 행은 NaN
+    """
+    values = np.nan_to_num(np.asarray(returns, dtype=float))
+    T, K = values.shape
+    zero = np.zeros((1, K))
+    csum = np.concatenate([zero, np.cumsum(values, axis=0)])
+    couter = np.concatenate([zero[None].repeat(K, 1).reshape(1, K, K), np.cumsum(values[:, :, None] * values[:, None, :], axis=0)])
+
+    out = np.full((T, K, K), np.nan)
+    if T >= window:
+        sums = csum[window:] - csum[:-window]
+        outer = couter[window:] - couter[:-window]
+        out[window - 1:] = _moments(np.full(T - window + 1, window), sums, outer)
+    return out
+
+
+class RollingCovariance:
+    """링 버퍼 기반 증분 롤링 공분산 (새 거래일 1행 = O(K²))"""
+
+    def __init__(self, names: Iterable[str], window: int):
+        self.names = list(names)
+        self.window = window
+        K = len(self.names)
+        self.buffer = np.zeros((window, K))
+        self.count = 0
+        self.sums = np.zeros(K)
+        self.outer = np.zeros((K, K))
+
+    @property
+    def size(self) -> int:
+        """현재 창에 들어 있는 행 수"""
+        return min(self.count, self.window)
+
+    def update(self, row: np.ndarray) -> None:
+        """새 거래일 변화율 1행 반영 (NaN은 0 = 변화 없음)"""
+        row = np.nan_to_num(np.asarray(row, dtype=float))
+        pos = self.count % self.window
+        old = self.buffer[pos] if self.count >= self.window else np.zeros_like(row)
+        self.sums += row - old
+        self.outer += np.outer(row, row) - np.outer(old, old)
+        self.buffer[pos] = row
+        self.count += 1
+        if self.count % self.window == 0:
+            # 한 바퀴마다 버퍼에서 다시 합산 (부동소수 오차 보정)
+            self.sums = self.buffer.sum(axis=0)
+            self.outer = self.buffer.T @ self.buffer
+
+    def extend(self, rows: np.ndarray) -> None:
+        for row in np.atleast_2d(rows):
+            self.update(row)
+
+    def covariance(self) -> pd.DataFrame:
+        cov = _moments(np.array(self.size), self.sums, self.outer)
+        return pd.DataFrame(cov, index=self.names, columns=self.names)
+
+    def correlation(self) -> pd.DataFrame:
+        return pd.DataFrame(correlation_from_cov(self.covariance().to_numpy()), index=self.names, columns=self.names)
+
+    def beta(self) -> pd.DataFrame:
+        """beta.loc[자산, 요인]"""
+        return pd.DataFrame(beta_from_cov(self.covariance().to_numpy()), index=self.names, columns=self.names)
+
+    def state(self, prefix: str) -> dict[str, np.ndarray]:
+        return {
+            f"{prefix}buffer": self.buffer, f"{prefix}count": np.array(self.count),
+            f"{prefix}sums": self.sums, f"{prefix}outer": self.outer,
+        }
+
+    @classmethod
+    def from_state(cls, names: list[str], window: int, data, prefix: str) -> "RollingCovariance":
+        engine = cls(names, window)
+        buffer = data[f"{prefix}buffer"]
+        if buffer.shape != engine.buffer.shape:
+            raise ValueError("상태 크기가 설정과 다릅니다.")
+        engine.buffer = buffer.copy()
+        engine.count = int(data[f"{prefix}count"])
+        engine.sums = data[f"{prefix}sums"].copy()
+        engine.outer = data[f"{prefix}outer"].copy()
+        return engine
+
+
+def to_returns(levels: pd.DataFrame, rate_columns: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    수준 → 일간 변화 (가격/환율: 변화율 %, 금리: 변화폭 %p)
+
+    Args:
+        levels: 날짜 인덱스 × 자산 컬럼 (거래일 기준 정렬, 결측은 직전 값)
+        rate_columns: 변화폭으로 계산할 금리 컬럼
+    """
+    levels = levels.sort_index().ffill()
+    rates = [c for c in rate_columns if c in levels]
+    returns = levels.pct_change(fill_method=None) * 100
+    if rates:
+        returns[rates] = levels[rates].diff()
+    return returns.iloc[1:]
+
+
+def sensitivity_shifts(
+    short: RollingCovariance,
+    long: RollingCovariance,
+    targets: Iterable[str],
+    factors: Iterable[str],
+    threshold: float = CORR_SHIFT,
+    min_corr: float = CORR_MIN
+) -> list[dict]:
+    """
+    단기 창과 장기 창의 상관계수 차이가 큰 (자산, 요인) 쌍
+
+    Returns:
+        target, factor, corr_short, corr_long, beta_short, beta_long dict 리스트 (변화폭 내림차순)
+    """
+    corr_s, corr_l = short.correlation(), long.correlation()
+    beta_s, beta_l = short.beta(), long.beta()
+    targets = [t for t in targets if t in corr_s.index]
+    factors = [f for f in factors if f in corr_s.columns]
+    if not targets or not factors:
+        return []
+
+    cs = corr_s.loc[targets, factors].to_numpy()
+    cl = corr_l.loc[targets, factors].to_numpy()
+    with np.errstate(invalid="ignore"):
+        shifted = (np.abs(cs - cl) >= threshold) & (np.maximum(np.abs(cs), np.abs(cl)) >= min_corr)
+    rows = []
+    for i, j in zip(*np.nonzero(shifted)):
+        target, factor = targets[i], factors[j]
+        rows.append({
+            "target": target, "factor": factor,
+            "corr_short": float(cs[i, j]), "corr_long": float(cl[i, j]),
+            "beta_short": float(beta_s.loc[target, factor]), "beta_long": float(beta_l.loc[target, factor]),
+        })
+    return sorted(rows, key=lambda r: -abs(r["corr_short"] - r["corr_long"]))
+
+
+def format_sensitivity(
+    short: RollingCovariance,
+    long: RollingCovariance,
+    targets: list[str],
+    factors: list[str],
+    labels: Optional[dict[str, str]] = None,
+    market: Optional[str] = None,
+    threshold: float = CORR_SHIFT,
+    min_corr: float = CORR_MIN
+) -> str:
+    """
+    관심 종목 요인 민감도 요약 (브리핑용)
+
+    Args:
+        short, long: 단기 / 장기 창 공분산
+        targets: 관심 종목 컬럼
+        factors: 요인 컬럼 (지수, 환율, 금리)
+        labels: 컬럼 → 표시명
+        market: 시장 베타를 표시할 지수 컬럼
+        threshold, min_corr: sensitivity_shifts 참고
+
+    Returns:
+        마크다운 문자열. 창이 덜 찼으면 빈 문자열
+    """
+    if short.size < short.window:
+        return ""
+    labels = labels or {}
+    name = lambda key: labels.get(key, key)  # noqa: E731
+
+    lines = [f"### 환율·금리 민감도 ({short.window}일 vs {long.window}일 상관)"]
+    if market and market in short.names:
+        beta = short.beta()
+        betas = [f"{name(t)} {beta.loc[t, market]:.2f}" for t in targets if t in beta.index]
+        if betas:
+            lines.append(f"- **{name(market)} 베타({short.window}일)**: " + " · ".join(betas))
+
+    shifts = sensitivity_shifts(short, long, targets, [f for f in factors if f != market], threshold, min_corr)
+    for row in shifts:
+        lines.append(
+            f"- **{name(row['target'])}** × {name(row['factor'])}: 상관 {row['corr_short']:+.2f} "
+            f"({long.window}일 {row['corr_long']:+.2f}), 베타 {row['beta_short']:+.2f} ({row['beta_long']:+.2f})"
+        )
+    if not shifts:
+        lines.append(f"- 상관계수가 {threshold} 이상 달라진 종목 없음")
+    return "\n".join(lines)
+
+
+class SensitivityMonitor:
+    """
+    단기 / 장기 창 롤링 공분산 + 마지막 수준값 (새 거래일 수준만 받아 증분 갱신)
+
+    같은 변화율 행을 두 창에 동시에 반영하므로 하루 갱신 비용은 O(자산 수²)입니다.
+    """
+
+    def __init__(self, names: Iterable[str], rate_columns: Iterable[str], short_window: int, long_window: int):
+        self.names = list(names)
+        rates = set(rate_columns)
+        self.is_rate = np.array([name in rates for name in self.names], dtype=bool)
+        self.short = RollingCovariance(self.names, short_window)
+        self.long = RollingCovariance(self.names, long_window)
+        self.last_date: Optional[np.datetime64] = None
+        self.last_levels = np.full(len(self.names), np.nan)
+
+    @property
+    def ready(self) -> bool:
+        return self.long.size >= self.long.window
+
+    def update(self, date, levels: np.ndarray) -> bool:
+        """
+        거래일 1개 수준값 반영 (이미 반영한 날짜 이하는 무시)
+
+        Returns:
+            반영 여부
+        """
+        day = np.datetime64(pd.Timestamp(date).date(), "D")
+        if self.last_date is not None and day <= self.last_date:
+            return False
+        levels = np.asarray(levels, dtype=float)
+        # 당일 값이 없으면 직전 값 유지 (변화 0)
+        levels = np.where(np.isnan(levels), self.last_levels, levels)
+        if self.last_date is not None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                row = np.where(self.is_rate, levels - self.last_levels, (levels / self.last_levels - 1) * 100)
+            self.short.update(row)
+            self.long.update(row)
+        self.last_date = day
+        self.last_levels = levels
+        return True
+
+    def update_frame(self, levels: pd.DataFrame) -> int:
+        """
+        날짜 인덱스 × 자산 수준 DataFrame 중 새 거래일만 반영
+
+        Returns:
+            반영한 거래일 수
+        """
+        frame = levels.reindex(columns=self.names).sort_index()
+        return sum(self.update(date, row) for date, row in zip(frame.index, frame.to_numpy()))
+
+    def shifts(self, targets: Iterable[str], factors: Iterable[str], **kwargs) -> list[dict]:
+        return sensitivity_shifts(self.short, self.long, targets, factors, **kwargs)
+
+    def save(self, path: Path) -> None:
+        """상태 저장 (.npz)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            names=np.array(self.names, dtype=str),
+            is_rate=self.is_rate,
+            windows=np.array([self.short.window, self.long.window]),
+            last_date=np.array(self.last_date if self.last_date is not None else np.datetime64("NaT"), dtype="datetime64[D]"),
+            last_levels=self.last_levels,
+            **self.short.state("short_"),
+            **self.long.state("long_"),
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SensitivityMonitor"]:
+        """저장된 상태 로드 (없거나 형식이 다르면 None)"""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                names = [str(n) for n in data["names"]]
+                rates = [n for n, flag in zip(names, data["is_rate"]) if flag]
+                short_window, long_window = (int(w) for w in data["windows"])
+                monitor = cls(names, rates, short_window, long_window)
+                monitor.short = RollingCovariance.from_state(names, short_window, data, "short_")
+                monitor.long = RollingCovariance.from_state(names, long_window, data, "long_")
+                last_date = data["last_date"][()]
+                monitor.last_date = None if np.isnat(last_date) else last_date
+                monitor.last_levels = data["last_levels"].copy()
+            return monitor
+        except (OSError, KeyError, ValueError):
+            return None
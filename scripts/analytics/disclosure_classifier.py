@@ -0,0 +1,237 @@
+"""
+공시 분류 / 중요도 순위
+
+DART 공시 보고서명(report_nm)을 유형별로 분류하고 중요도 점수를 매깁니다.
+- 실적, 배당, 유상증자, 메자닌(CB/BW/EB), M&A, 자사주, 상장/거래 리스크 등
+- [기재정정], [첨부정정] 등 접두어는 점수를 낮춤
+- 거래정지 해제 등 리스크 해소 공시는 상장리스크 키워드를 포함해도 낮은 점수로 분류
+
+유형별 패턴을 Aho-Corasick 오토마톤 하나로 미리 컴파일해 두므로
+보고서명 1건은 패턴 수와 무관하게 한 번 훑어 분류합니다.
+시장 전체 공시(수천 건)도 보고서명 종류가 수백 개 수준이라 결과를 캐시해 재사용합니다.
+"""
+from collections import Counter, deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:  # collectors가 이 모듈을 import하므로 런타임 순환 import 방지
+    from collectors.records import Disclosure
+
+
+# 유형 → (중요도 점수 0~10, 보고서명 패턴)
+# 패턴은 공백 제거, 가운뎃점(·, ・) → ㆍ 로 정규화한 보고서명에 대해 부분 일치
+DISCLOSURE_CATEGORIES: dict[str, tuple[float, list[str]]] = {
+    "상장리스크": (10, [
+        "상장폐지", "상장적격성", "매매거래정지", "거래정지", "관리종목", "회생절차",
+        "부도발생", "은행거래정지", "해산사유", "감사의견거절", "의견거절",
+    ]),
+    "횡령배임": (9, ["횡령ㆍ배임", "횡령", "배임혐의"]),
+    "실적": (9, [
+        "영업(잠정)실적", "잠정실적", "매출액또는손익구조", "손익구조30%", "결산실적",
+    ]),
+    "M&A": (9, [
+        "합병결정", "분할결정", "분할합병결정", "주식교환ㆍ이전결정", "영업양수결정",
+        "영업양도결정", "공개매수", "타법인주식및출자증권취득결정", "타법인주식및출자증권처분결정",
+        "유형자산양수결정", "유형자산양도결정",
+    ]),
+    "최대주주변경": (8, ["최대주주변경", "최대주주인수인"]),
+    "유상증자": (8, ["유상증자결정", "유상증자"]),
+    "메자닌": (7, [
+        "전환사채권발행결정", "신주인수권부사채권발행결정", "교환사채권발행결정",
+        "전환가액의조정", "행사가액조정",
+    ]),
+    "배당": (7, ["현금ㆍ현물배당", "현금배당", "주식배당", "분기배당", "중간배당", "배당결정"]),
+    "자사주": (6, [
+        "자기주식취득결정", "자기주식처분결정", "자기주식소각", "주식소각결정",
+        "자기주식취득신탁계약", "신탁계약해지",
+    ]),
+    "공급계약": (6, ["단일판매ㆍ공급계약", "공급계약체결"]),
+    "무상증자": (6, ["무상증자결정", "무상증자"]),
+    "소송": (5, ["소송등의제기", "소송등의판결", "가처분"]),
+    "투자": (5, ["신규시설투자", "시설투자"]),
+    "정기보고서": (3, ["사업보고서", "반기보고서", "분기보고서", "감사보고서"]),
+    "지분": (2, ["주식등의대량보유상황보고서", "최대주주등소유주식변동", "특정증권등소유상황보고서"]),
+}
+
+# 우선 유형 → (점수, 패턴): 일치하면 점수와 무관하게 DISCLOSURE_CATEGORIES보다 우선
+# "주권매매거래정지해제"처럼 리스크 키워드(거래정지)를 포함한 해소 공시를 상장리스크로 올리지 않기 위함
+DISCLOSURE_OVERRIDES: dict[str, tuple[float, list[str]]] = {
+    "리스크해소": (3, ["정지해제", "지정해제", "사유해소"]),
+}
+
+# 분류되지 않은 공시 유형 / 점수
+OTHER_CATEGORY = "기타"
+OTHER_SCORE = 1.0
+
+# 보고서명 접두어 → 점수 배율 (정정/첨부 공시는 원공시보다 덜 중요)
+DISCLOSURE_MODIFIERS: dict[str, float] = {
+    "[기재정정]": 0.6,
+    "[첨부정정]": 0.3,
+    "[첨부추가]": 0.3,
+    "[변경등록]": 0.5,
+    "[발행조건확정]": 0.7,
+    "[연장결정]": 0.8,
+}
+
+_DOTS = str.maketrans({"·": "ㆍ", "・": "ㆍ", "•": "ㆍ"})
+
+
+def _normalize(text: str) -> str:
+    return "".join(text.split()).translate(_DOTS)
+
+
+class DisclosureClassifier:
+    """보고서명 패턴 Aho-Corasick 오토마톤 기반 공시 분류기"""
+
+    def __init__(
+        self,
+        categories: Optional[dict[str, tuple[float, list[str]]]] = None,
+        modifiers: Optional[dict[str, float]] = None,
+        overrides: Optional[dict[str, tuple[float, list[str]]]] = None
+    ):
+        """
+        Args:
+            categories: 유형 → (점수, 패턴 목록). None이면 DISCLOSURE_CATEGORIES
+            modifiers: 접두어 → 점수 배율. None이면 DISCLOSURE_MODIFIERS
+            overrides: categories보다 우선하는 유형 → (점수, 패턴 목록). None이면 DISCLOSURE_OVERRIDES
+        """
+        categories = categories if categories is not None else DISCLOSURE_CATEGORIES
+        overrides = overrides if overrides is not None else DISCLOSURE_OVERRIDES
+        self.modifiers = {
+            _normalize(k): v
+            for k, v in (modifiers if modifiers is not None else DISCLOSURE_MODIFIERS).items()
+        }
+        self.scores = {name: float(score) for name, (score, _) in {**categories, **overrides}.items()}
+        self._overrides = set(overrides)
+
+        # 트라이: 상태 i의 전이 dict / 실패 링크 / 출력(우선 유형 > 점수 순으로 가장 앞선 유형)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[Optional[str]] = [None]
+
+        for name, (_, patterns) in {**categories, **overrides}.items():
+            for pattern in patterns:
+                self._insert(_normalize(pattern), name)
+        self._link()
+
+        self._cache: dict[str, tuple[str, float]] = {}
+
+    def _better(self, a: Optional[str], b: Optional[str]) -> Optional[str]:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        rank_a = (a in self._overrides, self.scores[a])
+        rank_b = (b in self._overrides, self.scores[b])
+        return a if rank_a >= rank_b else b
+
+    def _insert(self, pattern: str, category: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+            state = nxt
+        self._out[state] = self._better(self._out[state], category)
+
+    def _link(self) -> None:
+        """BFS로 실패 링크 계산, 실패 링크 쪽 출력을 병합해 상태당 출력 1개로 압축"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._better(self._out[nxt], self._out[self._fail[nxt]])
+                queue.append(nxt)
+
+    def _match(self, text: str) -> Optional[str]:
+        """텍스트에서 일치하는 유형 중 점수가 가장 높은 유형 (우선 유형이 있으면 우선 유형)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        best = None
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] is not None:
+                best = self._better(best, out[state])
+        return best
+
+    def classify(self, report_nm: str) -> tuple[str, float]:
+        """
+        보고서명 1건 분류
+
+        Returns:
+            (유형, 중요도 점수)
+        """
+        cached = self._cache.get(report_nm)
+        if cached is not None:
+            return cached
+
+        text = _normalize(report_nm)
+        category = self._match(text)
+        score = self.scores[category] if category else OTHER_SCORE
+        for prefix, factor in self.modifiers.items():
+            if text.startswith(prefix):
+                score *= factor
+                break
+
+        result = (category or OTHER_CATEGORY, round(score, 2))
+        self._cache[report_nm] = result
+        return result
+
+    def rank(
+        self,
+        disclosures: Iterable["Disclosure"],
+        watchlist: Iterable[str] = ()
+    ) -> list[tuple["Disclosure", str, float]]:
+        """
+        공시 목록을 중요도 순으로 정렬
+
+        Args:
+            disclosures: 공시 목록
+            watchlist: 가산점(+2)을 줄 종목 코드
+
+        Returns:
+            (공시, 유형, 점수) 리스트. 점수 내림차순, 동점이면 최신순
+        """
+        watch = set(watchlist)
+        ranked = []
+        for disc in disclosures:
+            category, score = self.classify(disc.report_nm)
+            if disc.stock_code in watch:
+                score += 2
+            ranked.append((disc, category, score))
+
+        ranked.sort(key=lambda row: (row[2], row[0].rcept_dt, row[0].rcept_no), reverse=True)
+        return ranked
+
+    def rollup(self, disclosures: Iterable["Disclosure"]) -> dict[str, int]:
+        """
+        유형별 공시 건수 (점수 높은 유형 순)
+
+        Returns:
+            유형 → 건수
+        """
+        counts = Counter(self.classify(disc.report_nm)[0] for disc in disclosures)
+        order = sorted(counts, key=lambda c: (-self.scores.get(c, OTHER_SCORE), -counts[c]))
+        return {category: counts[category] for category in order}
+
+
+@lru_cache(maxsize=1)
+def get_classifier() -> DisclosureClassifier:
+    """프로세스 공용 공시 분류기 (오토마톤은 1회만 컴파일)"""
+    return DisclosureClassifier()
+
+
+def format_disclosure_rollup(rollup: dict[str, int]) -> str:
+    """유형별 건수 한 줄 요약 (예: "실적 12 · 배당 5 · 기타 830")"""
+    return " · ".join(f"{category} {count:,}" for category, count in rollup.items())
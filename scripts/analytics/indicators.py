@@ -0,0 +1,351 @@
+"""
+관심 종목 기술적 지표 (증분 계산)
+
+종목별 롤링 상태(링 버퍼 + 누적 합계)를 보관하고, 새 일봉이 들어올 때마다
+전체 이력을 다시 계산하지 않고 봉 1개분만 갱신합니다 (종목당 O(1)).
+- 단순 이동평균 5/20/60일
+- RSI(14, Wilder 평활)
+- 볼린저 밴드(20일, ±2σ)와 %B
+- ATR(14, Wilder 평활)
+- 거래량 z-score (직전 20일 대비)
+
+상태는 종목 × 필드 NumPy 배열이라 같은 날짜의 봉은 전 종목을 한 번에 갱신합니다.
+누적 합계의 부동소수 오차는 링 버퍼가 한 바퀴 돌 때마다 버퍼에서 다시 계산해 보정합니다.
+"""
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+SMA_WINDOWS = (5, 20, 60)
+RSI_PERIOD = 14
+BB_WINDOW = 20
+BB_K = 2.0
+ATR_PERIOD = 14
+VOLUME_WINDOW = 20
+
+# 종가 링 버퍼 길이 (가장 긴 이동평균)
+RING = max(SMA_WINDOWS + (BB_WINDOW,))
+
+# RSI 과매수 / 과매도 기준
+RSI_OVERBOUGHT = 70.0
+RSI_OVERSOLD = 30.0
+
+_NOT_SEEN = np.datetime64("NaT", "D")
+
+
+class IndicatorEngine:
+    """종목별 롤링 상태 기반 증분 지표 계산기"""
+
+    # save()/load() 대상 배열 필드
+    _FIELDS = (
+        "count", "last_date", "closes", "volumes", "close_sums", "bb_sq_sum",
+        "volume_sum", "volume_sq_sum", "prev_close", "avg_gain", "avg_loss", "atr", "volume_z",
+    )
+
+    def __init__(self, tickers: Iterable[str] = ()):
+        self.tickers: list[str] = []
+        self._index: dict[str, int] = {}
+        self.count = np.zeros(0, dtype=np.int64)             # 반영한 봉 수
+        self.last_date = np.zeros(0, dtype="datetime64[D]")  # 마지막 반영 봉 날짜
+        self.closes = np.zeros((0, RING))                    # 종가 링 버퍼
+        self.volumes = np.zeros((0, VOLUME_WINDOW))          # 거래량 링 버퍼
+        self.close_sums = np.zeros((0, len(SMA_WINDOWS)))    # 이동평균 창별 종가 합계
+        self.bb_sq_sum = np.zeros(0)                         # 볼린저 창 종가 제곱 합계
+        self.volume_sum = np.zeros(0)
+        self.volume_sq_sum = np.zeros(0)
+        self.prev_close = np.zeros(0)
+        self.avg_gain = np.zeros(0)
+        self.avg_loss = np.zeros(0)
+        self.atr = np.zeros(0)
+        self.volume_z = np.zeros(0)
+        self.add_tickers(tickers)
+
+    # ----- 종목 관리 -----
+
+    def add_tickers(self, tickers: Iterable[str]) -> None:
+        """상태 배열에 신규 종목 행 추가 (이미 있으면 무시)"""
+        new = [t for t in dict.fromkeys(tickers) if t not in self._index]
+        if not new:
+            return
+        k = len(new)
+        for ticker in new:
+            self._index[ticker] = len(self.tickers)
+            self.tickers.append(ticker)
+
+        self.count = np.concatenate([self.count, np.zeros(k, dtype=np.int64)])
+        self.last_date = np.concatenate([self.last_date, np.full(k, _NOT_SEEN)])
+        self.closes = np.vstack([self.closes, np.zeros((k, RING))])
+        self.volumes = np.vstack([self.volumes, np.zeros((k, VOLUME_WINDOW))])
+        self.close_sums = np.vstack([self.close_sums, np.zeros((k, len(SMA_WINDOWS)))])
+        for name in ("bb_sq_sum", "volume_sum", "volume_sq_sum", "prev_close", "avg_gain", "avg_loss", "atr"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(k)]))
+        self.volume_z = np.concatenate([self.volume_z, np.full(k, np.nan)])
+
+    def reset(self, tickers: Iterable[str]) -> None:
+        """종목 상태 초기화 (이력 재적재 전)"""
+        self.add_tickers(tickers)
+        rows = [self._index[t] for t in tickers]
+        self.count[rows] = 0
+        self.last_date[rows] = _NOT_SEEN
+        for name in ("closes", "volumes", "close_sums"):
+            getattr(self, name)[rows] = 0
+        for name in ("bb_sq_sum", "volume_sum", "volume_sq_sum", "prev_close", "avg_gain", "avg_loss", "atr"):
+            getattr(self, name)[rows] = 0
+        self.volume_z[rows] = np.nan
+
+    def needs_warmup(self, tickers: Iterable[str], first_date) -> list[str]:
+        """
+        이력 재적재가 필요한 종목
+
+        상태가 없거나, 마지막 반영 봉이 이번 조회 구간 시작보다 앞서 중간 봉이 빠지는 종목
+
+        Args:
+            tickers: 종목 코드
+            first_date: 이번에 조회한 일봉 구간의 첫 날짜
+        """
+        first = np.datetime64(pd.Timestamp(first_date).date(), "D")
+        stale = []
+        for ticker in tickers:
+            row = self._index.get(ticker)
+            if row is None or self.count[row] == 0 or self.last_date[row] < first:
+                stale.append(ticker)
+        return stale
+
+    # ----- 갱신 -----
+
+    def update(
+        self,
+        tickers: list[str],
+        day,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> int:
+        """
+        같은 날짜의 봉으로 여러 종목 지표를 한 번에 갱신 (종목당 O(1))
+
+        이미 반영한 날짜 이하의 봉은 건너뜁니다.
+
+        Args:
+            tickers: 종목 코드 (배열 순서와 동일)
+            day: 봉 날짜
+            high, low, close, volume: 종목별 값 (tickers와 같은 길이)
+
+        Returns:
+            갱신한 종목 수
+        """
+        self.add_tickers(tickers)
+        day = np.datetime64(pd.Timestamp(day).date(), "D")
+        rows = np.array([self._index[t] for t in tickers], dtype=np.int64)
+        fresh = np.isnat(self.last_date[rows]) | (self.last_date[rows] < day)
+        if not fresh.any():
+            return 0
+
+        rows = rows[fresh]
+        h = np.asarray(high, dtype=float)[fresh]
+        l = np.asarray(low, dtype=float)[fresh]
+        c = np.asarray(close, dtype=float)[fresh]
+        v = np.asarray(volume, dtype=float)[fresh]
+        n = self.count[rows]
+        prev = self.prev_close[rows]
+        has_prev = n > 0
+
+        # 거래량 z-score: 새 봉을 넣기 전 직전 VOLUME_WINDOW일 분포 기준
+        full_volume = n >= VOLUME_WINDOW
+        mean = self.volume_sum[rows] / VOLUME_WINDOW
+        var = np.maximum(self.volume_sq_sum[rows] / VOLUME_WINDOW - mean ** 2, 0)
+        std = np.sqrt(var * VOLUME_WINDOW / (VOLUME_WINDOW - 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.volume_z[rows] = np.where(full_volume & (std > 0), (v - mean) / std, np.nan)
+
+        # 이동평균 / 볼린저 합계: 창 밖으로 나가는 값 빼고 새 값 더하기
+        for k, window in enumerate(SMA_WINDOWS):
+            outgoing = np.where(n >= window, self.closes[rows, (n - window) % RING], 0.0)
+            self.close_sums[rows, k] += c - outgoing
+        outgoing = np.where(n >= BB_WINDOW, self.closes[rows, (n - BB_WINDOW) % RING], 0.0)
+        self.bb_sq_sum[rows] += c ** 2 - outgoing ** 2
+        outgoing = np.where(full_volume, self.volumes[rows, n % VOLUME_WINDOW], 0.0)
+        self.volume_sum[rows] += v - outgoing
+        self.volume_sq_sum[rows] += v ** 2 - outgoing ** 2
+        self.closes[rows, n % RING] = c
+        self.volumes[rows, n % VOLUME_WINDOW] = v
+
+        # RSI / ATR: 첫 기간은 단순 평균으로 시드, 이후 Wilder 평활
+        delta = np.where(has_prev, c - prev, 0.0)
+        gain, loss = np.maximum(delta, 0), np.maximum(-delta, 0)
+        seeding = n <= RSI_PERIOD
+        self.avg_gain[rows] = np.where(
+            seeding, self.avg_gain[rows] + gain / RSI_PERIOD,
+            (self.avg_gain[rows] * (RSI_PERIOD - 1) + gain) / RSI_PERIOD,
+        )
+        self.avg_loss[rows] = np.where(
+            seeding, self.avg_loss[rows] + loss / RSI_PERIOD,
+            (self.avg_loss[rows] * (RSI_PERIOD - 1) + loss) / RSI_PERIOD,
+        )
+        true_range = np.where(
+            has_prev, np.maximum.reduce([h - l, np.abs(h - prev), np.abs(l - prev)]), h - l
+        )
+        seeding = n < ATR_PERIOD
+        self.atr[rows] = np.where(
+            seeding, self.atr[rows] + true_range / ATR_PERIOD,
+            (self.atr[rows] * (ATR_PERIOD - 1) + true_range) / ATR_PERIOD,
+        )
+
+        self.prev_close[rows] = c
+        self.count[rows] = n + 1
+        self.last_date[rows] = day
+
+        # 링 버퍼가 한 바퀴 돈 종목은 누적 합계를 버퍼에서 다시 계산 (부동소수 오차 보정)
+        wrapped = rows[(n + 1) % RING == 0]
+        if len(wrapped):
+            self._resync(wrapped)
+        return len(rows)
+
+    def _resync(self, rows: np.ndarray) -> None:
+        n = self.count[rows]
+        for k, window in enumerate(SMA_WINDOWS):
+            self.close_sums[rows, k] = self._window(self.closes[rows], n, window, RING).sum(axis=1)
+        bb = self._window(self.closes[rows], n, BB_WINDOW, RING)
+        self.bb_sq_sum[rows] = (bb ** 2).sum(axis=1)
+        volumes = self._window(self.volumes[rows], n, VOLUME_WINDOW, VOLUME_WINDOW)
+        self.volume_sum[rows] = volumes.sum(axis=1)
+        self.volume_sq_sum[rows] = (volumes ** 2).sum(axis=1)
+
+    @staticmethod
+    def _window(buffer: np.ndarray, n: np.ndarray, window: int, size: int) -> np.ndarray:
+        """링 버퍼에서 최근 window개 값 (부족하면 0)"""
+        offsets = np.arange(1, window + 1)
+        idx = (n[:, None] - offsets) % size
+        values = np.take_along_axis(buffer, idx, axis=1)
+        return np.where(offsets <= n[:, None], values, 0.0)
+
+    def update_frame(self, history: pd.DataFrame) -> int:
+        """
+        long-format 일봉 DataFrame 반영 (날짜별로 전 종목 일괄 갱신)
+
+        Args:
+            history: ticker, date, high, low, close, volume 컬럼 (KrxCollector.get_watchlist_history)
+
+        Returns:
+            반영한 봉 수
+        """
+        if history is None or history.empty:
+            return 0
+        updated = 0
+        for day, bars in history.sort_values("date", kind="stable").groupby("date", sort=True):
+            updated += self.update(
+                bars["ticker"].tolist(), day,
+                bars["high"].to_numpy(), bars["low"].to_numpy(),
+                bars["close"].to_numpy(), bars["volume"].to_numpy(),
+            )
+        return updated
+
+    # ----- 조회 -----
+
+    def snapshot(self, tickers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        현재 지표 값
+
+        Args:
+            tickers: 종목 코드 (None이면 전체)
+
+        Returns:
+            종목 인덱스 DataFrame
+            (date, close, sma5/20/60, rsi, bb_upper, bb_lower, pct_b, atr, atr_pct, volume_z)
+            데이터가 부족한 지표는 NaN
+        """
+        tickers = [t for t in (tickers if tickers is not None else self.tickers) if t in self._index]
+        rows = np.array([self._index[t] for t in tickers], dtype=np.int64)
+        n = self.count[rows]
+        close = np.where(n > 0, self.prev_close[rows], np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frame = pd.DataFrame({"date": self.last_date[rows], "close": close}, index=pd.Index(tickers, name="ticker"))
+            for k, window in enumerate(SMA_WINDOWS):
+                frame[f"sma{window}"] = np.where(n >= window, self.close_sums[rows, k] / window, np.nan)
+
+            mean = self.close_sums[rows, SMA_WINDOWS.index(BB_WINDOW)] / BB_WINDOW
+            var = np.maximum(self.bb_sq_sum[rows] / BB_WINDOW - mean ** 2, 0)
+            std = np.where(n >= BB_WINDOW, np.sqrt(var), np.nan)
+            frame["bb_upper"] = mean + BB_K * std
+            frame["bb_lower"] = mean - BB_K * std
+            width = frame["bb_upper"] - frame["bb_lower"]
+            frame["pct_b"] = np.where(width > 0, (close - frame["bb_lower"]) / width, np.nan)
+
+            avg_gain, avg_loss = self.avg_gain[rows], self.avg_loss[rows]
+            rsi = np.where(avg_loss > 0, 100 - 100 / (1 + avg_gain / avg_loss), 100.0)
+            frame["rsi"] = np.where(n > RSI_PERIOD, rsi, np.nan)
+            frame["atr"] = np.where(n >= ATR_PERIOD, self.atr[rows], np.nan)
+            frame["atr_pct"] = frame["atr"] / close * 100
+            frame["volume_z"] = self.volume_z[rows]
+        return frame
+
+    # ----- 저장 -----
+
+    def save(self, path: Path) -> None:
+        """상태 저장 (.npz)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(tmp, tickers=np.array(self.tickers, dtype=str), **{f: getattr(self, f) for f in self._FIELDS})
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["IndicatorEngine"]:
+        """저장된 상태 로드 (없거나 형식이 다르면 None)"""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                engine = cls()
+                engine.tickers = [str(t) for t in data["tickers"]]
+                engine._index = {t: i for i, t in enumerate(engine.tickers)}
+                for name in cls._FIELDS:
+                    value = data[name]
+                    if value.shape[1:] != getattr(engine, name).shape[1:]:
+                        return None
+                    setattr(engine, name, value.copy())
+            return engine
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+def format_indicators(frame: pd.DataFrame, names: Optional[dict[str, str]] = None) -> str:
+    """
+    기술적 지표 요약 (브리핑 관심 종목 섹션용)
+
+    Args:
+        frame: IndicatorEngine.snapshot() 결과
+        names: 종목 코드 → 종목명
+
+    Returns:
+        마크다운 문자열. 지표가 없으면 빈 문자열
+    """
+    if frame is None or frame.empty:
+        return ""
+    names = names or {}
+    lines = ["### 기술적 지표"]
+    for ticker, row in frame.iterrows():
+        if pd.isna(row["close"]):
+            continue
+        parts = []
+        mas = [f"MA{w} {row[f'sma{w}']:,.0f}" for w in SMA_WINDOWS if pd.notna(row[f"sma{w}"])]
+        if mas:
+            parts.append(" / ".join(mas))
+        if pd.notna(row["sma20"]):
+            parts.append(f"MA20 대비 {(row['close'] / row['sma20'] - 1) * 100:+.1f}%")
+        if pd.notna(row["rsi"]):
+            zone = " 과매수" if row["rsi"] >= RSI_OVERBOUGHT else " 과매도" if row["rsi"] <= RSI_OVERSOLD else ""
+            parts.append(f"RSI {row['rsi']:.1f}{zone}")
+        if pd.notna(row["pct_b"]):
+            parts.append(f"볼린저 %B {row['pct_b']:.2f}")
+        if pd.notna(row["atr"]):
+            parts.append(f"ATR {row['atr']:,.0f} ({row['atr_pct']:.1f}%)")
+        if pd.notna(row["volume_z"]):
+            parts.append(f"거래량 z {row['volume_z']:+.1f}")
+        if parts:
+            lines.append(f"- **{names.get(ticker, ticker)}** ({ticker}): " + " | ".join(parts))
+    return "\n".join(lines) if len(lines) > 1 else ""
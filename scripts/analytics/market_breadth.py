@@ -0,0 +1,133 @@
+"""
+시장 내부 지표 (Market Breadth)
+
+KrxCollector.get_market_snapshot()의 전종목 스냅샷 하나로 시장 내부 지표를 계산합니다.
+- 상승/하락/보합 종목 수, 상한가/하한가 종목 수
+- 거래대금 상위 종목 중 상승률/하락률 상위
+- 시가총액 상위 20종목 등락
+
+종목별 추가 조회 없이 전종목 DataFrame 컬럼 연산만으로 계산합니다.
+"""
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+# 가격제한폭 ±30% (호가 단위 반올림으로 29.x%에 체결되는 경우 포함)
+LIMIT_PCT = 29.5
+
+
+def compute_market_breadth(
+    snapshot: pd.DataFrame,
+    top_n: int = 5,
+    value_universe: int = 100,
+    cap_top: int = 20,
+    name_of: Optional[Callable[[str], str]] = None
+) -> dict:
+    """
+    전종목 스냅샷에서 시장 내부 지표 계산
+
+    Args:
+        snapshot: 티커 인덱스 DataFrame (change_pct, volume, value, market_cap 컬럼)
+        top_n: 상승률/하락률 상위 표시 개수
+        value_universe: 상승률/하락률 순위를 매길 거래대금 상위 종목 수
+        cap_top: 시가총액 상위 표시 개수
+        name_of: 티커 → 종목명 함수 (표시 대상 종목에만 적용)
+
+    Returns:
+        시장 내부 지표 dict. 스냅샷이 비어 있으면 빈 dict
+    """
+    if snapshot is None or snapshot.empty:
+        return {}
+
+    # 거래정지 종목(거래량 0)은 집계에서 제외
+    traded = snapshot[snapshot["volume"] > 0]
+    pct = traded["change_pct"]
+
+    breadth = {
+        "total": int(len(traded)),
+        "advancers": int((pct > 0).sum()),
+        "decliners": int((pct < 0).sum()),
+        "unchanged": int((pct == 0).sum()),
+        "limit_up": int((pct >= LIMIT_PCT).sum()),
+        "limit_down": int((pct <= -LIMIT_PCT).sum()),
+        "total_value": int(traded["value"].sum()) if "value" in traded else 0,
+    }
+    breadth["advance_ratio"] = (
+        breadth["advancers"] / breadth["decliners"] if breadth["decliners"] else float("inf")
+    )
+
+    # 거래대금 상위 종목 안에서 상승/하락 순위 (저가 소형주 왜곡 방지)
+    columns = ["close", "change_pct", "value"]
+    if "value" in traded:
+        active = traded.nlargest(value_universe, "value")
+        breadth["gainers"] = _with_names(active.nlargest(top_n, "change_pct")[columns], name_of)
+        breadth["losers"] = _with_names(active.nsmallest(top_n, "change_pct")[columns], name_of)
+
+    if "market_cap" in traded and traded["market_cap"].notna().any():
+        leaders = traded.nlargest(cap_top, "market_cap")[["close", "change_pct", "market_cap"]].copy()
+        # 전일 시가총액 = 당일 시가총액 / (1 + 등락률)
+        leaders["cap_change"] = leaders["market_cap"] - leaders["market_cap"] / (1 + leaders["change_pct"] / 100)
+        breadth["cap_leaders"] = _with_names(leaders, name_of)
+
+    return breadth
+
+
+def _with_names(df: pd.DataFrame, name_of: Optional[Callable[[str], str]]) -> pd.DataFrame:
+    """표시 대상 행에만 종목명 컬럼 추가"""
+    df = df.copy()
+    df["name"] = [name_of(t) for t in df.index] if name_of else list(df.index)
+    return df
+
+
+def format_market_breadth(breadth: dict) -> str:
+    """
+    브리핑용 마크다운 포맷 생성
+
+    Args:
+        breadth: compute_market_breadth() 결과
+
+    Returns:
+        마크다운 문자열
+    """
+    if not breadth:
+        return "### 시장 내부\n전종목 시세를 조회할 수 없습니다."
+
+    ratio = breadth["advance_ratio"]
+    ratio_text = f"{ratio:.2f}" if ratio != float("inf") else "-"
+    lines = [
+        "### 시장 내부",
+        f"- **상승/하락/보합**: {breadth['advancers']:,} / {breadth['decliners']:,} / "
+        f"{breadth['unchanged']:,} (등락비 {ratio_text})",
+        f"- **상한가/하한가**: {breadth['limit_up']} / {breadth['limit_down']}",
+        f"- **전체 거래대금**: {breadth['total_value'] / 1e8:,.0f}억원",
+    ]
+
+    gainers = breadth.get("gainers")
+    if gainers is not None and not gainers.empty:
+        lines.append("\n**거래대금 상위 중 상승률 상위**")
+        for ticker, row in gainers.iterrows():
+            lines.append(
+                f"- {row['name']} ({ticker}): {row['close']:,.0f}원 ({row['change_pct']:+.2f}%) "
+                f"| 거래대금 {row['value'] / 1e8:,.0f}억원"
+            )
+
+    losers = breadth.get("losers")
+    if losers is not None and not losers.empty:
+        lines.append("\n**거래대금 상위 중 하락률 상위**")
+        for ticker, row in losers.iterrows():
+            lines.append(
+                f"- {row['name']} ({ticker}): {row['close']:,.0f}원 ({row['change_pct']:+.2f}%) "
+                f"| 거래대금 {row['value'] / 1e8:,.0f}억원"
+            )
+
+    leaders = breadth.get("cap_leaders")
+    if leaders is not None and not leaders.empty:
+        lines.append(f"\n**시가총액 상위 {len(leaders)}종목**")
+        for ticker, row in leaders.iterrows():
+            lines.append(
+                f"- {row['name']} ({ticker}): {row['change_pct']:+.2f}% "
+                f"| 시총 {row['market_cap'] / 1e12:,.1f}조원 ({row['cap_change'] / 1e8:+,.0f}억원)"
+            )
+
+    return "\n".join(lines)
@@ -0,0 +1,167 @@
+"""
+뉴스 중복 기사 묶기 (MinHash + LSH)
+
+여러 매체가 같은 사건을 제목만 조금 바꿔 보도하는 경우를 하나의 기사 묶음으로 합칩니다.
+- 제목 / 요약 앞부분의 한글 문자 n-gram 집합을 각각 MinHash 서명으로 압축
+- 서명을 밴드로 나눠 같은 버킷에 들어온 기사 쌍만 비교 (LSH)
+- 제목 또는 요약의 추정 자카드 유사도가 기준 이상인 쌍을 union-find로 묶음
+  (짧은 제목과 긴 요약을 한 집합으로 합치면 요약 차이가 제목 유사도를 희석함)
+
+전체 쌍 비교(O(n²)) 없이 기사 수에 대해 거의 선형 시간에 동작합니다.
+"""
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:  # collectors가 이 모듈을 import하므로 런타임 순환 import 방지
+    from collectors.records import Article
+
+
+# MinHash 서명 길이 = 밴드 수 × 밴드당 행 수
+NUM_BANDS = 32
+ROWS_PER_BAND = 4
+NUM_PERM = NUM_BANDS * ROWS_PER_BAND
+
+# 같은 기사로 볼 추정 자카드 유사도 (제목 2-gram 기준 "코스피 하락 마감"/"코스닥 하락 마감" = 0.5)
+SIMILARITY_THRESHOLD = 0.55
+
+# 요약은 리드 문장 위주로만 사용 (매체별 본문 차이가 커서)
+SUMMARY_CHARS = 80
+
+_MERSENNE = np.uint64((1 << 61) - 1)
+_PRIME = np.uint64(4294967311)  # 2^32보다 큰 소수
+_NON_WORD = re.compile(r"[^0-9A-Za-z가-힣]+")
+# 제목 머리표/괄호 태그 ([속보], [단독], (종합) 등)
+_TAG = re.compile(r"^\s*[\[(<【][^\])>】]{1,8}[\])>】]\s*|\s*[\[(<【](?:종합|상보|1보|2보|속보)[\])>】]\s*")
+
+
+@dataclass(slots=True)
+class StoryCluster:
+    """같은 사건을 다룬 기사 묶음"""
+    representative: "Article"
+    articles: list["Article"] = field(default_factory=list)
+
+    @property
+    def sources(self) -> list[str]:
+        """보도 매체 (중복 제거, 등장 순)"""
+        return list(dict.fromkeys(a.source for a in self.articles if a.source))
+
+
+def _shingles(text: str, n: int) -> set[str]:
+    text = _NON_WORD.sub("", text)
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def article_shingles(article: "Article") -> tuple[set[str], set[str]]:
+    """
+    (제목 2-gram, 요약 앞부분 3-gram)
+
+    한글 제목은 짧아 2-gram이 조사/어순 변형에 덜 민감합니다.
+    """
+    title = _TAG.sub("", article.title)
+    return _shingles(title, 2), _shingles(article.summary[:SUMMARY_CHARS], 3)
+
+
+class MinHasher:
+    """문자열 집합 → MinHash 서명 (유니버설 해시 NUM_PERM개)"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        # a*x + b가 uint64 범위를 넘지 않도록 a, b < 2^31
+        self.a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, shingles: set[str]) -> np.ndarray:
+        if not shingles:
+            return np.full(self.num_perm, _MERSENNE, dtype=np.uint64)
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        # (해시 수, 1) × (순열 수,) → 순열별 최솟값
+        permuted = (hashes[:, None] * self.a + self.b) % _PRIME
+        return permuted.min(axis=0)
+
+
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_articles(
+    articles: list["Article"],
+    threshold: float = SIMILARITY_THRESHOLD,
+    hasher: Optional[MinHasher] = None
+) -> list[StoryCluster]:
+    """
+    기사 목록을 중복 기사 묶음으로 합침
+
+    Args:
+        articles: 기사 목록 (최신순 정렬 권장: 묶음 순서와 대표 기사 선택에 사용)
+        threshold: 같은 기사로 볼 추정 자카드 유사도
+        hasher: MinHash 계산기 (기본: NUM_PERM개 순열)
+
+    Returns:
+        기사 묶음 리스트. 입력 순서상 첫 기사 기준 순서를 유지하며,
+        대표 기사는 묶음에서 제목([속보] 등 태그 제외)+요약이 가장 긴 기사
+    """
+    if not articles:
+        return []
+
+    hasher = hasher or MinHasher()
+    shingles = [article_shingles(a) for a in articles]
+    # 제목 / 요약 서명 (기사 수, 순열 수)
+    titles = np.stack([hasher.signature(t) for t, _ in shingles])
+    leads = np.stack([hasher.signature(s) for _, s in shingles])
+    rows = hasher.num_perm // NUM_BANDS
+
+    def similarity(i: int, j: int) -> float:
+        # 서명 일치 비율 = 자카드 유사도 추정치 (빈 제목/요약은 비교하지 않음)
+        sims = [
+            float(np.mean(sig[i] == sig[j]))
+            for kind, sig in enumerate((titles, leads))
+            if shingles[i][kind] and shingles[j][kind]
+        ]
+        return max(sims, default=0.0)
+
+    # 밴드별 버킷에서 후보 쌍 수집
+    parent = list(range(len(articles)))
+    checked = set()
+    for kind, signatures in enumerate((titles, leads)):
+        # 빈 집합은 서명이 모두 같아 한 버킷에 몰리므로 제외
+        valid = [i for i, pair in enumerate(shingles) if pair[kind]]
+        for band in range(NUM_BANDS):
+            buckets = defaultdict(list)
+            chunk = signatures[valid, band * rows:(band + 1) * rows]
+            for i, key in zip(valid, map(bytes, chunk)):
+                buckets[key].append(i)
+
+            for members in buckets.values():
+                for pos, i in enumerate(members):
+                    for j in members[pos + 1:]:
+                        if (i, j) in checked:
+                            continue
+                        checked.add((i, j))
+                        if similarity(i, j) >= threshold:
+                            root_a, root_b = _find(parent, i), _find(parent, j)
+                            if root_a != root_b:
+                                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(articles)):
+        groups[_find(parent, i)].append(i)
+
+    clusters = []
+    for root in sorted(groups):
+        members = [articles[i] for i in groups[root]]
+        representative = max(members, key=lambda a: len(_TAG.sub("", a.title)) + len(a.summary))
+        clusters.append(StoryCluster(representative=representative, articles=members))
+    return clusters
@@ -0,0 +1,93 @@
+"""
+기간 성과 지표 (주간/월간 리포트용)
+
+날짜 × 종목(또는 지표) 종가 DataFrame 하나로 종목별 기간 성과를 한 번에 계산합니다.
+- 기간 수익률, 최대 낙폭(MDD), 일간 변동성(표준편차)과 연율화 변동성
+- 최고/최저 일간 등락률, 관측 일수
+
+종목별 반복 없이 컬럼 단위 벡터 연산만 사용합니다.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def compute_period_stats(
+    closes: pd.DataFrame,
+    base: Optional[pd.Series] = None,
+    daily_pct: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    종목별 기간 성과 계산
+
+    Args:
+        closes: 날짜 인덱스 × 종목 컬럼 종가 (기간 내 거래일만, 빈 값은 NaN)
+        base: 종목별 기준가 (기간 직전 종가). None이면 기간 첫 종가
+        daily_pct: closes와 같은 모양의 일간 등락률(%). None이면 종가 변화율로 계산
+            (수집 누락일이 있어도 거래소 등락률을 그대로 쓰기 위함)
+
+    Returns:
+        종목 인덱스 DataFrame
+        (start, end, return_pct, mdd_pct, vol_pct, vol_annual_pct, best_pct, worst_pct, days)
+    """
+    if closes is None or closes.empty:
+        return pd.DataFrame()
+
+    closes = closes.sort_index().astype(float)
+    first = closes.bfill().iloc[0]
+    start = first if base is None else base.reindex(closes.columns).fillna(first)
+    end = closes.ffill().iloc[-1]
+
+    # 기준가를 첫 행으로 붙여 기간 첫날 낙폭/등락도 반영
+    path = pd.concat([start.to_frame().T, closes]).ffill()
+    drawdown = path / path.cummax() - 1
+
+    if daily_pct is None:
+        daily_pct = path.pct_change().iloc[1:] * 100
+    daily_pct = daily_pct.reindex(index=closes.index, columns=closes.columns).where(closes.notna())
+
+    stats = pd.DataFrame({
+        "start": start,
+        "end": end,
+        "return_pct": (end / start - 1) * 100,
+        "mdd_pct": drawdown.min() * 100,
+        "vol_pct": daily_pct.std(ddof=1),
+        "best_pct": daily_pct.max(),
+        "worst_pct": daily_pct.min(),
+        "days": closes.notna().sum(),
+    })
+    stats["vol_annual_pct"] = stats["vol_pct"] * np.sqrt(TRADING_DAYS_PER_YEAR)
+    return stats
+
+
+def compute_level_changes(levels: pd.DataFrame, base: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    금리/환율 등 수준 지표의 기간 변화
+
+    Args:
+        levels: 날짜 인덱스 × 지표 컬럼 값
+        base: 지표별 기준값 (기간 직전 값). None이면 기간 첫 값
+
+    Returns:
+        지표 인덱스 DataFrame (start, end, change, change_pct, high, low)
+    """
+    if levels is None or levels.empty:
+        return pd.DataFrame()
+
+    levels = levels.sort_index().astype(float)
+    first = levels.bfill().iloc[0]
+    start = first if base is None else base.reindex(levels.columns).fillna(first)
+    end = levels.ffill().iloc[-1]
+
+    return pd.DataFrame({
+        "start": start,
+        "end": end,
+        "change": end - start,
+        "change_pct": (end / start - 1) * 100,
+        "high": levels.max(),
+        "low": levels.min(),
+    })
@@ -0,0 +1,300 @@
+"""
+전종목 스크리너 (선언형 규칙)
+
+"volume_ratio(20) >= 3 and value >= 5e9" 같은 규칙 문자열을 한 번 컴파일해 두고
+전종목 컬럼 배열(당일 스냅샷 + 전종목 행렬 이력)에 벡터 연산으로 적용합니다.
+
+규칙 문법:
+    규칙   := 조건 ("and" 조건)*
+    조건   := 값 비교연산자 값 | 값 "between" 값 값
+    값     := 숫자(음수, 1e9 표기 가능) | 필드 | 함수(N)
+    비교   := >= <= > < == !=
+
+필드 (당일 스냅샷): open, high, low, close, volume, value, change_pct, market_cap, gap_pct
+함수 (직전 N거래일 이력, 당일 제외):
+    avg_volume(N), avg_value(N)  평균 거래량 / 거래대금
+    volume_ratio(N)              당일 거래량 / avg_volume(N)
+    max_close(N), min_close(N)   최고 / 최저 종가 (52주 = 250)
+    return_pct(N)                N거래일 전 종가 대비 수익률 %
+
+이력이 부족한 종목(신규 상장 등)의 함수 값은 NaN이라 해당 조건을 만족하지 않습니다.
+"""
+import operator
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+SNAPSHOT_FIELDS = ("open", "high", "low", "close", "volume", "value", "change_pct", "market_cap", "gap_pct")
+# 함수 → 필요한 이력 필드
+HISTORY_FUNCTIONS = {
+    "avg_volume": "volume",
+    "avg_value": "value",
+    "volume_ratio": "volume",
+    "max_close": "close",
+    "min_close": "close",
+    "return_pct": "close",
+}
+
+_COMPARE = {
+    ">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt,
+    "==": operator.eq, "!=": operator.ne,
+}
+_TOKEN = re.compile(r"\s*(?:(-?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(>=|<=|==|!=|[><()]))")
+
+
+class ScreenContext:
+    """
+    스크리너 입력 컬럼 (당일 스냅샷 + 직전 이력 행렬)
+
+    이력 행렬은 (거래일 수, 종목 수)로 스냅샷 행 순서에 맞춰 정렬된 배열이며,
+    같은 함수·기간 값은 한 번만 계산해 규칙 간에 재사용합니다.
+    """
+
+    def __init__(self, snapshot: pd.DataFrame, history: Optional[dict[str, np.ndarray]] = None):
+        """
+        Args:
+            snapshot: 티커 인덱스 DataFrame (KrxCollector.get_market_snapshot 결과)
+            history: 필드 → (직전 거래일 수, 종목 수) 배열 (오래된 순, 당일 제외)
+        """
+        self.snapshot = snapshot
+        self.history = history or {}
+        self._cache: dict[tuple, np.ndarray] = {}
+
+    @property
+    def tickers(self) -> pd.Index:
+        return self.snapshot.index
+
+    @property
+    def sessions(self) -> int:
+        """보유 이력 거래일 수"""
+        return min((len(values) for values in self.history.values()), default=0)
+
+    def column(self, name: str) -> np.ndarray:
+        key = (name,)
+        if key not in self._cache:
+            if name == "gap_pct":
+                # 전일 종가 = 종가 / (1 + 등락률)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    prev_close = self.column("close") / (1 + self.column("change_pct") / 100)
+                    values = (self.column("open") / prev_close - 1) * 100
+            elif name in self.snapshot:
+                values = pd.to_numeric(self.snapshot[name], errors="coerce").to_numpy(dtype=np.float64)
+            else:
+                values = np.full(len(self.snapshot), np.nan)
+            self._cache[key] = values
+        return self._cache[key]
+
+    def function(self, name: str, n: int) -> np.ndarray:
+        key = (name, n)
+        if key in self._cache:
+            return self._cache[key]
+
+        window = self.history.get(HISTORY_FUNCTIONS[name])
+        if window is None or len(window) < n:
+            values = np.full(len(self.snapshot), np.nan)
+        else:
+            window = window[-n:]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if name in ("avg_volume", "avg_value"):
+                    values = _nanmean(window)
+                elif name == "volume_ratio":
+                    values = self.column("volume") / self.function("avg_volume", n)
+                elif name == "max_close":
+                    values = _nan_reduce(np.fmax, window)
+                elif name == "min_close":
+                    values = _nan_reduce(np.fmin, window)
+                else:  # return_pct
+                    values = (self.column("close") / window[0] - 1) * 100
+        self._cache[key] = values
+        return values
+
+
+def _nanmean(window: np.ndarray) -> np.ndarray:
+    """열별 NaN 제외 평균 (전부 NaN이면 NaN, 경고 없음)"""
+    valid = ~np.isnan(window)
+    count = valid.sum(axis=0)
+    total = np.where(valid, window, 0).sum(axis=0, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def _nan_reduce(ufunc, window: np.ndarray) -> np.ndarray:
+    """np.fmax / np.fmin 누적 (NaN 무시, 전부 NaN이면 NaN)"""
+    return ufunc.reduce(window, axis=0).astype(np.float64)
+
+
+Operand = Callable[[ScreenContext], "np.ndarray | float"]
+
+
+@dataclass
+class ScreenRule:
+    """컴파일된 스크리너 규칙"""
+    name: str
+    text: str
+    conditions: list[Callable[[ScreenContext], np.ndarray]] = field(repr=False)
+    lookback: int = 0  # 필요한 최대 이력 거래일 수
+    history_fields: frozenset = frozenset()  # 필요한 이력 필드 (close / volume / value)
+
+    def evaluate(self, ctx: ScreenContext) -> np.ndarray:
+        """종목별 충족 여부 (bool 배열, 스냅샷 행 순서)"""
+        mask = np.ones(len(ctx.snapshot), dtype=bool)
+        for condition in self.conditions:
+            with np.errstate(invalid="ignore"):
+                mask &= np.asarray(condition(ctx), dtype=bool)
+        return mask
+
+
+class _Parser:
+    """규칙 문자열 → 조건 함수 목록 (재귀 하강)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+        self.lookback = 0
+        self.history_fields: set[str] = set()
+
+    def _tokenize(self, text: str) -> list[str]:
+        tokens, pos = [], 0
+        text = text.strip()
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"규칙 '{self.text}': {pos + 1}번째 글자를 해석할 수 없습니다.")
+            tokens.append(next(group for group in match.groups() if group))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self, expected: Optional[str] = None) -> str:
+        token = self._peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"규칙 '{self.text}': '{expected or '값'}'이(가) 필요합니다 (현재: {token or '끝'}).")
+        self.pos += 1
+        return token
+
+    def parse(self) -> list[Callable[[ScreenContext], np.ndarray]]:
+        conditions = [self._condition()]
+        while self._peek() == "and":
+            self._next()
+            conditions.append(self._condition())
+        if self._peek() is not None:
+            raise ValueError(f"규칙 '{self.text}': '{self._peek()}' 앞에 and가 필요합니다.")
+        return conditions
+
+    def _condition(self) -> Callable[[ScreenContext], np.ndarray]:
+        left = self._operand()
+        op = self._next()
+        if op == "between":
+            low, high = self._operand(), self._operand()
+            return lambda ctx: (left(ctx) >= low(ctx)) & (left(ctx) <= high(ctx))
+        if op not in _COMPARE:
+            raise ValueError(f"규칙 '{self.text}': 비교 연산자가 필요합니다 (현재: {op}).")
+        compare, right = _COMPARE[op], self._operand()
+        return lambda ctx: compare(left(ctx), right(ctx))
+
+    def _operand(self) -> Operand:
+        token = self._next()
+        if token in _COMPARE or token in ("(", ")"):
+            raise ValueError(f"규칙 '{self.text}': 값이 필요합니다 (현재: {token}).")
+        if token.lstrip("-")[:1].isdigit():
+            value = float(token)
+            return lambda ctx: value
+        if self._peek() == "(":
+            if token not in HISTORY_FUNCTIONS:
+                raise ValueError(f"규칙 '{self.text}': 알 수 없는 함수 {token}() (지원: {', '.join(HISTORY_FUNCTIONS)})")
+            self._next("(")
+            arg = self._next()
+            self._next(")")
+            if not arg.isdigit() or int(arg) < 1:
+                raise ValueError(f"규칙 '{self.text}': {token}()의 인자는 1 이상의 정수여야 합니다.")
+            n = int(arg)
+            self.lookback = max(self.lookback, n)
+            self.history_fields.add(HISTORY_FUNCTIONS[token])
+            return lambda ctx: ctx.function(token, n)
+        if token not in SNAPSHOT_FIELDS:
+            raise ValueError(f"규칙 '{self.text}': 알 수 없는 필드 {token} (지원: {', '.join(SNAPSHOT_FIELDS)})")
+        return lambda ctx: ctx.column(token)
+
+
+@lru_cache(maxsize=256)
+def compile_rule(text: str, name: str = "") -> ScreenRule:
+    """
+    규칙 문자열 컴파일 (같은 문자열은 캐시 재사용)
+
+    Raises:
+        ValueError: 문법 오류, 알 수 없는 필드/함수
+    """
+    parser = _Parser(text)
+    conditions = parser.parse()
+    return ScreenRule(
+        name=name or text, text=text, conditions=conditions,
+        lookback=parser.lookback, history_fields=frozenset(parser.history_fields),
+    )
+
+
+def compile_rules(rules: dict[str, str]) -> list[ScreenRule]:
+    """규칙명 → 규칙 문자열 dict 일괄 컴파일"""
+    return [compile_rule(text, name) for name, text in rules.items()]
+
+
+def run_screen(rules: list[ScreenRule], ctx: ScreenContext, sort_by: str = "value") -> dict[str, pd.DataFrame]:
+    """
+    규칙별 충족 종목
+
+    Args:
+        rules: compile_rules() 결과
+        ctx: 스크리너 입력
+        sort_by: 결과 정렬 기준 스냅샷 컬럼 (내림차순)
+
+    Returns:
+        규칙명 → 충족 종목 DataFrame (티커 인덱스, 스냅샷 컬럼 + gap_pct)
+    """
+    frame = ctx.snapshot.assign(gap_pct=ctx.column("gap_pct"))
+    results = {}
+    for rule in rules:
+        hits = frame[rule.evaluate(ctx)]
+        if sort_by in hits:
+            hits = hits.sort_values(sort_by, ascending=False)
+        results[rule.name] = hits
+    return results
+
+
+def format_screen(
+    results: dict[str, pd.DataFrame],
+    top: int = 5,
+    name_of: Optional[Callable[[str], str]] = None,
+    universe: Optional[int] = None
+) -> str:
+    """
+    스크리너 결과 마크다운 (규칙별 건수 + 거래대금 상위 종목)
+
+    Args:
+        results: run_screen() 결과
+        top: 규칙별 표시 종목 수
+        name_of: 티커 → 종목명 함수 (표시 종목에만 적용)
+        universe: 대상 종목 수 (제목 표시용)
+    """
+    if not results:
+        return ""
+    name_of = name_of or (lambda ticker: ticker)
+    title = "### 전종목 스크리너" + (f" ({universe:,}종목)" if universe else "")
+    lines = [title]
+    for rule_name, hits in results.items():
+        if hits.empty:
+            lines.append(f"- **{rule_name}**: 없음")
+            continue
+        shown = []
+        for ticker, row in hits.head(top).iterrows():
+            change = row.get("change_pct")
+            shown.append(f"{name_of(str(ticker))}({change:+.1f}%)" if pd.notna(change) else name_of(str(ticker)))
+        more = f" 외 {len(hits) - top}" if len(hits) > top else ""
+        lines.append(f"- **{rule_name}** {len(hits)}종목: " + ", ".join(shown) + more)
+    return "\n".join(lines)
@@ -0,0 +1,193 @@
+"""
+업종 / 테마 지수 성과 (히트맵)
+
+계열별 전체 지수 종가(주간 기준일, 전 거래일, 당일 3개 거래일)만으로
+업종·테마 지수의 일간 / 주간 등락률과 순위를 벡터 연산으로 계산하고,
+관심 종목을 KRX 업종 분류로 해당 업종 지수에 연결합니다.
+
+업종 지수는 KRX 업종 분류의 업종명과 이름이 같은 지수만 사용하고
+(코스피200·규모별 지수 등 제외), 테마 계열은 모든 지수를 테마로 봅니다.
+"""
+import re
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+# (하한 등락률 %, 표시) 높은 구간부터. 상승 빨강 / 하락 파랑
+HEAT_LEVELS = ((2.0, "🟥"), (0.5, "🟧"), (-0.5, "⬜"), (-2.0, "🟦"))
+HEAT_BOTTOM = "🟪"
+HEAT_LEGEND = "🟥 +2% 이상 · 🟧 +0.5~2% · ⬜ ±0.5% · 🟦 -0.5~-2% · 🟪 -2% 이하"
+
+# 업종 분류가 없을 때 업종 지수에서 제외할 시장 대표 / 규모 / 파생 지수
+_BROAD = re.compile(r"^(코스피|코스닥|KRX|KOSPI|KOSDAQ)|\d|대형|중형|소형|외국주|우선주|배당|레버리지|인버스")
+
+
+def normalize_sector(name: str) -> str:
+    """지수명 / 업종명 비교용 정규화 (공백·기호, 코스피/코스닥 접두어 제거)"""
+    text = re.sub(r"[^\w]", "", str(name))
+    return re.sub(r"^(코스피|코스닥)", "", text)
+
+
+def compute_sector_performance(
+    closes: pd.DataFrame,
+    sectors: Optional[dict[str, set[str]]] = None,
+    theme_families: tuple[str, ...] = ("테마",)
+) -> pd.DataFrame:
+    """
+    업종 / 테마 지수 일간·주간 등락률과 순위
+
+    Args:
+        closes: 거래일 인덱스(주간 기준일, 전 거래일, 당일 순) × (계열, 지수명) 종가
+        sectors: 계열(시장) → 업종명 집합 (KRX 업종 분류). None이면 이름 패턴으로 대표 지수 제외
+        theme_families: 모든 지수를 테마로 보는 계열
+
+    Returns:
+        (계열, 지수명) 인덱스 DataFrame
+        columns = [kind(업종/테마), close, daily_pct, weekly_pct, daily_rank, weekly_rank]
+        순위는 kind·계열별 내림차순. 당일 종가가 없으면 빈 DataFrame
+    """
+    columns = ["kind", "close", "daily_pct", "weekly_pct", "daily_rank", "weekly_rank"]
+    if closes is None or len(closes) < 2:
+        return pd.DataFrame(columns=columns)
+
+    last, prev, week = closes.iloc[-1], closes.iloc[-2], closes.iloc[0]
+    frame = pd.DataFrame({
+        "close": last,
+        "daily_pct": (last / prev - 1) * 100,
+        "weekly_pct": (last / week - 1) * 100 if len(closes) > 2 else float("nan"),
+    }).dropna(subset=["close"])
+    if frame.empty:
+        return pd.DataFrame(columns=columns)
+
+    families = frame.index.get_level_values(0)
+    names = frame.index.get_level_values(1)
+    normalized = [normalize_sector(name) for name in names]
+    is_theme = families.isin(theme_families)
+    if sectors is not None:
+        lookup = {family: {normalize_sector(s) for s in names_} for family, names_ in sectors.items()}
+        is_sector = [key in lookup.get(family, ()) for family, key in zip(families, normalized)]
+    else:
+        is_sector = [not _BROAD.search(name) for name in names]
+
+    frame["kind"] = None
+    frame.loc[is_theme, "kind"] = "테마"
+    frame.loc[~is_theme & pd.Series(is_sector, index=frame.index), "kind"] = "업종"
+    frame = frame.dropna(subset=["kind"])
+
+    grouped = frame.groupby([frame["kind"], frame.index.get_level_values(0)])
+    frame["daily_rank"] = grouped["daily_pct"].rank(ascending=False, method="min")
+    frame["weekly_rank"] = grouped["weekly_pct"].rank(ascending=False, method="min")
+    return frame[columns].sort_values(["kind", "daily_pct"], ascending=[True, False])
+
+
+def map_to_sectors(
+    members: dict[str, tuple[str, str]],
+    performance: pd.DataFrame
+) -> dict[str, tuple[str, str]]:
+    """
+    종목 → 업종 지수 키
+
+    Args:
+        members: 종목 코드 → (시장, 업종명) (KRX 업종 분류)
+        performance: compute_sector_performance() 결과
+
+    Returns:
+        종목 코드 → (계열, 지수명). 같은 이름의 업종 지수가 없는 종목은 제외
+    """
+    sectors = performance[performance["kind"] == "업종"]
+    keys = {(family, normalize_sector(name)): (family, name) for family, name in sectors.index}
+    mapped = {}
+    for ticker, (market, sector) in members.items():
+        key = keys.get((market, normalize_sector(sector)))
+        if key:
+            mapped[ticker] = key
+    return mapped
+
+
+def heat(change: float) -> str:
+    """등락률 → 히트맵 칸"""
+    if pd.isna(change):
+        return "▫️"
+    for floor, cell in HEAT_LEVELS:
+        if change >= floor:
+            return cell
+    return HEAT_BOTTOM
+
+
+def _split(count: int, top: int) -> int:
+    """상위 / 하위 목록이 겹치지 않는 표시 개수"""
+    return max(1, min(top, count // 2))
+
+
+def format_sector_heatmap(
+    performance: pd.DataFrame,
+    watchlist: Optional[dict[str, tuple[str, str]]] = None,
+    name_of: Optional[Callable[[str], str]] = None,
+    top: int = 5,
+    per_line: int = 4,
+    families: Optional[list[str]] = None
+) -> str:
+    """
+    업종 히트맵 + 테마 상위/하위 + 관심 종목 업종 (마크다운)
+
+    Args:
+        performance: compute_sector_performance() 결과
+        watchlist: 종목 코드 → (계열, 지수명) (map_to_sectors 결과)
+        name_of: 티커 → 종목명 함수
+        top: 테마 / 주간 상위·하위 표시 개수
+        per_line: 히트맵 한 줄에 표시할 업종 수
+        families: 히트맵 계열 표시 순서 (None이면 결과 순서)
+    """
+    if performance is None or performance.empty:
+        return ""
+    name_of = name_of or (lambda ticker: ticker)
+    lines = ["### 업종·테마 히트맵", f"_{HEAT_LEGEND}_"]
+
+    sectors = performance[performance["kind"] == "업종"]
+    present = list(dict.fromkeys(sectors.index.get_level_values(0)))
+    order = [f for f in (families or []) if f in present] + [f for f in present if f not in (families or [])]
+    for family in order:
+        group = sectors.loc[[family]]
+        cells = [
+            f"{heat(row.daily_pct)} {name} {row.daily_pct:+.2f}%"
+            for (_, name), row in group.sort_values("daily_pct", ascending=False).iterrows()
+        ]
+        lines.append(f"\n**{family} 업종 ({len(cells)}개, 일간)**")
+        for i in range(0, len(cells), per_line):
+            lines.append("- " + " · ".join(cells[i:i + per_line]))
+
+    if not sectors.empty and sectors["weekly_pct"].notna().any():
+        weekly = sectors.dropna(subset=["weekly_pct"]).sort_values("weekly_pct", ascending=False)
+        n = _split(len(weekly), top)
+        fmt = lambda rows: ", ".join(f"{name}({row.weekly_pct:+.1f}%)" for (_, name), row in rows.iterrows())
+        lines.append(f"\n**주간 업종**: 강세 {fmt(weekly.head(n))} / 약세 {fmt(weekly.tail(n).iloc[::-1])}")
+
+    themes = performance[performance["kind"] == "테마"]
+    if not themes.empty:
+        fmt = lambda rows: ", ".join(
+            f"{name}({row.daily_pct:+.1f}%"
+            + (f", 주 {row.weekly_pct:+.1f}%" if pd.notna(row.weekly_pct) else "") + ")"
+            for (_, name), row in rows.iterrows()
+        )
+        ranked = themes.dropna(subset=["daily_pct"]).sort_values("daily_pct", ascending=False)
+        n = _split(len(ranked), top)
+        lines.append(f"\n**테마 ({len(themes)}개) 일간 상위**: {fmt(ranked.head(n))}")
+        lines.append(f"**테마 일간 하위**: {fmt(ranked.tail(n).iloc[::-1])}")
+
+    if watchlist:
+        total = sectors.groupby(level=0).size()
+        lines.append("\n**관심 종목 업종**")
+        for ticker, key in watchlist.items():
+            if key not in sectors.index:
+                continue
+            row = sectors.loc[key]
+            family = key[0]
+            rank = f"{row['daily_rank']:.0f}" if pd.notna(row["daily_rank"]) else "-"
+            weekly = f", 주간 {row['weekly_pct']:+.2f}%" if pd.notna(row["weekly_pct"]) else ""
+            lines.append(
+                f"- {name_of(ticker)}: {family} {key[1]} {heat(row['daily_pct'])} {row['daily_pct']:+.2f}%"
+                f"{weekly} (일간 {rank}/{total[family]}위)"
+            )
+
+    return "\n".join(lines)
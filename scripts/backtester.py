@@ -0,0 +1,174 @@
+"""
+모의투자 백테스터 (데이터 로드 + 파라미터 스윕)
+
+KrxCollector.get_market_ohlcv()로 종목별 일봉을 받아 가격 행렬로 정렬한 뒤
+analytics/backtest.py 엔진으로 분할 매수 / 손절 / 익절 규칙을 검증합니다.
+
+파라미터 스윕은 프로세스 풀로 나눠 실행합니다.
+가격 행렬은 공유 메모리(multiprocessing.shared_memory)에 한 번만 올리고
+각 워커는 복사 없이 같은 버퍼를 NumPy 배열로 참조합니다 (작업마다 전달하는 것은 파라미터뿐).
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import BACKTEST_SETTINGS, WATCHLIST_STOCKS
+from collectors import KrxCollector
+from collectors.trading_calendar import now_kst
+from analytics.backtest import (
+    PriceMatrix, StrategyParams, CostModel, BacktestResult, run_backtest, param_grid,
+)
+
+
+# 가격 행렬 필드 (공유 메모리 버퍼 = (필드 수, T, N) float64)
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+# 워커 프로세스 전역 (initializer에서 설정)
+_worker_prices: Optional[PriceMatrix] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_config: dict = {}
+
+
+def load_prices(
+    tickers: Optional[list[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    collector: Optional[KrxCollector] = None
+) -> PriceMatrix:
+    """
+    종목별 일봉 조회 → 날짜 × 종목 가격 행렬
+
+    Args:
+        tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+        start_date: 시작일 (YYYYMMDD). None이면 BACKTEST_SETTINGS["years"]년 전
+        end_date: 종료일 (YYYYMMDD). None이면 오늘
+    """
+    tickers = tickers or WATCHLIST_STOCKS
+    collector = collector or KrxCollector()
+    if start_date is None:
+        start_date = (now_kst() - timedelta(days=365 * BACKTEST_SETTINGS["years"])).strftime("%Y%m%d")
+
+    bars = {}
+    for ticker in tickers:
+        ticker_bars = collector.get_market_ohlcv(ticker, start_date=start_date, end_date=end_date)
+        if len(ticker_bars):
+            bars[ticker] = ticker_bars
+        else:
+            print(f"  [경고] {ticker} 일봉 없음 (제외)")
+    return PriceMatrix.from_bars(bars)
+
+
+def default_costs() -> CostModel:
+    return CostModel(
+        commission_rate=BACKTEST_SETTINGS["commission_rate"],
+        sell_tax_rate=BACKTEST_SETTINGS["sell_tax_rate"],
+        slippage_rate=BACKTEST_SETTINGS["slippage_rate"],
+    )
+
+
+def backtest(prices: PriceMatrix, params: StrategyParams = StrategyParams()) -> BacktestResult:
+    """설정(BACKTEST_SETTINGS) 비용/초기 자금으로 단일 백테스트"""
+    return run_backtest(prices, params, default_costs(), BACKTEST_SETTINGS["initial_cash"])
+
+
+def _attach_worker(shm_name: str, shape: tuple, dates: np.ndarray, tickers: list[str], config: dict) -> None:
+    """워커 initializer: 공유 메모리 가격 버퍼를 복사 없이 참조"""
+    global _worker_prices, _worker_shm, _worker_config
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf)
+    block.flags.writeable = False
+    _worker_prices = PriceMatrix(dates=dates, tickers=tickers, **dict(zip(PRICE_FIELDS, block)))
+    _worker_config = config
+
+
+def _run_worker(params: StrategyParams) -> dict:
+    return run_backtest(
+        _worker_prices, params, _worker_config["costs"], _worker_config["initial_cash"]
+    ).summary()
+
+
+def run_sweep(
+    prices: PriceMatrix,
+    grid: list[StrategyParams],
+    workers: Optional[int] = None
+) -> list[dict]:
+    """
+    파라미터 조합별 백테스트 (프로세스 풀, 가격 행렬은 공유 메모리)
+
+    Args:
+        prices: 가격 행렬
+        grid: 파라미터 조합 목록 (param_grid 참고)
+        workers: 프로세스 수. None이면 BACKTEST_SETTINGS["workers"] (0이면 CPU 수)
+
+    Returns:
+        조합별 summary dict 리스트 (샤프 지수 내림차순)
+    """
+    workers = workers if workers is not None else BACKTEST_SETTINGS["workers"]
+    workers = min(workers or os.cpu_count() or 1, len(grid))
+    config = {"costs": default_costs(), "initial_cash": BACKTEST_SETTINGS["initial_cash"]}
+
+    if workers <= 1:
+        results = [run_backtest(prices, params, config["costs"], config["initial_cash"]).summary() for params in grid]
+    else:
+        shape = (len(PRICE_FIELDS), *prices.shape)
+        shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+        try:
+            block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            for i, name in enumerate(PRICE_FIELDS):
+                block[i] = getattr(prices, name)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_worker,
+                initargs=(shm.name, shape, prices.dates, prices.tickers, config),
+            ) as pool:
+                results = list(pool.map(_run_worker, grid, chunksize=max(len(grid) // (workers * 4), 1)))
+            del block
+        finally:
+            shm.close()
+            shm.unlink()
+
+    return sorted(results, key=lambda row: row["sharpe"], reverse=True)
+
+
+def default_grid() -> list[StrategyParams]:
+    """BACKTEST_SETTINGS["sweep"] 조합"""
+    return param_grid(StrategyParams(), **BACKTEST_SETTINGS["sweep"])
+
+
+def format_sweep(results: list[dict], top: int = 10) -> str:
+    """스윕 결과 상위 조합 표 (콘솔 출력용)"""
+    if not results:
+        return "결과가 없습니다."
+    lines = [
+        f"{'진입MA':>6} {'청산MA':>6} {'분할':>4} {'손절%':>6} {'익절%':>6} | "
+        f"{'수익률%':>8} {'MDD%':>8} {'샤프':>6} {'거래':>5} {'승률%':>6}"
+    ]
+    for row in results[:top]:
+        lines.append(
+            f"{row['entry_window']:>6} {row['exit_window']:>6} {row['splits']:>4} "
+            f"{row['stop_loss_pct']:>6g} {row['take_profit_pct']:>6g} | "
+            f"{row['return_pct']:>+8.2f} {row['mdd_pct']:>8.2f} {row['sharpe']:>6.2f} "
+            f"{row['trades']:>5} {row['win_rate_pct']:>6.1f}"
+        )
+    return "\n".join(lines)
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    from analytics.backtest import format_backtest
+
+    prices = load_prices()
+    print(f"가격 행렬: {prices.shape[0]}거래일 × {prices.shape[1]}종목")
+    print("\n=== 기본 규칙 ===")
+    print(format_backtest(backtest(prices), prices.tickers))
+    print("\n=== 파라미터 스윕 ===")
+    print(format_sweep(run_sweep(prices, default_grid())))
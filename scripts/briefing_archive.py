@@ -0,0 +1,430 @@
+"""
+브리핑 아카이브 인덱스
+
+notes/daily_briefing/의 마크다운 브리핑에서 수치(지수, 환율/금리, 시장 내부 지표,
+관심 종목 시세)를 추출해 SQLite(data/briefings.sqlite3)에 저장합니다.
+- 브리핑 저장 시점에 바로 색인, 기존 파일은 sync()로 변경분만 백필
+- "최근 20회 원/달러", "종목별 ±3% 등락 횟수" 같은 추이 조회를 파일 재파싱 없이 처리
+- 브리핑 본문에 "전주 대비" 비교 섹션 제공
+- 기간 조회(quote_frame / metric_frame / disclosures_between)로 주간/월간 리포트 집계
+"""
+import re
+import sys
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR, RESULTS_DIR, BRIEFING_SETTINGS
+from collectors.ecos_collector import EcosCollector
+from collectors.trading_calendar import today_kst
+
+
+# 브리핑 표시명 → 지표 키
+METRIC_LABELS = {
+    "KOSPI": "kospi",
+    "KOSDAQ": "kosdaq",
+    **{label: key for key, (_, _, label) in EcosCollector.INDICATORS.items()},
+    "미국 기준금리(FF)": "fed_funds",
+    "미국 10년물 국채": "us10y",
+}
+METRIC_NAMES = {key: label for label, key in METRIC_LABELS.items()}
+
+# 파일명 접미사 → 브리핑 유형 (초기 "마켓브리핑"은 유형 구분 전 일일 브리핑)
+FILE_TYPES = {settings["file_suffix"]: name for name, settings in BRIEFING_SETTINGS.items()}
+FILE_TYPES["마켓브리핑"] = "market"
+
+_NUM = r"[+-]*[\d,]+(?:\.\d+)?"
+_FILENAME = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.+)\.md$")
+_INDEX = re.compile(rf"^- \*\*(KOSPI|KOSDAQ)\*\*: ({_NUM}) \(({_NUM}), ({_NUM})%\)")
+_MACRO = re.compile(rf"^- \*\*([^*]+)\*\*: ({_NUM})(?:%|원)(?: \(({_NUM})(?:%p|원)\))?")
+_QUOTE = re.compile(
+    rf"^- \*\*([^*]+)\*\* \((\d{{6}})\): ({_NUM})원 \(({_NUM}), ({_NUM})%\) "
+    rf"\| 고가 ({_NUM}) / 저가 ({_NUM})(?: \(스프레드 ({_NUM})%\))? \| 거래량: ({_NUM})"
+)
+_BREADTH = re.compile(rf"^- \*\*상승/하락/보합\*\*: ({_NUM}) / ({_NUM}) / ({_NUM})")
+_LIMITS = re.compile(rf"^- \*\*상한가/하한가\*\*: ({_NUM}) / ({_NUM})")
+_VALUE = re.compile(rf"^- \*\*전체 거래대금\*\*: ({_NUM})억원")
+_DISCLOSURES = re.compile(rf"전체 공시 ({_NUM})건")
+# 공시 섹션 항목: "- **회사** [유형] 보고서명 (날짜)" 또는 구버전 "- **회사**: 보고서명 (날짜)"
+_DISCLOSURE_ITEM = re.compile(r"^- \*\*([^*]+)\*\*(?::| \[[^\]]+\]) (.+?)(?:\s+\((\d{4}-\d{2}-\d{2})\))?$")
+
+# 스키마 버전 (파싱 항목이 늘면 올려서 기존 파일을 다시 색인)
+SCHEMA_VERSION = 2
+
+
+def _num(text: Optional[str]) -> Optional[float]:
+    if text is None:
+        return None
+    text = text.replace(",", "")
+    # 구버전 국고채 표기 "++0.012%p" 보정
+    sign = -1 if text.startswith("-") else 1
+    return sign * float(text.lstrip("+-"))
+
+
+def parse_briefing(text: str) -> tuple[dict[str, float], list[dict], list[dict]]:
+    """
+    브리핑 마크다운에서 수치 / 공시 추출
+
+    Returns:
+        (지표 키 → 값, 관심 종목 시세 리스트, 공시 리스트)
+        지표 키 예: kospi, kospi.change_pct, usd_krw, usd_krw.change, advancers, disclosures_all
+        공시: corp_name, report_nm, rcept_dt (본문에 날짜가 없으면 빈 문자열)
+    """
+    metrics: dict[str, float] = {}
+    quotes: list[dict] = []
+    disclosures: list[dict] = []
+    in_disclosures = False
+
+    for line in text.splitlines():
+        if line.startswith("## "):
+            in_disclosures = "공시" in line
+            continue
+        if not line.startswith("- ") and "전체 공시" not in line:
+            continue
+
+        if in_disclosures and (m := _DISCLOSURE_ITEM.match(line)):
+            corp_name, report_nm, rcept_dt = m.groups()
+            disclosures.append({
+                "corp_name": corp_name, "report_nm": report_nm.strip(), "rcept_dt": rcept_dt or "",
+            })
+        elif m := _QUOTE.match(line):
+            name, ticker, close, change, pct, high, low, spread, volume = m.groups()
+            quotes.append({
+                "ticker": ticker, "name": name, "close": _num(close), "change_amt": _num(change),
+                "change_pct": _num(pct), "high": _num(high), "low": _num(low),
+                "spread_pct": _num(spread), "volume": _num(volume),
+            })
+        elif m := _INDEX.match(line):
+            key = METRIC_LABELS[m.group(1)]
+            metrics[key] = _num(m.group(2))
+            metrics[f"{key}.change"] = _num(m.group(3))
+            metrics[f"{key}.change_pct"] = _num(m.group(4))
+        elif m := _BREADTH.match(line):
+            metrics["advancers"], metrics["decliners"], metrics["unchanged"] = map(_num, m.groups())
+        elif m := _LIMITS.match(line):
+            metrics["limit_up"], metrics["limit_down"] = map(_num, m.groups())
+        elif m := _VALUE.match(line):
+            metrics["total_value"] = _num(m.group(1))
+        elif (m := _MACRO.match(line)) and m.group(1) in METRIC_LABELS:
+            key = METRIC_LABELS[m.group(1)]
+            metrics.setdefault(key, _num(m.group(2)))
+            if m.group(3) is not None:
+                metrics.setdefault(f"{key}.change", _num(m.group(3)))
+        elif m := _DISCLOSURES.search(line):
+            metrics.setdefault("disclosures_all", _num(m.group(1)))
+
+    return metrics, quotes, disclosures
+
+
+class BriefingArchive:
+    """SQLite 기반 브리핑 수치 인덱스"""
+
+    def __init__(self, path: Path = DATA_DIR / "briefings.sqlite3", directory: Path = RESULTS_DIR):
+        """
+        Args:
+            path: 인덱스 SQLite 파일
+            directory: 브리핑 마크다운 폴더 (백필 대상)
+        """
+        self.path = path
+        self.directory = directory
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS briefings (
+                id INTEGER PRIMARY KEY,
+                file TEXT NOT NULL UNIQUE,
+                date TEXT NOT NULL,
+                type TEXT NOT NULL,
+                mtime REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS briefings_date ON briefings (date, type);
+            CREATE TABLE IF NOT EXISTS metrics (
+                briefing_id INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (briefing_id, key)
+            );
+            CREATE INDEX IF NOT EXISTS metrics_key ON metrics (key);
+            CREATE TABLE IF NOT EXISTS quotes (
+                briefing_id INTEGER NOT NULL,
+                ticker TEXT NOT NULL,
+                name TEXT NOT NULL,
+                close REAL, change_amt REAL, change_pct REAL,
+                high REAL, low REAL, spread_pct REAL, volume REAL,
+                PRIMARY KEY (briefing_id, ticker)
+            );
+            CREATE INDEX IF NOT EXISTS quotes_ticker ON quotes (ticker);
+            CREATE TABLE IF NOT EXISTS disclosures (
+                briefing_id INTEGER NOT NULL,
+                corp_name TEXT NOT NULL,
+                report_nm TEXT NOT NULL,
+                rcept_dt TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS disclosures_briefing ON disclosures (briefing_id);
+            """
+        )
+        conn = self._connect()
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # 이전 버전으로 색인한 파일은 다음 sync()에서 전부 다시 파싱
+            conn.executescript(
+                "DELETE FROM metrics; DELETE FROM quotes; DELETE FROM disclosures; DELETE FROM briefings;"
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def ingest(self, filepath: Path, text: Optional[str] = None) -> bool:
+        """
+        브리핑 파일 1건 색인 (같은 파일은 덮어씀)
+
+        Args:
+            filepath: 브리핑 파일 경로 (파일명에서 날짜/유형 결정)
+            text: 파일 내용 (None이면 파일에서 읽음)
+
+        Returns:
+            색인 여부. 브리핑 파일명 형식이 아니면 False
+        """
+        filepath = Path(filepath)
+        m = _FILENAME.match(filepath.name)
+        if not m:
+            return False
+        day, suffix = m.groups()
+        if text is None:
+            text = filepath.read_text(encoding="utf-8")
+        metrics, quotes, disclosures = parse_briefing(text)
+
+        conn = self._connect()
+        # 성공 시에만 COMMIT, 예외 시 ROLLBACK (반쯤 쓴 배치를 남기지 않음)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT id FROM briefings WHERE file = ?", (filepath.name,)).fetchone()
+            if row:
+                conn.execute("DELETE FROM metrics WHERE briefing_id = ?", row)
+                conn.execute("DELETE FROM quotes WHERE briefing_id = ?", row)
+                conn.execute("DELETE FROM disclosures WHERE briefing_id = ?", row)
+                conn.execute("DELETE FROM briefings WHERE id = ?", row)
+            briefing_id = conn.execute(
+                "INSERT INTO briefings (file, date, type, mtime) VALUES (?, ?, ?, ?)",
+                (filepath.name, day, FILE_TYPES.get(suffix, suffix), filepath.stat().st_mtime),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO metrics (briefing_id, key, value) VALUES (?, ?, ?)",
+                [(briefing_id, key, value) for key, value in metrics.items() if value is not None],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO quotes VALUES "
+                "(:briefing_id, :ticker, :name, :close, :change_amt, :change_pct, "
+                ":high, :low, :spread_pct, :volume)",
+                [{"briefing_id": briefing_id, **quote} for quote in quotes],
+            )
+            conn.executemany(
+                "INSERT INTO disclosures (briefing_id, corp_name, report_nm, rcept_dt) "
+                "VALUES (?, ?, ?, ?)",
+                [(briefing_id, d["corp_name"], d["report_nm"], d["rcept_dt"] or day) for d in disclosures],
+            )
+        return True
+
+    def sync(self) -> int:
+        """
+        브리핑 폴더의 신규/변경 파일만 색인 (백필)
+
+        Returns:
+            색인한 파일 수
+        """
+        if not self.directory.exists():
+            return 0
+        known = dict(self._connect().execute("SELECT file, mtime FROM briefings").fetchall())
+        count = 0
+        for filepath in sorted(self.directory.glob("*.md")):
+            if known.get(filepath.name) != filepath.stat().st_mtime and self.ingest(filepath):
+                count += 1
+        return count
+
+    # ----- 조회 -----
+
+    def series(self, key: str, briefing_type: Optional[str] = None, last: int = 20) -> list[tuple]:
+        """
+        지표 추이 (오래된 순)
+
+        Args:
+            key: 지표 키 (예: usd_krw, kospi.change_pct)
+            briefing_type: 브리핑 유형 필터 (None이면 전체)
+            last: 최근 몇 회
+
+        Returns:
+            (날짜, 브리핑 유형, 값) 리스트
+        """
+        type_clause = "AND b.type = ?" if briefing_type else ""
+        params = (key, briefing_type, last) if briefing_type else (key, last)
+        rows = self._connect().execute(
+            "SELECT b.date, b.type, m.value FROM metrics m JOIN briefings b ON b.id = m.briefing_id "
+            f"WHERE m.key = ? {type_clause} ORDER BY b.date DESC, b.id DESC LIMIT ?",
+            params,
+        ).fetchall()
+        return rows[::-1]
+
+    def ticker_history(self, ticker: str, last: int = 20) -> list[dict]:
+        """관심 종목 시세 추이 (오래된 순, 같은 날은 마지막 브리핑 기준)"""
+        rows = self._connect().execute(
+            "SELECT b.date, b.type, q.name, q.close, q.change_pct, q.spread_pct, q.volume "
+            "FROM quotes q JOIN briefings b ON b.id = q.briefing_id "
+            "WHERE q.ticker = ? AND b.id = ("
+            "  SELECT MAX(b2.id) FROM briefings b2 JOIN quotes q2 ON q2.briefing_id = b2.id "
+            "  WHERE b2.date = b.date AND q2.ticker = q.ticker) "
+            "ORDER BY b.date DESC LIMIT ?",
+            (ticker, last),
+        ).fetchall()
+        keys = ["date", "type", "name", "close", "change_pct", "spread_pct", "volume"]
+        return [dict(zip(keys, row)) for row in rows[::-1]]
+
+    def count_moves(self, threshold: float = 3.0, days: int = 30) -> list[tuple]:
+        """
+        종목별 ±threshold% 이상 등락 일수 (같은 날 여러 브리핑은 1일로 집계)
+
+        Returns:
+            (종목 코드, 종목명, 일수) 리스트 (일수 내림차순)
+        """
+        since = (today_kst() - timedelta(days=days)).isoformat()
+        return self._connect().execute(
+            "SELECT q.ticker, MAX(q.name), COUNT(DISTINCT b.date) "
+            "FROM quotes q JOIN briefings b ON b.id = q.briefing_id "
+            "WHERE b.date >= ? AND ABS(q.change_pct) >= ? "
+            "GROUP BY q.ticker ORDER BY 3 DESC",
+            (since, threshold),
+        ).fetchall()
+
+    def value_before(self, key: str, day: str, briefing_type: Optional[str] = None) -> Optional[tuple]:
+        """day 이전(포함) 가장 최근 브리핑의 지표 값 → (날짜, 값)"""
+        type_clause = "AND b.type = ?" if briefing_type else ""
+        params = (key, day, briefing_type) if briefing_type else (key, day)
+        return self._connect().execute(
+            "SELECT b.date, m.value FROM metrics m JOIN briefings b ON b.id = m.briefing_id "
+            f"WHERE m.key = ? AND b.date <= ? {type_clause} ORDER BY b.date DESC, b.id DESC LIMIT 1",
+            params,
+        ).fetchone()
+
+    def quote_frame(self, start: str, end: str) -> pd.DataFrame:
+        """
+        기간 내 관심 종목 일별 시세 (같은 날은 마지막 브리핑 기준)
+
+        Args:
+            start, end: 기간 (YYYY-MM-DD, 양끝 포함)
+
+        Returns:
+            date, type, ticker, name, close, change_pct, high, low, volume 컬럼 DataFrame (날짜순)
+        """
+        frame = pd.read_sql_query(
+            "SELECT b.date, b.type, b.id, q.ticker, q.name, q.close, q.change_pct, q.high, q.low, q.volume "
+            "FROM quotes q JOIN briefings b ON b.id = q.briefing_id "
+            "WHERE b.date BETWEEN ? AND ? ORDER BY b.date, b.id",
+            self._connect(), params=(start, end),
+        )
+        frame = frame.drop_duplicates(["date", "ticker"], keep="last")
+        return frame.drop(columns="id").reset_index(drop=True)
+
+    def metric_frame(self, start: str, end: str, keys: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        기간 내 지표 값 (브리핑 순)
+
+        Args:
+            start, end: 기간 (YYYY-MM-DD, 양끝 포함)
+            keys: 지표 키 목록 (None이면 전체)
+
+        Returns:
+            date, type, key, value 컬럼 DataFrame (long 형식, 브리핑 작성 순)
+        """
+        key_clause = f"AND m.key IN ({','.join('?' * len(keys))})" if keys else ""
+        return pd.read_sql_query(
+            "SELECT b.date, b.type, m.key, m.value FROM metrics m JOIN briefings b ON b.id = m.briefing_id "
+            f"WHERE b.date BETWEEN ? AND ? {key_clause} ORDER BY b.date, b.id",
+            self._connect(), params=(start, end, *(keys or [])),
+        )
+
+    def disclosures_between(self, start: str, end: str) -> list[dict]:
+        """
+        기간 내 브리핑에 실린 공시 (여러 브리핑에 반복된 공시는 1건)
+
+        Returns:
+            corp_name, report_nm, rcept_dt dict 리스트 (접수일순)
+        """
+        rows = self._connect().execute(
+            "SELECT DISTINCT d.corp_name, d.report_nm, d.rcept_dt "
+            "FROM disclosures d JOIN briefings b ON b.id = d.briefing_id "
+            "WHERE b.date BETWEEN ? AND ? AND d.rcept_dt BETWEEN ? AND ? "
+            "ORDER BY d.rcept_dt",
+            (start, end, start, end),
+        ).fetchall()
+        keys = ["corp_name", "report_nm", "rcept_dt"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def format_comparison(self, text: str, day: str, briefing_type: str) -> str:
+        """
+        브리핑 본문 수치의 전주 대비 변화 (브리핑 삽입용)
+
+        Args:
+            text: 현재 브리핑 마크다운
+            day: 브리핑 날짜 (YYYY-MM-DD)
+            briefing_type: 브리핑 유형 (같은 유형의 1주 전 브리핑과 비교)
+
+        Returns:
+            마크다운 문자열. 비교할 과거 데이터가 없으면 빈 문자열
+        """
+        metrics, _, _ = parse_briefing(text)
+        week_ago = (datetime.strptime(day, "%Y-%m-%d").date() - timedelta(days=7)).isoformat()
+
+        lines = []
+        for key, label in METRIC_NAMES.items():
+            if key not in metrics:
+                continue
+            past = self.value_before(key, week_ago, briefing_type)
+            if past is None:
+                continue
+            past_day, past_value = past
+            diff = metrics[key] - past_value
+            if key in ("kospi", "kosdaq") or key.endswith("_krw"):
+                pct = (metrics[key] / past_value - 1) * 100 if past_value else 0.0
+                lines.append(f"- **{label}**: {past_value:,.2f} → {metrics[key]:,.2f} ({pct:+.2f}%, {past_day} 대비)")
+            else:
+                digits = 2 if key in ("base_rate", "fed_funds") else 3
+                lines.append(
+                    f"- **{label}**: {past_value:.{digits}f}% → {metrics[key]:.{digits}f}% "
+                    f"({diff:+.{digits}f}%p, {past_day} 대비)"
+                )
+
+        if not lines:
+            return ""
+        return "### 전주 대비\n" + "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def get_archive() -> BriefingArchive:
+    """프로세스 공용 브리핑 아카이브"""
+    return BriefingArchive()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    archive = get_archive()
+    print(f"색인: {archive.sync()}건 (신규/변경)")
+    print("\n=== 원/달러 최근 20회 ===")
+    for day, kind, value in archive.series("usd_krw"):
+        print(f"{day} {kind}: {value:,.1f}")
+    print("\n=== 최근 30일 ±3% 등락 일수 ===")
+    for ticker, name, days in archive.count_moves():
+        print(f"{name}({ticker}): {days}일")
@@ -8,19 +8,34 @@
 """
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import Optional
 
+import pandas as pd
+
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import (
-    OPENAI_API_KEY, RESULTS_DIR, BRIEFING_SETTINGS,
+    OPENAI_API_KEY, RESULTS_DIR, BRIEFING_SETTINGS, CORRELATION_SETTINGS, SECTOR_SETTINGS, COLLECT_TIMEOUTS,
+    WATCHLIST_STOCKS, NEWS_RSS_FEEDS, PROFILE_RENDER_WORKERS,
     AI_ENABLED, AI_MODEL, AI_MAX_TOKENS, AI_TEMPERATURE,
 )
-from collectors import DartCollector, KrxCollector, EcosCollector, NewsCollector
+from collectors import (
+    DartCollector, KrxCollector, EcosCollector, NewsCollector, IntradayCollector, CrossAssetCollector,
+    SectorCollector, Quote,
+)
+from collectors.records import frame_to_records
+from collectors.trading_calendar import get_calendar, now_kst, today_kst
+from analytics import compute_market_breadth, format_market_breadth
+from analytics.indicators import format_indicators
+from briefing_archive import get_archive
+from briefing_sinks import get_publisher
+from profiles import BriefingProfile, drop_empty_sections, matches_keywords, union_tickers
+from screener import screen, format_for_briefing as format_screener
 
 # AI 분석용 시스템 프롬프트
 AI_SYSTEM_PROMPT = """당신은 한국 주식시장 전문 애널리스트입니다.
@@ -30,7 +45,9 @@ AI_SYSTEM_PROMPT = """당신은 한국 주식시장 전문 애널리스트입니
 1. 객관적 데이터 기반 분석 (감정적 표현 지양)
 2. 국내 시장뿐 아니라 글로벌 매크로(미국 금리, 달러 강세/약세, 유가 등)와 국내 시장의 연관성을 반드시 짚어주세요
 3. 뉴스에서 주요 정책 발표, 정치 이벤트, 외교/회담, 중앙은행 발언 등을 포착해 시장 영향력을 평가하세요
-4. 관심 종목 분석 시 반드시 데이터(등락률, 고가/저가, 거래량)를 근거로 서술하세요
+4. 관심 종목 분석 시 반드시 데이터(등락률, 고가/저가, 거래량)를 근거로 서술하고,
+   추세는 기술적 지표(이동평균 대비 위치, RSI, 볼린저 %B, ATR, 거래량 z-score)로 뒷받침하세요.
+   환율·금리 민감도(상관/베타)가 달라진 종목은 그 변화를 매크로 흐름과 연결해 짚어주세요
 5. 면책 조항이나 "투자 판단은 본인 책임" 같은 문구는 절대 포함하지 마세요 (별도로 추가됨)
 
 ## 절대 금지 표현
@@ -123,42 +140,176 @@ AI_AFTERMARKET_PROMPT = """아래는 오늘 애프터 마켓 브리핑을 위해
 간결하게 핵심만 작성해주세요."""
 
 
+def resolve_dates(briefing_type: str, today: Optional[date] = None) -> tuple[date, int]:
+    """
+    브리핑 유형별 KRX 기준 거래일과 공시 조회 기간
+
+    Args:
+        briefing_type: "morning", "midday", 또는 "aftermarket"
+        today: 기준일. None이면 오늘
+
+    Returns:
+        (KRX 기준 거래일, 공시 조회 days_back)
+    """
+    # KRX 대상 거래일 결정 (월요일 모닝 → 직전 금요일, 휴장일 → 직전 거래일)
+    calendar = get_calendar()
+    today = today or today_kst()
+    if briefing_type == "morning":
+        krx_session = calendar.previous_session(today)
+    else:  # midday, aftermarket
+        krx_session = calendar.session_on_or_before(today)
+
+    # 전일 공시는 직전 거래일부터 (주말/연휴 공시 포함)
+    dart_days_back = (today - krx_session).days if BRIEFING_SETTINGS[briefing_type]["days_back"] else 0
+    return krx_session, dart_days_back
+
+
+def describe_plan(briefing_type: str, tickers: Optional[list[str]] = None) -> str:
+    """
+    브리핑 유형별 수집 계획과 예상 외부 호출 수 (실제 호출 없이)
+
+    Args:
+        briefing_type: "morning", "midday", 또는 "aftermarket"
+        tickers: 수집 종목 (프로필 관심 종목 합집합). None이면 WATCHLIST_STOCKS
+
+    Returns:
+        콘솔 출력용 문자열
+    """
+    settings = BRIEFING_SETTINGS[briefing_type]
+    plan = settings["plan"]
+    krx_session, dart_days_back = resolve_dates(briefing_type)
+    watchlist = len(tickers if tickers is not None else WATCHLIST_STOCKS)
+
+    lines = [
+        f"[{settings['title']}] 수집 계획",
+        f"  KRX 기준 거래일: {krx_session} | 공시 조회: 최근 {dart_days_back}일",
+    ]
+    total = 0
+
+    if "dart" in plan:
+        calls = watchlist + (1 if plan["dart"].get("count_all") else 0)
+        detail = f"관심 종목 공시 목록 x {watchlist}"
+        if plan["dart"].get("count_all"):
+            detail += " + 전체 공시 목록 1"
+        lines.append(f"  - dart: {detail} = {calls}회")
+        total += calls
+
+    if "krx" in plan:
+        krx_plan = plan["krx"]
+        calls = 2 + watchlist
+        detail = f"지수 OHLCV 2 + 관심 종목 OHLCV x {watchlist}"
+        if krx_plan.get("breadth"):
+            bulk = 2 if krx_plan.get("market_cap") else 1
+            calls += bulk
+            detail += f" + 전종목 스냅샷 {bulk}" + (" (시세+시총)" if bulk == 2 else " (시세)")
+        if krx_plan.get("universe") and krx_plan.get("breadth"):
+            detail += " (전종목 스냅샷은 data/universe/ 행렬에 기록)"
+        if krx_plan.get("screener") and krx_plan.get("breadth"):
+            detail += " (스크리너는 같은 스냅샷으로 실행)"
+        if krx_plan.get("sectors"):
+            families = len(SECTOR_SETTINGS["families"])
+            calls += families
+            detail += f" + 업종/테마 지수 계열별 bulk {families} (저장소에 없는 거래일만, 업종 분류는 월 1회)"
+        if krx_plan.get("indicators"):
+            detail += " (기술적 지표는 조회한 일봉으로 증분 갱신, 상태 없는 종목만 이력 재조회)"
+        lines.append(f"  - krx: {detail} = {calls}회 (휴장 시 재조회 제외)")
+        total += calls
+
+    if "ecos" in plan:
+        keys = plan["ecos"]
+        ecos_keys = [k for k in keys if k in EcosCollector.INDICATORS]
+        fred_keys = [k for k in keys if k in EcosCollector.US_SERIES]
+        if ecos_keys:
+            lines.append(f"  - ecos: {', '.join(ecos_keys)} = {len(ecos_keys)}회 (data/ecos.sqlite3 마지막 관측 이후만)")
+        if fred_keys:
+            lines.append(f"  - fred: {', '.join(fred_keys)} = {len(fred_keys)}회")
+        total += len(ecos_keys) + len(fred_keys)
+
+    if "news" in plan:
+        lines.append(f"  - news: RSS 피드 x {len(NEWS_RSS_FEEDS)} = {len(NEWS_RSS_FEEDS)}회 (최근 {settings['news_max_hours']}시간)")
+        total += len(NEWS_RSS_FEEDS)
+
+    if "intraday" in plan:
+        lines.append("  - intraday: 장중 스냅샷 (메모리/디스크, 외부 호출 없음)")
+
+    if "correlation" in plan:
+        factors = CORRELATION_SETTINGS["factors"]
+        macro = [k for k in factors if k != "kospi"]
+        calls = watchlist + (1 if "kospi" in factors else 0) + len(macro)
+        lines.append(
+            f"  - correlation: 종가 x {watchlist} + 지수/환율·금리 {len(factors)} = {calls}회 "
+            f"(data/correlation.npz 이후 거래일만, 상태 없으면 {CORRELATION_SETTINGS['long_window']}거래일 재적재)"
+        )
+        total += calls
+
+    skipped = [name for name in ("dart", "krx", "ecos", "news", "intraday", "correlation") if name not in plan]
+    if skipped:
+        lines.append(f"  (생략: {', '.join(skipped)})")
+    lines.append(f"  예상 외부 호출: 약 {total}회")
+    return "\n".join(lines)
+
+
 class BriefingGenerator:
     """일일 마켓 브리핑 생성기"""
 
-    def __init__(self):
+    def __init__(self, intraday: Optional[IntradayCollector] = None):
+        """
+        Args:
+            intraday: 장중 스냅샷을 수집 중인 IntradayCollector (미드데이 브리핑용).
+                None이면 디스크에 저장된 당일 스냅샷을 사용
+        """
         # 데이터 수집기 초기화
         self.dart = DartCollector()
         self.krx = KrxCollector()
         self.ecos = EcosCollector()
         self.news = NewsCollector()
+        self.cross_asset = CrossAssetCollector(krx=self.krx, ecos=self.ecos)
+        self.sectors = SectorCollector(krx=self.krx)
+        self.intraday = intraday
+        self._names: dict[str, str] = {}
+
+    def watchlist_names(self, tickers: Optional[list[str]] = None) -> dict[str, str]:
+        """
+        관심 종목 코드 → 종목명 (뉴스 인덱스 언급 종목 기록 / AI 컨텍스트용)
+
+        Args:
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+        """
+        tickers = tickers if tickers is not None else WATCHLIST_STOCKS
+        for ticker in tickers:
+            if ticker not in self._names:
+                self._names[ticker] = self.krx.get_ticker_name(ticker)
+        return {ticker: self._names[ticker] for ticker in tickers}
 
-    def collect_all_data(self, briefing_type: str = "aftermarket") -> dict:
+    def collect_all_data(self, briefing_type: str = "aftermarket", tickers: Optional[list[str]] = None) -> dict:
         """
         모든 데이터 수집 (ThreadPoolExecutor 병렬 실행)
 
+        섹션마다 포맷팅 결과("formatted")와 함께 원자료("raw")를 남겨
+        프로필 브리핑이 재조회 없이 종목 / 키워드별로 다시 포맷팅할 수 있게 합니다.
+
         Args:
             briefing_type: "morning", "midday", 또는 "aftermarket"
+            tickers: 수집 종목 (프로필 관심 종목 합집합). None이면 WATCHLIST_STOCKS
 
         Returns:
             수집된 데이터 dict
         """
         settings = BRIEFING_SETTINGS[briefing_type]
+        plan = settings["plan"]
+        tickers = list(tickers) if tickers is not None else list(WATCHLIST_STOCKS)
         data = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date": now_kst().strftime("%Y-%m-%d"),
+            "timestamp": now_kst().strftime("%Y-%m-%d %H:%M:%S"),
             "briefing_type": briefing_type,
+            "tickers": tickers,
             "sections": {}
         }
 
-        # KRX 대상 날짜 결정
-        if briefing_type == "morning":
-            yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
-            krx_target_date = yesterday
-        else:  # midday, aftermarket
-            krx_target_date = datetime.now().strftime("%Y%m%d")
+        krx_session, dart_days_back = resolve_dates(briefing_type)
+        krx_target_date = krx_session.strftime("%Y%m%d")
+        data["krx_date"] = krx_session.strftime("%Y-%m-%d")
 
-        dart_days_back = settings["days_back"]
         news_hours = settings["news_max_hours"]
         max_news = settings["max_news"]
 
@@ -166,64 +317,209 @@ class BriefingGenerator:
         def fetch_dart():
             if not self.dart.is_available():
                 return {"formatted": "DART API 키가 설정되지 않았습니다."}
-            disclosures = self.dart.get_recent_disclosures(days_back=dart_days_back)
-            watchlist_disc = self.dart.get_watchlist_disclosures(days_back=dart_days_back)
-            return {
-                "all_disclosures": len(disclosures),
-                "watchlist_disclosures": watchlist_disc,
-                "formatted": self.dart.format_for_briefing(watchlist_disc)
-            }
+            watchlist_disc = self.dart.get_watchlist_disclosures(days_back=dart_days_back, tickers=tickers)
+            raw = {"watchlist": watchlist_disc, "market": None}
+            result = {"watchlist_disclosures": watchlist_disc, "raw": raw}
+            # 전체 공시 목록은 유형별 건수/주요 공시 표시가 필요한 브리핑에서만 조회
+            if plan["dart"].get("count_all"):
+                disclosures = self.dart.get_recent_disclosures(days_back=dart_days_back)
+                result["all_disclosures"] = len(disclosures)
+                raw["market"] = self.dart.format_market_for_briefing(disclosures)
+            result["formatted"] = self._format_dart(raw, max_items=settings["max_disclosures"])
+            return result
 
         def fetch_krx():
             if not self.krx.is_available():
                 return {"formatted": "PyKRX가 설치되지 않았습니다."}
+            # 지수/관심 종목은 한 번만 조회하고 포맷팅에 재사용
+            summary = self.krx.get_market_summary(target_date=krx_target_date)
+            history = self.krx.get_watchlist_history(tickers=tickers, target_date=krx_target_date)
+            watchlist = self.krx.compute_watchlist_frame(history)
+            raw = {"summary": summary, "watchlist": watchlist, "indicators": None, "market": [], "sectors": None}
+            if plan["krx"].get("indicators"):
+                # 같은 일봉 이력으로 지표 상태 갱신 (새 봉만 O(1) 반영)
+                raw["indicators"] = self.krx.get_watchlist_indicators(history, target_date=krx_target_date)
+            result = {
+                "market_summary": summary,
+                "watchlist": frame_to_records(watchlist, Quote),
+                "raw": raw,
+            }
+            if plan["krx"].get("breadth"):
+                # 시장 내부 지표: 전종목 bulk 스냅샷 1건으로 계산 (시총 상위는 market_cap 시에만)
+                snapshot = self.krx.get_latest_market_snapshot(
+                    target_date=krx_target_date, with_cap=plan["krx"].get("market_cap", True)
+                )
+                breadth = compute_market_breadth(snapshot, name_of=self.krx.get_ticker_name)
+                if plan["krx"].get("universe"):
+                    # 장 마감 시세 스냅샷을 전종목 행렬에 1행으로 기록
+                    self.krx.update_universe(snapshot)
+                result["breadth"] = {k: v for k, v in breadth.items() if not isinstance(v, pd.DataFrame)}
+                raw["market"].append(format_market_breadth(breadth))
+                if plan["krx"].get("screener") and not snapshot.empty:
+                    # 같은 스냅샷 + 전종목 행렬 이력으로 규칙 일괄 적용 (추가 조회 없음)
+                    hits, ctx = screen(snapshot)
+                    result["screener"] = {name: list(frame.index) for name, frame in hits.items()}
+                    section = format_screener(hits, ctx, name_of=self.krx.get_ticker_name)
+                    if section:
+                        raw["market"].append(section)
+            result["formatted"] = self._format_krx(raw)
+            return result
+
+        def fetch_sectors():
+            # 업종/테마 지수: 계열별 bulk 1회 (저장소에 있는 거래일은 재조회 없음)
+            # 별도 작업으로 krx와 동시에 실행하고, 결과는 수집 후 krx 섹션 히트맵으로 합침
+            if not self.sectors.is_available():
+                return {}
+            performance, members = self.sectors.get_performance(target_date=krx_target_date, tickers=tickers)
             return {
-                "market_summary": self.krx.get_market_summary(target_date=krx_target_date),
-                "watchlist": self.krx.get_watchlist_data(target_date=krx_target_date),
-                "formatted": self.krx.format_for_briefing(target_date=krx_target_date)
+                "sectors": {
+                    f"{family}/{name}": round(float(row.daily_pct), 2)
+                    for (family, name), row in performance.iterrows() if pd.notna(row.daily_pct)
+                },
+                "raw": (performance, members),
             }
 
         def fetch_ecos():
             if not self.ecos.is_available():
                 return {"formatted": "ECOS API 키가 설정되지 않았습니다."}
+            indicators = self.ecos.get_latest_indicators(plan["ecos"])
             return {
-                "indicators": self.ecos.get_latest_indicators(),
-                "formatted": self.ecos.format_for_briefing()
+                "indicators": indicators,
+                "formatted": self.ecos.format_for_briefing(indicators)
             }
 
         def fetch_news():
             if not self.news.is_available():
                 return {"formatted": "feedparser가 설치되지 않았습니다."}
+            self.news.ticker_names = self.watchlist_names(tickers)
             news_items = self.news.get_investment_news(max_hours=news_hours)
+            clusters = self.news.get_story_clusters(news=news_items)
             return {
                 "count": len(news_items),
-                "items": news_items[:max_news],
-                "formatted": self.news.format_for_briefing(max_news, max_hours=news_hours)
+                "stories": len(clusters),
+                "items": [cluster.representative for cluster in clusters[:max_news]],
+                "raw": clusters,
+                "formatted": self._format_news(clusters, max_items=max_news)
+            }
+
+        def fetch_intraday():
+            # 메모리 링 버퍼(수집 중) 우선, 없으면 당일 저장분
+            if self.intraday is not None:
+                collector = self.intraday
+                snapshots = collector.get_snapshots()
+            else:
+                collector = IntradayCollector(krx=self.krx)
+                snapshots = IntradayCollector.load_day()
+            return {
+                "snapshots": len(snapshots),
+                "formatted": collector.format_for_briefing(snapshots)
+            }
+
+        def fetch_correlation():
+            if not self.cross_asset.is_available():
+                return {"formatted": ""}
+            # 저장된 롤링 상태에 마지막 반영일 이후 거래일만 반영
+            monitor = self.cross_asset.get_monitor(target_date=krx_target_date, tickers=tickers)
+            return {
+                "shifts": self.cross_asset.get_shifts(monitor),
+                "raw": monitor,
+                "formatted": self.cross_asset.format_for_briefing(monitor),
             }
 
-        tasks = {
+        # 브리핑 유형별 수집 계획(BRIEFING_SETTINGS[...]["plan"])에 있는 수집만 실행
+        fetchers = {
             "dart": fetch_dart,
             "krx": fetch_krx,
             "ecos": fetch_ecos,
             "news": fetch_news,
+            "intraday": fetch_intraday,
+            "correlation": fetch_correlation,
         }
+        tasks = {key: fn for key, fn in fetchers.items() if key in plan}
+        if "krx" in plan and plan["krx"].get("sectors"):
+            tasks["sectors"] = fetch_sectors
 
         print("  - 데이터 수집 중 (병렬)...")
         start = time.time()
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {key: executor.submit(fn) for key, fn in tasks.items()}
-            for key, future in futures.items():
-                try:
-                    data["sections"][key] = future.result(timeout=30)
-                except Exception as e:
-                    print(f"  [경고] {key} 수집 실패: {e}")
-                    data["sections"][key] = {"formatted": f"## {key} 데이터 수집 실패\n수집 중 오류가 발생했습니다."}
+        # 작업별 제한 시간은 수집 시작 기준 (앞 작업을 기다린 시간이 뒤 작업 제한에 더해지지 않도록)
+        # 제한을 넘긴 작업은 기다리지 않고 실패 처리 (스레드는 백그라운드에서 마저 끝남)
+        executor = ThreadPoolExecutor(max_workers=len(tasks))
+        futures = {key: executor.submit(fn) for key, fn in tasks.items()}
+        results = {}
+        for key, future in futures.items():
+            limit = COLLECT_TIMEOUTS.get(key, COLLECT_TIMEOUTS["default"])
+            try:
+                results[key] = future.result(timeout=max(0.0, start + limit - time.time()))
+            except FutureTimeout:
+                print(f"  [경고] {key} 수집 시간 초과 ({limit}초)")
+                results[key] = {"formatted": f"## {key} 데이터 수집 실패\n수집 시간({limit}초)을 초과했습니다."}
+            except Exception as e:
+                print(f"  [경고] {key} 수집 실패: {e}")
+                results[key] = {"formatted": f"## {key} 데이터 수집 실패\n수집 중 오류가 발생했습니다."}
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        # 업종 히트맵은 krx 섹션의 일부 (프로필 렌더링도 krx 원자료로 다시 포맷팅)
+        sectors = results.pop("sectors", None)
+        krx = results.get("krx")
+        if sectors and krx and "raw" in krx and "raw" in sectors:
+            krx["sectors"] = sectors["sectors"]
+            krx["raw"]["sectors"] = sectors["raw"]
+            krx["formatted"] = self._format_krx(krx["raw"])
+        data["sections"] = results
 
         elapsed = time.time() - start
         print(f"  [수집 완료] {elapsed:.1f}초 소요")
 
         return data
 
+    # ------------------------------------------------------------------
+    # 섹션 포맷팅 (collect_all_data 원자료 → 마크다운, 기본 / 프로필 브리핑 공용)
+    # ------------------------------------------------------------------
+    def _format_dart(self, raw: dict, tickers: Optional[list[str]] = None, max_items: int = 20) -> str:
+        """공시 섹션 (tickers가 있으면 해당 종목 공시만)"""
+        disclosures = raw["watchlist"]
+        if tickers is not None:
+            disclosures = [d for d in disclosures if d.stock_code in tickers]
+        formatted = self.dart.format_for_briefing(disclosures, max_items=max_items)
+        if raw["market"] is not None:
+            formatted = raw["market"] + "\n\n**관심 종목 공시**\n" + formatted
+        return formatted
+
+    def _format_krx(self, raw: dict, tickers: Optional[list[str]] = None) -> str:
+        """시세 섹션: 지수 + 관심 종목 + 기술적 지표 + 시장 공통(내부 지표, 스크리너) + 업종 히트맵"""
+        watchlist = raw["watchlist"]
+        if tickers is not None and not watchlist.empty:
+            watchlist = watchlist[watchlist["ticker"].isin(tickers)]
+        formatted = self.krx.format_for_briefing(summary=raw["summary"], watchlist=watchlist)
+
+        indicators = raw["indicators"]
+        if indicators is not None:
+            if tickers is not None and not indicators.empty:
+                indicators = indicators[indicators.index.isin(tickers)]
+            names = dict(zip(watchlist["ticker"], watchlist["name"])) if not watchlist.empty else {}
+            section = format_indicators(indicators, names)
+            if section:
+                formatted += "\n\n" + section
+
+        for section in raw["market"]:
+            formatted += "\n\n" + section
+
+        if raw["sectors"] is not None:
+            performance, members = raw["sectors"]
+            if tickers is not None:
+                members = {ticker: key for ticker, key in members.items() if ticker in tickers}
+            formatted += "\n\n" + self.sectors.format_for_briefing(performance, members)
+        return formatted
+
+    def _format_news(self, clusters: list, keywords: Optional[list[str]] = None, max_items: int = 10) -> str:
+        """뉴스 섹션 (keywords가 있으면 대표 기사 제목·요약에 키워드가 있는 기사 묶음만)"""
+        if keywords:
+            clusters = [
+                cluster for cluster in clusters
+                if matches_keywords(f"{cluster.representative.title} {cluster.representative.summary}", keywords)
+            ]
+        return self.news.format_for_briefing(max_items, clusters=clusters)
+
     def generate_basic_briefing(self, data: dict) -> str:
         """
         기본 브리핑 생성 (AI 없이)
@@ -298,12 +594,16 @@ class BriefingGenerator:
 
 {sections.get('krx', {}).get('formatted', '데이터 없음')}
 
+{sections.get('intraday', {}).get('formatted', '')}
+
 ---
 
 ## 2. 거시경제 지표
 
 {sections.get('ecos', {}).get('formatted', '데이터 없음')}
 
+{sections.get('correlation', {}).get('formatted', '')}
+
 ---
 
 ## 3. 금일 주요 공시 (DART)
@@ -343,6 +643,8 @@ class BriefingGenerator:
 
 {sections.get('ecos', {}).get('formatted', '데이터 없음')}
 
+{sections.get('correlation', {}).get('formatted', '')}
+
 ---
 
 ## 3. 금일 주요 공시 (DART)
@@ -360,13 +662,19 @@ class BriefingGenerator:
 *본 애프터 마켓 브리핑은 자동 생성되었습니다. 투자 판단은 본인 책임 하에 이루어져야 합니다.*
 """
 
-    def generate_ai_analysis(self, briefing: str, briefing_type: str) -> str:
+    def generate_ai_analysis(
+        self,
+        briefing: str,
+        briefing_type: str,
+        names: Optional[dict[str, str]] = None
+    ) -> str:
         """
         OpenAI API를 사용한 AI 분석 생성
 
         Args:
             briefing: 기본 브리핑 텍스트
             briefing_type: "morning" 또는 "aftermarket"
+            names: 뉴스 인덱스 컨텍스트를 찾을 종목 코드 → 종목명. None이면 관심 종목
 
         Returns:
             AI 분석 마크다운 문자열
@@ -383,6 +691,18 @@ class BriefingGenerator:
 
             client = OpenAI(api_key=OPENAI_API_KEY)
 
+            # 로컬 뉴스 인덱스에서 관심 종목별 최근 기사를 찾아 컨텍스트로 추가
+            try:
+                context = (
+                    self.news.index.format_context(names or self.watchlist_names())
+                    if self.news.index is not None else ""
+                )
+            except sqlite3.Error as e:
+                print(f"  [AI] 뉴스 인덱스 조회 실패: {e}")
+                context = ""
+            if context:
+                briefing = f"{briefing}\n\n{context}"
+
             # 브리핑 유형별 프롬프트 선택
             if briefing_type == "morning":
                 user_prompt = AI_MORNING_PROMPT.format(briefing_data=briefing)
@@ -447,6 +767,17 @@ class BriefingGenerator:
         print("2. 브리핑 생성 중...")
         briefing = self.generate_basic_briefing(data)
 
+        # 지난 브리핑 아카이브(백필 포함)에서 같은 유형 1주 전 수치와 비교
+        archive = get_archive()
+        try:
+            archive.sync()
+            comparison = archive.format_comparison(briefing, data["date"], briefing_type)
+        except sqlite3.Error as e:
+            print(f"  [경고] 브리핑 아카이브 조회 실패: {e}")
+            comparison = ""
+        if comparison:
+            briefing = self._insert_before_footer(briefing, f"\n{comparison}\n")
+
         # AI 분석 (use_ai 플래그 + AI_ENABLED 설정 모두 필요)
         ai_section = ""
         if use_ai:
@@ -459,13 +790,7 @@ class BriefingGenerator:
 
         # AI 분석을 면책조항 바로 앞에 삽입
         if ai_section:
-            # "---\n\n*본 " 패턴을 찾아 그 앞에 AI 분석 삽입
-            marker = "\n---\n\n*본 "
-            if marker in briefing:
-                idx = briefing.rfind(marker)
-                briefing = briefing[:idx] + ai_section + briefing[idx:]
-            else:
-                briefing += ai_section
+            briefing = self._insert_before_footer(briefing, ai_section)
 
         # 파일 저장
         step_num = "4" if use_ai else "3"
@@ -478,9 +803,131 @@ class BriefingGenerator:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(briefing)
 
+        # 이번 브리핑 수치 색인 (추이 조회 / 다음 비교용)
+        try:
+            archive.ingest(filepath, briefing)
+        except sqlite3.Error as e:
+            print(f"  [경고] 브리핑 아카이브 저장 실패: {e}")
+
+        # 출력 sink 발행 (sink별 스레드 / 큐, 저장을 기다리게 하지 않음)
+        get_publisher().publish_file(filepath, briefing, briefing_type, data["date"], settings["title"])
+
         print(f"브리핑 저장 완료: {filepath}")
         return str(filepath)
 
+    def render_profile(self, data: dict, profile: BriefingProfile, use_ai: bool = False) -> str:
+        """
+        수집 데이터 1벌에서 프로필 1개 브리핑 렌더링 (AI 분석 외 외부 조회 없음)
+
+        프로필 관심 종목 / 뉴스 키워드로 섹션 원자료를 다시 포맷팅하고,
+        프로필에서 뺀 섹션은 비워 제목째 제거한 뒤 섹션 번호를 다시 매깁니다.
+        지수, 환율·금리, 시장 내부 지표처럼 시장 공통 섹션과 장중 스냅샷은 그대로 사용합니다.
+
+        Args:
+            data: collect_all_data() 결과 (프로필 관심 종목 합집합으로 수집)
+            profile: 렌더링할 프로필
+            use_ai: AI 분석 사용 여부 (AI_ENABLED=true일 때만 실제 동작)
+
+        Returns:
+            마크다운 브리핑 문자열
+        """
+        settings = BRIEFING_SETTINGS[data["briefing_type"]]
+        tickers = profile.watchlist
+        sections = {}
+        for key, section in data["sections"].items():
+            if not profile.includes(key):
+                sections[key] = {"formatted": ""}
+            elif "raw" not in section:
+                sections[key] = section
+            elif key == "dart":
+                sections[key] = {"formatted": self._format_dart(section["raw"], tickers, settings["max_disclosures"])}
+            elif key == "krx":
+                sections[key] = {"formatted": self._format_krx(section["raw"], tickers)}
+            elif key == "news":
+                sections[key] = {"formatted": self._format_news(section["raw"], profile.keywords, settings["max_news"])}
+            elif key == "correlation":
+                sections[key] = {"formatted": self.cross_asset.format_for_briefing(section["raw"], tickers=tickers)}
+            else:
+                sections[key] = section
+
+        briefing = self.generate_basic_briefing({**data, "sections": sections})
+        header = f"**프로필**: {profile.name} (관심 종목 {len(tickers)}개"
+        if profile.keywords:
+            header += f" | 뉴스 키워드: {', '.join(profile.keywords)}"
+        briefing = briefing.replace("\n\n---\n", f"\n{header})\n\n---\n", 1)
+
+        if use_ai and AI_ENABLED:
+            ai_section = self.generate_ai_analysis(briefing, data["briefing_type"], names=self.watchlist_names(tickers))
+            if ai_section:
+                briefing = self._insert_before_footer(briefing, ai_section)
+        return drop_empty_sections(briefing)
+
+    def generate_profiles(
+        self,
+        profiles: list[BriefingProfile],
+        briefing_type: str = "aftermarket",
+        use_ai: bool = False
+    ) -> list[str]:
+        """
+        프로필별 브리핑 생성 및 저장
+
+        데이터는 전체 프로필 관심 종목 합집합으로 한 번만 수집하고 (외부 호출은 서로 다른 종목 수에 비례),
+        프로필별 필터링·렌더링·저장만 PROFILE_RENDER_WORKERS개 스레드로 병렬 실행합니다.
+        프로필 브리핑은 profile.directory에 저장하며 브리핑 아카이브(비교 / 추이)에는 색인하지 않습니다.
+
+        Args:
+            profiles: 생성할 프로필 목록 (profiles.load_profiles())
+            briefing_type: "morning", "midday", 또는 "aftermarket"
+            use_ai: AI 분석 사용 여부 (--ai 플래그). AI_ENABLED=true일 때만 실제 동작
+
+        Returns:
+            저장된 파일 경로 리스트 (프로필 순서)
+        """
+        settings = BRIEFING_SETTINGS[briefing_type]
+        tickers = union_tickers(profiles)
+        print(f"{settings['title']} 프로필 {len(profiles)}개 생성 시작... (관심 종목 합집합 {len(tickers)}개)")
+
+        print("1. 데이터 수집 중...")
+        data = self.collect_all_data(briefing_type=briefing_type, tickers=tickers)
+
+        if use_ai and not AI_ENABLED:
+            print("  AI 분석 건너뜀 (AI_ENABLED=false)")
+
+        def render(profile: BriefingProfile) -> str:
+            briefing = self.render_profile(data, profile, use_ai=use_ai)
+            directory = profile.directory
+            directory.mkdir(parents=True, exist_ok=True)
+            filepath = directory / f"{data['date']}_{settings['file_suffix']}_{profile.name}.md"
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(briefing)
+            get_publisher().publish_file(
+                filepath, briefing, briefing_type, data["date"], settings["title"], profile=profile.name
+            )
+            return str(filepath)
+
+        print(f"2. 프로필 브리핑 렌더링 중 (병렬 {min(PROFILE_RENDER_WORKERS, len(profiles))})...")
+        start = time.time()
+        paths = []
+        with ThreadPoolExecutor(max_workers=max(1, min(PROFILE_RENDER_WORKERS, len(profiles)))) as executor:
+            futures = {profile.name: executor.submit(render, profile) for profile in profiles}
+            for name, future in futures.items():
+                try:
+                    paths.append(future.result())
+                    print(f"  - {name}: {paths[-1]}")
+                except Exception as e:
+                    print(f"  [경고] 프로필 {name} 생성 실패: {e}")
+        print(f"  [렌더링 완료] {time.time() - start:.2f}초 소요")
+        return paths
+
+    @staticmethod
+    def _insert_before_footer(briefing: str, section: str) -> str:
+        """면책조항("---\n\n*본 ...") 바로 앞에 섹션 삽입 (없으면 끝에 추가)"""
+        marker = "\n---\n\n*본 "
+        if marker in briefing:
+            idx = briefing.rfind(marker)
+            return briefing[:idx] + section + briefing[idx:]
+        return briefing + section
+
 
 # 테스트용 코드
 if __name__ == "__main__":
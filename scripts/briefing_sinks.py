@@ -0,0 +1,427 @@
+"""
+완성된 브리핑 출력 sink
+
+브리핑 마크다운 파일을 저장한 뒤, 같은 브리핑을 설정된 sink(BRIEFING_SINKS)로 비동기 발행합니다.
+- file: 마크다운 사본 (공유 폴더 등)
+- json: 메타데이터 + 섹션별 본문 JSON
+- html: 단독으로 열 수 있는 HTML 문서
+- webhook: 로컬 webhook으로 POST (메신저 연동 대용)
+
+sink마다 전용 스레드와 크기 제한 큐를 두어 느리거나 실패하는 sink가
+브리핑 저장이나 다른 sink를 막지 않습니다. 큐가 가득 차면 해당 sink 전달만 건너뛰고,
+실패한 전달은 지수 백오프로 BRIEFING_SINK_SETTINGS["retries"]회까지 다시 시도합니다.
+"""
+import sys
+import html
+import json
+import queue
+import re
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import BRIEFING_SINKS, BRIEFING_SINK_DIR, BRIEFING_SINK_SETTINGS, BRIEFING_WEBHOOK_URL
+from collectors.transport import get_transport
+from collectors.trading_calendar import now_kst
+
+
+@dataclass(slots=True)
+class PublishedBriefing:
+    """발행할 브리핑 1건 (저장이 끝난 마크다운 파일 기준)"""
+    path: Path
+    briefing_type: str
+    date: str
+    title: str
+    markdown: str
+    profile: Optional[str] = None
+    created: str = field(default_factory=lambda: now_kst().strftime("%Y-%m-%d %H:%M:%S"))
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+    def sections(self) -> dict[str, str]:
+        """'## 제목' → 본문 (구분선 제외)"""
+        parts = re.split(r"^## (.+)$", self.markdown, flags=re.MULTILINE)
+        return {
+            title.strip(): re.sub(r"\n-{3,}\s*$", "", body.strip()).strip()
+            for title, body in zip(parts[1::2], parts[2::2])
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "path": str(self.path),
+            "briefing_type": self.briefing_type,
+            "date": self.date,
+            "title": self.title,
+            "profile": self.profile,
+            "created": self.created,
+            "sections": self.sections(),
+            "markdown": self.markdown,
+        }
+
+
+# =========================
+# 마크다운 → HTML (브리핑에 쓰는 문법만)
+# =========================
+
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]*)\)")
+_LINK_SCHEMES = ("http", "https")  # 그 외(javascript:, data:, 상대 경로 ...)는 링크 없이 글자만
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_INLINE = (
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"(?<![\w*])[*_]([^*_\n]+)[*_](?![\w*])"), r"<em>\1</em>"),
+)
+
+
+def _emphasis(text: str) -> str:
+    text = html.escape(text)
+    for pattern, repl in _INLINE:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def _inline(text: str) -> str:
+    """
+    한 줄 인라인 변환. 링크는 자리표시자로 빼 두었다가 마지막에 되돌려
+    URL의 _ / * 가 강조 문법으로 바뀌어 href 속성이 깨지지 않게 합니다.
+    """
+    links = []
+
+    def keep(match: re.Match) -> str:
+        label, url = _emphasis(match.group(1)), match.group(2)
+        if urlsplit(url).scheme.lower() in _LINK_SCHEMES:
+            links.append(f'<a href="{html.escape(url, quote=True)}">{label}</a>')
+        else:
+            links.append(label)
+        return f"\x00{len(links) - 1}\x00"
+
+    text = _emphasis(_LINK.sub(keep, text.replace("\x00", "")))
+    return _PLACEHOLDER.sub(lambda m: links[int(m.group(1))], text)
+
+
+def markdown_to_html(markdown: str, title: str = "") -> str:
+    """
+    브리핑 마크다운 → 단독 HTML 문서
+
+    제목(#~###), 목록(-), 인용(>), 구분선(---), 굵게/기울임/코드/링크만 변환합니다.
+    링크는 http/https만 <a>로 만들고, 다른 스킴은 링크 글자만 남깁니다.
+    """
+    body, paragraph, in_list = [], [], False
+
+    def flush() -> None:
+        nonlocal in_list
+        if paragraph:
+            body.append(f"<p>{'<br>'.join(_inline(line) for line in paragraph)}</p>")
+            paragraph.clear()
+        if in_list:
+            body.append("</ul>")
+            in_list = False
+
+    for line in markdown.splitlines():
+        stripped = line.strip()
+        heading = re.match(r"^(#{1,3}) (.+)$", stripped)
+        if not stripped:
+            flush()
+        elif heading:
+            flush()
+            level = len(heading.group(1))
+            body.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif re.fullmatch(r"-{3,}", stripped):
+            flush()
+            body.append("<hr>")
+        elif stripped.startswith("- "):
+            if paragraph:
+                flush()
+            if not in_list:
+                body.append("<ul>")
+                in_list = True
+            body.append(f"<li>{_inline(stripped[2:])}</li>")
+        elif stripped.startswith(">"):
+            flush()
+            body.append(f"<blockquote>{_inline(stripped.lstrip('> '))}</blockquote>")
+        else:
+            if in_list:
+                flush()
+            paragraph.append(stripped)
+    flush()
+
+    return (
+        "<!DOCTYPE html>\n<html lang=\"ko\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title)}</title>\n"
+        "<style>body{font-family:sans-serif;max-width:860px;margin:2em auto;line-height:1.6;padding:0 1em}"
+        "blockquote{color:#555;border-left:3px solid #ccc;margin:0;padding-left:1em}</style>\n"
+        "</head>\n<body>\n" + "\n".join(body) + "\n</body>\n</html>\n"
+    )
+
+
+# =========================
+# sink
+# =========================
+
+def _output_dir(doc: PublishedBriefing, root: Path) -> Path:
+    """sink 출력 폴더 (프로필 브리핑은 프로필별 하위 폴더)"""
+    directory = root / doc.profile if doc.profile else root
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+class FileSink:
+    """마크다운 사본"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory or BRIEFING_SINK_DIR / "md"
+
+    def publish(self, doc: PublishedBriefing) -> None:
+        shutil.copyfile(doc.path, _output_dir(doc, self.directory) / doc.path.name)
+
+
+class JsonSink:
+    """메타데이터 + 섹션별 본문 JSON"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory or BRIEFING_SINK_DIR / "json"
+
+    def publish(self, doc: PublishedBriefing) -> None:
+        path = _output_dir(doc, self.directory) / f"{doc.stem}.json"
+        path.write_text(json.dumps(doc.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+class HtmlSink:
+    """단독 HTML 문서"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory or BRIEFING_SINK_DIR / "html"
+
+    def publish(self, doc: PublishedBriefing) -> None:
+        path = _output_dir(doc, self.directory) / f"{doc.stem}.html"
+        path.write_text(markdown_to_html(doc.markdown, title=doc.title), encoding="utf-8")
+
+
+class WebhookSink:
+    """로컬 webhook으로 POST (메신저 연동 대용, 본문은 max_chars까지)"""
+
+    def __init__(self, url: str = BRIEFING_WEBHOOK_URL, timeout: float = BRIEFING_SINK_SETTINGS["timeout"]):
+        self.url = url
+        self.timeout = timeout
+        self.max_chars = BRIEFING_SINK_SETTINGS["webhook_max_chars"]
+        self.http = get_transport()
+
+    def publish(self, doc: PublishedBriefing) -> None:
+        text = doc.markdown
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars] + "\n..."
+        payload = {
+            "title": doc.title,
+            "briefing_type": doc.briefing_type,
+            "date": doc.date,
+            "profile": doc.profile,
+            "path": str(doc.path),
+            "text": text,
+        }
+        response = self.http.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+
+
+SINK_TYPES = {
+    "file": FileSink,
+    "json": JsonSink,
+    "html": HtmlSink,
+    "webhook": WebhookSink,
+}
+
+
+def build_sinks(names: Iterable[str] = BRIEFING_SINKS) -> dict[str, object]:
+    """설정된 이름 목록으로 sink 생성 (이름 → sink)"""
+    sinks = {}
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        if name not in SINK_TYPES:
+            print(f"  [경고] 알 수 없는 브리핑 sink: {name}")
+            continue
+        sinks[name] = SINK_TYPES[name]()
+    return sinks
+
+
+# =========================
+# 비동기 발행
+# =========================
+
+@dataclass(slots=True)
+class SinkStats:
+    """sink별 전달 집계"""
+    sent: int = 0
+    retries: int = 0
+    failed: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+
+
+class _SinkWorker:
+    """sink 1개 전용 스레드 + 크기 제한 큐"""
+
+    def __init__(self, name: str, sink, queue_size: int, retries: int, backoff: float):
+        self.name = name
+        self.sink = sink
+        self.retries = retries
+        self.backoff = backoff
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.stats = SinkStats()
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name=f"briefing-sink-{name}", daemon=True)
+        self.thread.start()
+
+    def _record(self, **deltas) -> None:
+        with self.lock:
+            for key, value in deltas.items():
+                setattr(self.stats, key, getattr(self.stats, key) + value)
+
+    def offer(self, doc: PublishedBriefing) -> bool:
+        """대기 없이 큐에 추가 (가득 차면 False)"""
+        try:
+            self.queue.put_nowait(doc)
+            return True
+        except queue.Full:
+            self._record(dropped=1)
+            return False
+
+    def _run(self) -> None:
+        while True:
+            doc = self.queue.get()
+            try:
+                self._deliver(doc)
+            finally:
+                self.queue.task_done()
+
+    def _deliver(self, doc: PublishedBriefing) -> None:
+        started = time.perf_counter()
+        for attempt in range(self.retries + 1):
+            try:
+                self.sink.publish(doc)
+                self._record(sent=1, elapsed=time.perf_counter() - started)
+                return
+            except Exception as e:
+                if attempt == self.retries:
+                    self._record(failed=1, elapsed=time.perf_counter() - started)
+                    print(f"  [경고] 브리핑 sink {self.name} 전달 실패 ({doc.path.name}): {e}")
+                    return
+                self._record(retries=1)
+                time.sleep(self.backoff * (2 ** attempt))
+
+    def pending(self) -> int:
+        return self.queue.unfinished_tasks
+
+
+class BriefingPublisher:
+    """sink별 스레드 / 큐로 브리핑을 동시에 발행"""
+
+    def __init__(self, sinks: Optional[dict[str, object]] = None, settings: Optional[dict] = None):
+        """
+        Args:
+            sinks: 이름 → sink (publish(doc) 메서드). None이면 BRIEFING_SINKS 설정
+            settings: queue_size / retries / backoff / flush_timeout. None이면 BRIEFING_SINK_SETTINGS
+        """
+        self.settings = settings or BRIEFING_SINK_SETTINGS
+        sinks = sinks if sinks is not None else build_sinks()
+        self.workers = [
+            _SinkWorker(
+                name, sink, self.settings["queue_size"], self.settings["retries"], self.settings["backoff"]
+            )
+            for name, sink in sinks.items()
+        ]
+
+    @property
+    def names(self) -> list[str]:
+        return [worker.name for worker in self.workers]
+
+    def submit(self, doc: PublishedBriefing) -> None:
+        """모든 sink 큐에 추가하고 바로 반환 (가득 찬 sink는 건너뜀)"""
+        for worker in self.workers:
+            if not worker.offer(doc):
+                print(f"  [경고] 브리핑 sink {worker.name} 큐가 가득 차 {doc.path.name} 전달을 건너뜁니다.")
+
+    def publish_file(
+        self,
+        path: Path,
+        briefing: str,
+        briefing_type: str,
+        date: str,
+        title: str,
+        profile: Optional[str] = None
+    ) -> None:
+        """저장한 브리핑 파일 발행 (submit 편의 함수)"""
+        if self.workers:
+            self.submit(PublishedBriefing(
+                path=Path(path), briefing_type=briefing_type, date=date,
+                title=title, markdown=briefing, profile=profile,
+            ))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 전달이 끝날 때까지 최대 timeout초 대기 (스레드는 계속 동작)
+
+        Returns:
+            모두 끝났으면 True. 시간 초과 시 남은 전달은 백그라운드에서 계속 (프로세스 종료 시 중단)
+        """
+        timeout = self.settings["flush_timeout"] if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while any(worker.pending() for worker in self.workers):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def stats(self) -> dict[str, SinkStats]:
+        """sink별 전달 집계 사본"""
+        result = {}
+        for worker in self.workers:
+            with worker.lock:
+                result[worker.name] = SinkStats(**asdict(worker.stats))
+        return result
+
+    def format_stats(self) -> str:
+        """sink별 전달 집계 요약 (콘솔 출력용)"""
+        if not self.workers:
+            return "브리핑 sink 없음"
+        stats = self.stats()
+        lines = ["브리핑 sink 집계:"]
+        for worker in self.workers:
+            s = stats[worker.name]
+            pending = worker.pending()
+            lines.append(
+                f"  - {worker.name}: 전달 {s.sent}건 (재시도 {s.retries}, 실패 {s.failed}, 건너뜀 {s.dropped}"
+                + (f", 대기 {pending}" if pending else "") + f") | {s.elapsed:.2f}초"
+            )
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def get_publisher() -> BriefingPublisher:
+    """프로세스 공용 브리핑 발행기"""
+    return BriefingPublisher()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    from config import RESULTS_DIR
+
+    publisher = get_publisher()
+    print(f"브리핑 sink: {', '.join(publisher.names) or '없음'} → {BRIEFING_SINK_DIR}")
+    latest = sorted(RESULTS_DIR.glob("*.md"))[-1:] if RESULTS_DIR.exists() else []
+    for path in latest:
+        text = path.read_text(encoding="utf-8")
+        title = text.splitlines()[0].lstrip("# ") if text else path.stem
+        publisher.publish_file(path, text, briefing_type="", date=path.stem[:10], title=title)
+    publisher.flush()
+    print(publisher.format_stats())
@@ -2,5 +2,25 @@ from .dart_collector import DartCollector
 from .krx_collector import KrxCollector
 from .ecos_collector import EcosCollector
 from .news_collector import NewsCollector
+from .intraday_collector import IntradayCollector
+from .cross_asset_collector import CrossAssetCollector
+from .sector_collector import SectorCollector
+from .records import Article, Disclosure, Quote, OHLCV_DTYPE
+from .trading_calendar import TradingCalendar, get_calendar
+from .transport import HttpTransport, get_transport
+from .rate_limit import QuotaExceeded, RateLimiter, get_limiter
+from .health import SourceHealth, get_health
+from .news_index import NewsIndex, get_news_index
+from .ecos_store import EcosStore, get_ecos_store
+from .universe_matrix import UniverseMatrix, get_universe
+from .sector_store import SectorStore, get_sector_store
 
-__all__ = ["DartCollector", "KrxCollector", "EcosCollector", "NewsCollector"]
+__all__ = [
+    "DartCollector", "KrxCollector", "EcosCollector", "NewsCollector", "IntradayCollector",
+    "CrossAssetCollector", "SectorCollector",
+    "Article", "Disclosure", "Quote", "OHLCV_DTYPE",
+    "TradingCalendar", "get_calendar", "HttpTransport", "get_transport",
+    "QuotaExceeded", "RateLimiter", "get_limiter", "SourceHealth", "get_health",
+    "NewsIndex", "get_news_index", "EcosStore", "get_ecos_store", "UniverseMatrix", "get_universe",
+    "SectorStore", "get_sector_store",
+]
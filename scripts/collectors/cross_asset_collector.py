@@ -0,0 +1,230 @@
+"""
+교차 자산 상관 / 베타 수집기
+
+KOSPI 지수, 관심 종목 종가(KRX)와 환율·금리(ECOS, FRED)를 KRX 거래일 기준으로 맞춘 뒤
+analytics/correlation.py의 SensitivityMonitor로 단기 / 장기 창 롤링 상관과 베타를 갱신합니다.
+
+상태는 data/correlation.npz에 저장하며, 브리핑마다 마지막 반영일 이후 거래일만 조회해 반영합니다.
+(상태가 없거나 RESYNC_SESSIONS보다 오래 끊긴 경우에만 장기 창 전체 이력을 다시 조회)
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import CORRELATION_SETTINGS, DATA_DIR, WATCHLIST_STOCKS
+from collectors.krx_collector import KrxCollector
+from collectors.ecos_collector import EcosCollector
+from collectors.trading_calendar import get_calendar, now_kst, today_kst
+from analytics.correlation import SensitivityMonitor, format_sensitivity
+
+
+# 롤링 상관 상태 (브리핑마다 새 거래일만 반영)
+CORRELATION_STATE_PATH = DATA_DIR / "correlation.npz"
+
+# 시장 베타 요인 (KOSPI 지수). 나머지 요인은 EcosCollector 지표 키
+MARKET_FACTOR = "kospi"
+MARKET_INDEX = "1001"
+
+
+class CrossAssetCollector:
+    """관심 종목 × 지수 / 환율 / 금리 롤링 상관 수집기"""
+
+    # 이보다 오래 끊긴 상태는 증분 대신 전체 재적재
+    RESYNC_SESSIONS = 10
+
+    def __init__(self, krx: Optional[KrxCollector] = None, ecos: Optional[EcosCollector] = None):
+        self.krx = krx or KrxCollector()
+        self.ecos = ecos or EcosCollector()
+        self.settings = CORRELATION_SETTINGS
+
+    def is_available(self) -> bool:
+        return self.krx.is_available()
+
+    @property
+    def factors(self) -> list[str]:
+        return list(self.settings["factors"])
+
+    @property
+    def rate_columns(self) -> list[str]:
+        """변화폭(%p)으로 계산할 금리 요인"""
+        return [key for key in self.factors if key == "us10y" or EcosCollector.INDICATORS.get(key, ("", ""))[1] == "%"]
+
+    def labels(self, tickers: list[str]) -> dict[str, str]:
+        labels = {MARKET_FACTOR: "KOSPI", "us10y": "미국 10년물"}
+        labels.update({key: spec[2] for key, spec in EcosCollector.INDICATORS.items()})
+        labels.update({ticker: self.krx.get_ticker_name(ticker) for ticker in tickers})
+        return labels
+
+    def get_levels(
+        self,
+        sessions: int,
+        target_date: Optional[str] = None,
+        tickers: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        KRX 거래일 인덱스 × (관심 종목 종가, KOSPI, 환율·금리) 수준값
+
+        환율·금리는 해당 거래일 이하 마지막 발표값을 사용하고,
+        미국 금리는 한국 장 마감 시점에 확정된 미국 전일 값을 사용합니다.
+
+        Args:
+            sessions: 조회 거래일 수
+            target_date: 기준일 (YYYYMMDD). None이면 오늘
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+
+        Returns:
+            DataFrame (컬럼 = 종목 코드 + factors). 거래일이 없으면 빈 DataFrame
+        """
+        tickers = tickers if tickers is not None else WATCHLIST_STOCKS
+        columns = [*tickers, *self.factors]
+
+        history = self.krx.get_watchlist_history(tickers, target_date=target_date, sessions=sessions)
+        frame = pd.DataFrame(index=pd.DatetimeIndex([]))
+        if not history.empty:
+            frame = history.pivot_table(index="date", columns="ticker", values="close", aggfunc="last")
+            frame.index = pd.DatetimeIndex(frame.index)
+        if MARKET_FACTOR in self.factors:
+            bars = self.krx.get_index_ohlcv(MARKET_INDEX, target_date=target_date, sessions=sessions)
+            if len(bars):
+                kospi = pd.Series(bars["close"], index=pd.DatetimeIndex(bars["date"]))
+                frame = frame.join(kospi.rename(MARKET_FACTOR), how="outer")
+        if frame.empty:
+            return pd.DataFrame(columns=columns, dtype=float)
+
+        macro_keys = [key for key in self.factors if key != MARKET_FACTOR]
+        macro = self.ecos.get_history(macro_keys, sessions=sessions + 1, target_date=target_date) if macro_keys else None
+        if macro is not None and not macro.empty:
+            if "us10y" in macro:
+                # 미국 날짜 d의 값은 한국 d+1 거래일에 반영
+                us = macro.pop("us10y").dropna()
+                us.index = us.index + pd.Timedelta(days=1)
+                macro = macro.join(us, how="outer")
+            dates = frame.index
+            macro = macro.reindex(macro.index.union(dates)).ffill().reindex(dates)
+            frame = frame.join(macro, how="left")
+
+        return frame.reindex(columns=columns).sort_index()
+
+    def _load_monitor(self, names: list[str]) -> Optional[SensitivityMonitor]:
+        monitor = SensitivityMonitor.load(CORRELATION_STATE_PATH)
+        windows = (self.settings["short_window"], self.settings["long_window"])
+        if monitor is None or monitor.names != names or (monitor.short.window, monitor.long.window) != windows:
+            return None
+        return monitor
+
+    def get_monitor(
+        self,
+        target_date: Optional[str] = None,
+        tickers: Optional[list[str]] = None
+    ) -> SensitivityMonitor:
+        """
+        기준일까지 반영된 SensitivityMonitor
+
+        저장 상태가 기준 거래일 직전까지 이어져 있으면 빠진 거래일만 조회해 반영하고,
+        상태가 없거나 설정이 바뀌었거나 오래 끊겼으면 장기 창 + 1거래일 수준값으로 다시 적재합니다.
+        과거 날짜 재생성처럼 저장 상태가 기준일보다 앞서 있으면 저장하지 않는 임시 상태로 계산합니다.
+
+        Args:
+            target_date: 기준일 (YYYYMMDD). None이면 오늘
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+        """
+        tickers = tickers if tickers is not None else WATCHLIST_STOCKS
+        names = [*tickers, *self.factors]
+        base = datetime.strptime(target_date, "%Y%m%d") if target_date else now_kst()
+        end = np.datetime64(get_calendar().session_on_or_before(base), "D")
+
+        monitor = self._load_monitor(names)
+        persist = True
+        if monitor is not None and monitor.last_date is not None and monitor.last_date > end:
+            monitor, persist = None, False
+        if monitor is not None and monitor.last_date == end:
+            return monitor
+
+        # 마지막 반영일 이후 빠진 거래일 수 (마지막 반영일 수준값은 상태에 있으므로 재조회하지 않음)
+        missing = None
+        if monitor is not None and monitor.last_date is not None:
+            missing = len(get_calendar().sessions_between(monitor.last_date, end)) - 1
+        if missing is not None and missing <= self.RESYNC_SESSIONS:
+            sessions = missing
+        else:
+            monitor = SensitivityMonitor(
+                names, self.rate_columns, self.settings["short_window"], self.settings["long_window"]
+            )
+            sessions = self.settings["long_window"] + 1
+
+        levels = self.get_levels(sessions, target_date=target_date, tickers=tickers)
+        if monitor.update_frame(levels.loc[:str(end)]) and persist:
+            try:
+                monitor.save(CORRELATION_STATE_PATH)
+            except OSError as e:
+                print(f"  [경고] 상관 상태 저장 실패: {e}")
+        return monitor
+
+    def get_shifts(self, monitor: SensitivityMonitor) -> list[dict]:
+        """관심 종목 × 환율·금리 요인 중 단기 / 장기 상관이 크게 달라진 쌍 (sensitivity_shifts 참고)"""
+        tickers = [name for name in monitor.names if name not in self.factors]
+        return monitor.shifts(
+            tickers, [key for key in self.factors if key != MARKET_FACTOR],
+            threshold=self.settings["corr_shift"], min_corr=self.settings["min_corr"],
+        )
+
+    def format_for_briefing(
+        self,
+        monitor: Optional[SensitivityMonitor] = None,
+        target_date: Optional[str] = None,
+        tickers: Optional[list[str]] = None
+    ) -> str:
+        """
+        관심 종목 시장 베타 + 환율·금리 민감도 변화 (마크다운)
+
+        Args:
+            monitor: 이미 갱신한 get_monitor() 결과 (없으면 조회)
+            target_date: 기준일 (YYYYMMDD)
+            tickers: 표시할 종목 (monitor 종목 중 일부). None이면 monitor 전체
+        """
+        if monitor is None:
+            monitor = self.get_monitor(target_date=target_date)
+        tickers = [
+            name for name in monitor.names
+            if name not in self.factors and (tickers is None or name in tickers)
+        ]
+        section = format_sensitivity(
+            monitor.short, monitor.long, tickers, self.factors,
+            labels=self.labels(tickers),
+            market=MARKET_FACTOR if MARKET_FACTOR in self.factors else None,
+            threshold=self.settings["corr_shift"],
+            min_corr=self.settings["min_corr"],
+        )
+        return section or f"교차 자산 상관: 이력 누적 중 ({monitor.short.size}/{monitor.short.window}거래일)"
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    from analytics.correlation import rolling_covariance, correlation_from_cov, to_returns
+
+    collector = CrossAssetCollector()
+    if not collector.is_available():
+        print("PyKRX가 설치되지 않았습니다.")
+    else:
+        monitor = collector.get_monitor()
+        print(f"반영 거래일: {monitor.last_date} ({monitor.long.size}/{monitor.long.window})")
+        print(collector.format_for_briefing(monitor))
+
+        # 전체 구간 벡터 계산 (단기 창 상관 추이)
+        levels = collector.get_levels(collector.settings["long_window"] + 1)
+        returns = to_returns(levels, collector.rate_columns)
+        corr = correlation_from_cov(rolling_covariance(returns.to_numpy(), collector.settings["short_window"]))
+        names = list(returns.columns)
+        if "usd_krw" in names:
+            j = names.index("usd_krw")
+            trend = pd.DataFrame(corr[:, :len(WATCHLIST_STOCKS), j], index=returns.index, columns=names[:len(WATCHLIST_STOCKS)])
+            print("\n=== 원/달러 단기 상관 추이 ===")
+            print(trend.dropna().tail(10).round(2))
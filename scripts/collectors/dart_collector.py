@@ -4,16 +4,19 @@ DART (전자공시시스템) 데이터 수집기
 DART API를 통해 기업 공시 정보를 수집합니다.
 - 실적 발표, 배당, M&A, 유상증자 등 주요 공시
 - 관심 종목의 최신 공시 모니터링
+- 공시 유형 분류/중요도 순위 (analytics/disclosure_classifier.py)
 
 API 키 발급: https://opendart.fss.or.kr/
 """
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
 
-# 프로젝트 루트 경로 추가
+# 프로젝트 루트 / scripts 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     import OpenDartReader
@@ -23,6 +26,11 @@ except ImportError:
     print("Warning: OpenDartReader not installed. Run: pip install opendartreader")
 
 from config import DART_API_KEY, WATCHLIST_STOCKS
+from collectors.records import Disclosure, frame_to_records
+from collectors.rate_limit import get_limiter
+from collectors.health import get_health
+from collectors.trading_calendar import now_kst
+from analytics.disclosure_classifier import get_classifier, format_disclosure_rollup
 
 
 class DartCollector:
@@ -35,6 +43,8 @@ class DartCollector:
         """
         self.api_key = api_key or DART_API_KEY
         self.dart = None
+        self.limiter = get_limiter()
+        self.health = get_health()
 
         if DART_AVAILABLE and self.api_key:
             self.dart = OpenDartReader(self.api_key)
@@ -47,7 +57,7 @@ class DartCollector:
         self,
         corp_code: Optional[str] = None,
         days_back: int = 1
-    ) -> list[dict]:
+    ) -> list[Disclosure]:
         """
         최근 공시 목록 조회
 
@@ -56,16 +66,19 @@ class DartCollector:
             days_back: 며칠 전까지 조회할지
 
         Returns:
-            공시 목록 (dict의 list)
+            공시 레코드 리스트. DART 장애 시 마지막 정상 조회 결과
         """
         if not self.is_available():
             return []
 
-        end_date = datetime.now()
+        end_date = now_kst()
         start_date = end_date - timedelta(days=days_back)
+        # 마지막 정상 데이터는 같은 조회 기간일 때만 재사용 (다른 날짜의 공시를 오늘 공시로 내보내지 않도록)
+        period = f"{start_date:%Y%m%d}-{end_date:%Y%m%d}"
 
-        try:
+        def fetch() -> list[Disclosure]:
             # 공시 목록 조회
+            self.limiter.acquire("dart")
             if corp_code:
                 df = self.dart.list(corp_code,
                                    start=start_date.strftime("%Y%m%d"),
@@ -77,32 +90,40 @@ class DartCollector:
             if df is None or df.empty:
                 return []
 
-            # DataFrame을 dict 리스트로 변환
-            disclosures = df.to_dict("records")
-            return disclosures
+            return frame_to_records(df, Disclosure)
 
-        except Exception as e:
-            print(f"DART 공시 조회 오류: {e}")
-            return []
+        return self.health.call(
+            "dart",
+            fetch,
+            default=[],
+            cache_key=f"dart:{corp_code or 'all'}:{period}",
+            encode=lambda disclosures: [asdict(d) for d in disclosures],
+            decode=lambda rows: [Disclosure(**row) for row in rows],
+        )
 
-    def get_watchlist_disclosures(self, days_back: int = 1) -> list[dict]:
+    def get_watchlist_disclosures(
+        self,
+        days_back: int = 1,
+        tickers: Optional[list[str]] = None
+    ) -> list[Disclosure]:
         """
         관심 종목의 공시 조회
 
         Args:
             days_back: 며칠 전까지 조회할지
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
 
         Returns:
             관심 종목 공시 목록
         """
         all_disclosures = []
 
-        for stock_code in WATCHLIST_STOCKS:
+        for stock_code in (tickers if tickers is not None else WATCHLIST_STOCKS):
             disclosures = self.get_recent_disclosures(stock_code, days_back)
             all_disclosures.extend(disclosures)
 
         # 날짜 기준 정렬 (최신순)
-        all_disclosures.sort(key=lambda x: x.get("rcept_dt", ""), reverse=True)
+        all_disclosures.sort(key=lambda x: x.rcept_dt, reverse=True)
         return all_disclosures
 
     def get_company_info(self, corp_code: str) -> dict:
@@ -119,6 +140,7 @@ class DartCollector:
             return {}
 
         try:
+            self.limiter.acquire("dart")
             info = self.dart.company(corp_code)
             if info is not None:
                 return info.to_dict()
@@ -148,6 +170,7 @@ class DartCollector:
             return {}
 
         try:
+            self.limiter.acquire("dart")
             fs = self.dart.finstate(corp_code, year, reprt_code=report_code)
             if fs is not None and not fs.empty:
                 return fs.to_dict("records")
@@ -156,10 +179,12 @@ class DartCollector:
             print(f"재무제표 조회 오류: {e}")
             return {}
 
-    def format_for_briefing(self, disclosures: list[dict], max_items: int = 20) -> str:
+    def format_for_briefing(self, disclosures: list[Disclosure], max_items: int = 20) -> str:
         """
         브리핑용 마크다운 포맷 생성
 
+        실적/배당/증자/M&A 등 중요도가 높은 공시를 먼저 표시합니다.
+
         Args:
             disclosures: 공시 목록
             max_items: 최대 표시 개수
@@ -171,10 +196,10 @@ class DartCollector:
             return "공시 내역이 없습니다."
 
         lines = []
-        for i, disc in enumerate(disclosures[:max_items]):
-            corp_name = disc.get("corp_name", "알 수 없음")
-            report_nm = disc.get("report_nm", "")
-            rcept_dt = disc.get("rcept_dt", "")
+        for disc, category, _ in get_classifier().rank(disclosures)[:max_items]:
+            corp_name = disc.corp_name or "알 수 없음"
+            report_nm = disc.report_nm
+            rcept_dt = disc.rcept_dt
 
             # 날짜 포맷팅
             if rcept_dt:
@@ -182,13 +207,51 @@ class DartCollector:
             else:
                 formatted_date = ""
 
-            lines.append(f"- **{corp_name}**: {report_nm} ({formatted_date})")
+            lines.append(f"- **{corp_name}** [{category}] {report_nm} ({formatted_date})")
 
         if len(disclosures) > max_items:
             lines.append(f"\n... 외 {len(disclosures) - max_items}건")
 
         return "\n".join(lines)
 
+    def format_market_for_briefing(
+        self,
+        disclosures: list[Disclosure],
+        max_items: int = 10,
+        min_score: float = 7
+    ) -> str:
+        """
+        시장 전체 공시 요약 (유형별 건수 + 중요 공시)
+
+        Args:
+            disclosures: 시장 전체 공시 목록 (get_recent_disclosures())
+            max_items: 중요 공시 최대 표시 개수
+            min_score: 중요 공시로 표시할 최소 점수
+
+        Returns:
+            마크다운 문자열
+        """
+        if not disclosures:
+            return "전체 공시 내역이 없습니다."
+
+        classifier = get_classifier()
+        lines = [
+            f"**전체 공시 {len(disclosures):,}건**: "
+            f"{format_disclosure_rollup(classifier.rollup(disclosures))}"
+        ]
+
+        important = [row for row in classifier.rank(disclosures) if row[2] >= min_score]
+        if important:
+            lines.append("")
+            lines.append("**주요 공시 (시장 전체)**")
+            for disc, category, _ in important[:max_items]:
+                corp_name = disc.corp_name or "알 수 없음"
+                lines.append(f"- **{corp_name}** [{category}] {disc.report_nm}")
+            if len(important) > max_items:
+                lines.append(f"- ... 외 {len(important) - max_items}건")
+
+        return "\n".join(lines)
+
 
 # 테스트용 코드
 if __name__ == "__main__":
@@ -204,7 +267,7 @@ if __name__ == "__main__":
         # 최근 공시 조회 테스트
         print("\n=== 최근 공시 (전체) ===")
         disclosures = collector.get_recent_disclosures(days_back=1)
-        print(f"총 {len(disclosures)}건의 공시")
+        print(collector.format_market_for_briefing(disclosures))
 
         # 관심 종목 공시 조회
         print("\n=== 관심 종목 공시 ===")
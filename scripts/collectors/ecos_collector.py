@@ -10,15 +10,23 @@ ECOS (한국은행 경제통계시스템) 데이터 수집기
 API 키 발급: https://ecos.bok.or.kr/api/
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
-import requests
+from typing import Iterable, Optional
 
-# 프로젝트 루트 경로 추가
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import ECOS_API_KEY, ECOS_STAT_CODES
+from config import ECOS_API_KEY, ECOS_STAT_CODES, ECOS_PAGE_SIZE, ECOS_FETCH_WORKERS
+from collectors.ecos_store import get_ecos_store, series_key
+from collectors.trading_calendar import get_calendar, now_kst, today_kst
+from collectors.transport import get_transport
+from collectors.health import get_health
 
 
 class EcosCollector:
@@ -26,12 +34,30 @@ class EcosCollector:
 
     BASE_URL = "https://ecos.bok.or.kr/api/StatisticSearch"
 
+    # 지표 키 → (조회 메서드, 단위, 표시명). 브리핑 수집 계획(BRIEFING_SETTINGS["plan"])에서 키로 선택
+    INDICATORS = {
+        "base_rate": ("get_base_rate", "%", "한국 기준금리"),
+        "usd_krw": ("get_exchange_rate", "원", "원/달러"),
+        "jpy_krw": ("get_jpy_rate", "원", "원/100엔"),
+        "eur_krw": ("get_eur_rate", "원", "원/유로"),
+        "gbp_krw": ("get_gbp_rate", "원", "원/파운드"),
+        "bond_3y": ("get_bond_yield_3y", "%", "국고채 3년"),
+    }
+    # FRED 시계열: 지표 키 → 시계열 ID (FEDFUNDS: 월별, DGS10: 일별)
+    US_SERIES = {
+        "fed_funds": "FEDFUNDS",
+        "us10y": "DGS10",
+    }
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Args:
             api_key: ECOS API 키. None이면 환경변수에서 로드
         """
         self.api_key = api_key or ECOS_API_KEY
+        self.http = get_transport()
+        self.health = get_health()
+        self.store = get_ecos_store()
 
     def is_available(self) -> bool:
         """API 사용 가능 여부 확인"""
@@ -46,7 +72,12 @@ class EcosCollector:
         period: str = "D"  # D=일별, M=월별, Q=분기별, A=연도별
     ) -> list[dict]:
         """
-        통계 데이터 조회
+        통계 데이터 조회 (로컬 저장소 + 부족한 구간만 페이지 조회)
+
+        data/ecos.sqlite3에 이미 받은 구간은 다시 요청하지 않고,
+        조회 범위 앞쪽과 마지막 관측 시점 이후(잠정치 갱신을 위해 마지막 시점 포함)만 받습니다.
+        100행을 넘는 구간은 ECOS_PAGE_SIZE 단위 페이지로 나눠 동시에 조회하며,
+        중단된 조회는 다음 호출에서 남은 페이지만 이어 받습니다.
 
         Args:
             stat_code: 통계표코드
@@ -56,29 +87,101 @@ class EcosCollector:
             period: 주기 (D/M/Q/A)
 
         Returns:
-            통계 데이터 리스트
+            통계 데이터 리스트 (TIME, DATA_VALUE). ECOS 장애 시 저장소에 있는 구간만
         """
         if not self.is_available():
             return []
 
+        series = series_key(stat_code, item_code, period)
+        for job, start, end, total in self.store.pending_jobs(series):
+            self._fetch_range(stat_code, item_code, period, start, end, job=job, total=total)
+
+        coverage = self.store.coverage(series)
+        if coverage is None or coverage[1] is None:
+            ranges = [(start_date, end_date)]
+        else:
+            head, tail = coverage
+            ranges = []
+            if start_date < head:
+                ranges.append((start_date, head))
+            if end_date > tail:
+                ranges.append((tail, end_date))
+        for start, end in ranges:
+            self._fetch_range(stat_code, item_code, period, start, end)
+
+        return self.store.rows(series, start_date, end_date)
+
+    def _fetch_page(self, stat_code: str, item_code: str, period: str, start: str, end: str, page: int) -> Optional[tuple[int, list[dict]]]:
+        """페이지 1개 조회 → (전체 행 수, 행). 실패/차단 시 None"""
+        first = (page - 1) * ECOS_PAGE_SIZE + 1
         url = (
-            f"{self.BASE_URL}/{self.api_key}/json/kr/1/100/"
-            f"{stat_code}/{period}/{start_date}/{end_date}/{item_code}"
+            f"{self.BASE_URL}/{self.api_key}/json/kr/{first}/{first + ECOS_PAGE_SIZE - 1}/"
+            f"{stat_code}/{period}/{start}/{end}/{item_code}"
         )
 
-        try:
-            response = requests.get(url, timeout=10)
+        def fetch() -> tuple[int, list[dict]]:
+            response = self.http.get(url, source="ecos")
             response.raise_for_status()
             data = response.json()
+            # 데이터 없음은 {"RESULT": {...}} 형태의 정상 응답
+            result = data.get("StatisticSearch", {})
+            return int(result.get("list_total_count", 0)), result.get("row", [])
 
-            if "StatisticSearch" in data:
-                rows = data["StatisticSearch"].get("row", [])
-                return rows
-            return []
+        return self.health.call("ecos", fetch)
 
-        except Exception as e:
-            print(f"ECOS 조회 오류: {e}")
-            return []
+    def _fetch_range(
+        self,
+        stat_code: str,
+        item_code: str,
+        period: str,
+        start: str,
+        end: str,
+        job: Optional[str] = None,
+        total: Optional[int] = None
+    ) -> bool:
+        """
+        구간 전체를 페이지로 나눠 저장소에 적재 (첫 페이지로 전체 행 수 확인 후 나머지 동시 조회)
+
+        Returns:
+            모든 페이지를 받았는지 여부 (실패한 페이지는 다음 호출에서 이어 받음)
+        """
+        series = series_key(stat_code, item_code, period)
+        job = job or f"{series}/{start}/{end}"
+        done = self.store.done_pages(job)
+
+        if total is None:
+            first = self._fetch_page(stat_code, item_code, period, start, end, 1)
+            if first is None:
+                return False
+            total, rows = first
+            self.store.save_page(job, series, start, end, total, 1, rows)
+            done.add(1)
+
+        pages = [page for page in range(1, -(-total // ECOS_PAGE_SIZE) + 1) if page not in done]
+        complete = True
+        if pages:
+            with ThreadPoolExecutor(max_workers=min(ECOS_FETCH_WORKERS, len(pages))) as executor:
+                futures = {
+                    executor.submit(self._fetch_page, stat_code, item_code, period, start, end, page): page
+                    for page in pages
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None:
+                        complete = False
+                        continue
+                    self.store.save_page(job, series, start, end, total, futures[future], result[1])
+
+        if complete:
+            self.store.finish_job(job)
+        return complete
+
+    @staticmethod
+    def _session_range(sessions: int, target_date: Optional[str] = None) -> tuple[str, str]:
+        """기준일(기본 오늘) 이하 최근 N거래일을 덮는 (시작일, 종료일). 일별 시장 지표 조회용"""
+        end = datetime.strptime(target_date, "%Y%m%d") if target_date else now_kst()
+        start = get_calendar().sessions_back(end, sessions - 1)
+        return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
 
     def get_base_rate(self, days_back: int = 30) -> list[dict]:
         """
@@ -90,8 +193,8 @@ class EcosCollector:
         Returns:
             기준금리 데이터
         """
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        end_date = now_kst().strftime("%Y%m%d")
+        start_date = (now_kst() - timedelta(days=days_back)).strftime("%Y%m%d")
 
         # 기준금리 통계코드
         return self.get_stat_data(
@@ -102,18 +205,18 @@ class EcosCollector:
             period="D"
         )
 
-    def get_exchange_rate(self, days_back: int = 7) -> list[dict]:
+    def get_exchange_rate(self, sessions: int = 3, target_date: Optional[str] = None) -> list[dict]:
         """
         원/달러 환율 조회 (장시간 매매기준율)
 
         Args:
-            days_back: 며칠 전 데이터까지
+            sessions: 최근 몇 거래일 데이터까지 (당일 미발표 시에도 전일 대비 계산 가능하도록 기본 3)
+            target_date: 기준일 (YYYYMMDD). None이면 오늘
 
         Returns:
             환율 데이터
         """
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        start_date, end_date = self._session_range(sessions, target_date)
 
         # 원/달러 장시간 매매기준율
         return self.get_stat_data(
@@ -124,10 +227,9 @@ class EcosCollector:
             period="D"
         )
 
-    def get_jpy_rate(self, days_back: int = 7) -> list[dict]:
+    def get_jpy_rate(self, sessions: int = 3, target_date: Optional[str] = None) -> list[dict]:
         """원/100엔 환율 조회"""
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        start_date, end_date = self._session_range(sessions, target_date)
         return self.get_stat_data(
             stat_code="731Y003",
             item_code="0000006",
@@ -136,10 +238,9 @@ class EcosCollector:
             period="D"
         )
 
-    def get_eur_rate(self, days_back: int = 7) -> list[dict]:
+    def get_eur_rate(self, sessions: int = 3, target_date: Optional[str] = None) -> list[dict]:
         """원/유로 환율 조회"""
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        start_date, end_date = self._session_range(sessions, target_date)
         return self.get_stat_data(
             stat_code="731Y003",
             item_code="0000007",
@@ -148,10 +249,9 @@ class EcosCollector:
             period="D"
         )
 
-    def get_gbp_rate(self, days_back: int = 7) -> list[dict]:
+    def get_gbp_rate(self, sessions: int = 3, target_date: Optional[str] = None) -> list[dict]:
         """원/파운드 환율 조회 (영국 파운드 스털링)"""
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        start_date, end_date = self._session_range(sessions, target_date)
         # 731Y001: 주요국통화의대원화환율, 0000014=영국 파운드
         return self.get_stat_data(
             stat_code="731Y001",
@@ -161,10 +261,9 @@ class EcosCollector:
             period="D"
         )
 
-    def get_bond_yield_3y(self, days_back: int = 7) -> list[dict]:
+    def get_bond_yield_3y(self, sessions: int = 3, target_date: Optional[str] = None) -> list[dict]:
         """국고채 3년 금리 조회"""
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
+        start_date, end_date = self._session_range(sessions, target_date)
         return self.get_stat_data(
             stat_code="817Y002",
             item_code="010190000",
@@ -173,165 +272,150 @@ class EcosCollector:
             period="D"
         )
 
-    def get_us_rates(self) -> dict:
+    def _fetch_fred_series(self, series_id: str) -> pd.Series:
+        """FRED 시계열 CSV 전체 (날짜 인덱스, 휴장일 제외, 실패 시 예외)"""
+        response = self.http.get(
+            f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}", source="fred"
+        )
+        response.raise_for_status()
+
+        # 첫 컬럼은 날짜, 휴장일 값은 "." 또는 빈 문자열
+        frame = pd.read_csv(StringIO(response.text), index_col=0, parse_dates=True, na_values=["."])
+        series = pd.to_numeric(frame.iloc[:, 0], errors="coerce").dropna()
+        if series.empty:
+            raise ValueError(f"FRED {series_id}: 유효한 데이터가 없습니다.")
+        return series
+
+    def _fetch_fred_latest(self, series_id: str) -> dict:
+        """FRED 시계열 CSV의 마지막 유효값 (실패 시 예외)"""
+        series = self._fetch_fred_series(series_id)
+        return {"value": float(series.iloc[-1]), "date": series.index[-1].strftime("%Y-%m-%d"), "unit": "%"}
+
+    def get_us_rates(self, keys: Optional[Iterable[str]] = None) -> dict:
         """
         미국 기준금리 및 10년물 국채 수익률 조회 (FRED 공개 API)
 
+        FRED 장애 시 마지막 정상 조회값을 사용합니다.
+
+        Args:
+            keys: 조회할 US_SERIES 키. None이면 전체
+
         Returns:
-            {"fed_funds": float, "us10y": float}
+            {"fed_funds": {...}, "us10y": {...}}
         """
         result = {}
-
-        # 미국 기준금리 (FEDFUNDS, 월별)
-        try:
-            r = requests.get(
-                "https://fred.stlouisfed.org/graph/fredgraph.csv?id=FEDFUNDS",
-                timeout=8
-            )
-            if r.status_code == 200:
-                lines = [l for l in r.text.strip().split("\n") if l and not l.startswith("DATE")]
-                if lines:
-                    last = lines[-1].split(",")
-                    result["fed_funds"] = {
-                        "value": float(last[1]),
-                        "date": last[0],
-                        "unit": "%"
-                    }
-        except Exception:
-            pass
-
-        # 미국 10년물 국채 (DGS10, 일별)
-        try:
-            r2 = requests.get(
-                "https://fred.stlouisfed.org/graph/fredgraph.csv?id=DGS10",
-                timeout=8
+        for key in (keys if keys is not None else self.US_SERIES):
+            series_id = self.US_SERIES[key]
+            value = self.health.call(
+                "fred",
+                lambda series_id=series_id: self._fetch_fred_latest(series_id),
+                cache_key=f"fred:{series_id}",
             )
-            if r2.status_code == 200:
-                lines2 = [l for l in r2.text.strip().split("\n") if l and not l.startswith("DATE")]
-                # 마지막 유효 데이터 (. 이 아닌 값)
-                for line in reversed(lines2):
-                    parts = line.split(",")
-                    if len(parts) == 2 and parts[1].strip() not in (".", ""):
-                        result["us10y"] = {
-                            "value": float(parts[1]),
-                            "date": parts[0],
-                            "unit": "%"
-                        }
-                        break
-        except Exception:
-            pass
-
+            if value:
+                result[key] = value
         return result
 
-    def get_latest_indicators(self) -> dict:
+    def get_history(
+        self,
+        keys: Iterable[str],
+        sessions: int,
+        target_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        일별 지표 이력 (교차 자산 상관 계산용)
+
+        ECOS 일별 지표(기준금리 제외)는 기준일 이하 최근 N거래일,
+        FRED 일별 시계열(us10y)은 같은 기간(미국 날짜 기준)을 조회합니다.
+
+        Args:
+            keys: INDICATORS / US_SERIES 키
+            sessions: 조회 거래일 수
+            target_date: 기준일 (YYYYMMDD). None이면 오늘
+
+        Returns:
+            날짜 인덱스 × 지표 키 컬럼 DataFrame (발표 날짜 기준, 결측 그대로)
+        """
+        columns = {}
+        start_date, end_date = self._session_range(sessions, target_date)
+        for key in keys:
+            if key in self.INDICATORS and key != "base_rate":
+                rows = getattr(self, self.INDICATORS[key][0])(sessions=sessions, target_date=target_date)
+                if rows:
+                    columns[key] = pd.Series(
+                        [float(row.get("DATA_VALUE", "nan")) for row in rows],
+                        index=pd.to_datetime([row.get("TIME", "") for row in rows], format="%Y%m%d"),
+                    )
+            elif key == "us10y":
+                # 미국 시각 기준 전일 값을 쓰므로 며칠 앞부터 조회
+                series_id = self.US_SERIES[key]
+                start = (datetime.strptime(start_date, "%Y%m%d") - timedelta(days=7)).strftime("%Y-%m-%d")
+                series = self.health.call(
+                    "fred",
+                    lambda series_id=series_id: self._fetch_fred_series(series_id).loc[start:end_date],
+                    cache_key=f"fred:{series_id}:history",
+                    encode=lambda s: {d.strftime("%Y-%m-%d"): float(v) for d, v in s.items()},
+                    decode=lambda p: pd.Series(list(p.values()), index=pd.to_datetime(list(p)), dtype=float),
+                )
+                if series is not None and len(series):
+                    columns[key] = series
+
+        if not columns:
+            return pd.DataFrame(columns=list(keys), dtype=float)
+        return pd.DataFrame(columns).sort_index()
+
+    def get_latest_indicators(self, keys: Optional[Iterable[str]] = None) -> dict:
         """
         최신 주요 경제지표 조회
 
+        Args:
+            keys: 조회할 지표 키 (INDICATORS / US_SERIES 키). None이면 전체
+
         Returns:
             주요 지표 dict
         """
+        keys = list(keys) if keys is not None else [*self.INDICATORS, *self.US_SERIES]
         indicators = {}
 
-        # 한국 기준금리
-        base_rate = self.get_base_rate(days_back=30)
-        if base_rate:
-            latest = base_rate[-1]
-            indicators["base_rate"] = {
-                "value": float(latest.get("DATA_VALUE", 0)),
-                "date": latest.get("TIME", ""),
-                "unit": "%",
-                "label": "한국 기준금리"
-            }
-
-        # 원/달러 환율
-        exchange = self.get_exchange_rate(days_back=7)
-        if exchange:
-            latest = exchange[-1]
-            prev = exchange[-2] if len(exchange) > 1 else latest
-            current_val = float(latest.get("DATA_VALUE", 0))
-            prev_val = float(prev.get("DATA_VALUE", 0))
-            indicators["usd_krw"] = {
-                "value": current_val,
-                "change": current_val - prev_val,
-                "date": latest.get("TIME", ""),
-                "unit": "원",
-                "label": "원/달러"
-            }
-
-        # 원/100엔 환율
-        jpy = self.get_jpy_rate(days_back=7)
-        if jpy:
-            latest = jpy[-1]
-            prev = jpy[-2] if len(jpy) > 1 else latest
-            current_val = float(latest.get("DATA_VALUE", 0))
-            prev_val = float(prev.get("DATA_VALUE", 0))
-            indicators["jpy_krw"] = {
-                "value": current_val,
-                "change": current_val - prev_val,
-                "date": latest.get("TIME", ""),
-                "unit": "원",
-                "label": "원/100엔"
-            }
-
-        # 원/유로 환율
-        eur = self.get_eur_rate(days_back=7)
-        if eur:
-            latest = eur[-1]
-            prev = eur[-2] if len(eur) > 1 else latest
-            current_val = float(latest.get("DATA_VALUE", 0))
-            prev_val = float(prev.get("DATA_VALUE", 0))
-            indicators["eur_krw"] = {
-                "value": current_val,
-                "change": current_val - prev_val,
-                "date": latest.get("TIME", ""),
-                "unit": "원",
-                "label": "원/유로"
-            }
-
-        # 원/파운드 환율
-        gbp = self.get_gbp_rate(days_back=7)
-        if gbp:
-            latest = gbp[-1]
-            prev = gbp[-2] if len(gbp) > 1 else latest
-            current_val = float(latest.get("DATA_VALUE", 0))
-            prev_val = float(prev.get("DATA_VALUE", 0))
-            indicators["gbp_krw"] = {
-                "value": current_val,
-                "change": current_val - prev_val,
-                "date": latest.get("TIME", ""),
-                "unit": "원",
-                "label": "원/파운드"
-            }
+        for key in keys:
+            if key not in self.INDICATORS:
+                continue
+            method, unit, label = self.INDICATORS[key]
+            rows = getattr(self, method)()
+            if not rows:
+                continue
 
-        # 국고채 3년
-        bond3y = self.get_bond_yield_3y(days_back=7)
-        if bond3y:
-            latest = bond3y[-1]
-            prev = bond3y[-2] if len(bond3y) > 1 else latest
+            latest = rows[-1]
+            prev = rows[-2] if len(rows) > 1 else latest
             current_val = float(latest.get("DATA_VALUE", 0))
-            prev_val = float(prev.get("DATA_VALUE", 0))
-            indicators["bond_3y"] = {
+            indicators[key] = {
                 "value": current_val,
-                "change": current_val - prev_val,
                 "date": latest.get("TIME", ""),
-                "unit": "%",
-                "label": "국고채 3년"
+                "unit": unit,
+                "label": label,
             }
+            # 기준금리는 변경 시점이 드물어 전일 대비 변화를 표시하지 않음
+            if key != "base_rate":
+                indicators[key]["change"] = current_val - float(prev.get("DATA_VALUE", 0))
 
         # 미국 기준금리 + 10년물 (FRED)
-        us_rates = self.get_us_rates()
-        indicators.update(us_rates)
+        us_keys = [key for key in keys if key in self.US_SERIES]
+        if us_keys:
+            indicators.update(self.get_us_rates(us_keys))
 
         return indicators
 
-    def format_for_briefing(self) -> str:
+    def format_for_briefing(self, indicators: Optional[dict] = None) -> str:
         """
         브리핑용 마크다운 포맷 생성
 
+        Args:
+            indicators: 이미 조회한 get_latest_indicators() 결과 (없으면 전체 조회)
+
         Returns:
             마크다운 문자열
         """
-        indicators = self.get_latest_indicators()
+        if indicators is None:
+            indicators = self.get_latest_indicators()
 
         if not indicators:
             if not self.is_available():
@@ -406,4 +490,4 @@ if __name__ == "__main__":
 
         # 브리핑 포맷
         print("\n=== 브리핑 포맷 ===")
-        print(collector.format_for_briefing())
+        print(collector.format_for_briefing(indicators))
@@ -0,0 +1,179 @@
+"""
+ECOS 통계 시계열 로컬 저장소
+
+ECOS StatisticSearch 조회 결과를 SQLite(data/ecos.sqlite3)에 시계열별로 누적합니다.
+- 시계열 = (통계표코드, 주기, 통계항목코드). 관측값 1건 = (시점, 값)
+- 조회 범위(coverage): 빠짐없이 받은 구간의 시작 시점과 마지막 관측 시점.
+  다음 조회는 이 범위 밖(앞쪽 / 마지막 관측 이후)만 요청합니다.
+- 조회 작업(job): 페이지 단위 진행 상황을 기록해 중단된 조회는 남은 페이지만 이어 받습니다.
+  작업이 끝나야 조회 범위가 넓어지므로 일부 페이지만 받은 구간이 빈 채로 남지 않습니다.
+"""
+import sys
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR
+
+
+def series_key(stat_code: str, item_code: str, period: str) -> str:
+    return f"{stat_code}/{period}/{item_code}"
+
+
+class EcosStore:
+    """SQLite 기반 ECOS 시계열 저장소 + 페이지 조회 진행 기록"""
+
+    def __init__(self, path: Path = DATA_DIR / "ecos.sqlite3"):
+        """
+        Args:
+            path: 저장소 SQLite 파일
+        """
+        self.path = path
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS observations (
+                series TEXT NOT NULL,
+                time TEXT NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (series, time)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS coverage (
+                series TEXT PRIMARY KEY,
+                start TEXT NOT NULL,
+                tail TEXT
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                job TEXT PRIMARY KEY,
+                series TEXT NOT NULL,
+                start TEXT NOT NULL,
+                end TEXT NOT NULL,
+                total INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_pages (
+                job TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                PRIMARY KEY (job, page)
+            );
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def coverage(self, series: str) -> Optional[tuple[str, Optional[str]]]:
+        """(조회 시작 시점, 마지막 관측 시점). 조회한 적 없으면 None"""
+        row = self._connect().execute(
+            "SELECT start, tail FROM coverage WHERE series = ?", (series,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def rows(self, series: str, start: str, end: str) -> list[dict]:
+        """
+        저장된 관측값 (ECOS 응답 row 형식: TIME, DATA_VALUE)
+
+        Args:
+            series: series_key()
+            start, end: 시점 범위 (양끝 포함, ECOS 시점 형식)
+        """
+        cursor = self._connect().execute(
+            "SELECT time, value FROM observations WHERE series = ? AND time BETWEEN ? AND ? ORDER BY time",
+            (series, start, end),
+        )
+        return [{"TIME": time, "DATA_VALUE": value} for time, value in cursor]
+
+    def pending_jobs(self, series: str) -> list[tuple[str, str, str, int]]:
+        """끝나지 않은 조회 작업 (job, start, end, total)"""
+        return self._connect().execute(
+            "SELECT job, start, end, total FROM jobs WHERE series = ? ORDER BY start", (series,)
+        ).fetchall()
+
+    def done_pages(self, job: str) -> set[int]:
+        cursor = self._connect().execute("SELECT page FROM job_pages WHERE job = ?", (job,))
+        return {page for (page,) in cursor}
+
+    def save_page(self, job: str, series: str, start: str, end: str, total: int, page: int, rows: Iterable[dict]) -> int:
+        """
+        조회한 페이지의 관측값 저장 + 진행 기록 (한 트랜잭션)
+
+        Returns:
+            저장한 관측값 수 (값이 비어 있거나 숫자가 아닌 행 제외)
+        """
+        values = []
+        for row in rows:
+            try:
+                values.append((series, str(row["TIME"]), float(row["DATA_VALUE"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        conn = self._connect()
+        # 성공 시에만 COMMIT, 예외 시 ROLLBACK (반쯤 쓴 배치를 남기지 않음)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (job, series, start, end, total) VALUES (?, ?, ?, ?, ?)",
+                (job, series, start, end, total),
+            )
+            # 잠정치가 확정치로 바뀌는 경우가 있어 같은 시점은 덮어씀
+            conn.executemany("INSERT OR REPLACE INTO observations (series, time, value) VALUES (?, ?, ?)", values)
+            conn.execute("INSERT OR IGNORE INTO job_pages (job, page) VALUES (?, ?)", (job, page))
+        return len(values)
+
+    def finish_job(self, job: str) -> None:
+        """모든 페이지를 받은 작업 정리 + 조회 범위 확장"""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT series, start, end FROM jobs WHERE job = ?", (job,)).fetchone()
+            if row:
+                series, start, end = row
+                (tail,) = conn.execute(
+                    "SELECT MAX(time) FROM observations WHERE series = ? AND time <= ?", (series, end)
+                ).fetchone()
+                conn.execute(
+                    "INSERT INTO coverage (series, start, tail) VALUES (?, ?, ?) "
+                    "ON CONFLICT (series) DO UPDATE SET "
+                    "start = MIN(start, excluded.start), "
+                    "tail = NULLIF(MAX(COALESCE(tail, ''), COALESCE(excluded.tail, '')), '')",
+                    (series, start, tail),
+                )
+                conn.execute("DELETE FROM jobs WHERE job = ?", (job,))
+                conn.execute("DELETE FROM job_pages WHERE job = ?", (job,))
+
+    def coverages(self) -> list[tuple[str, str, Optional[str]]]:
+        """시계열별 (series, 조회 시작 시점, 마지막 관측 시점)"""
+        return self._connect().execute("SELECT series, start, tail FROM coverage ORDER BY series").fetchall()
+
+    def count(self) -> tuple[int, int]:
+        """(시계열 수, 관측값 수)"""
+        return self._connect().execute(
+            "SELECT COUNT(DISTINCT series), COUNT(*) FROM observations"
+        ).fetchone()
+
+
+@lru_cache(maxsize=1)
+def get_ecos_store() -> EcosStore:
+    """프로세스 공용 ECOS 저장소"""
+    return EcosStore()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    store = get_ecos_store()
+    series_count, observations = store.count()
+    print(f"ECOS 저장소: {store.path} ({series_count}개 시계열, 관측값 {observations:,}건)")
+    for series, start, tail in store.coverages():
+        print(f"  {series}: {start} ~ {tail}")
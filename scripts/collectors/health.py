@@ -0,0 +1,235 @@
+"""
+소스별 상태 기록 / 서킷 브레이커
+
+RSS 호스트나 FRED가 장애일 때 매 실행마다 타임아웃을 다시 겪지 않도록
+소스별 상태를 SQLite(data/health.sqlite3)에 저장해 실행 간에 유지합니다.
+
+- closed: 정상. 연속 실패가 HEALTH_FAILURE_THRESHOLD회에 도달하면 open
+- open: 호출하지 않고 즉시 마지막 정상 데이터(없으면 기본값)를 반환
+- half_open: open 후 HEALTH_COOLDOWN_SEC가 지나면 1회만 시험 호출.
+  성공하면 closed, 실패하면 다시 open
+"""
+import sys
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR, HEALTH_FAILURE_THRESHOLD, HEALTH_COOLDOWN_SEC
+from collectors.rate_limit import QuotaExceeded
+from collectors.trading_calendar import KST
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 시험 호출이 이 시간(초) 안에 끝나지 않으면 다른 호출자가 다시 시험 호출
+PROBE_TIMEOUT_SEC = 120
+
+
+class SourceHealth:
+    """SQLite 기반 소스별 서킷 브레이커 + 마지막 정상 데이터 보관"""
+
+    def __init__(
+        self,
+        path: Path = DATA_DIR / "health.sqlite3",
+        failure_threshold: int = HEALTH_FAILURE_THRESHOLD,
+        cooldown: float = HEALTH_COOLDOWN_SEC
+    ):
+        """
+        Args:
+            path: 상태 저장 SQLite 파일
+            failure_threshold: open 전환까지 연속 실패 횟수
+            cooldown: open 후 시험 호출까지 대기 시간(초)
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS health (
+                source TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                failures INTEGER NOT NULL,
+                opened_at REAL NOT NULL DEFAULT 0,
+                probe_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT NOT NULL DEFAULT '',
+                last_success REAL NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS last_good (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                saved_at REAL NOT NULL
+            );
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _row(self, conn: sqlite3.Connection, source: str) -> tuple:
+        row = conn.execute(
+            "SELECT state, failures, opened_at, probe_at FROM health WHERE source = ?", (source,)
+        ).fetchone()
+        return row or (CLOSED, 0, 0.0, 0.0)
+
+    def _save(self, conn: sqlite3.Connection, source: str, **values) -> None:
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in values)
+        conn.execute(
+            f"INSERT INTO health (source, {columns}) VALUES (?, {placeholders}) "
+            f"ON CONFLICT (source) DO UPDATE SET {updates}",
+            (source, *values.values()),
+        )
+
+    def allow(self, source: str) -> bool:
+        """
+        호출 허용 여부. open 상태에서 냉각 시간이 지났으면 half_open으로 바꾸고 1회 허용
+        """
+        conn = self._connect()
+        now = time.time()
+        # 상태 읽기 → 전환을 한 트랜잭션으로 (예외 시 ROLLBACK, return 포함 정상 종료 시 COMMIT)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            state, failures, opened_at, probe_at = self._row(conn, source)
+            if state == CLOSED:
+                return True
+            if state == OPEN and now - opened_at < self.cooldown:
+                return False
+            if state == HALF_OPEN and now - probe_at < PROBE_TIMEOUT_SEC:
+                return False
+            self._save(conn, source, state=HALF_OPEN, failures=failures, probe_at=now)
+            return True
+
+    def record_success(self, source: str) -> None:
+        self._save(self._connect(), source, state=CLOSED, failures=0, last_success=time.time())
+
+    def record_failure(self, source: str, error: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            state, failures, opened_at, _ = self._row(conn, source)
+            failures += 1
+            if state == HALF_OPEN or failures >= self.failure_threshold:
+                state, opened_at = OPEN, time.time()
+            self._save(conn, source, state=state, failures=failures,
+                       opened_at=opened_at, last_error=error[:200])
+
+    def save_last_good(self, key: str, payload: Any) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO last_good (key, payload, saved_at) VALUES (?, ?, ?)",
+            (key, json.dumps(payload, ensure_ascii=False), time.time()),
+        )
+
+    def load_last_good(self, key: str) -> Optional[Any]:
+        row = self._connect().execute(
+            "SELECT payload FROM last_good WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def call(
+        self,
+        source: str,
+        fetch: Callable[[], Any],
+        default: Any = None,
+        cache_key: Optional[str] = None,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        """
+        서킷 브레이커를 거쳐 fetch 실행
+
+        Args:
+            source: 상태를 기록할 소스 이름 (예: "fred", "news:한국경제")
+            fetch: 실제 조회 함수. 실패 시 예외를 발생시켜야 함
+            default: 실패/차단 시 마지막 정상 데이터도 없으면 반환할 값
+            cache_key: 마지막 정상 데이터 저장 키. None이면 저장하지 않음
+            encode: 결과 → JSON 직렬화 가능한 값 (기본: 그대로)
+            decode: encode의 역변환 (기본: 그대로)
+
+        Returns:
+            fetch 결과. 차단/실패 시 마지막 정상 데이터 또는 default
+        """
+        def fallback():
+            if cache_key is None:
+                return default
+            payload = self.load_last_good(cache_key)
+            if payload is None:
+                return default
+            return decode(payload) if decode else payload
+
+        if not self.allow(source):
+            return fallback()
+
+        try:
+            result = fetch()
+        except QuotaExceeded as e:
+            # 호출 한도는 소스 장애가 아님
+            print(f"  [경고] {e}")
+            return fallback()
+        except Exception as e:
+            self.record_failure(source, f"{type(e).__name__}: {e}")
+            note = ", 마지막 정상 데이터 사용" if cache_key is not None else ""
+            print(f"  [경고] {source} 조회 실패{note}: {e}")
+            return fallback()
+
+        self.record_success(source)
+        if cache_key is not None:
+            self.save_last_good(cache_key, encode(result) if encode else result)
+        return result
+
+    def snapshot(self) -> list[dict]:
+        """전체 소스 상태 목록"""
+        rows = self._connect().execute(
+            "SELECT source, state, failures, opened_at, last_error, last_success "
+            "FROM health ORDER BY source"
+        ).fetchall()
+        keys = ["source", "state", "failures", "opened_at", "last_error", "last_success"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def format_health(self) -> str:
+        """소스별 상태 요약 (콘솔 출력용)"""
+        rows = self.snapshot()
+        if not rows:
+            return "소스 상태 기록 없음"
+
+        lines = ["소스 상태:"]
+        for row in rows:
+            last_ok = (
+                datetime.fromtimestamp(row["last_success"], KST).strftime("%m-%d %H:%M")
+                if row["last_success"] else "-"
+            )
+            line = f"  - {row['source']}: {row['state']} (연속 실패 {row['failures']}, 마지막 정상 {last_ok})"
+            if row["state"] != CLOSED and row["last_error"]:
+                line += f" | {row['last_error']}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def get_health() -> SourceHealth:
+    """프로세스 공용 소스 상태 기록"""
+    return SourceHealth()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    print(get_health().format_health())
@@ -0,0 +1,355 @@
+"""
+장중 스냅샷 수집기
+
+장중에 관심 종목과 KOSPI/KOSDAQ 지수의 현재가를 일정 간격으로 폴링하여
+고정 크기 메모리 링 버퍼에 쌓습니다. 버퍼가 가득 차면 오래된 스냅샷은 디스크로 내보냅니다.
+- 관심 종목: 전종목 시세 bulk 1회 호출에서 관심 종목만 추출
+- 지수: 지수별 당일 OHLCV 1회 호출
+
+미드데이 브리핑은 이 스냅샷으로 장중 고가/저가, 거래량 가중 평균가, 오전 흐름을 보여줍니다.
+pykrx 시세는 KRX 정보데이터시스템 기준이므로 장중 값은 실시간이 아닌 지연 시세입니다.
+"""
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    DATA_DIR, WATCHLIST_STOCKS,
+    INTRADAY_INTERVAL_SEC, INTRADAY_BUFFER_SIZE, INTRADAY_END_TIME,
+)
+from collectors.krx_collector import KrxCollector
+from collectors.trading_calendar import now_kst, today_kst
+
+
+# 장중 추적 지수 (지수 코드 → 표시명)
+INTRADAY_INDICES = {"1001": "KOSPI", "2001": "KOSDAQ"}
+
+
+class SnapshotRingBuffer:
+    """
+    고정 크기 스냅샷 링 버퍼
+
+    시각 × 종목 2차원 배열을 필드별로 미리 할당해 두고 순환하며 덮어씁니다.
+    가득 찬 상태에서 새 스냅샷이 들어오면 가장 오래된 spill_batch개를 한 번에 디스크(CSV)로 내보냅니다.
+    """
+
+    FIELDS = ("open", "high", "low", "price", "volume")
+
+    def __init__(
+        self,
+        symbols: list[str],
+        capacity: int = INTRADAY_BUFFER_SIZE,
+        spill_path: Optional[Path] = None,
+        spill_batch: Optional[int] = None
+    ):
+        """
+        Args:
+            symbols: 종목/지수 코드 (열 순서 고정)
+            capacity: 메모리에 보관할 최대 스냅샷 수
+            spill_path: 밀려난 스냅샷을 이어 쓸 CSV 경로. None이면 버림
+            spill_batch: 한 번에 내보낼 스냅샷 수 (기본 capacity의 1/4)
+        """
+        self.symbols = list(symbols)
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = max(1, spill_batch or capacity // 4)
+
+        n = len(self.symbols)
+        self.timestamps = np.empty(capacity, dtype="datetime64[s]")
+        self.values = {field: np.full((capacity, n), np.nan) for field in self.FIELDS}
+        self._start = 0  # 가장 오래된 슬롯
+        self._size = 0
+        self.spilled = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: datetime, values: dict[str, np.ndarray]) -> None:
+        """
+        스냅샷 1건 추가
+
+        Args:
+            timestamp: 스냅샷 시각
+            values: 필드 → 종목 순서 배열 (없는 필드는 NaN)
+        """
+        if self._size == self.capacity:
+            self._spill(self.spill_batch)
+
+        slot = (self._start + self._size) % self.capacity
+        self.timestamps[slot] = np.datetime64(timestamp, "s")
+        for field in self.FIELDS:
+            row = values.get(field)
+            self.values[field][slot] = np.nan if row is None else row
+        self._size += 1
+
+    def _ordered_slots(self, count: Optional[int] = None) -> np.ndarray:
+        """오래된 순서의 슬롯 인덱스"""
+        count = self._size if count is None else min(count, self._size)
+        return (self._start + np.arange(count)) % self.capacity
+
+    def _spill(self, count: int) -> None:
+        """가장 오래된 count개 스냅샷을 디스크로 내보내고 버퍼에서 제거"""
+        slots = self._ordered_slots(count)
+        if self.spill_path is not None and len(slots):
+            frame = self._long_frame(slots)
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            write_header = not self.spill_path.exists()
+            frame.to_csv(self.spill_path, mode="a", header=write_header, index=False)
+
+        self._start = (self._start + len(slots)) % self.capacity
+        self._size -= len(slots)
+        self.spilled += len(slots)
+
+    def flush(self) -> None:
+        """버퍼 전체를 디스크로 내보냄 (수집 종료 시)"""
+        self._spill(self._size)
+
+    def _long_frame(self, slots: np.ndarray) -> pd.DataFrame:
+        """슬롯들을 long-format DataFrame으로 변환 (timestamp, symbol, 필드...)"""
+        n = len(self.symbols)
+        frame = pd.DataFrame({
+            "timestamp": np.repeat(self.timestamps[slots], n),
+            "symbol": np.tile(self.symbols, len(slots)),
+        })
+        for field in self.FIELDS:
+            frame[field] = self.values[field][slots].ravel()
+        return frame
+
+    def to_frame(self, include_spilled: bool = True) -> pd.DataFrame:
+        """
+        수집된 스냅샷 전체를 시간순 long-format DataFrame으로 반환
+
+        Args:
+            include_spilled: 디스크로 내보낸 스냅샷도 포함할지
+        """
+        frames = []
+        if include_spilled and self.spill_path is not None and self.spill_path.exists():
+            frames.append(load_snapshots(self.spill_path))
+        if self._size:
+            frames.append(self._long_frame(self._ordered_slots()))
+        if not frames:
+            return pd.DataFrame(columns=["timestamp", "symbol", *self.FIELDS])
+        return pd.concat(frames, ignore_index=True)
+
+
+def load_snapshots(path: Path) -> pd.DataFrame:
+    """디스크에 저장된 스냅샷 CSV 로드"""
+    return pd.read_csv(path, dtype={"symbol": str}, parse_dates=["timestamp"])
+
+
+def summarize_intraday(snapshots: pd.DataFrame, checkpoint_minutes: int = 30) -> pd.DataFrame:
+    """
+    장중 스냅샷을 종목별 요약으로 변환 (전 종목 벡터 연산)
+
+    Args:
+        snapshots: long-format 스냅샷 (timestamp, symbol, open, high, low, price, volume)
+        checkpoint_minutes: 흐름(trajectory) 표시 간격(분)
+
+    Returns:
+        symbol 인덱스 DataFrame
+        columns = [open, price, high, low, change_pct, vwap, samples, first, last, trajectory]
+    """
+    if snapshots is None or snapshots.empty:
+        return pd.DataFrame()
+
+    snapshots = snapshots.dropna(subset=["price"])
+    if snapshots.empty:
+        return pd.DataFrame()
+
+    price = snapshots.pivot_table(index="timestamp", columns="symbol", values="price", aggfunc="last")
+    volume = snapshots.pivot_table(index="timestamp", columns="symbol", values="volume", aggfunc="last")
+    volume = volume.reindex_like(price).ffill().fillna(0)
+
+    # 누적 거래량 증분을 가중치로 사용 (첫 스냅샷은 그때까지의 누적 거래량 전체)
+    traded = volume.diff().clip(lower=0)
+    traded.iloc[0] = volume.iloc[0]
+    weight_sum = traded.sum()
+    vwap = (price * traded).sum() / weight_sum.where(weight_sum > 0)
+
+    by_symbol = snapshots.groupby("symbol")
+    summary = pd.DataFrame({
+        "open": by_symbol["open"].first(),
+        "price": price.ffill().iloc[-1],
+        # 스냅샷 사이 고가/저가는 당일 봉의 고가/저가로 보완
+        "high": np.fmax(price.max(), by_symbol["high"].max()),
+        "low": np.fmin(price.min(), by_symbol["low"].min()),
+        "vwap": vwap.fillna(price.mean()),
+        "samples": price.count(),
+        "first": price.index[0],
+        "last": price.index[-1],
+    })
+    base = summary["open"].where(summary["open"] > 0, price.bfill().iloc[0])
+    summary["change_pct"] = (summary["price"] / base - 1) * 100
+
+    # 구간 마지막 가격을 구간 종료 시각으로 표시 (예: 09:00~09:30 → "09:30")
+    checkpoints = price.resample(f"{checkpoint_minutes}min", label="right").last().dropna(how="all")
+    summary["trajectory"] = [
+        [(ts.strftime("%H:%M"), value) for ts, value in checkpoints[symbol].dropna().items()]
+        for symbol in summary.index
+    ]
+    return summary
+
+
+class IntradayCollector:
+    """장중 현재가 폴링 수집기"""
+
+    def __init__(
+        self,
+        krx: Optional[KrxCollector] = None,
+        tickers: Optional[list[str]] = None,
+        interval: int = INTRADAY_INTERVAL_SEC,
+        capacity: int = INTRADAY_BUFFER_SIZE,
+        date: Optional[str] = None
+    ):
+        """
+        Args:
+            krx: 시세 조회에 사용할 KrxCollector. None이면 새로 생성
+            tickers: 관심 종목 코드. None이면 WATCHLIST_STOCKS
+            interval: 폴링 간격(초)
+            capacity: 링 버퍼 크기
+            date: 수집 일자 (YYYYMMDD). None이면 오늘
+        """
+        self.krx = krx or KrxCollector()
+        self.tickers = list(tickers if tickers is not None else WATCHLIST_STOCKS)
+        self.interval = interval
+        self.date = date or now_kst().strftime("%Y%m%d")
+        self.buffer = SnapshotRingBuffer(
+            self.tickers + list(INTRADAY_INDICES),
+            capacity=capacity,
+            spill_path=self.spill_path(self.date),
+        )
+
+    @staticmethod
+    def spill_path(date: str) -> Path:
+        """일자별 스냅샷 저장 경로"""
+        return DATA_DIR / "intraday" / f"{date}.csv"
+
+    def is_available(self) -> bool:
+        """라이브러리 사용 가능 여부"""
+        return self.krx.is_available()
+
+    def poll_once(self) -> bool:
+        """
+        현재가 스냅샷 1건 수집
+
+        Returns:
+            하나 이상의 종목/지수 시세를 받았으면 True
+        """
+        n = len(self.buffer.symbols)
+        values = {field: np.full(n, np.nan) for field in SnapshotRingBuffer.FIELDS}
+
+        # 관심 종목: 전종목 시세 1회 호출 후 추출
+        snapshot = self.krx.get_market_snapshot(self.date, with_cap=False)
+        if not snapshot.empty:
+            rows = snapshot.reindex(self.tickers)
+            for field, column in (("open", "open"), ("high", "high"), ("low", "low"),
+                                  ("price", "close"), ("volume", "volume")):
+                values[field][:len(self.tickers)] = rows[column].to_numpy(dtype="float64")
+
+        # 지수: 지수별 당일 봉
+        for i, index_ticker in enumerate(INTRADAY_INDICES, start=len(self.tickers)):
+            bars = self.krx.get_index_ohlcv(index_ticker, days_back=0, target_date=self.date)
+            if len(bars):
+                bar = bars[-1]
+                values["open"][i] = bar["open"]
+                values["high"][i] = bar["high"]
+                values["low"][i] = bar["low"]
+                values["price"][i] = bar["close"]
+                values["volume"][i] = bar["volume"]
+
+        if np.isnan(values["price"]).all():
+            return False
+
+        self.buffer.append(now_kst(), values)
+        return True
+
+    def run(self, end_time: str = INTRADAY_END_TIME) -> None:
+        """
+        end_time(HH:MM)까지 interval 간격으로 폴링
+
+        종료 시 버퍼를 디스크에 모두 기록하므로 다른 프로세스도 load_day()로 읽을 수 있습니다.
+        """
+        end = datetime.combine(today_kst(), datetime.strptime(end_time, "%H:%M").time())
+        print(f"장중 스냅샷 수집 시작 ({self.interval}초 간격, {end_time}까지)")
+
+        try:
+            while now_kst() < end:
+                started = time.monotonic()
+                if self.poll_once():
+                    print(f"  [{now_kst():%H:%M:%S}] 스냅샷 {len(self.buffer) + self.buffer.spilled}건")
+                elapsed = time.monotonic() - started
+                time.sleep(max(0.0, min(self.interval - elapsed, (end - now_kst()).total_seconds())))
+        except KeyboardInterrupt:
+            print("장중 수집 중단")
+        finally:
+            self.buffer.flush()
+
+    def get_snapshots(self) -> pd.DataFrame:
+        """디스크 + 메모리 스냅샷 전체"""
+        return self.buffer.to_frame()
+
+    @classmethod
+    def load_day(cls, date: Optional[str] = None) -> pd.DataFrame:
+        """저장된 일자별 스냅샷 로드 (없으면 빈 DataFrame)"""
+        date = date or now_kst().strftime("%Y%m%d")
+        path = cls.spill_path(date)
+        return load_snapshots(path) if path.exists() else pd.DataFrame()
+
+    def format_for_briefing(self, snapshots: Optional[pd.DataFrame] = None) -> str:
+        """
+        브리핑용 마크다운 포맷 생성
+
+        Args:
+            snapshots: 요약할 스냅샷. None이면 현재 수집분 (디스크 + 메모리)
+
+        Returns:
+            마크다운 문자열
+        """
+        if snapshots is None:
+            snapshots = self.get_snapshots()
+        summary = summarize_intraday(snapshots)
+        if summary.empty:
+            return "### 장중 흐름\n장중 스냅샷이 없습니다. (python scripts/main.py --intraday 로 수집)"
+
+        first = summary["first"].min()
+        last = summary["last"].max()
+        lines = [f"### 장중 흐름 ({first:%H:%M}~{last:%H:%M}, 스냅샷 {int(summary['samples'].max())}회)"]
+
+        for symbol, row in summary.iterrows():
+            name = INTRADAY_INDICES.get(symbol) or self.krx.get_ticker_name(symbol)
+            label = f"**{name}**" if symbol in INTRADAY_INDICES else f"**{name}** ({symbol})"
+            fmt = ",.2f" if symbol in INTRADAY_INDICES else ",.0f"
+            trajectory = " → ".join(f"{hhmm} {value:{fmt}}" for hhmm, value in row["trajectory"])
+            lines.append(
+                f"- {label}: {row['price']:{fmt}} (시가 대비 {row['change_pct']:+.2f}%) "
+                f"| 장중 고가 {row['high']:{fmt}} / 저가 {row['low']:{fmt}} "
+                f"| 가중평균 {row['vwap']:{fmt}}"
+            )
+            if trajectory:
+                lines.append(f"  - 흐름: {trajectory}")
+
+        return "\n".join(lines)
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    collector = IntradayCollector(interval=10)
+
+    if not collector.is_available():
+        print("PyKRX를 사용할 수 없습니다.")
+        print("설치: pip install pykrx")
+    else:
+        print("장중 스냅샷 3회 수집 테스트...")
+        for _ in range(3):
+            collector.poll_once()
+            time.sleep(collector.interval)
+        print(collector.format_for_briefing())
@@ -10,11 +10,15 @@ PyKRX 라이브러리를 통해 주식 시세 데이터를 수집합니다.
 """
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
 
-# 프로젝트 루트 경로 추가
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from pykrx import stock
@@ -23,27 +27,75 @@ except ImportError:
     PYKRX_AVAILABLE = False
     print("Warning: pykrx not installed. Run: pip install pykrx")
 
-from config import WATCHLIST_STOCKS
+from config import WATCHLIST_STOCKS, DATA_DIR
+from collectors.records import Quote, frame_to_bars, frame_to_records
+from collectors.trading_calendar import get_calendar, now_kst, today_kst
+from collectors.rate_limit import get_limiter
+from collectors.health import get_health
+from collectors.universe_matrix import get_universe
+from analytics.indicators import IndicatorEngine
+
+
+# pykrx 한글 컬럼 → 내부 컬럼명
+OHLCV_COLUMNS = {
+    "날짜": "date",
+    "시가": "open",
+    "고가": "high",
+    "저가": "low",
+    "종가": "close",
+    "거래량": "volume",
+    "등락률": "change_pct",
+}
+
+# 관심 종목 기술적 지표 롤링 상태 (브리핑마다 새 일봉만 반영)
+INDICATOR_STATE_PATH = DATA_DIR / "indicators.npz"
 
 
 class KrxCollector:
     """KRX 주식 데이터 수집기"""
 
+    # AI 프롬프트 필수 규칙과 동일한 기준 (등락률 ±3%, 고저 스프레드 5%)
+    BIG_MOVE_PCT = 3.0
+    WIDE_SPREAD_PCT = 5.0
+    VOLUME_AVG_WINDOW = 20
+    # 지표 상태가 없거나 끊긴 종목의 이력 재적재 기간 (MA60 + RSI/ATR 평활 안정화)
+    INDICATOR_WARMUP_SESSIONS = 120
+
     def __init__(self):
         self.available = PYKRX_AVAILABLE
+        self._ticker_names: dict[str, str] = {}
+        self.limiter = get_limiter()
+        self.health = get_health()
 
     def is_available(self) -> bool:
         """라이브러리 사용 가능 여부"""
         return self.available
 
-    def get_market_ohlcv(
+    def _call(self, endpoint: str, fn, *args, **kwargs):
+        """
+        pykrx 호출 (호출 제한 + 엔드포인트별 서킷 브레이커). 실패 또는 차단 시 None
+
+        호출 제한은 KRX 전체("krx")로 공유하지만, 서킷 브레이커는 "krx:{endpoint}"별로 둡니다.
+        지수 엔드포인트 장애가 종목 시세 조회까지 막지 않도록 하기 위함입니다.
+        상장폐지·신규 종목 등으로 pykrx가 데이터 없음을 KeyError/IndexError로 알리는 경우는
+        장애로 세지 않고 None을 반환합니다.
+        """
+        def fetch():
+            self.limiter.acquire("krx")
+            try:
+                return fn(*args, **kwargs)
+            except (KeyError, IndexError):
+                return None
+        return self.health.call(f"krx:{endpoint}", fetch)
+
+    def get_market_ohlcv_frame(
         self,
         ticker: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> list[dict]:
+    ) -> pd.DataFrame:
         """
-        종목 OHLCV(시가/고가/저가/종가/거래량) 조회
+        종목 OHLCV를 DataFrame 그대로 조회
 
         Args:
             ticker: 종목 코드 (예: "005930")
@@ -51,70 +103,103 @@ class KrxCollector:
             end_date: 종료일 (YYYYMMDD)
 
         Returns:
-            OHLCV 데이터 리스트
+            날짜 인덱스의 OHLCV DataFrame (pykrx 한글 컬럼). 실패 시 빈 DataFrame
         """
         if not self.is_available():
-            return []
+            return pd.DataFrame()
 
         if end_date is None:
-            end_date = datetime.now().strftime("%Y%m%d")
+            end_date = now_kst().strftime("%Y%m%d")
         if start_date is None:
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
+            start_date = (now_kst() - timedelta(days=7)).strftime("%Y%m%d")
 
-        try:
-            df = stock.get_market_ohlcv(start_date, end_date, ticker)
-            if df is None or df.empty:
-                return []
+        df = self._call("ohlcv", stock.get_market_ohlcv, start_date, end_date, ticker)
+        if df is None or df.empty:
+            return pd.DataFrame()
+        return df
 
-            # 인덱스(날짜)를 컬럼으로 변환
-            df = df.reset_index()
-            df["날짜"] = df["날짜"].dt.strftime("%Y-%m-%d")
-            return df.to_dict("records")
+    def get_market_ohlcv(
+        self,
+        ticker: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        종목 OHLCV(시가/고가/저가/종가/거래량) 조회
 
-        except Exception as e:
-            print(f"OHLCV 조회 오류 ({ticker}): {e}")
-            return []
+        Args:
+            ticker: 종목 코드 (예: "005930")
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            OHLCV_DTYPE structured array (records.py 참고)
+        """
+        return frame_to_bars(self.get_market_ohlcv_frame(ticker, start_date, end_date))
 
     def get_index_ohlcv(
         self,
         index_ticker: str = "1001",  # 1001=KOSPI, 2001=KOSDAQ
         days_back: int = 7,
-        target_date: Optional[str] = None
-    ) -> list[dict]:
+        target_date: Optional[str] = None,
+        sessions: Optional[int] = None
+    ) -> np.ndarray:
         """
         지수 OHLCV 조회
 
         Args:
             index_ticker: 지수 코드 (1001=KOSPI, 2001=KOSDAQ)
-            days_back: 며칠 전 데이터까지
+            days_back: 며칠 전 데이터까지 (sessions 지정 시 무시)
             target_date: 조회 기준 날짜 (YYYYMMDD). None이면 오늘
+            sessions: 기준일 이하 최근 N거래일만 정확히 조회
 
         Returns:
-            지수 OHLCV 데이터
+            OHLCV_DTYPE structured array (records.py 참고)
         """
         if not self.is_available():
-            return []
+            return frame_to_bars(None)
 
         if target_date:
             base = datetime.strptime(target_date, "%Y%m%d")
         else:
-            base = datetime.now()
+            base = now_kst()
 
-        end_date = base.strftime("%Y%m%d")
-        start_date = (base - timedelta(days=days_back)).strftime("%Y%m%d")
+        if sessions:
+            calendar = get_calendar()
+            end = calendar.session_on_or_before(base)
+            end_date = end.strftime("%Y%m%d")
+            start_date = calendar.sessions_back(end, sessions - 1).strftime("%Y%m%d")
+        else:
+            end_date = base.strftime("%Y%m%d")
+            start_date = (base - timedelta(days=days_back)).strftime("%Y%m%d")
 
-        try:
-            df = stock.get_index_ohlcv(start_date, end_date, index_ticker)
-            if df is None or df.empty:
-                return []
+        return frame_to_bars(self._call("index", stock.get_index_ohlcv, start_date, end_date, index_ticker))
 
-            df = df.reset_index()
-            df["날짜"] = df["날짜"].dt.strftime("%Y-%m-%d")
-            return df.to_dict("records")
+    def get_market_cap_frame(
+        self,
+        date: Optional[str] = None,
+        market: str = "ALL"
+    ) -> pd.DataFrame:
+        """
+        특정 일자 전종목 시가총액 (bulk 1회 호출)
 
-        except Exception as e:
-            print(f"지수 조회 오류 ({index_ticker}): {e}")
-            return []
+        Args:
+            date: 조회 날짜 (YYYYMMDD), None이면 오늘
+            market: KOSPI / KOSDAQ / KONEX / ALL
+
+        Returns:
+            티커 인덱스 DataFrame (종가, 시가총액, 거래량, 거래대금, 상장주식수). 실패 시 빈 DataFrame
+        """
+        if not self.is_available():
+            return pd.DataFrame()
+
+        if date is None:
+            date = now_kst().strftime("%Y%m%d")
+
+        df = self._call("market_cap", stock.get_market_cap, date, market=market)
+        if df is None or df.empty:
+            return pd.DataFrame()
+        return df
 
     def get_market_cap(self, date: Optional[str] = None) -> list[dict]:
         """
@@ -126,82 +211,395 @@ class KrxCollector:
         Returns:
             시가총액 데이터
         """
-        if not self.is_available():
+        df = self.get_market_cap_frame(date)
+        if df.empty:
             return []
 
+        df = df.sort_values("시가총액", ascending=False).reset_index()
+        return df.head(20).to_dict("records")  # 상위 20종목
+
+    def get_market_snapshot(
+        self,
+        date: Optional[str] = None,
+        market: str = "ALL",
+        with_cap: bool = True
+    ) -> pd.DataFrame:
+        """
+        특정 일자 전종목 시세 + 시가총액 스냅샷
+
+        전종목 OHLCV 1회 + 전종목 시가총액 1회, 총 2회의 bulk 호출로 구성합니다.
+
+        Args:
+            date: 조회 날짜 (YYYYMMDD), None이면 오늘
+            market: KOSPI / KOSDAQ / KONEX / ALL
+            with_cap: False면 시가총액 조회를 생략 (장중 폴링 등 시세만 필요할 때)
+
+        Returns:
+            티커 인덱스 DataFrame
+            columns = [open, high, low, close, volume, value, change_pct, market_cap, shares]
+            휴장일 등으로 거래가 없으면 빈 DataFrame
+        """
+        if not self.is_available():
+            return pd.DataFrame()
+
         if date is None:
-            date = datetime.now().strftime("%Y%m%d")
+            date = now_kst().strftime("%Y%m%d")
+
+        ohlcv = self._call("snapshot", stock.get_market_ohlcv, date, market=market)
+
+        # 휴장일에는 빈 결과 또는 거래량 0 행만 반환됨
+        if ohlcv is None or ohlcv.empty or not (ohlcv["거래량"] > 0).any():
+            return pd.DataFrame()
+
+        snapshot = ohlcv.rename(columns={**OHLCV_COLUMNS, "거래대금": "value"})
+        cap = self.get_market_cap_frame(date, market=market) if with_cap else pd.DataFrame()
+        if not cap.empty:
+            snapshot = snapshot.join(
+                cap[["시가총액", "상장주식수"]].rename(
+                    columns={"시가총액": "market_cap", "상장주식수": "shares"}
+                ),
+                how="left",
+            )
+        snapshot.index.name = "ticker"
+        return snapshot
 
-        try:
-            df = stock.get_market_cap(date)
-            if df is None or df.empty:
-                return []
+    def get_latest_market_snapshot(
+        self,
+        target_date: Optional[str] = None,
+        max_sessions: int = 2,
+        with_cap: bool = True
+    ) -> pd.DataFrame:
+        """
+        기준일 이하 가장 최근 거래일의 전종목 스냅샷
 
-            df = df.reset_index()
-            return df.head(20).to_dict("records")  # 상위 20종목
+        거래일 달력으로 휴장일을 조회 없이 건너뜁니다.
+        당일 개장 전처럼 거래일인데 아직 시세가 없으면 직전 거래일을 조회합니다.
 
-        except Exception as e:
-            print(f"시가총액 조회 오류: {e}")
-            return []
+        Args:
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 오늘
+            max_sessions: 최대 조회할 거래일 수
+            with_cap: False면 시가총액 조회를 생략
 
-    def get_ticker_name(self, ticker: str) -> str:
-        """종목 코드로 종목명 조회"""
+        Returns:
+            get_market_snapshot() 결과 (+ attrs["date"]=실제 거래일). 없으면 빈 DataFrame
+        """
+        calendar = get_calendar()
+        base = datetime.strptime(target_date, "%Y%m%d") if target_date else now_kst()
+
+        day = calendar.session_on_or_before(base)
+        for _ in range(max_sessions):
+            snapshot = self.get_market_snapshot(day.strftime("%Y%m%d"), with_cap=with_cap)
+            if not snapshot.empty:
+                snapshot.attrs["date"] = day.strftime("%Y-%m-%d")
+                return snapshot
+            day = calendar.previous_session(day)
+
+        return pd.DataFrame()
+
+    def update_universe(self, snapshot: pd.DataFrame) -> int:
+        """
+        전종목 스냅샷을 전종목 행렬(data/universe/)에 기록 (추가 조회 없음)
+
+        Args:
+            snapshot: get_latest_market_snapshot() 결과 (attrs["date"] 필요, 장 마감 후 시세)
+
+        Returns:
+            기록한 종목 수
+        """
+        if snapshot is None or snapshot.empty or "date" not in snapshot.attrs:
+            return 0
+        return get_universe().update(snapshot.attrs["date"], snapshot)
+
+    def backfill_universe(self, sessions: int, target_date: Optional[str] = None) -> int:
+        """
+        최근 N거래일 중 전종목 행렬에 없는 날짜만 전종목 시세 bulk 조회로 채움
+
+        Args:
+            sessions: 거래일 수 (기준일 포함)
+            target_date: 기준일 (YYYYMMDD). None이면 오늘 (장 마감 전이면 직전 거래일까지)
+
+        Returns:
+            새로 기록한 거래일 수
+        """
+        calendar = get_calendar()
+        base = datetime.strptime(target_date, "%Y%m%d") if target_date else now_kst()
+        end = calendar.session_on_or_before(base)
+        # 당일 장 마감 전 시세는 확정값이 아니므로 직전 거래일까지
+        if end == today_kst() and now_kst().strftime("%H:%M") < calendar.session_hours(end)[1]:
+            end = calendar.previous_session(end)
+        start = calendar.sessions_back(end, sessions - 1)
+
+        universe = get_universe()
+        added = 0
+        for day in calendar.sessions_between(start, end):
+            if universe.has(day):
+                continue
+            snapshot = self.get_market_snapshot(day.strftime("%Y%m%d"), with_cap=False)
+            if not snapshot.empty:
+                universe.update(day, snapshot)
+                added += 1
+        return added
+
+    def get_index_family_ohlcv(self, date: str, family: str = "KOSPI") -> pd.DataFrame:
+        """
+        지수 계열 전체(업종/규모/테마 지수 등)의 하루 OHLCV를 bulk 1회로 조회
+
+        Args:
+            date: 조회 날짜 (YYYYMMDD)
+            family: KRX / KOSPI / KOSDAQ / 테마
+
+        Returns:
+            지수명 인덱스 DataFrame (open, high, low, close, volume, value).
+            휴장일 / 개장 전이라 시세가 없으면 빈 DataFrame
+        """
         if not self.is_available():
-            return ticker
+            return pd.DataFrame()
+
+        df = self._call("index", stock.get_index_ohlcv_by_ticker, date, family)
+        if df is None or df.empty:
+            return pd.DataFrame()
+        bars = df.rename(columns={**OHLCV_COLUMNS, "거래대금": "value"})
+        # 산출하지 않는 지수(외국주포함 등)는 0으로 채워져 옴
+        bars = bars[bars["close"] > 0]
+        if bars.empty or not (bars["open"] > 0).any():
+            return pd.DataFrame()
+        return bars[["open", "high", "low", "close", "volume", "value"]].astype(float)
+
+    def get_sector_classifications(self, date: str, market: str = "KOSPI") -> dict[str, str]:
+        """
+        시장 전종목 업종 분류를 bulk 1회로 조회
+
+        Args:
+            date: 조회 날짜 (YYYYMMDD, 거래일)
+            market: KOSPI / KOSDAQ
 
-        try:
-            return stock.get_market_ticker_name(ticker)
-        except Exception:
+        Returns:
+            종목 코드 → 업종명. 실패 시 빈 dict
+        """
+        if not self.is_available():
+            return {}
+
+        df = self._call("sector", stock.get_market_sector_classifications, date, market)
+        if df is None or df.empty or "업종명" not in df:
+            return {}
+        return {str(ticker): str(sector) for ticker, sector in df["업종명"].items() if sector}
+
+    def get_ticker_name(self, ticker: str) -> str:
+        """
+        종목 코드로 종목명 조회 (인스턴스 내 캐시)
+
+        pykrx는 종목명을 메모리의 티커 목록에서 찾으므로 호출 제한/서킷 브레이커를 거치지 않습니다.
+        """
+        if not self.is_available():
             return ticker
 
-    def get_watchlist_data(self, target_date: Optional[str] = None) -> list[dict]:
+        if ticker not in self._ticker_names:
+            try:
+                name = stock.get_market_ticker_name(ticker)
+            except Exception:
+                return ticker
+            if not isinstance(name, str) or not name:
+                return ticker
+            self._ticker_names[ticker] = name
+        return self._ticker_names[ticker]
+
+    def get_watchlist_history(
+        self,
+        tickers: Optional[list[str]] = None,
+        target_date: Optional[str] = None,
+        sessions: int = VOLUME_AVG_WINDOW + 1
+    ) -> pd.DataFrame:
         """
-        관심 종목의 최근 시세 조회
+        관심 종목 OHLCV 이력을 하나의 long-format DataFrame으로 조회
 
         Args:
-            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 최근 영업일
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 오늘
+            sessions: 조회 거래일 수. 기본은 당일 + 직전 20거래일 (평균 거래량 계산용)
 
         Returns:
-            관심 종목 시세 데이터
+            columns = [ticker, date, open, high, low, close, volume, (change_pct)]
         """
-        results = []
+        tickers = tickers if tickers is not None else WATCHLIST_STOCKS
 
         if target_date:
             base = datetime.strptime(target_date, "%Y%m%d")
         else:
-            base = datetime.now()
+            base = now_kst()
+
+        calendar = get_calendar()
+        end = calendar.session_on_or_before(base)
+        start_date = calendar.sessions_back(end, sessions - 1).strftime("%Y%m%d")
+        end_date = end.strftime("%Y%m%d")
 
-        for ticker in WATCHLIST_STOCKS:
-            ohlcv = self.get_market_ohlcv(
-                ticker,
-                start_date=(base - timedelta(days=7)).strftime("%Y%m%d"),
-                end_date=base.strftime("%Y%m%d")
+        frames = {}
+        for ticker in tickers:
+            df = self.get_market_ohlcv_frame(ticker, start_date=start_date, end_date=end_date)
+            if not df.empty:
+                frames[ticker] = df
+
+        if not frames:
+            return pd.DataFrame()
+
+        history = pd.concat(frames, names=["ticker", "date"]).reset_index()
+        return history.rename(columns=OHLCV_COLUMNS)
+
+    def compute_watchlist_frame(self, history: pd.DataFrame) -> pd.DataFrame:
+        """
+        관심 종목 지표를 전 종목 한 번에 벡터 연산으로 계산
+
+        Args:
+            history: get_watchlist_history() 결과
+
+        Returns:
+            종목당 1행 (최신 거래일) DataFrame.
+            change_amt, change_pct, spread_pct, volume_ratio, big_move, wide_spread 포함
+        """
+        columns = [
+            "ticker", "name", "date", "open", "high", "low", "close",
+            "change_amt", "change_pct", "volume", "spread_pct",
+            "volume_ratio", "big_move", "wide_spread",
+        ]
+        if history.empty:
+            return pd.DataFrame(columns=columns)
+
+        # 입력 종목 순서(관심 종목 순서)를 유지한 채 종목 내 날짜순 정렬
+        order = pd.factorize(history["ticker"])[0]
+        df = (
+            history.assign(_order=order)
+            .sort_values(["_order", "date"], kind="stable")
+            .drop(columns="_order")
+            .reset_index(drop=True)
+        )
+        by_ticker = df.groupby("ticker", sort=False)
+
+        prev_close = by_ticker["close"].shift(1)
+        # 당일 제외 직전 N거래일 평균 거래량
+        prev_volume = by_ticker["volume"].shift(1)
+        avg_volume = (
+            prev_volume.groupby(df["ticker"], sort=False)
+            .rolling(self.VOLUME_AVG_WINDOW, min_periods=1)
+            .mean()
+            .reset_index(level=0, drop=True)
+        )
+
+        close = df["close"].astype("float64")
+        prev_close = prev_close.fillna(close)
+        computed_pct = np.where(prev_close > 0, (close / prev_close - 1) * 100, 0.0)
+        if "change_pct" in df:
+            change_pct = df["change_pct"].astype("float64").fillna(pd.Series(computed_pct))
+        else:
+            change_pct = pd.Series(computed_pct)
+
+        low = df["low"].astype("float64")
+        df["change_amt"] = close - prev_close
+        df["change_pct"] = change_pct.to_numpy()
+        df["spread_pct"] = np.where(low > 0, (df["high"] - low) / low * 100, 0.0)
+        df["volume_ratio"] = np.where(avg_volume > 0, df["volume"] / avg_volume, np.nan)
+
+        latest = df.groupby("ticker", sort=False).tail(1).copy()
+        latest["big_move"] = latest["change_pct"].abs() >= self.BIG_MOVE_PCT
+        latest["wide_spread"] = latest["spread_pct"] >= self.WIDE_SPREAD_PCT
+        latest["date"] = pd.to_datetime(latest["date"]).dt.strftime("%Y-%m-%d")
+        latest["name"] = latest["ticker"].map(self.get_ticker_name)
+
+        return latest[columns].reset_index(drop=True)
+
+    def get_watchlist_indicators(
+        self,
+        history: pd.DataFrame,
+        target_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        관심 종목 기술적 지표 (이동평균, RSI, 볼린저 밴드, ATR, 거래량 z-score)
+
+        data/indicators.npz의 종목별 롤링 상태에 이번에 조회한 일봉 중 새 봉만 반영합니다.
+        상태가 없거나 중간 봉이 빠진 종목만 INDICATOR_WARMUP_SESSIONS 이력을 한 번 다시 조회합니다.
+
+        Args:
+            history: get_watchlist_history() 결과
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 오늘
+
+        Returns:
+            종목 인덱스 DataFrame (IndicatorEngine.snapshot 참고). 이력이 없으면 빈 DataFrame
+        """
+        if history is None or history.empty:
+            return pd.DataFrame()
+
+        tickers = list(dict.fromkeys(history["ticker"]))
+        engine = IndicatorEngine.load(INDICATOR_STATE_PATH) or IndicatorEngine()
+        persist = True
+        last_day = np.datetime64(pd.Timestamp(history["date"].max()).date(), "D")
+        if (engine.snapshot(tickers)["date"] > last_day).any():
+            # 과거 날짜 브리핑 재생성: 저장 상태가 더 앞서 있으므로 임시 상태로 계산
+            engine, persist = IndicatorEngine(), False
+        elif self._is_partial_session(last_day.astype(date)):
+            # 장중 실행: 오늘 봉은 폐장 전 미확정 값이므로 계산만 하고 저장하지 않음
+            # (저장하면 last_date가 오늘이 되어 장 마감 후 실행에서 확정 종가가 반영되지 않음)
+            persist = False
+
+        stale = engine.needs_warmup(tickers, history["date"].min())
+        if stale:
+            warmup = self.get_watchlist_history(
+                stale, target_date=target_date, sessions=self.INDICATOR_WARMUP_SESSIONS
             )
+            engine.reset(stale)
+            engine.update_frame(warmup)
+        engine.update_frame(history)
+
+        if persist:
+            try:
+                engine.save(INDICATOR_STATE_PATH)
+            except OSError as e:
+                print(f"  [경고] 지표 상태 저장 실패: {e}")
+        return engine.snapshot(tickers)
+
+    @staticmethod
+    def _is_partial_session(day: date) -> bool:
+        """day가 오늘이고 아직 폐장 전이라 일봉이 미확정인지"""
+        if day != today_kst():
+            return False
+        hours = get_calendar().session_hours(day)
+        return hours is not None and now_kst().strftime("%H:%M") < hours[1]
+
+    def get_watchlist_frame(self, target_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        관심 종목 최신 시세 + 파생 지표 DataFrame
+
+        Args:
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 최근 영업일
+
+        Returns:
+            종목당 1행 DataFrame (compute_watchlist_frame 참고)
+        """
+        history = self.get_watchlist_history(target_date=target_date)
+        return self.compute_watchlist_frame(history)
+
+    def get_watchlist_data(self, target_date: Optional[str] = None) -> list[Quote]:
+        """
+        관심 종목의 최근 시세 조회
+
+        Args:
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 최근 영업일
 
-            if ohlcv:
-                latest = ohlcv[-1] if ohlcv else {}
-                prev = ohlcv[-2] if len(ohlcv) > 1 else None
-                name = self.get_ticker_name(ticker)
-
-                close = latest.get("종가", 0)
-                prev_close = prev.get("종가", close) if prev else close
-                change_amt = close - prev_close
-                change_pct = latest.get("등락률", ((close / prev_close - 1) * 100) if prev_close else 0)
-
-                results.append({
-                    "ticker": ticker,
-                    "name": name,
-                    "date": latest.get("날짜", ""),
-                    "open": latest.get("시가", 0),
-                    "high": latest.get("고가", 0),
-                    "low": latest.get("저가", 0),
-                    "close": close,
-                    "change_amt": change_amt,
-                    "change_pct": change_pct,
-                    "volume": latest.get("거래량", 0),
-                })
-
-        return results
+        Returns:
+            관심 종목 시세 레코드 리스트
+        """
+        return frame_to_records(self.get_watchlist_frame(target_date=target_date), Quote)
+
+    @staticmethod
+    def _summarize_index(bars: np.ndarray) -> dict:
+        """지수 봉 배열에서 최신 종가/전일 대비 계산"""
+        if len(bars) == 0:
+            return {}
+
+        close = float(bars["close"][-1])
+        prev_close = float(bars["close"][-2]) if len(bars) > 1 else close
+        return {
+            "close": close,
+            "change": close - prev_close,
+            "change_pct": ((close / prev_close) - 1) * 100 if prev_close else 0,
+        }
 
     def get_market_summary(self, target_date: Optional[str] = None) -> dict:
         """
@@ -216,44 +614,37 @@ class KrxCollector:
         if target_date:
             base = datetime.strptime(target_date, "%Y%m%d")
         else:
-            base = datetime.now()
+            base = now_kst()
 
         summary = {
             "kospi": {},
             "kosdaq": {},
-            "date": base.strftime("%Y-%m-%d"),
+            "date": get_calendar().session_on_or_before(base).strftime("%Y-%m-%d"),
         }
 
-        # KOSPI 지수
-        kospi = self.get_index_ohlcv("1001", days_back=5, target_date=target_date)
-        if kospi:
-            latest = kospi[-1]
-            prev = kospi[-2] if len(kospi) > 1 else latest
-            summary["kospi"] = {
-                "close": latest.get("종가", 0),
-                "change": latest.get("종가", 0) - prev.get("종가", 0),
-                "change_pct": ((latest.get("종가", 0) / prev.get("종가", 1)) - 1) * 100 if prev.get("종가", 0) else 0,
-            }
+        # KOSPI 지수 (기준 거래일 + 직전 거래일)
+        kospi = self.get_index_ohlcv("1001", target_date=target_date, sessions=2)
+        summary["kospi"] = self._summarize_index(kospi)
 
         # KOSDAQ 지수
-        kosdaq = self.get_index_ohlcv("2001", days_back=5, target_date=target_date)
-        if kosdaq:
-            latest = kosdaq[-1]
-            prev = kosdaq[-2] if len(kosdaq) > 1 else latest
-            summary["kosdaq"] = {
-                "close": latest.get("종가", 0),
-                "change": latest.get("종가", 0) - prev.get("종가", 0),
-                "change_pct": ((latest.get("종가", 0) / prev.get("종가", 1)) - 1) * 100 if prev.get("종가", 0) else 0,
-            }
+        kosdaq = self.get_index_ohlcv("2001", target_date=target_date, sessions=2)
+        summary["kosdaq"] = self._summarize_index(kosdaq)
 
         return summary
 
-    def format_for_briefing(self, target_date: Optional[str] = None) -> str:
+    def format_for_briefing(
+        self,
+        target_date: Optional[str] = None,
+        summary: Optional[dict] = None,
+        watchlist: Optional[pd.DataFrame] = None
+    ) -> str:
         """
         브리핑용 마크다운 포맷 생성
 
         Args:
             target_date: 조회 기준 날짜 (YYYYMMDD). None이면 최근 영업일
+            summary: 이미 조회한 get_market_summary() 결과 (없으면 새로 조회)
+            watchlist: 이미 조회한 get_watchlist_frame() 결과 (없으면 새로 조회)
 
         Returns:
             마크다운 문자열
@@ -261,7 +652,8 @@ class KrxCollector:
         lines = []
 
         # 시장 요약
-        summary = self.get_market_summary(target_date=target_date)
+        if summary is None:
+            summary = self.get_market_summary(target_date=target_date)
         kospi = summary.get("kospi", {})
         kosdaq = summary.get("kosdaq", {})
 
@@ -282,21 +674,35 @@ class KrxCollector:
             )
 
         # 관심 종목
-        watchlist = self.get_watchlist_data(target_date=target_date)
-        if watchlist:
+        if watchlist is None:
+            watchlist = self.get_watchlist_frame(target_date=target_date)
+        if not watchlist.empty:
             lines.append("\n### 관심 종목")
-            for item in watchlist:
-                change_amt = item.get("change_amt", 0)
-                change_pct = item.get("change_pct", 0)
-                sign = "+" if change_amt >= 0 else ""
-                high = item.get("high", 0)
-                low = item.get("low", 0)
+            for item in watchlist.itertuples(index=False):
+                sign = "+" if item.change_amt >= 0 else ""
+                volume_note = (
+                    f" ({self.VOLUME_AVG_WINDOW}일 평균 대비 {item.volume_ratio:.2f}배)"
+                    if pd.notna(item.volume_ratio) else ""
+                )
                 lines.append(
-                    f"- **{item['name']}** ({item['ticker']}): "
-                    f"{item['close']:,}원 ({sign}{change_amt:,}, {sign}{change_pct:.2f}%) "
-                    f"| 고가 {high:,} / 저가 {low:,} | 거래량: {item['volume']:,}"
+                    f"- **{item.name}** ({item.ticker}): "
+                    f"{item.close:,.0f}원 ({sign}{item.change_amt:,.0f}, {sign}{item.change_pct:.2f}%) "
+                    f"| 고가 {item.high:,.0f} / 저가 {item.low:,.0f} (스프레드 {item.spread_pct:.2f}%) "
+                    f"| 거래량: {item.volume:,.0f}{volume_note}"
                 )
 
+            # AI 프롬프트의 원인 분석 대상 (±3% 등락 / 5% 이상 고저 스프레드)
+            flagged = watchlist[watchlist["big_move"] | watchlist["wide_spread"]]
+            if not flagged.empty:
+                lines.append("\n**변동 점검 대상**")
+                for item in flagged.itertuples(index=False):
+                    reasons = []
+                    if item.big_move:
+                        reasons.append(f"등락률 {item.change_pct:+.2f}%")
+                    if item.wide_spread:
+                        reasons.append(f"고저 스프레드 {item.spread_pct:.2f}%")
+                    lines.append(f"- {item.name} ({item.ticker}): {', '.join(reasons)}")
+
         return "\n".join(lines)
 
 
@@ -320,7 +726,7 @@ if __name__ == "__main__":
         print("\n=== 관심 종목 ===")
         watchlist = collector.get_watchlist_data()
         for item in watchlist:
-            print(f"{item['name']}: {item['close']:,}원")
+            print(f"{item.name}: {item.close:,}원")
 
         # 브리핑 포맷
         print("\n=== 브리핑 포맷 ===")
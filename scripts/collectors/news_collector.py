@@ -3,17 +3,28 @@
 
 경제/금융 뉴스 RSS 피드를 수집하여 시장 동향을 파악합니다.
 - 한국경제, 매일경제, 이데일리 등
+- 매체 간 중복 기사는 하나로 묶어 표시 (analytics/news_clustering.py)
+- 수집한 기사는 로컬 전문 검색 인덱스에 누적 저장 (collectors/news_index.py)
+- RSS/Atom은 스트리밍 파싱: 조회 기간보다 오래된 기사가 이어지면 읽기를 중단하고,
+  요약 HTML 정리는 기간 안의 기사에만 수행
 
 설치: pip install feedparser
 """
 import sys
+import html
+import sqlite3
+import calendar
+from dataclasses import asdict
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterator, Optional
+from xml.etree import ElementTree
 import re
 
-# 프로젝트 루트 경로 추가
+# 프로젝트 루트 / scripts 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     import feedparser
@@ -23,6 +34,43 @@ except ImportError:
     print("Warning: feedparser not installed. Run: pip install feedparser")
 
 from config import NEWS_RSS_FEEDS
+from collectors.records import Article
+from collectors.transport import get_transport
+from collectors.health import get_health
+from collectors.news_index import get_news_index
+from collectors.trading_calendar import KST, now_kst
+from analytics.news_clustering import StoryCluster, cluster_articles
+
+
+# 피드는 최신순이므로 조회 기간 밖 기사가 이만큼 연속되면 나머지를 읽지 않음
+# (매체가 순서를 약간 섞어 내보내는 경우 대비)
+STALE_RUN_LIMIT = 3
+STREAM_CHUNK_BYTES = 16 * 1024
+
+_ITEM_TAGS = {"item", "entry"}
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+
+def _local_name(tag: str) -> str:
+    """{네임스페이스}태그 → 태그"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_feed_date(text: str) -> Optional[datetime]:
+    """RSS(RFC 822) / Atom·dc:date(ISO 8601) 날짜 → KST 시각 (naive, 시간대 없는 값은 KST로 간주)"""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(KST).replace(tzinfo=None)
+    return parsed
 
 
 class NewsCollector:
@@ -37,24 +85,35 @@ class NewsCollector:
         "금통위", "기준금리", "인플레이션", "GDP"
     ]
 
-    def __init__(self, feeds: Optional[dict] = None):
+    def __init__(self, feeds: Optional[dict] = None, ticker_names: Optional[dict[str, str]] = None):
         """
         Args:
             feeds: RSS 피드 URL dict. None이면 기본 설정 사용
+            ticker_names: 종목 코드 → 종목명. 인덱스 저장 시 언급 종목 기록용
         """
         self.feeds = feeds or NEWS_RSS_FEEDS
+        self.ticker_names = ticker_names or {}
         self.available = FEEDPARSER_AVAILABLE
+        self.http = get_transport()
+        self.health = get_health()
+        # 로컬 인덱스는 부가 기능: FTS5 trigram(SQLite 3.34+) 미지원 / 파일 오류 시 인덱스 없이 수집만
+        try:
+            self.index = get_news_index()
+        except (sqlite3.Error, OSError) as e:
+            print(f"  [경고] 뉴스 인덱스를 사용할 수 없습니다 (SQLite {sqlite3.sqlite_version}): {e}")
+            self.index = None
 
     def is_available(self) -> bool:
         """라이브러리 사용 가능 여부"""
         return self.available
 
-    def fetch_feed(self, url: str) -> list[dict]:
+    def fetch_feed(self, url: str, since: Optional[datetime] = None) -> list[Article]:
         """
         단일 RSS 피드 가져오기
 
         Args:
             url: RSS 피드 URL
+            since: 이 시각 이전 기사는 제외 (None이면 전체)
 
         Returns:
             뉴스 기사 리스트
@@ -63,52 +122,153 @@ class NewsCollector:
             return []
 
         try:
-            feed = feedparser.parse(url)
-            articles = []
-
-            for entry in feed.entries:
-                # 발행일 파싱
-                published = ""
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6]).strftime("%Y-%m-%d %H:%M")
-                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                    published = datetime(*entry.updated_parsed[:6]).strftime("%Y-%m-%d %H:%M")
-
-                articles.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": self._clean_html(entry.get("summary", "")),
-                    "published": published,
-                })
-
-            return articles
-
+            return self._download_feed(url, since)
         except Exception as e:
             print(f"RSS 피드 조회 오류 ({url}): {e}")
             return []
 
+    def _download_feed(self, url: str, since: Optional[datetime] = None) -> list[Article]:
+        """
+        RSS 피드 다운로드 + 파싱 (실패 시 예외)
+
+        XML을 받는 대로 기사 단위로 파싱하고, since 이전 기사가 STALE_RUN_LIMIT건
+        연속되면 남은 본문을 받지 않고 중단합니다.
+        표준 XML 파서가 읽지 못하는 피드(EUC-KR, 잘못된 엔티티 등)는 feedparser로 처리합니다.
+        """
+        # 피드 다운로드는 공용 전송 계층(연결 재사용/gzip/재시도)
+        with self.http.get(url, source="news", stream=True) as response:
+            response.raise_for_status()
+            received = []
+            chunks = self._iter_chunks(response, received)
+            try:
+                return self._stream_parse(chunks, since)
+            except (ElementTree.ParseError, ValueError):  # ValueError: EUC-KR 등 멀티바이트 인코딩
+                # 받은 부분 + 나머지 전체를 feedparser로 (관대한 파서)
+                for _ in chunks:  # 남은 조각도 received에 쌓임
+                    pass
+                return self._parse_with_feedparser(b"".join(received), since)
+
+    @staticmethod
+    def _iter_chunks(response, received: list[bytes]) -> Iterator[bytes]:
+        """응답 본문 조각 (받은 조각은 received에도 보관: 파서 전환 시 재사용)"""
+        for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+            received.append(chunk)
+            yield chunk
+
+    def _stream_parse(self, chunks: Iterator[bytes], since: Optional[datetime]) -> list[Article]:
+        """XMLPullParser로 <item>/<entry>가 닫힐 때마다 기사 1건 처리"""
+        parser = ElementTree.XMLPullParser(events=("end",))
+        articles = []
+        stale_run = 0
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if _local_name(elem.tag) not in _ITEM_TAGS:
+                    continue
+                fields = {}
+                for child in elem:
+                    name = _local_name(child.tag)
+                    if name == "link" and child.get("href"):
+                        fields.setdefault("link", child.get("href"))  # Atom
+                    elif name in ("title", "link", "description", "summary", "content", *_DATE_TAGS):
+                        fields.setdefault(name, child.text or "")
+                elem.clear()  # 처리한 기사 트리는 바로 해제
+
+                published = None
+                for tag in _DATE_TAGS:
+                    if fields.get(tag):
+                        published = _parse_feed_date(fields[tag])
+                        break
+
+                if since is not None and published is not None and published < since:
+                    stale_run += 1
+                    if stale_run >= STALE_RUN_LIMIT:
+                        return articles
+                    continue
+                stale_run = 0
+
+                summary = fields.get("description") or fields.get("summary") or fields.get("content", "")
+                articles.append(Article(
+                    title=fields.get("title", "").strip(),
+                    link=fields.get("link", "").strip(),
+                    summary=self._clean_html(summary),
+                    published=published.strftime("%Y-%m-%d %H:%M") if published else "",
+                ))
+
+        parser.close()
+        return articles
+
+    def _parse_with_feedparser(self, content: bytes, since: Optional[datetime]) -> list[Article]:
+        """feedparser 전체 파싱 (스트리밍 파싱 실패 시)"""
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            raise ValueError(f"RSS 파싱 실패: {feed.bozo_exception}")
+
+        articles = []
+        for entry in feed.entries:
+            # 발행일 파싱 (feedparser는 UTC struct_time → KST)
+            parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            published = datetime.fromtimestamp(calendar.timegm(parsed), KST).replace(tzinfo=None) if parsed else None
+            if since is not None and published is not None and published < since:
+                continue
+
+            articles.append(Article(
+                title=entry.get("title", ""),
+                link=entry.get("link", ""),
+                summary=self._clean_html(entry.get("summary", "")),
+                published=published.strftime("%Y-%m-%d %H:%M") if published else "",
+            ))
+
+        return articles
+
     def _clean_html(self, text: str) -> str:
-        """HTML 태그 제거"""
-        clean = re.sub(r"<[^>]+>", "", text)
+        """HTML 태그 / 엔티티 제거"""
+        clean = html.unescape(re.sub(r"<[^>]+>", "", text))
         clean = re.sub(r"\s+", " ", clean).strip()
         return clean[:200] + "..." if len(clean) > 200 else clean
 
-    def fetch_all_feeds(self) -> dict[str, list[dict]]:
+    def fetch_all_feeds(self, since: Optional[datetime] = None) -> dict[str, list[Article]]:
         """
         모든 RSS 피드 가져오기
 
+        매체별로 서킷 브레이커를 거치므로 장애 중인 매체는 조회 없이
+        마지막 정상 수집분을 사용합니다.
+
+        Args:
+            since: 이 시각 이전 기사는 제외 (None이면 전체)
+
         Returns:
             매체별 뉴스 기사 dict
         """
         all_news = {}
+        if not self.is_available():
+            return all_news
+
+        def fetch(source_name: str, url: str) -> list[Article]:
+            articles = self._download_feed(url, since)
+            # 새로 받은 기사만 인덱스에 저장 (인덱스 오류는 피드 장애로 보지 않음)
+            if self.index is None:
+                return articles
+            try:
+                self.index.add(articles, source=source_name, names=self.ticker_names)
+            except sqlite3.Error as e:
+                print(f"  [경고] 뉴스 인덱스 저장 실패: {e}")
+            return articles
 
         for source_name, url in self.feeds.items():
-            articles = self.fetch_feed(url)
-            all_news[source_name] = articles
+            all_news[source_name] = self.health.call(
+                f"news:{source_name}",
+                lambda source_name=source_name, url=url: fetch(source_name, url),
+                default=[],
+                cache_key=f"news:{source_name}",
+                encode=lambda articles: [asdict(a) for a in articles],
+                decode=lambda rows: [Article(**row) for row in rows],
+            )
 
         return all_news
 
-    def get_investment_news(self, max_hours: int = 24) -> list[dict]:
+    def get_investment_news(self, max_hours: int = 24) -> list[Article]:
         """
         투자 관련 뉴스 필터링
 
@@ -118,36 +278,68 @@ class NewsCollector:
         Returns:
             투자 관련 뉴스 리스트
         """
-        all_news = self.fetch_all_feeds()
+        cutoff_time = now_kst() - timedelta(hours=max_hours)
+        all_news = self.fetch_all_feeds(since=cutoff_time)
         investment_news = []
-        cutoff_time = datetime.now() - timedelta(hours=max_hours)
+        # 마지막 정상 수집분(장애 매체)에는 기간 밖 기사가 남아 있을 수 있음
+        cutoff = cutoff_time.strftime("%Y-%m-%d %H:%M")
 
         for source, articles in all_news.items():
             for article in articles:
+                if article.published and article.published < cutoff:
+                    continue
+
                 # 키워드 필터링
-                title = article.get("title", "")
-                summary = article.get("summary", "")
-                content = f"{title} {summary}"
+                content = f"{article.title} {article.summary}"
 
                 is_investment_related = any(
                     keyword in content for keyword in self.INVESTMENT_KEYWORDS
                 )
 
                 if is_investment_related:
-                    article["source"] = source
+                    article.source = source
                     investment_news.append(article)
 
         # 최신순 정렬
-        investment_news.sort(key=lambda x: x.get("published", ""), reverse=True)
+        investment_news.sort(key=lambda x: x.published, reverse=True)
         return investment_news
 
-    def format_for_briefing(self, max_items: int = 10, max_hours: int = 24) -> str:
+    def get_story_clusters(
+        self,
+        max_hours: int = 24,
+        news: Optional[list[Article]] = None
+    ) -> list[StoryCluster]:
+        """
+        투자 관련 뉴스를 매체 간 중복 기사 묶음으로 정리
+
+        Args:
+            max_hours: 최근 몇 시간 이내 뉴스
+            news: 이미 조회한 get_investment_news() 결과 (없으면 새로 조회)
+
+        Returns:
+            기사 묶음 리스트 (최신 기사 순)
+        """
+        if news is None:
+            news = self.get_investment_news(max_hours=max_hours)
+        return cluster_articles(news)
+
+    def format_for_briefing(
+        self,
+        max_items: int = 10,
+        max_hours: int = 24,
+        news: Optional[list[Article]] = None,
+        clusters: Optional[list[StoryCluster]] = None
+    ) -> str:
         """
         브리핑용 마크다운 포맷 생성
 
+        같은 사건을 다룬 여러 매체 기사는 대표 기사 1건 + 보도 매체로 표시합니다.
+
         Args:
-            max_items: 최대 표시 개수
+            max_items: 최대 표시 개수 (기사 묶음 기준)
             max_hours: 최근 몇 시간 이내 뉴스
+            news: 이미 조회한 get_investment_news() 결과 (없으면 새로 조회)
+            clusters: 이미 계산한 get_story_clusters() 결과 (있으면 news 대신 사용)
 
         Returns:
             마크다운 문자열
@@ -157,20 +349,23 @@ class NewsCollector:
         if not self.is_available():
             return "feedparser가 설치되지 않았습니다. pip install feedparser"
 
-        news = self.get_investment_news(max_hours=max_hours)
+        if clusters is None:
+            clusters = self.get_story_clusters(max_hours=max_hours, news=news)
 
-        if not news:
+        if not clusters:
             return "최근 투자 관련 뉴스가 없습니다."
 
-        for i, article in enumerate(news[:max_items]):
-            title = article.get("title", "")
-            source = article.get("source", "")
-            link = article.get("link", "")
-
-            lines.append(f"- [{title}]({link}) - {source}")
+        for cluster in clusters[:max_items]:
+            article = cluster.representative
+            sources = cluster.sources
+            via = " · ".join(sources) if sources else article.source
+            if len(sources) > 1:
+                via += f" ({len(sources)}개 매체)"
+            lines.append(f"- [{article.title}]({article.link}) - {via}")
 
-        if len(news) > max_items:
-            lines.append(f"\n... 외 {len(news) - max_items}건")
+        if len(clusters) > max_items:
+            total = sum(len(cluster.articles) for cluster in clusters)
+            lines.append(f"\n... 외 {len(clusters) - max_items}개 이슈 (기사 {total}건)")
 
         return "\n".join(lines)
 
@@ -191,14 +386,16 @@ if __name__ == "__main__":
         for source, articles in all_news.items():
             print(f"\n{source}: {len(articles)}건")
             if articles:
-                print(f"  최신: {articles[0].get('title', '')[:50]}...")
+                print(f"  최신: {articles[0].title[:50]}...")
 
         # 투자 관련 뉴스
         print("\n=== 투자 관련 뉴스 ===")
         investment = collector.get_investment_news(max_hours=24)
         print(f"총 {len(investment)}건")
         for article in investment[:5]:
-            print(f"- {article.get('title', '')[:50]}...")
+            print(f"- {article.title[:50]}...")
+        clusters = collector.get_story_clusters(news=investment)
+        print(f"중복 기사 묶음 후 {len(clusters)}개 이슈")
 
         # 브리핑 포맷
         print("\n=== 브리핑 포맷 ===")
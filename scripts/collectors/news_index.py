@@ -0,0 +1,228 @@
+"""
+뉴스 기사 로컬 전문 검색 인덱스
+
+수집한 모든 기사를 SQLite FTS5(data/news.sqlite3)에 누적 저장합니다.
+RSS 피드에서 사라진 기사도 "이번 주 SK하이닉스 관련 뉴스" 같은 질의로 다시 찾을 수 있습니다.
+
+- 기사 1건 = 매체, 발행 시각, 언급 종목(관심 종목명 일치)과 함께 저장 (링크 기준 중복 제거)
+- trigram 토크나이저: 조사가 붙은 한글("SK하이닉스가")도 부분 문자열로 검색
+- 2글자 검색어("금리")는 trigram 인덱스를 쓸 수 없어 LIKE로 처리
+"""
+import sys
+import sqlite3
+import threading
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR
+from collectors.records import Article
+from collectors.trading_calendar import now_kst
+
+
+class NewsIndex:
+    """SQLite FTS5 기반 뉴스 기사 저장소 + 검색"""
+
+    def __init__(self, path: Path = DATA_DIR / "news.sqlite3"):
+        """
+        Args:
+            path: 인덱스 SQLite 파일
+        """
+        self.path = path
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                link TEXT NOT NULL,
+                source TEXT NOT NULL,
+                published TEXT NOT NULL,
+                tickers TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS articles_published ON articles (published);
+            CREATE TABLE IF NOT EXISTS article_tickers (
+                ticker TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (ticker, article_id)
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, summary, content='articles', content_rowid='id', tokenize='trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts (rowid, title, summary)
+                VALUES (new.id, new.title, new.summary);
+            END;
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def add(
+        self,
+        articles: Iterable[Article],
+        source: Optional[str] = None,
+        names: Optional[dict[str, str]] = None
+    ) -> int:
+        """
+        기사 저장 (이미 저장된 링크는 건너뜀)
+
+        Args:
+            articles: 기사 목록
+            source: 매체 이름 (None이면 article.source)
+            names: 종목 코드 → 종목명. 제목/요약에 종목명이 있으면 언급 종목으로 기록
+
+        Returns:
+            새로 저장한 기사 수
+        """
+        names = {ticker: name for ticker, name in (names or {}).items() if name}
+        collected = now_kst().strftime("%Y-%m-%d %H:%M")
+        conn = self._connect()
+        added = 0
+
+        # 성공 시에만 COMMIT, 예외 시 ROLLBACK (반쯤 쓴 배치를 남기지 않음)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for article in articles:
+                article_source = source or article.source
+                key = article.link or f"{article_source}|{article.title}"
+                text = f"{article.title} {article.summary}"
+                tickers = [ticker for ticker, name in names.items() if name in text]
+
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO articles "
+                    "(key, title, summary, link, source, published, tickers) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, article.title, article.summary, article.link, article_source,
+                     article.published or collected, ",".join(tickers)),
+                )
+                if cursor.rowcount:
+                    added += 1
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO article_tickers (ticker, article_id) VALUES (?, ?)",
+                        [(ticker, cursor.lastrowid) for ticker in tickers],
+                    )
+        return added
+
+    def search(
+        self,
+        query: str = "",
+        ticker: Optional[str] = None,
+        source: Optional[str] = None,
+        days: Optional[int] = 7,
+        limit: int = 20
+    ) -> list[dict]:
+        """
+        기사 검색 (최신순)
+
+        Args:
+            query: 검색어. 공백으로 구분한 단어를 모두 포함하는 기사 (비우면 조건만 적용)
+            ticker: 언급 종목 코드
+            source: 매체 이름
+            days: 최근 며칠 (None이면 전체 기간)
+            limit: 최대 결과 수
+
+        Returns:
+            기사 dict 리스트 (published, source, title, link, summary, tickers)
+        """
+        clauses, params = [], []
+
+        fts_terms = []
+        for term in query.split():
+            if len(term) >= 3:
+                fts_terms.append('"' + term.replace('"', '""') + '"')
+            else:
+                clauses.append("(a.title LIKE ? OR a.summary LIKE ?)")
+                params += [f"%{term}%", f"%{term}%"]
+        if fts_terms:
+            clauses.append("a.id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(" AND ".join(fts_terms))
+
+        if ticker:
+            clauses.append("a.id IN (SELECT article_id FROM article_tickers WHERE ticker = ?)")
+            params.append(ticker)
+        if source:
+            clauses.append("a.source = ?")
+            params.append(source)
+        if days is not None:
+            clauses.append("a.published >= ?")
+            params.append((now_kst() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M"))
+
+        where = " AND ".join(clauses) or "1"
+        rows = self._connect().execute(
+            "SELECT a.published, a.source, a.title, a.link, a.summary, a.tickers "
+            f"FROM articles a WHERE {where} ORDER BY a.published DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        keys = ["published", "source", "title", "link", "summary", "tickers"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def format_results(self, results: list[dict]) -> str:
+        """검색 결과 요약 (콘솔 출력용)"""
+        if not results:
+            return "검색 결과가 없습니다."
+        return "\n".join(
+            f"- {row['published']} [{row['source']}] {row['title']}" for row in results
+        )
+
+    def format_context(
+        self,
+        names: dict[str, str],
+        days: int = 7,
+        per_ticker: int = 3
+    ) -> str:
+        """
+        관심 종목별 최근 기사 제목 (AI 분석 프롬프트 보강용)
+
+        Args:
+            names: 종목 코드 → 종목명
+            days: 최근 며칠
+            per_ticker: 종목당 최대 기사 수
+
+        Returns:
+            마크다운 문자열. 기사가 없으면 빈 문자열
+        """
+        lines = []
+        for ticker, name in names.items():
+            results = self.search(ticker=ticker, days=days, limit=per_ticker)
+            if not results:
+                continue
+            lines.append(f"**{name}({ticker})**")
+            lines.extend(f"- {row['published'][:10]} {row['title']} ({row['source']})" for row in results)
+
+        if not lines:
+            return ""
+        return f"### 최근 {days}일 관심 종목 뉴스 (로컬 뉴스 인덱스)\n" + "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def get_news_index() -> NewsIndex:
+    """프로세스 공용 뉴스 인덱스"""
+    return NewsIndex()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    index = get_news_index()
+    print(f"저장된 기사: {index.count():,}건")
+    query = sys.argv[1] if len(sys.argv) > 1 else "코스피"
+    print(f"\n=== '{query}' 최근 7일 ===")
+    print(index.format_results(index.search(query)))
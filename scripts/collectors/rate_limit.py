@@ -0,0 +1,174 @@
+"""
+소스별 호출 속도 제한 / 일일 호출량 집계
+
+DART Open API는 일일 호출 한도가 있고, pykrx는 KRX 웹사이트를 조회하므로
+과도한 호출 시 차단될 수 있습니다. 소스별 토큰 버킷으로 초당 호출 수를 제한하고
+일일 호출량을 집계합니다.
+
+상태는 SQLite(data/ratelimit.sqlite3)에 저장하므로
+- 같은 프로세스의 여러 스레드, 동시에 실행 중인 여러 프로세스가 같은 버킷을 공유하고
+- 실행이 끝나도 당일 호출량이 유지되어 한도가 실행 간에도 지켜집니다.
+"""
+import sys
+import time
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config import DATA_DIR, RATE_LIMITS
+from collectors.trading_calendar import today_kst
+
+
+class QuotaExceeded(Exception):
+    """일일 호출 한도 초과"""
+
+
+class RateLimiter:
+    """SQLite 기반 소스별 토큰 버킷 + 일일 호출량 집계"""
+
+    def __init__(
+        self,
+        path: Path = DATA_DIR / "ratelimit.sqlite3",
+        limits: Optional[dict[str, tuple[float, int, Optional[int]]]] = None
+    ):
+        """
+        Args:
+            path: 상태 저장 SQLite 파일
+            limits: 소스 → (초당 호출 수, 버스트 크기, 일일 한도 또는 None)
+        """
+        self.path = path
+        self.limits = limits if limits is not None else RATE_LIMITS
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    source TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS usage (
+                    source TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    calls INTEGER NOT NULL,
+                    PRIMARY KEY (source, day)
+                );
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _try_acquire(self, source: str, rate: float, burst: int, quota: Optional[int]) -> float:
+        """
+        토큰 1개 차감 시도 (프로세스 간 원자적)
+
+        Returns:
+            0이면 획득 성공, 양수면 다음 토큰까지 대기할 시간(초)
+        """
+        conn = self._connect()
+        today = today_kst().isoformat()  # DART 등 일일 한도는 KST 자정 기준
+        now = time.time()
+
+        # 성공 시에만 COMMIT, 예외 시 ROLLBACK (반쯤 쓴 배치를 남기지 않음)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if quota is not None:
+                row = conn.execute(
+                    "SELECT calls FROM usage WHERE source = ? AND day = ?", (source, today)
+                ).fetchone()
+                if row and row[0] >= quota:
+                    raise QuotaExceeded(f"{source} 일일 호출 한도 초과 ({row[0]:,}/{quota:,})")
+
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE source = ?", (source,)
+            ).fetchone()
+            tokens = float(burst) if row is None else min(burst, row[0] + (now - row[1]) * rate)
+
+            if tokens < 1:
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (source, tokens, updated) VALUES (?, ?, ?)",
+                    (source, tokens, now),
+                )
+                return (1 - tokens) / rate
+
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (source, tokens, updated) VALUES (?, ?, ?)",
+                (source, tokens - 1, now),
+            )
+            conn.execute(
+                "INSERT INTO usage (source, day, calls) VALUES (?, ?, 1) "
+                "ON CONFLICT (source, day) DO UPDATE SET calls = calls + 1",
+                (source, today),
+            )
+            return 0.0
+
+    def acquire(self, source: str) -> None:
+        """
+        호출 1회 허가 (토큰이 없으면 생길 때까지 대기)
+
+        설정에 없는 소스는 제한 없이 통과합니다.
+
+        Raises:
+            QuotaExceeded: 당일 호출 한도를 모두 사용한 경우
+        """
+        if source not in self.limits:
+            return
+
+        rate, burst, quota = self.limits[source]
+        while True:
+            wait = self._try_acquire(source, rate, burst, quota)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def usage(self, day: Optional[str] = None) -> dict[str, int]:
+        """
+        소스별 호출 수
+
+        Args:
+            day: 조회 날짜 (YYYY-MM-DD). None이면 오늘
+        """
+        rows = self._connect().execute(
+            "SELECT source, calls FROM usage WHERE day = ? ORDER BY source",
+            (day or today_kst().isoformat(),),
+        ).fetchall()
+        return dict(rows)
+
+    def format_usage(self) -> str:
+        """당일 소스별 호출량 요약 (콘솔 출력용)"""
+        usage = self.usage()
+        lines = [f"오늘 호출량 ({today_kst()}):"]
+        for source, (rate, _, quota) in self.limits.items():
+            calls = usage.get(source, 0)
+            limit = f"{calls:,} / {quota:,}" if quota else f"{calls:,}"
+            lines.append(f"  - {source}: {limit} (초당 {rate:g}회)")
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def get_limiter() -> RateLimiter:
+    """프로세스 공용 호출 제한기"""
+    return RateLimiter()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    limiter = get_limiter()
+    started = time.perf_counter()
+    for _ in range(5):
+        limiter.acquire("krx")
+    print(f"krx 5회 획득: {time.perf_counter() - started:.2f}초")
+    print(limiter.format_usage())
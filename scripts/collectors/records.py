@@ -0,0 +1,128 @@
+"""
+수집 데이터 레코드 타입
+
+수집기 간에 주고받는 레코드를 dict 대신 고정 필드 타입으로 정의합니다.
+- 시세 봉(OHLCV): NumPy structured array (봉 1개 = 고정 크기 행, 숫자 박싱 없음)
+- 관심 종목 시세, 공시, 뉴스 기사: __slots__ dataclass (인스턴스 __dict__ 없음)
+
+레코드를 JSON 등으로 내보낼 때는 dataclasses.asdict() 또는 bars_to_records()를 사용합니다.
+"""
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+
+# 일봉 1개 레이아웃 (지수 소수점 값을 위해 가격은 float64)
+OHLCV_DTYPE = np.dtype([
+    ("date", "datetime64[D]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "i8"),
+])
+
+# pykrx 한글 컬럼 → OHLCV_DTYPE 필드
+_OHLCV_SOURCE_COLUMNS = {
+    "open": "시가",
+    "high": "고가",
+    "low": "저가",
+    "close": "종가",
+    "volume": "거래량",
+}
+
+
+def frame_to_bars(df: pd.DataFrame) -> np.ndarray:
+    """
+    pykrx OHLCV DataFrame(날짜 인덱스, 한글 컬럼)을 structured array로 변환
+
+    Args:
+        df: pykrx get_market_ohlcv / get_index_ohlcv 결과
+
+    Returns:
+        OHLCV_DTYPE 배열 (날짜 오름차순). 입력이 비어 있으면 길이 0 배열
+    """
+    if df is None or df.empty:
+        return np.empty(0, dtype=OHLCV_DTYPE)
+
+    bars = np.empty(len(df), dtype=OHLCV_DTYPE)
+    bars["date"] = pd.DatetimeIndex(df.index).values.astype("datetime64[D]")
+    for field, column in _OHLCV_SOURCE_COLUMNS.items():
+        if column in df:
+            bars[field] = df[column].to_numpy()
+        else:
+            bars[field] = 0
+    return bars
+
+
+def bars_to_records(bars: np.ndarray) -> list[dict]:
+    """structured array를 dict 리스트로 변환 (JSON 출력 등 경계 지점 전용)"""
+    return [
+        {
+            "date": str(bar["date"]),
+            "open": float(bar["open"]),
+            "high": float(bar["high"]),
+            "low": float(bar["low"]),
+            "close": float(bar["close"]),
+            "volume": int(bar["volume"]),
+        }
+        for bar in bars
+    ]
+
+
+@dataclass(slots=True)
+class Quote:
+    """관심 종목 최신 시세 + 파생 지표 (KrxCollector.compute_watchlist_frame 1행)"""
+    ticker: str
+    name: str
+    date: str
+    open: float
+    high: float
+    low: float
+    close: float
+    change_amt: float
+    change_pct: float
+    volume: int
+    spread_pct: float
+    volume_ratio: float
+    big_move: bool
+    wide_spread: bool
+
+
+@dataclass(slots=True)
+class Disclosure:
+    """DART 공시 목록 1건 (OpenDartReader list() 컬럼)"""
+    corp_code: str = ""
+    corp_name: str = ""
+    stock_code: str = ""
+    corp_cls: str = ""
+    report_nm: str = ""
+    rcept_no: str = ""
+    flr_nm: str = ""
+    rcept_dt: str = ""
+    rm: str = ""
+
+
+@dataclass(slots=True)
+class Article:
+    """뉴스 기사 1건"""
+    title: str = ""
+    link: str = ""
+    summary: str = ""
+    published: str = ""
+    source: str = ""
+
+
+def frame_to_records(df: pd.DataFrame, record_type: type) -> list:
+    """
+    DataFrame 행을 레코드 타입 리스트로 변환
+
+    record_type에 정의된 필드 중 DataFrame에 없는 컬럼은 빈 문자열로 채웁니다.
+    """
+    if df is None or df.empty:
+        return []
+
+    names = [f.name for f in fields(record_type)]
+    aligned = df.reindex(columns=names, fill_value="")
+    return [record_type(*row) for row in aligned.itertuples(index=False, name=None)]
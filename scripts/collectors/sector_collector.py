@@ -0,0 +1,190 @@
+"""
+업종 / 테마 지수 수집기
+
+KRX 전체 지수 시세를 계열(KOSPI / KOSDAQ / 테마)별 bulk 1회로 받아 data/sectors.sqlite3에 저장하고,
+당일·전 거래일·주간 기준일 3개 거래일 종가로 analytics/sectors.py 히트맵을 만듭니다.
+
+- 지수별 개별 조회 없이 계열당 하루 1회. 저장소에 있는 거래일은 다시 조회하지 않으므로
+  매일 실행하면 당일분 계열 수만큼만 호출합니다.
+- 관심 종목 업종은 시장별 업종 분류 bulk 1회(SECTOR_SETTINGS["member_refresh_days"]마다)로 연결합니다.
+"""
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import SECTOR_SETTINGS, WATCHLIST_STOCKS
+from collectors.krx_collector import KrxCollector
+from collectors.sector_store import get_sector_store
+from collectors.trading_calendar import get_calendar, now_kst, today_kst
+from analytics.sectors import compute_sector_performance, map_to_sectors, format_sector_heatmap
+
+
+# 업종 분류를 제공하는 시장
+SECTOR_MARKETS = ("KOSPI", "KOSDAQ")
+
+
+def _close_series(by_family: dict[str, pd.DataFrame]) -> pd.Series:
+    """계열 → 지수 시세 dict → (계열, 지수명) 인덱스 종가"""
+    closes = {family: bars["close"] for family, bars in by_family.items() if not bars.empty}
+    return pd.concat(closes) if closes else pd.Series(dtype=float)
+
+
+class SectorCollector:
+    """업종 / 테마 지수 bulk 수집 + 히트맵"""
+
+    def __init__(self, krx: Optional[KrxCollector] = None):
+        self.krx = krx or KrxCollector()
+        self.store = get_sector_store()
+        self.settings = SECTOR_SETTINGS
+
+    def is_available(self) -> bool:
+        return self.krx.is_available()
+
+    @property
+    def families(self) -> list[str]:
+        return list(self.settings["families"])
+
+    def _is_final(self, day: date) -> bool:
+        """장 마감 후 확정 시세인지 (당일 장중·개장 전 시세는 저장하지 않음)"""
+        now = now_kst()
+        if day != now.date():
+            return day < now.date()
+        hours = get_calendar().session_hours(day)
+        return hours is None or now.strftime("%H:%M") >= hours[1]
+
+    def get_bars(self, day: date, family: str) -> pd.DataFrame:
+        """
+        거래일 1개·계열 1개 전체 지수 시세 (저장소 우선, 없으면 bulk 1회 조회 후 저장)
+
+        Returns:
+            지수명 인덱스 DataFrame (open, high, low, close, volume, value). 시세가 없으면 빈 DataFrame
+        """
+        key = day.isoformat()
+        if self.store.has(key, family):
+            return self.store.bars(key, family)
+        bars = self.krx.get_index_family_ohlcv(day.strftime("%Y%m%d"), family)
+        if not bars.empty and self._is_final(day):
+            self.store.save_bars(key, family, bars)
+        return bars
+
+    def get_closes(self, target_date: Optional[str] = None, max_sessions: int = 2) -> pd.DataFrame:
+        """
+        주간 기준일 / 전 거래일 / 기준 거래일 × (계열, 지수명) 종가
+
+        기준일 이하 가장 최근 거래일부터 시세가 있는 날을 찾고 (개장 전이면 직전 거래일),
+        나머지 두 거래일은 저장소에 없을 때만 조회합니다.
+
+        Args:
+            target_date: 조회 기준 날짜 (YYYYMMDD). None이면 오늘
+            max_sessions: 기준 거래일을 찾을 최대 거래일 수
+
+        Returns:
+            거래일 인덱스 DataFrame (attrs["date"] = 기준 거래일). 없으면 빈 DataFrame
+        """
+        calendar = get_calendar()
+        base = datetime.strptime(target_date, "%Y%m%d") if target_date else now_kst()
+        end = calendar.session_on_or_before(base)
+
+        latest = {}
+        for _ in range(max_sessions):
+            latest = {family: self.get_bars(end, family) for family in self.families}
+            if any(not bars.empty for bars in latest.values()):
+                break
+            end = calendar.previous_session(end)
+        else:
+            return pd.DataFrame()
+
+        days = [calendar.sessions_back(end, self.settings["weekly_sessions"]), calendar.previous_session(end)]
+        frames = {}
+        for day in days:
+            frames[day] = {family: self.get_bars(day, family) for family in self.families}
+        frames[end] = latest
+
+        closes = pd.DataFrame({pd.Timestamp(day): _close_series(by_family) for day, by_family in frames.items()})
+        closes = closes.T.sort_index()
+        closes.attrs["date"] = end.isoformat()
+        return closes
+
+    def get_members(self, tickers: list[str], day: date) -> dict[str, tuple[str, str]]:
+        """
+        종목 → (시장, 업종명). 시장별 분류가 없거나 오래됐으면 bulk 1회로 갱신
+
+        Args:
+            tickers: 종목 코드 리스트
+            day: 분류 기준 거래일
+        """
+        refresh = timedelta(days=self.settings["member_refresh_days"])
+        for market in SECTOR_MARKETS:
+            saved = self.store.member_date(market)
+            if saved is not None and day - date.fromisoformat(saved) < refresh:
+                continue
+            sectors = self.krx.get_sector_classifications(day.strftime("%Y%m%d"), market)
+            if sectors:
+                self.store.save_members(day.isoformat(), market, sectors)
+        return self.store.members(tickers)
+
+    def get_performance(
+        self,
+        target_date: Optional[str] = None,
+        tickers: Optional[list[str]] = None
+    ) -> tuple[pd.DataFrame, dict[str, tuple[str, str]]]:
+        """
+        업종 / 테마 성과 + 관심 종목 업종 지수
+
+        Args:
+            target_date: 조회 기준 날짜 (YYYYMMDD)
+            tickers: 종목 코드 리스트. None이면 WATCHLIST_STOCKS
+
+        Returns:
+            (compute_sector_performance() 결과, 종목 코드 → (계열, 지수명))
+        """
+        tickers = tickers if tickers is not None else WATCHLIST_STOCKS
+        closes = self.get_closes(target_date=target_date)
+        if closes.empty:
+            return compute_sector_performance(closes), {}
+
+        members = self.get_members(tickers, date.fromisoformat(closes.attrs["date"]))
+        performance = compute_sector_performance(
+            closes, sectors=self.store.sector_names() or None, theme_families=tuple(self.settings["theme_families"])
+        )
+        performance.attrs["date"] = closes.attrs["date"]
+        return performance, map_to_sectors(members, performance)
+
+    def format_for_briefing(
+        self,
+        performance: Optional[pd.DataFrame] = None,
+        watchlist: Optional[dict[str, tuple[str, str]]] = None,
+        target_date: Optional[str] = None
+    ) -> str:
+        """
+        업종·테마 히트맵 섹션 (마크다운)
+
+        Args:
+            performance, watchlist: 이미 조회한 get_performance() 결과 (없으면 조회)
+            target_date: 조회 기준 날짜 (YYYYMMDD)
+        """
+        if performance is None:
+            performance, watchlist = self.get_performance(target_date=target_date)
+        section = format_sector_heatmap(
+            performance, watchlist, name_of=self.krx.get_ticker_name,
+            top=self.settings["top"], families=self.families,
+        )
+        return section or "업종·테마 지수를 조회할 수 없습니다."
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    collector = SectorCollector()
+    if not collector.is_available():
+        print("PyKRX가 설치되지 않았습니다.")
+    else:
+        print(collector.format_for_briefing())
+        days, names, tickers = collector.store.count()
+        print(f"\n저장소: {days}거래일, 지수 {names}개, 업종 분류 {tickers:,}종목")
@@ -0,0 +1,178 @@
+"""
+업종 / 테마 지수 로컬 저장소
+
+KRX 전체 지수 시세(계열별 bulk 1회 = 해당 계열 지수 전체)와 종목별 업종 분류를
+SQLite(data/sectors.sqlite3)에 저장합니다.
+- 지수 시세: (거래일, 계열, 지수명) → OHLCV. 한 번 받은 거래일·계열은 다시 조회하지 않음
+- 업종 분류: 종목 코드 → (시장, 업종명). 분류는 자주 바뀌지 않아 시장별 기준일과 함께 저장
+"""
+import sys
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR
+
+
+BAR_COLUMNS = ("open", "high", "low", "close", "volume", "value")
+
+
+class SectorStore:
+    """SQLite 기반 업종 / 테마 지수 시세 + 종목 업종 분류 저장소"""
+
+    def __init__(self, path: Path = DATA_DIR / "sectors.sqlite3"):
+        """
+        Args:
+            path: 저장소 SQLite 파일
+        """
+        self.path = path
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS index_bars (
+                date TEXT NOT NULL,
+                family TEXT NOT NULL,
+                name TEXT NOT NULL,
+                open REAL, high REAL, low REAL, close REAL NOT NULL,
+                volume REAL, value REAL,
+                PRIMARY KEY (date, family, name)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS members (
+                ticker TEXT PRIMARY KEY,
+                market TEXT NOT NULL,
+                sector TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS member_dates (
+                market TEXT PRIMARY KEY,
+                date TEXT NOT NULL
+            );
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------------
+    # 지수 시세
+    # ------------------------------------------------------------------
+    def has(self, date: str, family: str) -> bool:
+        """해당 거래일(YYYY-MM-DD)·계열 시세 저장 여부"""
+        row = self._connect().execute(
+            "SELECT 1 FROM index_bars WHERE date = ? AND family = ? LIMIT 1", (date, family)
+        ).fetchone()
+        return row is not None
+
+    def save_bars(self, date: str, family: str, bars: pd.DataFrame) -> int:
+        """
+        거래일 1개·계열 1개 지수 시세 저장 (같은 거래일·계열은 통째로 교체)
+
+        Args:
+            date: 거래일 (YYYY-MM-DD)
+            family: 지수 계열 (KOSPI / KOSDAQ / 테마 ...)
+            bars: 지수명 인덱스 DataFrame (BAR_COLUMNS)
+
+        Returns:
+            저장한 지수 수
+        """
+        frame = bars.reindex(columns=list(BAR_COLUMNS))
+        values = [
+            (date, family, str(name), *(None if pd.isna(v) else float(v) for v in row))
+            for name, row in zip(frame.index, frame.itertuples(index=False))
+            if pd.notna(row.close)
+        ]
+
+        conn = self._connect()
+        # 성공 시에만 COMMIT, 예외 시 ROLLBACK (반쯤 쓴 배치를 남기지 않음)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM index_bars WHERE date = ? AND family = ?", (date, family))
+            conn.executemany(
+                "INSERT INTO index_bars (date, family, name, open, high, low, close, volume, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+        return len(values)
+
+    def bars(self, date: str, family: str) -> pd.DataFrame:
+        """저장된 거래일 1개·계열 1개 지수 시세 (지수명 인덱스, BAR_COLUMNS)"""
+        rows = self._connect().execute(
+            f"SELECT name, {', '.join(BAR_COLUMNS)} FROM index_bars WHERE date = ? AND family = ?",
+            (date, family),
+        ).fetchall()
+        frame = pd.DataFrame(rows, columns=["name", *BAR_COLUMNS]).set_index("name")
+        return frame.astype(float)
+
+    # ------------------------------------------------------------------
+    # 업종 분류
+    # ------------------------------------------------------------------
+    def member_date(self, market: str) -> Optional[str]:
+        """시장별 업종 분류 기준일 (YYYY-MM-DD). 저장한 적 없으면 None"""
+        row = self._connect().execute("SELECT date FROM member_dates WHERE market = ?", (market,)).fetchone()
+        return row[0] if row else None
+
+    def save_members(self, date: str, market: str, sectors: dict[str, str]) -> int:
+        """시장 1개 종목 → 업종명 전체 교체"""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM members WHERE market = ?", (market,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO members (ticker, market, sector) VALUES (?, ?, ?)",
+                [(ticker, market, sector) for ticker, sector in sectors.items()],
+            )
+            conn.execute("INSERT OR REPLACE INTO member_dates (market, date) VALUES (?, ?)", (market, date))
+        return len(sectors)
+
+    def members(self, tickers: Iterable[str]) -> dict[str, tuple[str, str]]:
+        """종목 코드 → (시장, 업종명). 분류가 없는 종목은 제외"""
+        tickers = list(tickers)
+        if not tickers:
+            return {}
+        rows = self._connect().execute(
+            f"SELECT ticker, market, sector FROM members WHERE ticker IN ({','.join('?' * len(tickers))})",
+            tickers,
+        ).fetchall()
+        return {ticker: (market, sector) for ticker, market, sector in rows}
+
+    def sector_names(self) -> dict[str, set[str]]:
+        """시장 → 업종명 집합"""
+        names: dict[str, set[str]] = {}
+        for market, sector in self._connect().execute("SELECT DISTINCT market, sector FROM members"):
+            names.setdefault(market, set()).add(sector)
+        return names
+
+    def count(self) -> tuple[int, int, int]:
+        """(저장 거래일 수, 지수 수, 업종 분류 종목 수)"""
+        days, names = self._connect().execute(
+            "SELECT COUNT(DISTINCT date), COUNT(DISTINCT family || '/' || name) FROM index_bars"
+        ).fetchone()
+        (tickers,) = self._connect().execute("SELECT COUNT(*) FROM members").fetchone()
+        return days, names, tickers
+
+
+@lru_cache(maxsize=1)
+def get_sector_store() -> SectorStore:
+    """프로세스 공용 업종 지수 저장소"""
+    return SectorStore()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    store = get_sector_store()
+    days, names, tickers = store.count()
+    print(f"업종 지수 저장소: {store.path} ({days}거래일, 지수 {names}개, 업종 분류 {tickers:,}종목)")
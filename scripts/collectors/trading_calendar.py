@@ -0,0 +1,284 @@
+"""
+KRX 거래일 달력
+
+거래일(세션), 휴장일, 개장/폐장 시각 변경일을 미리 계산해 둔 인덱스입니다.
+- 과거 구간: pykrx KOSPI 지수 이력의 실제 거래일 (임시 휴장 포함 자동 반영)
+- 미래 구간: 평일 - KRX_HOLIDAYS(config). 휴장일 목록이 있는 연도까지만 포함
+
+달력일마다 "이전/다음 거래일" 위치를 배열로 미리 계산해 두므로
+이전/다음 거래일, N거래일 전 조회가 모두 O(1)입니다.
+"""
+import sys
+import json
+from pathlib import Path
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from pykrx import stock
+    PYKRX_AVAILABLE = True
+except ImportError:
+    PYKRX_AVAILABLE = False
+
+from config import DATA_DIR, KRX_HOLIDAYS, KRX_SPECIAL_HOURS
+
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+REGULAR_HOURS = ("09:00", "15:30")
+
+# KRX 기준 시간대 (서머타임 없음). 실행 환경 시간대(UTC CI 러너 등)와 무관하게 장 날짜를 계산
+KST = timezone(timedelta(hours=9), "KST")
+
+
+def now_kst() -> datetime:
+    """현재 한국 시각 (tzinfo 없는 datetime → 기존 naive 비교 / strftime과 그대로 호환)"""
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+def today_kst() -> date:
+    """오늘 날짜 (한국 시각 기준)"""
+    return now_kst().date()
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """YYYYMMDD / YYYY-MM-DD 문자열, date, datetime → datetime64[D]"""
+    if isinstance(value, str) and len(value) == 8 and value.isdigit():
+        value = f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+def holiday_years(holidays: Iterable[DateLike] = KRX_HOLIDAYS) -> set[int]:
+    """휴장일 목록이 있는 연도 (매년 1월 1일 휴장이 있으므로 목록에 없는 연도 = 미관리 연도)"""
+    return {int(str(to_day(h))[:4]) for h in holidays}
+
+
+def covered_range(start: date, end: date, years: set[int]) -> tuple[date, date]:
+    """
+    start ~ end 중 휴장일 목록이 연속으로 있는 연도 구간 (올해 기준)
+
+    올해 이후 목록이 끊기는 연도부터, 올해 이전 목록이 끊기는 연도까지 제외합니다.
+    올해 목록이 없으면 범위를 줄이지 않습니다 (from_rules가 경고).
+    """
+    this_year = today_kst().year
+    if this_year not in years:
+        return start, end
+    first = last = this_year
+    while first - 1 in years and first - 1 >= start.year:
+        first -= 1
+    while last + 1 in years and last + 1 <= end.year:
+        last += 1
+    if last < end.year:
+        print(f"  [경고] KRX_HOLIDAYS에 {last + 1}년 휴장일이 없어 거래일 달력을 {last}-12-31까지로 제한합니다.")
+    return max(start, date(first, 1, 1)), min(end, date(last, 12, 31))
+
+
+class TradingCalendar:
+    """KRX 거래일 인덱스"""
+
+    def __init__(
+        self,
+        sessions: Iterable[DateLike],
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        special_hours: Optional[dict[str, tuple[str, str]]] = None
+    ):
+        """
+        Args:
+            sessions: 거래일 목록
+            start: 달력 시작일 (기본: 첫 거래일)
+            end: 달력 종료일 (기본: 마지막 거래일)
+            special_hours: 날짜(YYYY-MM-DD) → (개장, 폐장) 시각이 다른 날
+        """
+        self.sessions = np.unique(np.array([to_day(s) for s in sessions], dtype="datetime64[D]"))
+        if len(self.sessions) == 0:
+            raise ValueError("거래일 목록이 비어 있습니다.")
+
+        self.start = to_day(start) if start is not None else self.sessions[0]
+        self.end = to_day(end) if end is not None else self.sessions[-1]
+        self.special_hours = dict(special_hours or {})
+
+        # 달력일 i → 해당일 이하 마지막 거래일 / 이상 첫 거래일의 sessions 위치
+        days = np.arange(self.start, self.end + 1, dtype="datetime64[D]")
+        self._on_or_before = np.searchsorted(self.sessions, days, side="right") - 1
+        self._on_or_after = np.searchsorted(self.sessions, days, side="left")
+        self._is_session = np.isin(days, self.sessions)
+
+    def __contains__(self, day: DateLike) -> bool:
+        return self.is_session(day)
+
+    def _offset(self, day: DateLike) -> int:
+        offset = int((to_day(day) - self.start).astype(int))
+        if not 0 <= offset < len(self._is_session):
+            raise ValueError(f"거래일 달력 범위({self.start} ~ {self.end}) 밖의 날짜입니다: {day}")
+        return offset
+
+    def _session(self, pos: int) -> date:
+        if not 0 <= pos < len(self.sessions):
+            raise ValueError("거래일 달력 범위 밖의 거래일입니다.")
+        return self.sessions[pos].astype(date)
+
+    def is_session(self, day: DateLike) -> bool:
+        """거래일 여부"""
+        return bool(self._is_session[self._offset(day)])
+
+    def session_on_or_before(self, day: DateLike) -> date:
+        """해당일 이하 마지막 거래일 (거래일이면 자기 자신)"""
+        return self._session(self._on_or_before[self._offset(day)])
+
+    def session_on_or_after(self, day: DateLike) -> date:
+        """해당일 이상 첫 거래일 (거래일이면 자기 자신)"""
+        return self._session(self._on_or_after[self._offset(day)])
+
+    def previous_session(self, day: DateLike) -> date:
+        """해당일 직전 거래일 (해당일 제외)"""
+        return self._session(self._on_or_after[self._offset(day)] - 1)
+
+    def next_session(self, day: DateLike) -> date:
+        """해당일 다음 거래일 (해당일 제외)"""
+        return self._session(self._on_or_before[self._offset(day)] + 1)
+
+    def sessions_back(self, day: DateLike, count: int) -> date:
+        """해당일 이하 마지막 거래일로부터 count거래일 전 (0이면 그 거래일)"""
+        return self._session(self._on_or_before[self._offset(day)] - count)
+
+    def sessions_between(self, start: DateLike, end: DateLike) -> list[date]:
+        """start ~ end (양끝 포함) 거래일 목록"""
+        lo = self._on_or_after[self._offset(start)]
+        hi = self._on_or_before[self._offset(end)]
+        return [s.astype(date) for s in self.sessions[lo:hi + 1]]
+
+    def session_hours(self, day: DateLike) -> Optional[tuple[str, str]]:
+        """(개장, 폐장) 시각. 휴장일이면 None"""
+        if not self.is_session(day):
+            return None
+        return self.special_hours.get(str(to_day(day)), REGULAR_HOURS)
+
+    def holidays(self, start: DateLike, end: DateLike) -> list[date]:
+        """start ~ end 평일 휴장일 목록"""
+        days = np.arange(to_day(start), to_day(end) + 1, dtype="datetime64[D]")
+        weekdays = days[np.is_busday(days)]
+        closed = weekdays[~np.isin(weekdays, self.sessions)]
+        return [d.astype(date) for d in closed]
+
+    # ----- 생성 / 캐시 -----
+
+    @classmethod
+    def from_rules(
+        cls,
+        start: DateLike,
+        end: DateLike,
+        holidays: Iterable[DateLike] = KRX_HOLIDAYS
+    ) -> "TradingCalendar":
+        """평일 - 휴장일 규칙으로 생성 (네트워크 없이, 휴장일 목록이 없는 연도는 경고)"""
+        days = np.arange(to_day(start), to_day(end) + 1, dtype="datetime64[D]")
+        missing = sorted(set(range(int(str(days[0])[:4]), int(str(days[-1])[:4]) + 1)) - holiday_years(holidays))
+        if missing:
+            print(f"  [경고] KRX_HOLIDAYS에 {', '.join(map(str, missing))}년 휴장일이 없어 해당 연도는 평일을 모두 거래일로 봅니다.")
+        closed = np.array([to_day(h) for h in holidays], dtype="datetime64[D]")
+        sessions = days[np.is_busday(days, holidays=closed)]
+        return cls(sessions, start=start, end=end, special_hours=KRX_SPECIAL_HOURS)
+
+    @classmethod
+    def build(cls, years_back: int = 3, years_ahead: int = 1) -> "TradingCalendar":
+        """
+        과거는 pykrx 실제 거래일, 오늘 이후는 휴장일 규칙으로 달력 생성
+
+        규칙으로 만드는 구간은 KRX_HOLIDAYS에 휴장일이 있는 연도로 제한합니다
+        (목록 없는 연도의 설·추석을 거래일로 잘못 보지 않도록). 범위 밖 날짜 조회는 ValueError.
+
+        Args:
+            years_back: 과거 포함 연수
+            years_ahead: 올해 이후 포함 연수 (연말까지)
+        """
+        today = today_kst()
+        start = date(today.year - years_back, 1, 1)
+        rule_start, end = covered_range(start, date(today.year + years_ahead, 12, 31), holiday_years())
+        calendar = cls.from_rules(rule_start, end)
+
+        if not PYKRX_AVAILABLE:
+            return calendar
+
+        # rate_limit이 일일 호출량 날짜에 today_kst()를 쓰므로 순환 import를 피해 여기서 import
+        from collectors.rate_limit import get_limiter
+
+        yesterday = today - timedelta(days=1)
+        try:
+            get_limiter().acquire("krx")
+            df = stock.get_index_ohlcv(start.strftime("%Y%m%d"), yesterday.strftime("%Y%m%d"), "1001")
+        except Exception as e:
+            print(f"거래일 이력 조회 오류 (휴장일 규칙만 사용): {e}")
+            return calendar
+        if df is None or df.empty:
+            return calendar
+
+        past = np.asarray(df.index.values, dtype="datetime64[D]")
+        future = calendar.sessions[calendar.sessions >= to_day(today)]
+        return cls(np.concatenate([past, future]), start=start, end=end, special_hours=KRX_SPECIAL_HOURS)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "built": today_kst().isoformat(),
+            "start": str(self.start),
+            "end": str(self.end),
+            "sessions": [str(s) for s in self.sessions],
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["TradingCalendar"]:
+        """당일 생성된 캐시만 사용 (과거 구간이 매일 늘어나므로)"""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("built") != today_kst().isoformat():
+            return None
+        return cls(payload["sessions"], start=payload["start"], end=payload["end"],
+                   special_hours=KRX_SPECIAL_HOURS)
+
+
+CACHE_PATH = DATA_DIR / "calendar" / "krx_sessions.json"
+
+
+def get_calendar() -> TradingCalendar:
+    """
+    프로세스 공용 거래일 달력 (data/calendar/ 캐시, 하루 1회 재생성)
+
+    KST 날짜별로 캐시하므로 --schedule / --watch처럼 오래 도는 프로세스도 날짜가 바뀌면 새 달력을 씁니다.
+    """
+    return _calendar_for(today_kst().isoformat())
+
+
+@lru_cache(maxsize=1)
+def _calendar_for(day: str) -> TradingCalendar:
+    calendar = TradingCalendar.load(CACHE_PATH)
+    if calendar is None:
+        calendar = TradingCalendar.build()
+        try:
+            calendar.save(CACHE_PATH)
+        except OSError as e:
+            print(f"거래일 달력 캐시 저장 실패: {e}")
+    return calendar
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    calendar = get_calendar()
+    today = today_kst()
+    print(f"달력 범위: {calendar.start} ~ {calendar.end} ({len(calendar.sessions)}거래일)")
+    print(f"오늘({today}) 거래일 여부: {calendar.is_session(today)}")
+    print(f"직전 거래일: {calendar.previous_session(today)}")
+    print(f"다음 거래일: {calendar.next_session(today)}")
+    print(f"개장 시간: {calendar.session_hours(calendar.next_session(today))}")
+    print(f"올해 평일 휴장일: {calendar.holidays(date(today.year, 1, 1), date(today.year, 12, 31))}")
@@ -0,0 +1,192 @@
+"""
+공용 HTTP 전송 계층
+
+모든 수집기가 하나의 requests.Session을 공유합니다.
+- 호스트별 연결 풀 (keep-alive): TLS 핸드셰이크/연결 수립은 실행당 호스트별 1회
+- gzip/deflate 응답 압축
+- 일시 오류(연결 실패, 타임아웃, 429/5xx) 재시도: 지수 백오프 + 지터
+- 일관된 타임아웃
+- 호스트별 요청 수/재시도/오류/수신 바이트/소요 시간 집계
+- source 지정 시 소스별 호출 제한(rate_limit.py) 적용 (재시도 포함)
+"""
+import sys
+import time
+import random
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import HTTP_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF_SEC, HTTP_POOL_SIZE, HTTP_USER_AGENT
+from collectors.rate_limit import get_limiter
+
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class HostStats:
+    """호스트별 요청 집계"""
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+
+
+class HttpTransport:
+    """연결 풀 + 재시도 + 요청 집계를 갖춘 공용 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        timeout: float = HTTP_TIMEOUT,
+        retries: int = HTTP_RETRIES,
+        backoff: float = HTTP_BACKOFF_SEC,
+        pool_size: int = HTTP_POOL_SIZE
+    ):
+        """
+        Args:
+            timeout: 요청 타임아웃(초)
+            retries: 일시 오류 시 최대 재시도 횟수
+            backoff: 재시도 대기 기본값(초). n번째 재시도는 backoff * 2^(n-1) + 지터
+            pool_size: 호스트별 최대 유지 연결 수
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": HTTP_USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+        })
+        # 재시도는 아래 request()에서 직접 처리 (지터/집계를 위해)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._stats: dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def _sleep_before_retry(self, attempt: int, response: Optional[requests.Response]) -> None:
+        delay = self.backoff * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        time.sleep(min(delay, 30.0) * random.uniform(0.5, 1.5))
+
+    def _record(self, host: str, **deltas) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(host, HostStats())
+            for name, value in deltas.items():
+                setattr(stats, name, getattr(stats, name) + value)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        source: Optional[str] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        HTTP 요청 (일시 오류 시 재시도)
+
+        Args:
+            method: GET / POST 등
+            url: 요청 URL
+            source: 호출 제한 소스 이름 (RATE_LIMITS 키). None이면 제한 없음
+            **kwargs: requests.Session.request 인자 (timeout 미지정 시 공용 타임아웃).
+                stream=True면 본문을 읽지 않고 반환 (수신 바이트는 Content-Length 기준 집계)
+
+        Returns:
+            응답 객체. 재시도 후에도 429/5xx이면 마지막 응답을 그대로 반환
+
+        Raises:
+            requests.RequestException: 재시도 후에도 연결 실패/타임아웃인 경우
+            QuotaExceeded: source의 일일 호출 한도를 모두 사용한 경우
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        stream = kwargs.get("stream", False)
+        host = urlsplit(url).netloc
+
+        for attempt in range(self.retries + 1):
+            if source:
+                get_limiter().acquire(source)
+            started = time.perf_counter()
+            response = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(host, requests=1, errors=1, elapsed=time.perf_counter() - started)
+                if attempt == self.retries:
+                    raise
+            else:
+                size = int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+                self._record(host, requests=1, bytes=size, elapsed=time.perf_counter() - started)
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    if response.status_code >= 400:
+                        self._record(host, errors=1)
+                    return response
+                response.close()
+
+            self._record(host, retries=1)
+            self._sleep_before_retry(attempt, response)
+
+    def get(self, url: str, source: Optional[str] = None, **kwargs) -> requests.Response:
+        return self.request("GET", url, source=source, **kwargs)
+
+    def post(self, url: str, source: Optional[str] = None, **kwargs) -> requests.Response:
+        return self.request("POST", url, source=source, **kwargs)
+
+    def stats(self) -> dict[str, HostStats]:
+        """호스트별 요청 집계 사본"""
+        with self._lock:
+            return {host: replace(s) for host, s in self._stats.items()}
+
+    def format_stats(self) -> str:
+        """호스트별 요청 집계 요약 (콘솔 출력용)"""
+        stats = self.stats()
+        if not stats:
+            return "HTTP 요청 없음"
+
+        lines = ["HTTP 요청 집계:"]
+        for host, s in sorted(stats.items()):
+            lines.append(
+                f"  - {host}: {s.requests}회 (재시도 {s.retries}, 오류 {s.errors}) "
+                f"| {s.bytes / 1024:,.0f}KB | {s.elapsed:.2f}초"
+            )
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+@lru_cache(maxsize=1)
+def get_transport() -> HttpTransport:
+    """프로세스 공용 HTTP 전송 계층"""
+    return HttpTransport()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    transport = get_transport()
+    for url in [
+        "https://fred.stlouisfed.org/graph/fredgraph.csv?id=FEDFUNDS",
+        "https://fred.stlouisfed.org/graph/fredgraph.csv?id=DGS10",
+    ]:
+        try:
+            response = transport.get(url)
+            print(f"{url}: {response.status_code}")
+        except requests.RequestException as e:
+            print(f"{url}: {e}")
+    print(transport.format_stats())
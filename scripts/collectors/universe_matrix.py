@@ -0,0 +1,254 @@
+"""
+전종목 가격 행렬 (메모리 맵)
+
+KOSPI/KOSDAQ 전종목의 종가·거래량·거래대금을 날짜 × 종목 float32 행렬로 data/universe/에 저장합니다.
+- 필드별 파일 1개 (close.f32, volume.f32, value.f32), 행 우선(row-major) 배치
+  → 날짜 구간 조회는 연속된 행을 복사 없이 바로 참조 (np.memmap 뷰)
+- 하루 갱신 = 전종목 스냅샷(bulk 1회) → 행 1개 기록
+- 날짜/종목 목록은 meta.json에 저장. 파일은 행/열 여유 공간(capacity)을 두고 늘려
+  신규 상장 종목이 생겨도 매일 전체를 다시 쓰지 않습니다.
+- 값이 없는 칸(미상장, 거래정지 등)은 NaN
+"""
+import json
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 / scripts 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR
+
+
+def _day(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class UniverseMatrix:
+    """날짜 × 종목 float32 메모리 맵 행렬 (필드별 파일)"""
+
+    FIELDS = ("close", "volume", "value")
+    # 파일 확장 단위 (행 = 거래일, 열 = 종목)
+    ROW_CHUNK = 256
+    COL_CHUNK = 512
+
+    def __init__(self, path: Path = DATA_DIR / "universe"):
+        """
+        Args:
+            path: 행렬 디렉터리 (meta.json + 필드별 .f32 파일)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.tickers: list[str] = []
+        self._col: dict[str, int] = {}
+        self._capacity = (0, 0)
+        self._maps: dict[str, np.memmap] = {}
+        self._load_meta()
+
+    # ------------------------------------------------------------------
+    # 저장 구조
+    # ------------------------------------------------------------------
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    def _field_path(self, field: str) -> Path:
+        return self.path / f"{field}.f32"
+
+    def _load_meta(self) -> None:
+        if not self._meta_path.exists():
+            return
+        meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+        self.dates = np.array(meta["dates"], dtype="datetime64[D]")
+        self.tickers = list(meta["tickers"])
+        self._col = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._capacity = tuple(meta["capacity"])
+
+    def _save_meta(self) -> None:
+        meta = {
+            "dates": [str(d) for d in self.dates],
+            "tickers": self.tickers,
+            "capacity": list(self._capacity),
+        }
+        tmp = self._meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(self._meta_path)
+
+    def _map(self, field: str) -> np.memmap:
+        """필드 전체 (capacity) 메모리 맵 (읽기/쓰기)"""
+        if field not in self._maps:
+            self._maps[field] = np.memmap(self._field_path(field), dtype=np.float32, mode="r+", shape=self._capacity)
+        return self._maps[field]
+
+    def _reserve(self, rows: int, cols: int) -> None:
+        """행/열 여유 공간 확보 (열이 늘면 파일 재배치, 행만 늘면 파일 끝 확장)"""
+        cap_rows, cap_cols = self._capacity
+        if rows <= cap_rows and cols <= cap_cols:
+            return
+        new_rows = max(cap_rows, -(-rows // self.ROW_CHUNK) * self.ROW_CHUNK)
+        new_cols = max(cap_cols, -(-cols // self.COL_CHUNK) * self.COL_CHUNK)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        for field in self.FIELDS:
+            self._maps.pop(field, None)
+            target = self._field_path(field)
+            if new_cols == cap_cols and target.exists():
+                # 행 우선 배치라 기존 데이터 위치는 그대로, 파일 끝만 NaN으로 확장
+                with open(target, "r+b") as f:
+                    f.truncate(new_rows * new_cols * 4)
+                grown = np.memmap(target, dtype=np.float32, mode="r+", shape=(new_rows, new_cols))
+                grown[cap_rows:] = np.nan
+                grown.flush()
+                continue
+
+            tmp = target.with_suffix(".tmp")
+            grown = np.memmap(tmp, dtype=np.float32, mode="w+", shape=(new_rows, new_cols))
+            grown[:] = np.nan
+            if target.exists() and cap_rows:
+                old = np.memmap(target, dtype=np.float32, mode="r", shape=(cap_rows, cap_cols))
+                grown[:cap_rows, :cap_cols] = old
+                del old
+            grown.flush()
+            del grown
+            tmp.replace(target)
+
+        self._capacity = (new_rows, new_cols)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def update(self, date, snapshot: pd.DataFrame) -> int:
+        """
+        거래일 1개 전종목 스냅샷 기록 (같은 날짜가 있으면 덮어씀)
+
+        Args:
+            date: 거래일
+            snapshot: 티커 인덱스 DataFrame (KrxCollector.get_market_snapshot 결과, close/volume/value 컬럼)
+
+        Returns:
+            기록한 종목 수
+        """
+        if snapshot is None or snapshot.empty:
+            return 0
+        day = _day(date)
+        tickers = [str(t) for t in snapshot.index]
+
+        with self._lock:
+            new = [t for t in dict.fromkeys(tickers) if t not in self._col]
+            pos = int(np.searchsorted(self.dates, day))
+            exists = pos < len(self.dates) and self.dates[pos] == day
+            self._reserve(len(self.dates) + (0 if exists else 1), len(self.tickers) + len(new))
+
+            for ticker in new:
+                self._col[ticker] = len(self.tickers)
+                self.tickers.append(ticker)
+            cols = np.fromiter((self._col[t] for t in tickers), dtype=np.int64, count=len(tickers))
+
+            n = len(self.dates)
+            for field in self.FIELDS:
+                data = self._map(field)
+                if not exists and pos < n:
+                    # 과거 날짜 백필: 뒤쪽 행을 한 칸씩 밀기
+                    data[pos + 1:n + 1] = data[pos:n]
+                row = np.full(self._capacity[1], np.nan, dtype=np.float32)
+                if field in snapshot:
+                    row[cols] = pd.to_numeric(snapshot[field], errors="coerce").to_numpy(dtype=np.float32)
+                data[pos] = row
+                data.flush()
+
+            if not exists:
+                self.dates = np.insert(self.dates, pos, day)
+            self._save_meta()
+        return len(tickers)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def has(self, date) -> bool:
+        day = _day(date)
+        pos = int(np.searchsorted(self.dates, day))
+        return pos < len(self.dates) and self.dates[pos] == day
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(거래일 수, 종목 수)"""
+        return len(self.dates), len(self.tickers)
+
+    def _rows(self, start=None, end=None) -> slice:
+        lo = 0 if start is None else int(np.searchsorted(self.dates, _day(start), side="left"))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, _day(end), side="right"))
+        return slice(lo, hi)
+
+    def columns(self, tickers: Iterable[str]) -> np.ndarray:
+        """종목 코드 → 열 번호 (없는 종목은 제외)"""
+        return np.array([self._col[t] for t in tickers if t in self._col], dtype=np.int64)
+
+    def view(self, field: str, start=None, end=None) -> np.ndarray:
+        """
+        날짜 구간 × 전종목 읽기 전용 뷰 (복사 없음)
+
+        Args:
+            field: FIELDS 중 하나
+            start, end: 날짜 구간 (양끝 포함). None이면 처음 / 끝까지
+
+        Returns:
+            (거래일 수, 종목 수) float32 배열. 열 순서는 self.tickers
+        """
+        if field not in self.FIELDS:
+            raise ValueError(f"지원하지 않는 필드입니다: {field}")
+        if not self.dates.size:
+            return np.empty((0, len(self.tickers)), dtype=np.float32)
+        data = np.memmap(self._field_path(field), dtype=np.float32, mode="r", shape=self._capacity)
+        return data[self._rows(start, end), :len(self.tickers)]
+
+    def dates_between(self, start=None, end=None) -> np.ndarray:
+        return self.dates[self._rows(start, end)]
+
+    def frame(
+        self,
+        field: str,
+        start=None,
+        end=None,
+        tickers: Optional[Iterable[str]] = None
+    ) -> pd.DataFrame:
+        """
+        날짜 인덱스 × 종목 컬럼 DataFrame (요청한 부분만 메모리로 복사)
+
+        Args:
+            field: FIELDS 중 하나
+            start, end: 날짜 구간 (양끝 포함)
+            tickers: 종목 코드. None이면 전종목
+        """
+        values = self.view(field, start, end)
+        if tickers is None:
+            names = self.tickers
+        else:
+            names = [t for t in tickers if t in self._col]
+            values = values[:, self.columns(names)]
+        return pd.DataFrame(
+            np.asarray(values), index=pd.DatetimeIndex(self.dates_between(start, end)), columns=names
+        )
+
+
+@lru_cache(maxsize=1)
+def get_universe() -> UniverseMatrix:
+    """프로세스 공용 전종목 행렬"""
+    return UniverseMatrix()
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    universe = get_universe()
+    rows, cols = universe.shape
+    print(f"전종목 행렬: {universe.path} ({rows}거래일 × {cols}종목)")
+    if rows:
+        print(f"기간: {universe.dates[0]} ~ {universe.dates[-1]}")
+        close = universe.frame("close", start=universe.dates[-min(rows, 5)])
+        print(close.iloc[:, :5])
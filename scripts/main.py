@@ -13,7 +13,44 @@
     python main.py --type aftermarket
     python main.py
 
-    # 스케줄러로 자동 실행 (08:00 모닝, 12:30 미드데이, 18:00 애프터마켓)
+    # 수집 계획 / 예상 외부 호출 수 확인 (실제 수집 없음)
+    python main.py --type morning --plan
+
+    # 프로필별 브리핑 (BRIEFING_PROFILES_FILE, 관심 종목 합집합으로 1회 수집 → 프로필별 병렬 렌더링)
+    python main.py --profiles
+    python main.py --type morning --profiles semiconductor,battery
+    python main.py --profiles --plan
+
+    # 지난 브리핑 수치 추이 (지표 키 또는 종목 코드)
+    python main.py --trend usd_krw --last 20
+
+    # 주간/월간 리뷰 (브리핑 아카이브 집계, 외부 API 호출 없음 → results/)
+    python main.py --report weekly
+    python main.py --report monthly --period 2026-08
+    python main.py --trend 000660
+
+    # 분할 매수 / 손절 / 익절 규칙 백테스트 (관심 종목 또는 지정 종목 일봉)
+    python main.py --backtest
+    python main.py --backtest 005930,000660 --start 20230101 --sweep
+
+    # 전종목 종가/거래량/거래대금 행렬 채우기 (data/universe/, 없는 거래일만 bulk 조회)
+    python main.py --universe 250
+
+    # 전종목 스크리너 (SCREENER_SETTINGS 규칙, 전종목 스냅샷 + 전종목 행렬 이력)
+    python main.py --screen
+    python main.py --screen 20260814
+
+    # 수집된 뉴스 검색 (로컬 인덱스, 기본 최근 7일)
+    python main.py --search 하이닉스 --days 30
+    python main.py --search "" --ticker 000660
+
+    # 장중 스냅샷 수집 후 미드데이 브리핑 생성 (INTRADAY_END_TIME까지 폴링)
+    python main.py --intraday
+
+    # 조건부 알림 감시 (±3%/±5% 등락, 5% 스프레드, 신규 공시/뉴스)
+    python main.py --watch
+
+    # 스케줄러로 자동 실행 (거래일 08:00 모닝, 12:30 미드데이, 18:00 애프터마켓)
     python main.py --schedule
 
     # 개별 수집기 테스트
@@ -21,16 +58,50 @@
     python main.py --test krx
     python main.py --test ecos
     python main.py --test news
+    python main.py --test correlation
+    python main.py --test sectors
 """
 import sys
+import sqlite3
 import argparse
+from typing import Optional
 from pathlib import Path
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from briefing_generator import BriefingGenerator
-from collectors import DartCollector, KrxCollector, EcosCollector, NewsCollector
+from briefing_generator import BriefingGenerator, describe_plan
+from profiles import load_profiles, union_tickers
+from collectors import (
+    DartCollector, KrxCollector, EcosCollector, NewsCollector, IntradayCollector, CrossAssetCollector, SectorCollector,
+)
+from collectors.trading_calendar import get_calendar, today_kst
+from collectors.transport import get_transport
+from collectors.rate_limit import get_limiter
+from collectors.health import get_health
+from collectors.news_index import get_news_index
+from collectors.universe_matrix import get_universe
+from collectors.sector_store import get_sector_store
+from briefing_archive import get_archive, METRIC_NAMES
+from briefing_sinks import get_publisher
+from report_generator import ReportGenerator
+from backtester import load_prices, backtest, run_sweep, default_grid, format_sweep
+from screener import screen, format_for_briefing as format_screener
+from analytics.backtest import format_backtest
+
+
+# --test 로 시험할 수 있는 수집기 (argparse choices / 안내 메시지 공용)
+TEST_COLLECTORS = ("dart", "krx", "ecos", "news", "correlation", "sectors")
+
+
+def flush_sinks():
+    """대기 중인 브리핑 sink 전달을 BRIEFING_SINK_SETTINGS["flush_timeout"]까지 기다린 뒤 집계 출력"""
+    publisher = get_publisher()
+    if not publisher.workers:
+        return
+    if not publisher.flush():
+        print("  [경고] 브리핑 sink 전달이 제한 시간 안에 끝나지 않았습니다.")
+    print(publisher.format_stats())
 
 
 def run_briefing(briefing_type: str = "aftermarket", use_ai: bool = False):
@@ -38,10 +109,117 @@ def run_briefing(briefing_type: str = "aftermarket", use_ai: bool = False):
     generator = BriefingGenerator()
     filepath = generator.generate_and_save(briefing_type=briefing_type, use_ai=use_ai)
     print(f"\n완료! 파일 위치: {filepath}")
+    flush_sinks()
+    print(get_transport().format_stats())
+
+
+def run_profiles(names: Optional[list[str]] = None, briefing_type: str = "aftermarket", use_ai: bool = False):
+    """프로필별 브리핑 생성 실행 (names가 없으면 프로필 파일 전체)"""
+    try:
+        profiles = load_profiles(names)
+    except ValueError as e:
+        print(f"프로필 설정 오류: {e}")
+        return
+    generator = BriefingGenerator()
+    paths = generator.generate_profiles(profiles, briefing_type=briefing_type, use_ai=use_ai)
+    print(f"\n완료! 프로필 브리핑 {len(paths)}/{len(profiles)}개 생성")
+    flush_sinks()
+    print(get_transport().format_stats())
+
+
+def run_report(period: str, ref: Optional[str] = None):
+    """주간/월간 리뷰 생성 (브리핑 아카이브 집계)"""
+    generator = ReportGenerator()
+    generator.generate_and_save(period=period, ref=ref)
+
+
+def run_backtest(
+    tickers: Optional[list[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    sweep: bool = False
+):
+    """일봉 조회 → 기본 규칙 백테스트 (sweep이면 BACKTEST_SETTINGS 조합 전체)"""
+    prices = load_prices(tickers, start_date=start_date, end_date=end_date)
+    if not prices.tickers:
+        print("일봉 데이터가 없습니다.")
+        return
+    rows, cols = prices.shape
+    print(f"=== 백테스트: {prices.dates[0]} ~ {prices.dates[-1]} ({rows}거래일 × {cols}종목) ===\n")
+
+    if sweep:
+        grid = default_grid()
+        print(f"파라미터 {len(grid)}개 조합 (샤프 지수 상위 10개)\n")
+        print(format_sweep(run_sweep(prices, grid)))
+    else:
+        krx = KrxCollector()
+        names = {ticker: krx.get_ticker_name(ticker) for ticker in prices.tickers}
+        print(format_backtest(backtest(prices), prices.tickers, names))
+
+
+def run_universe(sessions: int):
+    """최근 N거래일 전종목 행렬 백필 (이미 있는 거래일은 건너뜀)"""
+    krx = KrxCollector()
+    if not krx.is_available():
+        print("PyKRX가 설치되지 않았습니다.")
+        print("설치: pip install pykrx")
+        return
+
+    print(f"전종목 행렬 갱신 중 (최근 {sessions}거래일, 없는 날짜만 조회)...")
+    added = krx.backfill_universe(sessions)
+    universe = get_universe()
+    rows, cols = universe.shape
+    print(f"{added}거래일 추가 → {rows}거래일 × {cols}종목 ({universe.path})")
+    if rows:
+        print(f"기간: {universe.dates[0]} ~ {universe.dates[-1]}")
+
+
+def run_screen(target_date: Optional[str] = None):
+    """전종목 스냅샷 조회 → SCREENER_SETTINGS 규칙 일괄 적용"""
+    krx = KrxCollector()
+    if not krx.is_available():
+        print("PyKRX가 설치되지 않았습니다.")
+        print("설치: pip install pykrx")
+        return
+
+    snapshot = krx.get_latest_market_snapshot(target_date=target_date)
+    if snapshot.empty:
+        print("전종목 스냅샷을 조회할 수 없습니다.")
+        return
+    print(f"=== 전종목 스크리너: {snapshot.attrs.get('date', '')} ({len(snapshot):,}종목) ===\n")
+    results, ctx = screen(snapshot)
+    print(format_screener(results, ctx, name_of=krx.get_ticker_name))
+
+
+def run_intraday(use_ai: bool = False):
+    """장중 스냅샷 수집 → 미드데이 브리핑 생성"""
+    if not get_calendar().is_session(today_kst()):
+        print(f"오늘({today_kst()})은 휴장일입니다. 장중 수집을 건너뜁니다.")
+        return
+
+    generator = BriefingGenerator()
+    collector = IntradayCollector(krx=generator.krx)
+    if not collector.is_available():
+        print("PyKRX가 설치되지 않았습니다.")
+        print("설치: pip install pykrx")
+        return
+
+    collector.run()
+    generator.intraday = collector
+    filepath = generator.generate_and_save(briefing_type="midday", use_ai=use_ai)
+    print(f"\n완료! 파일 위치: {filepath}")
+    flush_sinks()
+
+
+def run_watch():
+    """조건부 알림 감시 실행 (Ctrl+C로 종료)"""
+    from alert_engine import AlertEngine
+
+    AlertEngine().run()
 
 
 def run_scheduler():
-    """스케줄러로 자동 실행 (모닝 08:00, 미드데이 12:30, 애프터마켓 18:00)"""
+    """스케줄러로 자동 실행 (거래일만: 모닝 08:00, 미드데이 12:30, 애프터마켓 18:00)"""
     try:
         import schedule
         import time
@@ -50,24 +228,22 @@ def run_scheduler():
         print("설치: pip install schedule")
         return
 
-    def morning_job():
-        print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] 모닝 브리핑 생성 시작...")
-        run_briefing(briefing_type="morning")
-
-    def midday_job():
-        print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] 미드데이 브리핑 생성 시작...")
-        run_briefing(briefing_type="midday")
-
-    def aftermarket_job():
-        print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] 애프터 마켓 브리핑 생성 시작...")
-        run_briefing(briefing_type="aftermarket")
-
-    # 매일 08:00 모닝, 12:30 미드데이, 18:00 애프터마켓
-    schedule.every().day.at("08:00").do(morning_job)
-    schedule.every().day.at("12:30").do(midday_job)
-    schedule.every().day.at("18:00").do(aftermarket_job)
-
-    print("스케줄러 시작")
+    def briefing_job(briefing_type: str, label: str):
+        def job():
+            # 주말/공휴일 등 휴장일에는 실행하지 않음
+            if not get_calendar().is_session(today_kst()):
+                return
+            print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] {label} 생성 시작...")
+            run_briefing(briefing_type=briefing_type)
+        return job
+
+    # 거래일 08:00 모닝, 12:30 미드데이, 18:00 애프터마켓
+    schedule.every().day.at("08:00").do(briefing_job("morning", "모닝 브리핑"))
+    schedule.every().day.at("12:30").do(briefing_job("midday", "미드데이 브리핑"))
+    schedule.every().day.at("18:00").do(briefing_job("aftermarket", "애프터 마켓 브리핑"))
+
+    calendar = get_calendar()
+    print(f"스케줄러 시작 (다음 실행 거래일: {calendar.session_on_or_after(today_kst())})")
     print("  - 08:00 모닝 브리핑")
     print("  - 12:30 미드데이 브리핑")
     print("  - 18:00 애프터 마켓 브리핑")
@@ -116,6 +292,26 @@ def test_collector(collector_name: str):
         print("경제지표 조회 중...")
         print(collector.format_for_briefing())
 
+    elif collector_name == "correlation":
+        collector = CrossAssetCollector()
+        if not collector.is_available():
+            print("PyKRX가 설치되지 않았습니다.")
+            print("설치: pip install pykrx")
+            return
+
+        print("관심 종목 × 지수/환율/금리 롤링 상관 갱신 중...")
+        print(collector.format_for_briefing())
+
+    elif collector_name == "sectors":
+        collector = SectorCollector()
+        if not collector.is_available():
+            print("PyKRX가 설치되지 않았습니다.")
+            print("설치: pip install pykrx")
+            return
+
+        print("업종/테마 지수 조회 중 (계열별 bulk, 저장소에 없는 거래일만)...")
+        print(collector.format_for_briefing())
+
     elif collector_name == "news":
         collector = NewsCollector()
         if not collector.is_available():
@@ -128,7 +324,48 @@ def test_collector(collector_name: str):
 
     else:
         print(f"알 수 없는 수집기: {collector_name}")
-        print("사용 가능: dart, krx, ecos, news")
+        print(f"사용 가능: {', '.join(TEST_COLLECTORS)}")
+
+
+def search_news(query: str, ticker: Optional[str] = None, days: Optional[int] = 7, limit: int = 30):
+    """로컬 뉴스 인덱스 검색"""
+    try:
+        index = get_news_index()
+    except (sqlite3.Error, OSError) as e:
+        print(f"뉴스 인덱스를 열 수 없습니다 (SQLite {sqlite3.sqlite_version}, FTS5 trigram은 3.34 이상 필요): {e}")
+        return
+    period = f"최근 {days}일" if days else "전체 기간"
+    target = f" / 종목 {ticker}" if ticker else ""
+    print(f"=== 뉴스 검색: '{query}'{target} ({period}, 저장 {index.count():,}건) ===\n")
+    print(index.format_results(index.search(query, ticker=ticker, days=days, limit=limit)))
+
+
+def show_trend(key: str, last: int = 20):
+    """지난 브리핑 아카이브에서 지표 / 관심 종목 추이 출력"""
+    archive = get_archive()
+    synced = archive.sync()
+    if synced:
+        print(f"(브리핑 {synced}건 색인)")
+
+    if key.isdigit():
+        rows = archive.ticker_history(key, last=last)
+        if not rows:
+            print(f"{key}: 아카이브에 시세 기록이 없습니다.")
+            return
+        print(f"=== {rows[-1]['name']}({key}) 최근 {len(rows)}거래일 ===\n")
+        for row in rows:
+            print(f"{row['date']} {row['close']:>12,.0f}원 ({row['change_pct']:+.2f}%)")
+        big = sum(1 for row in rows if abs(row["change_pct"]) >= 3)
+        print(f"\n±3% 이상 등락: {big}일 / {len(rows)}일")
+        return
+
+    rows = archive.series(key, last=last)
+    if not rows:
+        print(f"{key}: 아카이브에 기록이 없습니다. 사용 가능 키: {', '.join(METRIC_NAMES)}")
+        return
+    print(f"=== {METRIC_NAMES.get(key, key)} 최근 {len(rows)}회 ===\n")
+    for day, briefing_type, value in rows:
+        print(f"{day} {briefing_type:<12} {value:>12,.3f}")
 
 
 def show_status():
@@ -148,12 +385,25 @@ def show_status():
     # ECOS
     ecos = EcosCollector()
     ecos_status = "[O] 사용 가능" if ecos.is_available() else "[X] API 키 필요"
-    print(f"ECOS (경제지표): {ecos_status}")
+    series_count, observations = ecos.store.count()
+    print(f"ECOS (경제지표): {ecos_status} (로컬 저장소 {series_count}개 시계열, {observations:,}건)")
 
     # News
     news = NewsCollector()
     news_status = "[O] 사용 가능" if news.is_available() else "[X] feedparser 설치 필요"
-    print(f"뉴스 RSS: {news_status}")
+    index_status = f"로컬 인덱스 {news.index.count():,}건" if news.index is not None else "로컬 인덱스 사용 불가"
+    print(f"뉴스 RSS: {news_status} ({index_status})")
+
+    # 전종목 행렬
+    rows, cols = get_universe().shape
+    print(f"전종목 행렬: {rows}거래일 × {cols}종목 (python main.py --universe N 으로 백필)")
+    days, indices, members = get_sector_store().count()
+    print(f"업종/테마 지수: {days}거래일 × 지수 {indices}개, 업종 분류 {members:,}종목")
+
+    # 브리핑 출력 sink
+    from config import BRIEFING_SINKS, BRIEFING_SINK_DIR
+    sinks = [name.strip() for name in BRIEFING_SINKS if name.strip()]
+    print(f"브리핑 sink: {', '.join(sinks) if sinks else '없음'} (출력 폴더 {BRIEFING_SINK_DIR})")
 
     # OpenAI
     from config import OPENAI_API_KEY, AI_ENABLED, AI_MODEL
@@ -161,6 +411,10 @@ def show_status():
     ai_on_off = "ON" if AI_ENABLED else "OFF"
     print(f"OpenAI (ChatGPT): {ai_key_ok} API 키 {'등록됨' if OPENAI_API_KEY else '필요'} | AI 분석: {ai_on_off} | 모델: {AI_MODEL}")
 
+    # 소스별 호출량 / 장애 상태
+    print(f"\n{get_limiter().format_usage()}")
+    print(f"\n{get_health().format_health()}")
+
     print("\n---")
     print("설정 방법: .env.example을 .env로 복사 후 API 키 입력")
 
@@ -176,8 +430,22 @@ def main():
   python main.py --type midday            미드데이 브리핑 생성
   python main.py --type aftermarket       애프터 마켓 브리핑 생성
   python main.py --type midday --ai       AI 분석 포함 미드데이 브리핑
-  python main.py --schedule               스케줄러로 자동 실행
+  python main.py --type morning --plan    모닝 브리핑 수집 계획 확인 (수집 없음)
+  python main.py --profiles               프로필별 브리핑 (프로필 파일 전체, 수집은 1회)
+  python main.py --profiles macro --ai    지정 프로필만 AI 분석 포함 생성 (쉼표 구분)
+  python main.py --intraday               장중 스냅샷 수집 후 미드데이 브리핑
+  python main.py --watch                  조건부 알림 감시 (Ctrl+C 종료)
+  python main.py --schedule               스케줄러로 자동 실행 (거래일만)
+  python main.py --type morning --trading-day-only   휴장일이면 생성하지 않음 (cron용)
+  python main.py --search 하이닉스         수집된 뉴스 검색 (최근 7일)
+  python main.py --backtest --sweep       관심 종목 규칙 백테스트 + 파라미터 스윕
+  python main.py --universe 250           전종목 행렬 최근 250거래일 백필 (없는 날짜만)
+  python main.py --screen                 전종목 스크리너 (SCREENER_SETTINGS 규칙)
+  python main.py --trend usd_krw          지난 브리핑 원/달러 추이 (종목 코드도 가능)
+  python main.py --report monthly         이번 달 월간 리뷰 (--period 2026-08 / 2026-W34 로 기간 지정)
   python main.py --test dart              DART 수집기 테스트
+  python main.py --test correlation       관심 종목 환율·금리 민감도 (롤링 상관/베타)
+  python main.py --test sectors           업종/테마 지수 히트맵 (계열별 bulk 조회)
   python main.py --status                 현재 설정 상태 확인
         """
     )
@@ -194,15 +462,122 @@ def main():
         action="store_true",
         help="AI 분석 포함"
     )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="--type 브리핑의 수집 계획과 예상 외부 호출 수만 출력 (dry run)"
+    )
+    parser.add_argument(
+        "--profiles",
+        type=str,
+        nargs="?",
+        const="",
+        metavar="NAMES",
+        help="프로필별 브리핑 생성 (쉼표 구분 프로필 이름, 생략 시 프로필 파일 전체)"
+    )
+    parser.add_argument(
+        "--intraday",
+        action="store_true",
+        help="장중 스냅샷 수집 모드 (INTRADAY_END_TIME까지 폴링 후 미드데이 브리핑 생성)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="조건부 알림 감시 (KRX/DART/뉴스 적응형 폴링, Ctrl+C로 종료)"
+    )
     parser.add_argument(
         "--schedule",
         action="store_true",
-        help="스케줄러로 자동 실행 (08:00 모닝 / 18:00 애프터마켓)"
+        help="스케줄러로 자동 실행 (거래일 08:00 모닝 / 12:30 미드데이 / 18:00 애프터마켓)"
+    )
+    parser.add_argument(
+        "--trading-day-only",
+        action="store_true",
+        help="오늘이 KRX 휴장일이면 브리핑을 생성하지 않고 종료 (cron 실행용)"
+    )
+    parser.add_argument(
+        "--trend",
+        type=str,
+        metavar="KEY",
+        help="지난 브리핑 수치 추이 (지표 키: usd_krw, kospi, bond_3y ... 또는 종목 코드)"
+    )
+    parser.add_argument(
+        "--last",
+        type=int,
+        default=20,
+        help="--trend 조회 횟수 (기본 20)"
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        choices=["weekly", "monthly"],
+        help="주간/월간 리뷰 생성 (수익률, MDD, 변동성, 주요 공시, 거시 지표 변화)"
+    )
+    parser.add_argument(
+        "--period",
+        type=str,
+        help="--report 기간: YYYY-MM, YYYY-Www, 또는 해당 기간의 날짜 YYYY-MM-DD (기본: 오늘이 속한 주/월)"
+    )
+    parser.add_argument(
+        "--backtest",
+        type=str,
+        nargs="?",
+        const="",
+        metavar="TICKERS",
+        help="분할 매수/손절/익절 규칙 백테스트 (쉼표 구분 종목 코드, 생략 시 관심 종목)"
+    )
+    parser.add_argument(
+        "--start",
+        type=str,
+        help="--backtest 시작일 (YYYYMMDD, 기본: BACKTEST_SETTINGS['years']년 전)"
+    )
+    parser.add_argument(
+        "--end",
+        type=str,
+        help="--backtest 종료일 (YYYYMMDD, 기본: 오늘)"
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="--backtest 파라미터 조합 스윕 (BACKTEST_SETTINGS['sweep'], 프로세스 풀)"
+    )
+    parser.add_argument(
+        "--universe",
+        type=int,
+        nargs="?",
+        const=1,
+        metavar="SESSIONS",
+        help="전종목 종가/거래량/거래대금 행렬(data/universe/) 백필 (최근 N거래일, 기본 1)"
+    )
+    parser.add_argument(
+        "--screen",
+        type=str,
+        nargs="?",
+        const="",
+        metavar="YYYYMMDD",
+        help="전종목 스크리너 (SCREENER_SETTINGS 규칙, 생략 시 최근 거래일)"
+    )
+    parser.add_argument(
+        "--search",
+        type=str,
+        metavar="QUERY",
+        help="로컬 뉴스 인덱스 검색 (공백 구분 단어 모두 포함)"
+    )
+    parser.add_argument(
+        "--ticker",
+        type=str,
+        help="--search 결과를 해당 종목 언급 기사로 제한"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="--search 기간 (최근 N일, 0이면 전체, 기본 7)"
     )
     parser.add_argument(
         "--test",
         type=str,
-        choices=["dart", "krx", "ecos", "news"],
+        choices=TEST_COLLECTORS,
         help="개별 수집기 테스트"
     )
     parser.add_argument(
@@ -212,13 +587,45 @@ def main():
     )
 
     args = parser.parse_args()
+    profile_names = (
+        [name.strip() for name in args.profiles.split(",") if name.strip()] or None
+        if args.profiles is not None else None
+    )
 
     if args.status:
         show_status()
+    elif args.plan and args.profiles is not None:
+        try:
+            print(describe_plan(args.type, tickers=union_tickers(load_profiles(profile_names))))
+        except ValueError as e:
+            print(f"프로필 설정 오류: {e}")
+    elif args.plan:
+        print(describe_plan(args.type))
+    elif args.backtest is not None:
+        tickers = [t.strip() for t in args.backtest.split(",") if t.strip()] or None
+        run_backtest(tickers, start_date=args.start, end_date=args.end, sweep=args.sweep)
+    elif args.universe is not None:
+        run_universe(args.universe)
+    elif args.screen is not None:
+        run_screen(args.screen or None)
+    elif args.report:
+        run_report(args.report, ref=args.period)
+    elif args.trend:
+        show_trend(args.trend, last=args.last)
+    elif args.search is not None or args.ticker:
+        search_news(args.search or "", ticker=args.ticker, days=args.days or None)
     elif args.test:
         test_collector(args.test)
+    elif args.intraday:
+        run_intraday(use_ai=args.ai)
+    elif args.watch:
+        run_watch()
     elif args.schedule:
         run_scheduler()
+    elif args.trading_day_only and not get_calendar().is_session(today_kst()):
+        print(f"오늘({today_kst()})은 휴장일입니다. 브리핑을 생성하지 않습니다.")
+    elif args.profiles is not None:
+        run_profiles(profile_names, briefing_type=args.type, use_ai=args.ai)
     else:
         run_briefing(briefing_type=args.type, use_ai=args.ai)
 
@@ -0,0 +1,158 @@
+"""
+브리핑 프로필 (사용자 / 포트폴리오별 브리핑)
+
+BRIEFING_PROFILES_FILE(JSON)의 프로필마다 관심 종목, 뉴스 키워드, 포함 섹션, 저장 폴더를 정의합니다.
+시장 공통 데이터(지수, 전종목 스냅샷, 환율·금리, 뉴스 피드 ...)는 브리핑 유형별로 한 번만 수집하고
+종목별 데이터는 전체 프로필 관심 종목의 합집합으로 한 번 수집한 뒤,
+BriefingGenerator.generate_profiles()가 프로필별로 걸러 병렬 렌더링합니다.
+→ 외부 호출 수는 프로필 수가 아니라 서로 다른 종목 수에 비례
+"""
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import BASE_DIR, BRIEFING_PROFILES_FILE, RESULTS_DIR, WATCHLIST_STOCKS
+
+
+# 프로필에서 고를 수 있는 섹션 (BRIEFING_SETTINGS[...]["plan"] 수집 키)
+PROFILE_SECTIONS = ("dart", "krx", "ecos", "news", "intraday", "correlation")
+
+# 프로필 이름은 저장 폴더 이름으로 쓰이므로 경로 구분자 / ".." 등을 허용하지 않음
+PROFILE_NAME = re.compile(r"[A-Za-z0-9_-]+")
+
+
+@dataclass(slots=True)
+class BriefingProfile:
+    """브리핑 프로필 1개"""
+    name: str
+    watchlist: list[str] = field(default_factory=lambda: list(WATCHLIST_STOCKS))
+    keywords: list[str] = field(default_factory=list)  # 뉴스 필터 (비어 있으면 전체 뉴스)
+    sections: Optional[list[str]] = None               # None이면 브리핑 plan 전체
+    output_dir: Optional[Path] = None
+
+    @classmethod
+    def from_settings(cls, name: str, spec: dict) -> "BriefingProfile":
+        """
+        프로필 파일 항목 → 프로필
+
+        Raises:
+            ValueError: 잘못된 이름 / 알 수 없는 섹션 / 빈 관심 종목
+        """
+        if not PROFILE_NAME.fullmatch(name):
+            raise ValueError(f"프로필 이름 '{name}': 영문/숫자/_/- 만 사용할 수 있습니다.")
+        if not isinstance(spec, dict):
+            raise ValueError(f"프로필 '{name}': 정의는 JSON 객체여야 합니다.")
+        watchlist = [str(t).strip() for t in spec.get("watchlist", WATCHLIST_STOCKS) if str(t).strip()]
+        if not watchlist:
+            raise ValueError(f"프로필 '{name}': 관심 종목이 비어 있습니다.")
+        sections = spec.get("sections")
+        if sections is not None:
+            unknown = [s for s in sections if s not in PROFILE_SECTIONS]
+            if unknown:
+                raise ValueError(
+                    f"프로필 '{name}': 알 수 없는 섹션 {', '.join(unknown)} (지원: {', '.join(PROFILE_SECTIONS)})"
+                )
+        output_dir = spec.get("output_dir")
+        if output_dir:
+            output_dir = Path(output_dir)
+            output_dir = output_dir if output_dir.is_absolute() else BASE_DIR / output_dir
+        return cls(
+            name=name,
+            watchlist=list(dict.fromkeys(watchlist)),
+            keywords=[str(k) for k in spec.get("keywords", []) if str(k).strip()],
+            sections=list(sections) if sections is not None else None,
+            output_dir=output_dir or None,
+        )
+
+    @property
+    def directory(self) -> Path:
+        """저장 폴더 (지정하지 않으면 RESULTS_DIR/profiles/<이름>, 아카이브 색인 대상 아님)"""
+        return self.output_dir or RESULTS_DIR / "profiles" / self.name
+
+    def includes(self, section: str) -> bool:
+        return self.sections is None or section in self.sections
+
+
+def read_profile_specs(path: Path = BRIEFING_PROFILES_FILE) -> dict[str, dict]:
+    """
+    프로필 파일(JSON) 읽기. 파일이 없으면 WATCHLIST_STOCKS 기본 프로필 1개
+
+    Raises:
+        ValueError: JSON 형식 오류 / 최상위가 객체가 아님 (메시지에 파일 경로 포함)
+    """
+    if not path.exists():
+        return {"default": {"watchlist": WATCHLIST_STOCKS}}
+    try:
+        specs = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"{path}: 프로필 파일을 읽을 수 없습니다 ({e})") from e
+    if not isinstance(specs, dict) or not specs:
+        raise ValueError(f"{path}: 프로필 이름 → 정의 형태의 JSON 객체여야 합니다.")
+    return specs
+
+
+def load_profiles(
+    names: Optional[list[str]] = None,
+    path: Path = BRIEFING_PROFILES_FILE
+) -> list[BriefingProfile]:
+    """
+    프로필 파일 → 프로필 목록
+
+    Args:
+        names: 사용할 프로필 이름. None이면 전체
+        path: 프로필 파일 (기본 BRIEFING_PROFILES_FILE)
+
+    Raises:
+        ValueError: 파일 형식 오류 / 없는 프로필 이름 / 잘못된 프로필 정의
+    """
+    specs = read_profile_specs(path)
+    names = names or list(specs)
+    missing = [name for name in names if name not in specs]
+    if missing:
+        raise ValueError(f"정의되지 않은 프로필: {', '.join(missing)} (정의됨: {', '.join(specs)})")
+    try:
+        return [BriefingProfile.from_settings(name, specs[name] or {}) for name in names]
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+
+def union_tickers(profiles: list[BriefingProfile]) -> list[str]:
+    """프로필 관심 종목 합집합 (등장 순, 수집은 이 종목들만 1회)"""
+    return list(dict.fromkeys(ticker for profile in profiles for ticker in profile.watchlist))
+
+
+def matches_keywords(text: str, keywords: list[str]) -> bool:
+    """키워드 중 하나라도 포함 (대소문자 무시, 키워드가 없으면 항상 True)"""
+    if not keywords:
+        return True
+    text = text.lower()
+    return any(keyword.lower() in text for keyword in keywords)
+
+
+_SECTION_HEADING = re.compile(r"^## (\d+)\. ", re.MULTILINE)
+_EMPTY_SECTION = re.compile(r"\n## \d+\. [^\n]*\n\s*\n---\n")
+
+
+def drop_empty_sections(briefing: str) -> str:
+    """본문이 빈 '## N. 제목' 블록 제거 후 섹션 번호를 1부터 다시 매김"""
+    briefing = _EMPTY_SECTION.sub("", briefing)
+    counter = iter(range(1, 100))
+    return _SECTION_HEADING.sub(lambda m: f"## {next(counter)}. ", briefing)
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    profiles = load_profiles()
+    tickers = union_tickers(profiles)
+    print(f"프로필 {len(profiles)}개, 관심 종목 합집합 {len(tickers)}개: {', '.join(tickers)}")
+    for profile in profiles:
+        sections = ", ".join(profile.sections) if profile.sections else "전체"
+        keywords = ", ".join(profile.keywords) if profile.keywords else "-"
+        print(f"  - {profile.name}: 종목 {', '.join(profile.watchlist)} | 섹션 {sections} | 키워드 {keywords}")
+        print(f"    → {profile.directory}")
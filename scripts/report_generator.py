@@ -0,0 +1,356 @@
+"""
+주간 / 월간 리뷰 생성기
+
+브리핑 아카이브(data/briefings.sqlite3)에 쌓인 일별 수치만 집계해 기간 리뷰를 만듭니다.
+pykrx / ECOS / DART를 다시 호출하지 않으므로 월간 리뷰도 몇 초 안에 생성됩니다.
+- 시장 지수 / 관심 종목: 기간 수익률, 최대 낙폭(MDD), 변동성, 최고/최저 일간 등락
+- 시장 내부: 누적 상승/하락 종목 수, 상/하한가, 평균 거래대금
+- 거시경제 지표: 기간 초/말, 변화폭, 고/저
+- 주요 공시: 유형별 건수 + 중요도 상위 공시
+"""
+import re
+import sys
+import sqlite3
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import REPORTS_DIR, REPORT_SETTINGS, WATCHLIST_STOCKS
+from collectors.records import Disclosure
+from collectors.trading_calendar import TradingCalendar, CACHE_PATH, to_day, now_kst, today_kst
+from analytics import compute_period_stats, compute_level_changes, get_classifier, format_disclosure_rollup
+from briefing_archive import BriefingArchive, get_archive, METRIC_NAMES
+
+
+# 기간 직전 기준값을 찾을 때 거슬러 올라가는 일수 (연휴 포함)
+LOOKBACK_DAYS = 14
+
+# 리포트에 싣는 수준 지표 (지수 제외 거시 지표)
+MACRO_KEYS = [key for key in METRIC_NAMES if key not in ("kospi", "kosdaq")]
+
+# 관심 종목 큰 등락 기준 (±%)
+BIG_MOVE_PCT = 3.0
+
+_WEEK = re.compile(r"^(\d{4})-W(\d{1,2})$")
+_MONTH = re.compile(r"^(\d{4})-(\d{2})$")
+
+
+def period_bounds(period: str, ref: Optional[str] = None) -> tuple[date, date, str]:
+    """
+    리포트 기간 계산
+
+    Args:
+        period: "weekly" 또는 "monthly"
+        ref: 기간 지정. "YYYY-MM-DD"(해당 날짜가 속한 주/월), "YYYY-Www", "YYYY-MM".
+            None이면 오늘이 속한 주/월
+
+    Returns:
+        (시작일, 종료일, 라벨) 예: (2026-08-17, 2026-08-23, "2026-W34")
+    """
+    if ref and (m := _WEEK.match(ref)):
+        day = date.fromisocalendar(int(m.group(1)), int(m.group(2)), 1)
+    elif ref and (m := _MONTH.match(ref)):
+        day = date(int(m.group(1)), int(m.group(2)), 1)
+    elif ref:
+        day = datetime.strptime(ref, "%Y-%m-%d").date()
+    else:
+        day = today_kst()
+
+    if period == "weekly":
+        start = day - timedelta(days=day.weekday())
+        year, week, _ = start.isocalendar()
+        return start, start + timedelta(days=6), f"{year}-W{week:02d}"
+
+    start = day.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start, end, start.strftime("%Y-%m")
+
+
+class ReportGenerator:
+    """브리핑 아카이브 기반 주간/월간 리뷰 생성기"""
+
+    def __init__(self, archive: Optional[BriefingArchive] = None):
+        self.archive = archive or get_archive()
+        self.classifier = get_classifier()
+
+    @staticmethod
+    def _calendar(first: date, end: date) -> TradingCalendar:
+        """거래일 달력 (캐시가 없거나 범위 밖이면 휴장일 규칙으로, 네트워크 없이)"""
+        calendar = TradingCalendar.load(CACHE_PATH)
+        if calendar is None or not (calendar.start <= to_day(first) and to_day(end) <= calendar.end):
+            calendar = TradingCalendar.from_rules(first - timedelta(days=LOOKBACK_DAYS), end)
+        return calendar
+
+    @staticmethod
+    def _with_sessions(frame: pd.DataFrame, calendar: TradingCalendar) -> pd.DataFrame:
+        """
+        브리핑 날짜 → 수치의 실제 거래일 (session 컬럼 추가)
+
+        모닝 브리핑의 시세/지수는 직전 거래일 기준, 나머지는 당일(휴장일이면 직전 거래일)
+        """
+        pairs = frame[["date", "type"]].drop_duplicates()
+        sessions = {
+            (day, kind): calendar.previous_session(day) if kind == "morning" else calendar.session_on_or_before(day)
+            for day, kind in pairs.itertuples(index=False)
+        }
+        frame = frame.copy()
+        frame["session"] = [sessions[pair] for pair in zip(frame["date"], frame["type"])]
+        return frame
+
+    def collect(self, period: str, ref: Optional[str] = None) -> dict:
+        """
+        기간 데이터 집계
+
+        Args:
+            period: "weekly" 또는 "monthly"
+            ref: 기간 지정 (period_bounds 참고)
+
+        Returns:
+            기간 정보와 집계 결과 DataFrame dict
+        """
+        start, end, label = period_bounds(period, ref)
+        first = start - timedelta(days=LOOKBACK_DAYS)
+        calendar = self._calendar(first, end)
+
+        # 기준값(기간 직전 값)을 위해 LOOKBACK_DAYS 앞부터 조회, 같은 거래일은 마지막 브리핑 기준
+        quotes = self.archive.quote_frame(first.isoformat(), end.isoformat())
+        if not quotes.empty:
+            quotes = self._with_sessions(quotes, calendar).drop_duplicates(["session", "ticker"], keep="last")
+        metrics = self.archive.metric_frame(first.isoformat(), end.isoformat())
+        if not metrics.empty:
+            metrics = self._with_sessions(metrics, calendar).pivot_table(
+                index="session", columns="key", values="value", aggfunc="last"
+            )
+
+        def split(frame: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
+            """기간 내 행 / 기간 직전 마지막 값"""
+            before = frame[frame.index < start].ffill()
+            base = before.iloc[-1] if not before.empty else None
+            return frame[(frame.index >= start) & (frame.index <= end)], base
+
+        result = {
+            "period": period, "label": label, "start": start, "end": end,
+            "sessions": len(calendar.sessions_between(start, min(end, today_kst()))),
+            "stocks": pd.DataFrame(), "indices": pd.DataFrame(), "macro": pd.DataFrame(),
+            "breadth": {}, "big_moves": pd.Series(dtype=int), "disclosures": [],
+        }
+
+        if not quotes.empty:
+            closes = quotes.pivot(index="session", columns="ticker", values="close")
+            pct = quotes.pivot(index="session", columns="ticker", values="change_pct")
+            closes, base = split(closes)
+            pct = pct.loc[closes.index]
+            if not closes.empty:
+                stocks = compute_period_stats(closes, base, daily_pct=pct)
+                stocks["name"] = quotes.groupby("ticker")["name"].last()
+                result["stocks"] = stocks.sort_values("return_pct", ascending=False)
+                result["big_moves"] = (pct.abs() >= BIG_MOVE_PCT).sum()
+
+        if not metrics.empty:
+            metrics, metric_base = split(metrics)
+            index_keys = [key for key in ("kospi", "kosdaq") if key in metrics]
+            if index_keys:
+                levels = metrics[index_keys].dropna(how="all")
+                pct_cols = [f"{key}.change_pct" for key in index_keys]
+                daily_pct = metrics.reindex(columns=pct_cols).loc[levels.index]
+                daily_pct.columns = index_keys
+                result["indices"] = compute_period_stats(
+                    levels, None if metric_base is None else metric_base.reindex(index_keys), daily_pct
+                )
+            macro_keys = [key for key in MACRO_KEYS if key in metrics]
+            if macro_keys:
+                result["macro"] = compute_level_changes(
+                    metrics[macro_keys].dropna(how="all"),
+                    None if metric_base is None else metric_base.reindex(macro_keys),
+                )
+            breadth_keys = ["advancers", "decliners", "limit_up", "limit_down", "total_value"]
+            if "advancers" in metrics:
+                breadth = metrics.reindex(columns=breadth_keys).dropna(subset=["advancers"])
+                result["breadth"] = {
+                    "days": len(breadth),
+                    "up_days": int((breadth["advancers"] > breadth["decliners"]).sum()),
+                    **breadth[breadth_keys[:4]].sum().astype(int).to_dict(),
+                    "avg_value": float(breadth["total_value"].mean()),
+                }
+
+        # 공시: 브리핑에 실린 공시를 중요도 순으로 (종목명 → 코드는 관심 종목 시세에서)
+        tickers = dict(zip(quotes["name"], quotes["ticker"])) if not quotes.empty else {}
+        disclosures = [
+            Disclosure(
+                corp_name=row["corp_name"], stock_code=tickers.get(row["corp_name"], ""),
+                report_nm=row["report_nm"], rcept_dt=row["rcept_dt"].replace("-", ""),
+            )
+            for row in self.archive.disclosures_between(start.isoformat(), end.isoformat())
+        ]
+        result["disclosures"] = disclosures
+        return result
+
+    def generate(self, period: str = "weekly", ref: Optional[str] = None) -> str:
+        """
+        리뷰 마크다운 생성
+
+        Args:
+            period: "weekly" 또는 "monthly"
+            ref: 기간 지정 (period_bounds 참고)
+
+        Returns:
+            마크다운 문자열
+        """
+        settings = REPORT_SETTINGS[period]
+        data = self.collect(period, ref)
+        now = now_kst().strftime("%Y-%m-%d %H:%M:%S")
+
+        report = f"""# {data['label']} {settings['title']}
+
+**생성일시**: {now}
+**기간**: {data['start']} ~ {data['end']} (거래일 {data['sessions']}일)
+**데이터**: 브리핑 아카이브 집계 (외부 API 재조회 없음)
+
+---
+
+## 1. 시장 지수
+
+{self._format_indices(data)}
+
+---
+
+## 2. 관심 종목 성과
+
+{self._format_stocks(data)}
+
+---
+
+## 3. 거시경제 지표 변화
+
+{self._format_macro(data)}
+
+---
+
+## 4. 주요 공시
+
+{self._format_disclosures(data, settings['top_disclosures'])}
+
+---
+
+*본 {settings['title']}는 지난 브리핑 수치를 집계해 자동 생성되었습니다. 투자 판단은 본인 책임 하에 이루어져야 합니다.*
+"""
+        return report
+
+    def _format_indices(self, data: dict) -> str:
+        lines = []
+        indices = data["indices"]
+        for key, row in indices.iterrows():
+            lines.append(
+                f"- **{METRIC_NAMES[key]}**: {row['start']:,.2f} → {row['end']:,.2f} "
+                f"({row['return_pct']:+.2f}%) | MDD {row['mdd_pct']:.2f}% | "
+                f"일간 변동성 {row['vol_pct']:.2f}% | 최고 {row['best_pct']:+.2f}% / 최저 {row['worst_pct']:+.2f}%"
+            )
+
+        breadth = data["breadth"]
+        if breadth:
+            lines.append("")
+            lines.append("### 시장 내부")
+            lines.append(
+                f"- **상승 우위 일수**: {breadth['up_days']} / {breadth['days']}일 "
+                f"(누적 상승 {breadth['advancers']:,} / 하락 {breadth['decliners']:,})"
+            )
+            lines.append(f"- **상한가/하한가 누적**: {breadth['limit_up']:,} / {breadth['limit_down']:,}")
+            lines.append(f"- **일평균 거래대금**: {breadth['avg_value']:,.0f}억원")
+
+        return "\n".join(lines) if lines else "기간 내 지수 기록이 없습니다."
+
+    def _format_stocks(self, data: dict) -> str:
+        stocks = data["stocks"]
+        if stocks.empty:
+            return "기간 내 관심 종목 시세 기록이 없습니다."
+
+        lines = [
+            "| 종목 | 종가 | 기간 수익률 | MDD | 일간 변동성 | 최고 / 최저 | "
+            f"±{BIG_MOVE_PCT:g}% 등락 |",
+            "|------|------|------|------|------|------|------|",
+        ]
+        for ticker, row in stocks.iterrows():
+            lines.append(
+                f"| {row['name']} ({ticker}) | {row['end']:,.0f}원 | **{row['return_pct']:+.2f}%** | "
+                f"{row['mdd_pct']:.2f}% | {row['vol_pct']:.2f}% | "
+                f"{row['best_pct']:+.2f}% / {row['worst_pct']:+.2f}% | "
+                f"{int(data['big_moves'].get(ticker, 0))} / {int(row['days'])}일 |"
+            )
+        return "\n".join(lines)
+
+    def _format_macro(self, data: dict) -> str:
+        macro = data["macro"]
+        if macro.empty:
+            return "기간 내 거시경제 지표 기록이 없습니다."
+
+        lines = []
+        for key, row in macro.iterrows():
+            label = METRIC_NAMES[key]
+            if key.endswith("_krw"):
+                lines.append(
+                    f"- **{label}**: {row['start']:,.2f} → {row['end']:,.2f}원 "
+                    f"({row['change']:+,.2f}원, {row['change_pct']:+.2f}%) | 고 {row['high']:,.2f} / 저 {row['low']:,.2f}"
+                )
+            else:
+                lines.append(
+                    f"- **{label}**: {row['start']:.3f}% → {row['end']:.3f}% "
+                    f"({row['change'] * 100:+.1f}bp) | 고 {row['high']:.3f}% / 저 {row['low']:.3f}%"
+                )
+        return "\n".join(lines)
+
+    def _format_disclosures(self, data: dict, max_items: int) -> str:
+        disclosures = data["disclosures"]
+        if not disclosures:
+            return "기간 내 브리핑에 실린 공시가 없습니다."
+
+        rollup = format_disclosure_rollup(self.classifier.rollup(disclosures))
+        lines = [f"**공시 {len(disclosures):,}건**: {rollup}", ""]
+        ranked = self.classifier.rank(disclosures, watchlist=WATCHLIST_STOCKS)
+        for disc, category, _ in ranked[:max_items]:
+            day = f"{disc.rcept_dt[:4]}-{disc.rcept_dt[4:6]}-{disc.rcept_dt[6:]}"
+            lines.append(f"- **{disc.corp_name}** [{category}] {disc.report_nm} ({day})")
+        return "\n".join(lines)
+
+    def save_report(self, content: str, label: str, period: str) -> Path:
+        """리뷰 파일 저장 (results/{라벨}_{접미사}.md)"""
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        filepath = REPORTS_DIR / f"{label}_{REPORT_SETTINGS[period]['file_suffix']}.md"
+        filepath.write_text(content, encoding="utf-8")
+        return filepath
+
+    def generate_and_save(self, period: str = "weekly", ref: Optional[str] = None) -> str:
+        """
+        리뷰 생성 및 저장
+
+        Args:
+            period: "weekly" 또는 "monthly"
+            ref: 기간 지정 (period_bounds 참고)
+
+        Returns:
+            저장된 파일 경로
+        """
+        settings = REPORT_SETTINGS[period]
+        print(f"{settings['title']} 생성 시작...")
+        try:
+            synced = self.archive.sync()
+            if synced:
+                print(f"  브리핑 {synced}건 색인")
+        except sqlite3.Error as e:
+            print(f"  [경고] 브리핑 아카이브 동기화 실패: {e}")
+
+        _, _, label = period_bounds(period, ref)
+        filepath = self.save_report(self.generate(period, ref), label, period)
+        print(f"완료! 저장 위치: {filepath}")
+        return str(filepath)
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    generator = ReportGenerator()
+    generator.archive.sync()
+    print(generator.generate("monthly", sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,121 @@
+"""
+전종목 스크리너 (데이터 로드 + 실행)
+
+당일 전종목 스냅샷(KrxCollector.get_latest_market_snapshot, bulk 1~2회)과
+전종목 행렬(data/universe/)의 직전 이력을 스냅샷 종목 순서로 맞춰
+analytics/screener.py 규칙(SCREENER_SETTINGS["rules"])을 전종목에 한 번에 적용합니다.
+
+이력은 메모리 맵에서 규칙이 요구하는 거래일 수(lookback)만큼만 읽습니다.
+"""
+import sys
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import SCREENER_SETTINGS
+from collectors import KrxCollector
+from collectors.universe_matrix import UniverseMatrix, get_universe
+from analytics.screener import ScreenContext, ScreenRule, compile_rules, run_screen, format_screen
+
+
+def default_rules() -> list[ScreenRule]:
+    """SCREENER_SETTINGS["rules"] 컴파일 (문자열별 1회)"""
+    return compile_rules(SCREENER_SETTINGS["rules"])
+
+
+def load_context(
+    snapshot: pd.DataFrame,
+    rules: list[ScreenRule],
+    universe: Optional[UniverseMatrix] = None
+) -> ScreenContext:
+    """
+    스냅샷 + 규칙에 필요한 직전 이력 → ScreenContext
+
+    Args:
+        snapshot: get_latest_market_snapshot() 결과 (attrs["date"] = 거래일)
+        rules: 컴파일된 규칙 (lookback / history_fields로 읽을 이력 결정)
+        universe: 전종목 행렬. None이면 data/universe/
+    """
+    universe = universe or get_universe()
+    lookback = max((rule.lookback for rule in rules), default=0)
+    fields = set().union(*(rule.history_fields for rule in rules)) if rules else set()
+    if not lookback or not fields or snapshot.empty:
+        return ScreenContext(snapshot)
+
+    # 스냅샷 당일은 제외하고 그 이전 거래일만
+    day = pd.Timestamp(snapshot.attrs.get("date", pd.Timestamp.today())) - pd.Timedelta(days=1)
+    tickers = [str(t) for t in snapshot.index]
+    positions = {ticker: i for i, ticker in enumerate(universe.tickers)}
+    rows = np.array([i for i, t in enumerate(tickers) if t in positions], dtype=np.int64)
+    cols = np.array([positions[tickers[i]] for i in rows], dtype=np.int64)
+
+    history = {}
+    for name in fields:
+        window = universe.view(name, end=day)[-lookback:]
+        aligned = np.full((len(window), len(tickers)), np.nan, dtype=np.float32)
+        aligned[:, rows] = window[:, cols]
+        history[name] = aligned
+    return ScreenContext(snapshot, history)
+
+
+def screen(
+    snapshot: Optional[pd.DataFrame] = None,
+    target_date: Optional[str] = None,
+    rules: Optional[list[ScreenRule]] = None,
+    krx: Optional[KrxCollector] = None
+) -> tuple[dict[str, pd.DataFrame], ScreenContext]:
+    """
+    전종목 스크리닝
+
+    Args:
+        snapshot: 이미 조회한 전종목 스냅샷 (없으면 조회, 시가총액 포함)
+        target_date: 조회 기준일 (YYYYMMDD)
+        rules: 컴파일된 규칙. None이면 SCREENER_SETTINGS
+
+    Returns:
+        (규칙명 → 충족 종목 DataFrame, 입력 컨텍스트)
+    """
+    if snapshot is None:
+        snapshot = (krx or KrxCollector()).get_latest_market_snapshot(target_date=target_date)
+    rules = rules if rules is not None else default_rules()
+    ctx = load_context(snapshot, rules)
+    return run_screen(rules, ctx), ctx
+
+
+def format_for_briefing(
+    results: dict[str, pd.DataFrame],
+    ctx: ScreenContext,
+    name_of=None,
+    rules: Optional[list[ScreenRule]] = None
+) -> str:
+    """브리핑용 스크리너 섹션 (이력이 부족하면 안내 추가)"""
+    section = format_screen(results, top=SCREENER_SETTINGS["top"], name_of=name_of, universe=len(ctx.snapshot))
+    rules = rules if rules is not None else default_rules()
+    lookback = max((rule.lookback for rule in rules), default=0)
+    if section and ctx.sessions < lookback:
+        section += (
+            f"\n- (전종목 행렬 이력 {ctx.sessions}/{lookback}거래일: 더 긴 이력이 필요한 규칙은 결과 없음,"
+            " `python scripts/main.py --universe N`으로 백필)"
+        )
+    return section
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    import time
+
+    krx = KrxCollector()
+    snapshot = krx.get_latest_market_snapshot()
+    if snapshot.empty:
+        print("전종목 스냅샷을 조회할 수 없습니다.")
+    else:
+        start = time.perf_counter()
+        results, ctx = screen(snapshot)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(format_for_briefing(results, ctx, name_of=krx.get_ticker_name))
+        print(f"\n{len(snapshot):,}종목 스크리닝 {elapsed:.1f}ms")
@@ -0,0 +1,11 @@
+"""
+pytest 공통 설정
+
+스크립트들과 같은 방식으로 프로젝트 루트 / scripts 경로를 추가합니다 (python -m pytest tests).
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
@@ -0,0 +1,104 @@
+"""알림 엔진: 규칙 하루 1회 / KST 날짜 초기화, 파일 sink 날짜, 느린 sink 비동기 전달"""
+import json
+import threading
+import time
+from datetime import date
+
+from alert_engine import (
+    Alert, DailyOnce, FileSink, PriceMoveRule, QuoteObservation, SinkWorker, SpreadRule,
+)
+
+
+def quote(change_pct: float, spread_pct: float = 0.0, ticker: str = "005930") -> QuoteObservation:
+    return QuoteObservation(ticker=ticker, name="삼성전자", close=70000,
+                            change_pct=change_pct, spread_pct=spread_pct)
+
+
+class FakeDay:
+    def __init__(self, day: date):
+        self.day = day
+
+    def __call__(self) -> date:
+        return self.day
+
+
+def test_daily_once_resets_when_day_changes():
+    today = FakeDay(date(2026, 10, 19))
+    fired = DailyOnce(today)
+
+    assert fired.first("005930")
+    assert not fired.first("005930")
+
+    today.day = date(2026, 10, 20)
+    assert fired.first("005930")
+    assert fired.keys == {"005930"}
+
+
+def test_price_move_fires_once_per_level_and_direction():
+    rule = PriceMoveRule(levels=[3, 5])
+    rule._fired = DailyOnce(FakeDay(date(2026, 10, 19)))
+
+    assert [a.key for a in rule.evaluate(quote(3.2))] == ["005930:+3"]
+    assert rule.evaluate(quote(3.8)) == []
+    assert [a.key for a in rule.evaluate(quote(5.1))] == ["005930:+5"]
+    assert [a.key for a in rule.evaluate(quote(-3.0))] == ["005930:-3"]
+    assert rule.evaluate(quote(1.0)) == []
+
+
+def test_price_move_fires_again_next_day():
+    today = FakeDay(date(2026, 10, 19))
+    rule = PriceMoveRule(levels=[3])
+    rule._fired = DailyOnce(today)
+
+    assert len(rule.evaluate(quote(4.0))) == 1
+    assert rule.evaluate(quote(4.0)) == []
+    today.day = date(2026, 10, 20)
+    assert len(rule.evaluate(quote(4.0))) == 1
+
+
+def test_spread_rule_day_reset():
+    today = FakeDay(date(2026, 10, 19))
+    rule = SpreadRule(threshold_pct=5)
+    rule._fired = DailyOnce(today)
+
+    assert rule.evaluate(quote(0, spread_pct=4.9)) == []
+    assert len(rule.evaluate(quote(0, spread_pct=5.5))) == 1
+    assert rule.evaluate(quote(0, spread_pct=6.0)) == []
+    today.day = date(2026, 10, 20)
+    assert len(rule.evaluate(quote(0, spread_pct=6.0))) == 1
+
+
+def test_file_sink_writes_to_alert_date(tmp_path, monkeypatch):
+    import alert_engine
+    monkeypatch.setattr(alert_engine, "DATA_DIR", tmp_path)
+    sink = FileSink()
+
+    sink.emit(Alert("krx", "price_move", "a", "m1", timestamp="2026-10-19 15:29:00"))
+    sink.emit(Alert("krx", "price_move", "b", "m2", timestamp="2026-10-20 09:01:00"))
+
+    first = (tmp_path / "alerts" / "2026-10-19.jsonl").read_text(encoding="utf-8").splitlines()
+    second = (tmp_path / "alerts" / "2026-10-20.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["key"] for line in first] == ["a"]
+    assert [json.loads(line)["key"] for line in second] == ["b"]
+
+
+def test_slow_sink_does_not_block_offer():
+    release = threading.Event()
+    received = []
+
+    class SlowSink:
+        def emit(self, alert):
+            release.wait(5)
+            received.append(alert.key)
+
+    worker = SinkWorker(SlowSink(), queue_size=2)
+    started = time.perf_counter()
+    results = [worker.offer(Alert("krx", "r", str(i), "m")) for i in range(4)]
+    assert time.perf_counter() - started < 0.5
+
+    # 첫 알림은 sink가 잡고 있고, 큐 2칸이 차면 나머지는 버림
+    assert results.count(False) == worker.dropped >= 1
+
+    release.set()
+    assert worker.join(timeout=5)
+    assert received[0] == "0"
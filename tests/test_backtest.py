@@ -0,0 +1,99 @@
+"""백테스트 엔진: 다음 날 시가 체결, 손절/익절(갭 포함), 분할 매수, 비용, 스윕 병렬 일치"""
+import numpy as np
+import pytest
+
+from analytics.backtest import CostModel, PriceMatrix, StrategyParams, param_grid, run_backtest
+from backtester import run_sweep
+
+
+NO_COSTS = CostModel(commission_rate=0, sell_tax_rate=0, slippage_rate=0)
+# 종가 2일 이동평균 돌파는 2일째(종가 12)에만 발생 → 3일째 시가 20에 매수
+ENTRY_ONLY = StrategyParams(entry_window=2, stop_loss_pct=0, take_profit_pct=0)
+
+
+def matrix(bars: list[tuple[float, float, float, float]]) -> PriceMatrix:
+    """(시가, 고가, 저가, 종가) 일봉 목록 → 1종목 가격 행렬"""
+    o, h, l, c = (np.array(col, dtype=float).reshape(-1, 1) for col in zip(*bars))
+    dates = np.arange(len(bars)).astype("datetime64[D]")
+    return PriceMatrix(dates=dates, tickers=["005930"], open=o, high=h, low=l, close=c)
+
+
+def setup_bars(day4: tuple[float, float, float, float] = (20, 20, 20, 20)) -> PriceMatrix:
+    return matrix([
+        (10, 10, 10, 10),
+        (10, 10, 10, 10),
+        (11, 12, 11, 12),   # 진입 신호 (종가)
+        (20, 21, 20, 21),   # 다음 날 시가 체결
+        day4,
+    ])
+
+
+def test_signal_fills_at_next_day_open():
+    result = run_backtest(setup_bars(), ENTRY_ONLY, NO_COSTS, initial_cash=1000)
+
+    # 시가 20에 50주 (신호일 종가 12였다면 83주)
+    assert result.equity[2] == pytest.approx(1000)
+    assert result.equity[3] == pytest.approx(50 * 21)
+    assert result.exits["end"] == 1
+    assert result.trade_pnl == pytest.approx([0.0])  # 마지막 종가 20으로 평가 청산
+
+
+@pytest.mark.parametrize("day4, reason, pnl", [
+    ((19, 19.5, 17.5, 19), "stop_loss", 50 * 18 - 1000),    # 장중 손절가 18
+    ((16, 16.5, 15, 16), "stop_loss", 50 * 16 - 1000),      # 갭 하락: 시가 16
+    ((22, 25, 21, 22), "take_profit", 50 * 24 - 1000),      # 장중 익절가 24
+    ((30, 31, 29, 30), "take_profit", 50 * 30 - 1000),      # 갭 상승: 시가 30
+])
+def test_stop_loss_and_take_profit(day4, reason, pnl):
+    params = StrategyParams(entry_window=2, stop_loss_pct=10, take_profit_pct=20)
+    result = run_backtest(setup_bars(day4), params, NO_COSTS, initial_cash=1000)
+
+    assert result.exits[reason] == 1 and result.exits["end"] == 0
+    assert result.trade_pnl == pytest.approx([pnl])
+
+
+def test_split_add_skips_same_day_buy():
+    # 매수일 저가 18은 추가 매수 기준(20 × 0.95 = 19) 아래지만 당일 신규 매수라 추가하지 않음
+    prices = matrix([
+        (10, 10, 10, 10),
+        (10, 10, 10, 10),
+        (11, 12, 11, 12),
+        (20, 21, 18, 21),
+        (19.5, 20, 18.5, 20),  # 다음 날 기준가 19 도달 → 19에 추가 매수
+    ])
+    params = StrategyParams(entry_window=2, splits=2, split_step_pct=5, stop_loss_pct=0, take_profit_pct=0)
+    result = run_backtest(prices, params, NO_COSTS, initial_cash=1000)
+
+    # 1차: 500 / 20 = 25주, 2차: floor(500 / 19) = 26주 (494)
+    assert result.equity[3] == pytest.approx(500 + 25 * 21)
+    assert result.equity[4] == pytest.approx(1000 - 500 - 494 + 51 * 20)
+    assert result.trade_pnl == pytest.approx([51 * 20 - 994])
+
+
+def test_commission_and_sell_tax():
+    costs = CostModel(commission_rate=0.001, sell_tax_rate=0.002, slippage_rate=0)
+    result = run_backtest(setup_bars(), ENTRY_ONLY, costs, initial_cash=1000)
+
+    # 매수: floor(1000 / 20.02) = 49주, 980 × 1.001 = 980.98
+    # 매도: 49주 × 20 = 980 × (1 - 0.001 - 0.002) = 977.06
+    assert result.equity[3] == pytest.approx(1000 - 980.98 + 49 * 21)
+    assert result.costs == pytest.approx(0.98 + 2.94)
+    assert result.trade_pnl == pytest.approx([977.06 - 980.98])
+    assert result.ticker_pnl == pytest.approx([977.06 - 980.98])
+
+
+def test_sweep_workers_match_serial():
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (120, 3)), axis=0))
+    open_ = close * (1 + rng.normal(0, 0.005, close.shape))
+    spread = np.abs(rng.normal(0, 0.01, close.shape))
+    prices = PriceMatrix(
+        dates=np.arange(120).astype("datetime64[D]"), tickers=["A", "B", "C"],
+        open=open_, high=np.maximum(open_, close) * (1 + spread),
+        low=np.minimum(open_, close) * (1 - spread), close=close,
+    )
+    grid = param_grid(StrategyParams(entry_window=10), splits=[1, 3], stop_loss_pct=[5, 10], exit_window=[0, 5])
+
+    serial = run_sweep(prices, grid, workers=1)
+    assert len(serial) == len(grid)
+    assert run_sweep(prices, grid, workers=2) == serial
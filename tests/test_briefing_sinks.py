@@ -0,0 +1,52 @@
+"""브리핑 sink: 마크다운 → HTML 이스케이프 / 링크 스킴 제한"""
+import pytest
+
+from briefing_sinks import markdown_to_html
+
+
+def body(markdown: str) -> str:
+    document = markdown_to_html(markdown, title="테스트")
+    return document[document.index("<body>"):]
+
+
+def test_text_is_escaped():
+    html = body('삼성전자 <script>alert("x")</script> & 하이닉스')
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html and "&amp;" in html
+
+
+def test_http_links_are_kept_and_escaped():
+    html = body('[기사](https://news.example.com/a?x=1&y="2")')
+    assert '<a href="https://news.example.com/a?x=1&amp;y=&quot;2&quot;">기사</a>' in html
+
+
+@pytest.mark.parametrize("url", [
+    "javascript:alert(1",
+    "JavaScript:alert(document.cookie",
+    "data:text/html;base64,PHNjcmlwdD4=",
+    "vbscript:msgbox",
+    "//evil.example.com",
+    "/relative/path",
+])
+def test_other_schemes_render_as_text(url):
+    html = body(f"[클릭]({url})")
+    assert "<a " not in html
+    assert "클릭" in html
+
+
+def test_underscores_in_url_are_not_emphasis():
+    html = body("[공시](https://dart.fss.or.kr/a_b_c?x=*y*) **굵게** _기울임_")
+    assert 'href="https://dart.fss.or.kr/a_b_c?x=*y*"' in html
+    assert "<strong>굵게</strong>" in html and "<em>기울임</em>" in html
+
+
+def test_emphasis_around_link():
+    html = body("**[기사](https://example.com)**")
+    assert '<strong><a href="https://example.com">기사</a></strong>' in html
+
+
+def test_block_structure():
+    html = body("# 제목\n\n## 1. 시장\n\n- 코스피 `+1.2%`\n- 코스닥\n\n> 인용\n\n---\n")
+    assert "<h1>제목</h1>" in html and "<h2>1. 시장</h2>" in html
+    assert "<li>코스피 <code>+1.2%</code></li>" in html
+    assert "<hr>" in html
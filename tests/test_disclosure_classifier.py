@@ -0,0 +1,47 @@
+"""공시 분류기: 유형/점수, 정정 접두어, 거래정지 해제 우선 분류"""
+import pytest
+
+from analytics.disclosure_classifier import DisclosureClassifier
+from collectors.records import Disclosure
+
+
+@pytest.fixture
+def classifier():
+    return DisclosureClassifier()
+
+
+@pytest.mark.parametrize("report_nm, expected", [
+    ("주권매매거래정지", ("상장리스크", 10.0)),
+    ("영업(잠정)실적(공정공시)", ("실적", 9.0)),
+    ("현금ㆍ현물배당결정", ("배당", 7.0)),
+    ("임원ㆍ주요주주특정증권등소유상황보고서", ("지분", 2.0)),
+    ("기업설명회(IR)개최", ("기타", 1.0)),
+])
+def test_classify(classifier, report_nm, expected):
+    assert classifier.classify(report_nm) == expected
+
+
+def test_correction_prefix_lowers_score(classifier):
+    assert classifier.classify("[기재정정]단일판매ㆍ공급계약체결") == ("공급계약", 3.6)
+
+
+@pytest.mark.parametrize("report_nm", [
+    "주권매매거래정지해제",
+    "매매거래정지및정지해제(중요내용공시)",
+    "관리종목지정해제",
+    "[기재정정]주권매매거래정지해제",
+])
+def test_trading_halt_release_is_not_listing_risk(classifier, report_nm):
+    category, score = classifier.classify(report_nm)
+    assert category == "리스크해소"
+    assert score <= 3.0
+
+
+def test_release_ranks_below_new_halt(classifier):
+    halt = Disclosure(stock_code="000001", report_nm="주권매매거래정지", rcept_dt="20261019", rcept_no="1")
+    release = Disclosure(stock_code="000002", report_nm="주권매매거래정지해제", rcept_dt="20261019", rcept_no="2")
+    earnings = Disclosure(stock_code="000003", report_nm="영업(잠정)실적(공정공시)", rcept_dt="20261019", rcept_no="3")
+
+    ranked = classifier.rank([release, earnings, halt])
+    assert [row[0] for row in ranked] == [halt, earnings, release]
+    assert list(classifier.rollup([release, halt, release])) == ["상장리스크", "리스크해소"]
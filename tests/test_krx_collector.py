@@ -0,0 +1,94 @@
+"""KRX 수집기: 엔드포인트별 서킷 브레이커, 데이터 없음 처리, 장중 지표 상태 미저장"""
+import pytest
+
+from collectors.health import SourceHealth, OPEN
+from collectors.krx_collector import KrxCollector
+from collectors.rate_limit import RateLimiter
+
+
+@pytest.fixture
+def krx(tmp_path, monkeypatch):
+    from collectors import krx_collector
+
+    health = SourceHealth(tmp_path / "health.sqlite3", failure_threshold=2, cooldown=3600)
+    limiter = RateLimiter(tmp_path / "ratelimit.sqlite3", limits={"krx": (1000, 100, None)})
+    monkeypatch.setattr(krx_collector, "get_health", lambda: health)
+    monkeypatch.setattr(krx_collector, "get_limiter", lambda: limiter)
+    return KrxCollector()
+
+
+def states(krx) -> dict[str, str]:
+    return {row["source"]: row["state"] for row in krx.health.snapshot()}
+
+
+def test_endpoint_failure_does_not_block_other_endpoints(krx):
+    def broken(*args):
+        raise ConnectionError("index endpoint down")
+
+    for _ in range(2):
+        assert krx._call("index", broken) is None
+    assert states(krx)["krx:index"] == OPEN
+
+    assert krx._call("ohlcv", lambda ticker: f"bars:{ticker}", "005930") == "bars:005930"
+    assert states(krx)["krx:ohlcv"] == "closed"
+
+
+def test_missing_ticker_data_is_not_a_failure(krx):
+    def no_data(ticker):
+        raise KeyError("종가")
+
+    for _ in range(3):
+        assert krx._call("ohlcv", no_data, "999999") is None
+    row = next(r for r in krx.health.snapshot() if r["source"] == "krx:ohlcv")
+    assert row["state"] == "closed" and row["failures"] == 0
+
+
+def test_ticker_name_skips_rate_limiter(krx, monkeypatch):
+    from collectors import krx_collector
+
+    class FakeStock:
+        @staticmethod
+        def get_market_ticker_name(ticker):
+            return {"005930": "삼성전자"}.get(ticker, "")
+
+    monkeypatch.setattr(krx_collector, "stock", FakeStock, raising=False)
+    krx.available = True
+
+    assert krx.get_ticker_name("005930") == "삼성전자"
+    assert krx.get_ticker_name("005930") == "삼성전자"  # 캐시
+    assert krx.get_ticker_name("999999") == "999999"
+    assert not krx.limiter.usage().get("krx")
+    assert "krx:name" not in states(krx)
+
+
+def test_midday_bar_is_not_persisted(krx, tmp_path, monkeypatch):
+    from datetime import date, datetime
+
+    import pandas as pd
+
+    from collectors import krx_collector
+    from collectors.trading_calendar import TradingCalendar
+
+    calendar = TradingCalendar.from_rules("2026-01-01", "2026-12-31")
+    days = [d.astype(date) for d in calendar.sessions if d.astype(date) <= date(2026, 10, 19)][-30:]
+    clock = {"now": datetime(2026, 10, 19, 12, 0)}
+    monkeypatch.setattr(krx_collector, "INDICATOR_STATE_PATH", tmp_path / "indicators.npz")
+    monkeypatch.setattr(krx_collector, "get_calendar", lambda: calendar)
+    monkeypatch.setattr(krx_collector, "now_kst", lambda: clock["now"])
+    monkeypatch.setattr(krx_collector, "today_kst", lambda: clock["now"].date())
+
+    def bars(today_close: float) -> pd.DataFrame:
+        close = [100.0] * (len(days) - 1) + [today_close]
+        return pd.DataFrame({"ticker": "005930", "date": pd.to_datetime(days), "high": close,
+                             "low": close, "close": close, "volume": 1000.0})
+
+    history = bars(102.0)  # 장중 미확정 봉
+    monkeypatch.setattr(krx, "get_watchlist_history", lambda *a, **k: history)
+    midday = krx.get_watchlist_indicators(history.tail(5))
+    assert midday.loc["005930", "close"] == 102.0
+
+    clock["now"] = datetime(2026, 10, 19, 16, 0)
+    history = bars(110.0)  # 장 마감 후 확정 종가
+    aftermarket = krx.get_watchlist_indicators(history.tail(5))
+    assert aftermarket.loc["005930", "close"] == 110.0
+    assert aftermarket.loc["005930", "sma5"] == pytest.approx(102.0)
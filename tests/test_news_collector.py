@@ -0,0 +1,43 @@
+"""뉴스 수집기: 발행 시각 KST 변환, 로컬 인덱스를 열 수 없을 때 인덱스 없이 수집"""
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from collectors import news_collector
+from collectors.news_collector import Article, NewsCollector, _parse_feed_date
+
+
+@pytest.mark.parametrize("text", [
+    "Mon, 19 Oct 2026 00:30:00 GMT",   # RSS (RFC 822, UTC)
+    "Mon, 19 Oct 2026 09:30:00 +0900",
+    "2026-10-19T00:30:00Z",            # Atom (ISO 8601)
+    "2026-10-19T09:30:00",             # 시간대 없음 → KST로 간주
+])
+def test_feed_dates_are_kst(text):
+    assert _parse_feed_date(text) == datetime(2026, 10, 19, 9, 30)
+
+
+def test_unparseable_feed_date():
+    assert _parse_feed_date("어제 오후") is None
+    assert _parse_feed_date("") is None
+
+
+class PassThroughHealth:
+    def call(self, source, fetch, default=None, **kwargs):
+        return fetch()
+
+
+def test_collector_works_without_index(monkeypatch):
+    def unavailable():
+        raise sqlite3.OperationalError("no such tokenizer: trigram")
+
+    monkeypatch.setattr(news_collector, "get_news_index", unavailable)
+    monkeypatch.setattr(news_collector, "get_health", PassThroughHealth)
+    collector = NewsCollector(feeds={"테스트": "https://example.com/rss"})
+    article = Article(title="삼성전자 실적", link="https://example.com/1", summary="", published="")
+    monkeypatch.setattr(collector, "_download_feed", lambda url, since: [article])
+    collector.available = True
+
+    assert collector.index is None
+    assert collector.fetch_all_feeds() == {"테스트": [article]}
@@ -0,0 +1,75 @@
+"""브리핑 프로필: 파일 읽기, 이름 검증, 빈 섹션 제거"""
+import json
+
+import pytest
+
+from profiles import drop_empty_sections, load_profiles, matches_keywords, union_tickers
+
+
+def write(tmp_path, specs) -> "Path":
+    path = tmp_path / "profiles.json"
+    path.write_text(specs if isinstance(specs, str) else json.dumps(specs), encoding="utf-8")
+    return path
+
+
+def test_missing_file_falls_back_to_default_profile(tmp_path):
+    profiles = load_profiles(path=tmp_path / "none.json")
+    assert [p.name for p in profiles] == ["default"]
+
+
+def test_load_and_union(tmp_path):
+    path = write(tmp_path, {
+        "semis": {"watchlist": ["005930", "000660"], "keywords": ["반도체"], "sections": ["krx", "news"]},
+        "auto": {"watchlist": ["005380", "005930"], "output_dir": "out/auto"},
+    })
+    profiles = load_profiles(path=path)
+
+    assert [p.name for p in profiles] == ["semis", "auto"]
+    assert union_tickers(profiles) == ["005930", "000660", "005380"]
+    assert profiles[0].includes("news") and not profiles[0].includes("dart")
+    assert profiles[1].directory.parts[-2:] == ("out", "auto")
+    assert [p.name for p in load_profiles(["auto"], path=path)] == ["auto"]
+
+
+def test_invalid_json_names_the_file(tmp_path):
+    path = write(tmp_path, "{not json")
+    with pytest.raises(ValueError, match="profiles.json"):
+        load_profiles(path=path)
+
+
+def test_top_level_must_be_object(tmp_path):
+    with pytest.raises(ValueError, match="profiles.json"):
+        load_profiles(path=write(tmp_path, ["semis"]))
+
+
+@pytest.mark.parametrize("name", ["../evil", "a/b", "..", "이름", "semis "])
+def test_profile_names_cannot_escape_output_folder(tmp_path, name):
+    with pytest.raises(ValueError, match="영문/숫자"):
+        load_profiles(path=write(tmp_path, {name: {"watchlist": ["005930"]}}))
+
+
+def test_unknown_profile_and_section(tmp_path):
+    path = write(tmp_path, {"semis": {"sections": ["krx", "weather"]}})
+    with pytest.raises(ValueError, match="weather"):
+        load_profiles(path=path)
+    with pytest.raises(ValueError, match="정의되지 않은 프로필"):
+        load_profiles(["auto"], path=path)
+
+
+def test_matches_keywords():
+    assert matches_keywords("삼성전자 HBM 공급", [])
+    assert matches_keywords("SK하이닉스 hbm 증설", ["HBM"])
+    assert not matches_keywords("현대차 판매 실적", ["반도체", "HBM"])
+
+
+def test_drop_empty_sections_renumbers():
+    briefing = (
+        "# 브리핑\n"
+        "\n## 1. 공시\n\n---\n"
+        "\n## 2. 시장\n\n코스피 상승\n\n---\n"
+        "\n## 3. 뉴스\n\n---\n"
+        "\n## 4. 환율\n\n1,380원\n\n---\n"
+    )
+    result = drop_empty_sections(briefing)
+    assert "공시" not in result and "뉴스" not in result
+    assert "## 1. 시장" in result and "## 2. 환율" in result
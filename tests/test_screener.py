@@ -0,0 +1,100 @@
+"""전종목 스크리너: 규칙 파서, 이력 함수, 벡터 평가"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics.screener import ScreenContext, compile_rule, compile_rules, format_screen, run_screen
+
+
+@pytest.fixture
+def ctx():
+    snapshot = pd.DataFrame({
+        "open":       [105.0, 50.0, 200.0, 10.0],
+        "high":       [110.0, 52.0, 210.0, 11.0],
+        "low":        [100.0, 49.0, 190.0, 9.0],
+        "close":      [108.0, 51.0, 195.0, 10.5],
+        "volume":     [3000.0, 1000.0, 500.0, 800.0],
+        "value":      [9e9, 1e9, 6e9, 2e8],
+        "change_pct": [8.0, 2.0, -2.5, 5.0],
+    }, index=pd.Index(["A", "B", "C", "D"], name="ticker"))
+    # 직전 3거래일 (오래된 순), D는 신규 상장이라 이력 없음
+    history = {
+        "volume": np.array([[1000.0, 900, 500, np.nan], [1000, 1100, 500, np.nan], [1000, 1000, 500, np.nan]]),
+        "close": np.array([[90.0, 50, 210, np.nan], [95, 49, 205, np.nan], [100, 50, 200, np.nan]]),
+    }
+    return ScreenContext(snapshot, history)
+
+
+def hits(rule_text: str, ctx: ScreenContext) -> list[str]:
+    rule = compile_rule(rule_text)
+    return list(ctx.tickers[rule.evaluate(ctx)])
+
+
+def test_compile_tracks_lookback_and_history_fields():
+    rule = compile_rule("volume_ratio(20) >= 3 and max_close(250) <= close and value >= 5e9")
+    assert rule.lookback == 250
+    assert rule.history_fields == frozenset({"volume", "close"})
+    assert len(rule.conditions) == 3
+    assert compile_rule("close > 0").lookback == 0
+
+
+def test_compile_is_cached():
+    assert compile_rule("close > 1") is compile_rule("close > 1")
+
+
+@pytest.mark.parametrize("text, message", [
+    ("close >", "필요합니다"),
+    ("close 100", "비교 연산자"),
+    ("close > 100 value > 1", "and가 필요"),
+    ("price > 100", "알 수 없는 필드 price"),
+    ("median(5) > 1", "알 수 없는 함수 median"),
+    ("avg_volume(0) > 1", "1 이상의 정수"),
+    ("avg_volume(2.5) > 1", "1 이상의 정수"),
+    ("close >= $5", "글자를 해석할 수 없습니다"),
+    ("> 5", "값이 필요합니다"),
+])
+def test_syntax_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        compile_rule(text)
+
+
+def test_snapshot_comparisons(ctx):
+    assert hits("change_pct >= 5", ctx) == ["A", "D"]
+    assert hits("change_pct >= 5 and value >= 5e9", ctx) == ["A"]
+    assert hits("change_pct between -3 2", ctx) == ["B", "C"]
+    assert hits("close != 51", ctx) == ["A", "C", "D"]
+    assert hits("change_pct < -2", ctx) == ["C"]
+
+
+def test_gap_pct_uses_previous_close(ctx):
+    # A: 전일 종가 108 / 1.08 = 100 → 시가 105는 +5% 갭
+    gap = ctx.column("gap_pct")
+    assert gap[0] == pytest.approx(5.0)
+    assert hits("gap_pct >= 4", ctx) == ["A"]
+
+
+def test_history_functions(ctx):
+    assert ctx.function("avg_volume", 3)[0] == pytest.approx(1000)
+    assert ctx.function("volume_ratio", 3)[0] == pytest.approx(3.0)
+    assert ctx.function("return_pct", 3)[0] == pytest.approx(20.0)  # 90 → 108
+    assert hits("volume_ratio(3) >= 3", ctx) == ["A"]
+    assert hits("close > max_close(3)", ctx) == ["A", "B"]
+    assert hits("close < min_close(3)", ctx) == ["C"]
+
+
+def test_missing_history_never_matches(ctx):
+    # 이력이 없는 D, 보유 이력(3)보다 긴 기간은 NaN → 조건 불충족
+    assert "D" not in hits("volume_ratio(3) >= 0", ctx)
+    assert hits("avg_volume(10) >= 0", ctx) == []
+
+
+def test_run_screen_sorts_and_formats(ctx):
+    rules = compile_rules({"강세": "change_pct >= 2", "급락": "change_pct <= -10"})
+    results = run_screen(rules, ctx)
+    assert list(results["강세"].index) == ["A", "B", "D"]  # 거래대금 내림차순
+    assert results["급락"].empty
+
+    text = format_screen(results, top=2, name_of=str.lower, universe=4)
+    assert text.splitlines()[0] == "### 전종목 스크리너 (4종목)"
+    assert "- **강세** 3종목: a(+8.0%), b(+2.0%) 외 1" in text
+    assert "- **급락**: 없음" in text
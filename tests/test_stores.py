@@ -0,0 +1,121 @@
+"""SQLite 저장소: 배치 쓰기 중 오류가 나면 이전 데이터를 그대로 유지"""
+import sqlite3
+
+import pytest
+
+from briefing_archive import BriefingArchive
+from collectors.ecos_store import EcosStore
+from collectors.health import OPEN, SourceHealth
+from collectors.news_collector import Article
+from collectors.news_index import NewsIndex
+from collectors.rate_limit import RateLimiter
+from collectors.sector_store import SectorStore
+
+
+def test_sector_members_rollback_on_error(tmp_path):
+    store = SectorStore(tmp_path / "sectors.sqlite3")
+    store.save_members("2026-10-16", "KOSPI", {"005930": "전기전자"})
+
+    with pytest.raises(sqlite3.Error):
+        # DELETE 후 INSERT 도중 실패 → 기존 분류가 지워진 채 커밋되면 안 됨
+        store.save_members("2026-10-19", "KOSPI", {"000660": ["잘못된 값"]})
+
+    assert store.members(["005930"]) == {"005930": ("KOSPI", "전기전자")}
+    assert store.member_date("KOSPI") == "2026-10-16"
+    assert not store._connect().in_transaction
+
+
+def test_ecos_page_and_progress_commit_together(tmp_path):
+    store = EcosStore(tmp_path / "ecos.sqlite3")
+    rows = [{"TIME": "20261016", "DATA_VALUE": "2.61"}]
+
+    with pytest.raises(sqlite3.Error):
+        # 관측값 저장 후 진행 기록에서 실패 → 관측값만 남으면 안 됨
+        store.save_page("job-1", "bond_3y", "20261001", "20261019", 1, ["잘못된 페이지"], rows)
+
+    assert store.count() == (0, 0)
+    assert store.pending_jobs("bond_3y") == []
+
+    assert store.save_page("job-1", "bond_3y", "20261001", "20261019", 1, 1, rows) == 1
+    assert store.done_pages("job-1") == {1}
+
+
+def test_news_batch_is_all_or_nothing(tmp_path):
+    index = NewsIndex(tmp_path / "news.sqlite3")
+    good = Article(title="삼성전자 실적 발표", link="https://example.com/1", summary="", published="2026-10-19 08:00")
+    bad = Article(title=["잘못된 제목"], link="https://example.com/2", summary="", published="2026-10-19 08:01")
+
+    with pytest.raises(sqlite3.Error):
+        index.add([good, bad], source="테스트")
+    assert index.count() == 0
+
+    assert index.add([good], source="테스트", names={"005930": "삼성전자"}) == 1
+    assert index.count() == 1
+
+
+def test_archive_reingest_failure_keeps_previous_index(tmp_path):
+    archive = BriefingArchive(tmp_path / "briefings.sqlite3", directory=tmp_path)
+    name = "2026-10-19_애프터마켓브리핑.md"
+    (tmp_path / name).write_text("- **KOSPI**: 2,600.50 (+10.20, +0.39%)\n", encoding="utf-8")
+    assert archive.ingest(tmp_path / name)
+    assert [row[-1] for row in archive.series("kospi")] == [2600.5]
+
+    # 같은 파일명 재색인 중 실패 (파일 없음) → 기존 색인이 지워진 채 커밋되면 안 됨
+    with pytest.raises(FileNotFoundError):
+        archive.ingest(tmp_path / "missing" / name, text="- **KOSPI**: 2,700.00 (+99.50, +3.83%)\n")
+    assert [row[-1] for row in archive.series("kospi")] == [2600.5]
+
+
+class FailOn:
+    """지정한 SQL에서 실패하는 연결 래퍼 (나머지는 원래 연결로 전달)"""
+
+    def __init__(self, conn: sqlite3.Connection, prefix: str):
+        self.conn = conn
+        self.prefix = prefix
+
+    def execute(self, sql, *args):
+        if sql.startswith(self.prefix):
+            raise sqlite3.OperationalError("disk I/O error")
+        return self.conn.execute(sql, *args)
+
+    def __enter__(self):
+        return self.conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self.conn.__exit__(*exc)
+
+
+def test_rate_limit_token_and_usage_commit_together(tmp_path):
+    limiter = RateLimiter(tmp_path / "ratelimit.sqlite3", limits={"dart": (1, 2, 3)})
+    conn = limiter._connect()
+
+    limiter._local.conn = FailOn(conn, "INSERT INTO usage")
+    with pytest.raises(sqlite3.OperationalError):
+        limiter.acquire("dart")
+    limiter._local.conn = conn
+
+    # 호출량 기록에 실패하면 토큰도 차감되지 않아야 함
+    assert conn.execute("SELECT COUNT(*) FROM buckets").fetchone() == (0,)
+    assert not conn.in_transaction
+
+    for _ in range(2):
+        limiter.acquire("dart")
+    assert sum(limiter.usage().values()) == 2
+
+
+def test_health_failure_count_rolls_back(tmp_path):
+    health = SourceHealth(tmp_path / "health.sqlite3", failure_threshold=2, cooldown=3600)
+    health.record_failure("fred", "timeout")
+    conn = health._connect()
+
+    health._local.conn = FailOn(conn, "INSERT INTO health")
+    with pytest.raises(sqlite3.OperationalError):
+        health.record_failure("fred", "timeout")
+    health._local.conn = conn
+    assert not conn.in_transaction
+
+    (row,) = health.snapshot()
+    assert (row["state"], row["failures"]) == ("closed", 1)
+    health.record_failure("fred", "timeout")
+    assert health.snapshot()[0]["state"] == OPEN
+    assert health.allow("fred") is False
@@ -0,0 +1,108 @@
+"""거래일 달력: 휴장일 규칙, 이전/다음 거래일, 연도 경계"""
+from datetime import date
+
+import pytest
+
+from collectors import trading_calendar
+from collectors.trading_calendar import TradingCalendar, covered_range, holiday_years, to_day
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar.from_rules("2024-01-01", "2027-12-31")
+
+
+@pytest.mark.parametrize("day", [
+    "2024-12-31",  # 연말 휴장
+    "2026-08-17",  # 광복절 대체공휴일
+    "2027-02-08",  # 설날
+    "2027-02-09",  # 설날 대체공휴일
+    "2027-09-15",  # 추석
+    "2027-12-31",  # 연말 휴장
+])
+def test_holidays_are_not_sessions(calendar, day):
+    assert not calendar.is_session(day)
+
+
+def test_weekdays_are_sessions(calendar):
+    assert calendar.is_session("2026-10-19")
+    assert calendar.is_session("20270104")
+    assert not calendar.is_session("2026-10-18")  # 일요일
+
+
+def test_previous_and_next_session_skip_holidays(calendar):
+    # 2027-02-05(금) → 주말 + 설 연휴(2/8~2/9) → 2027-02-10(수)
+    assert calendar.next_session("2027-02-05") == date(2027, 2, 10)
+    assert calendar.previous_session("2027-02-10") == date(2027, 2, 5)
+    assert calendar.session_on_or_before("2027-02-08") == date(2027, 2, 5)
+    assert calendar.session_on_or_after("2027-02-08") == date(2027, 2, 10)
+
+
+def test_year_boundary(calendar):
+    # 2026-12-31 휴장, 2027-01-01 신정 → 2026-12-30 다음은 2027-01-04(월)
+    assert calendar.next_session("2026-12-30") == date(2027, 1, 4)
+    assert calendar.previous_session("2027-01-04") == date(2026, 12, 30)
+    assert calendar.sessions_back("2027-01-04", 1) == date(2026, 12, 30)
+    assert calendar.sessions_between("2026-12-29", "2027-01-05") == [
+        date(2026, 12, 29), date(2026, 12, 30), date(2027, 1, 4), date(2027, 1, 5)
+    ]
+
+
+def test_out_of_range_raises(calendar):
+    with pytest.raises(ValueError):
+        calendar.is_session("2028-01-03")
+    with pytest.raises(ValueError):
+        calendar.previous_session("2024-01-01")  # 첫 거래일 이전
+
+
+def test_session_hours(calendar):
+    assert calendar.session_hours("2026-11-19") == ("10:00", "16:30")
+    assert calendar.session_hours("2026-10-19") == ("09:00", "15:30")
+    assert calendar.session_hours("2026-10-18") is None
+
+
+def test_holiday_years_covers_configured_years():
+    assert {2024, 2025, 2026, 2027} <= holiday_years()
+
+
+def test_from_rules_warns_for_uncovered_years(capsys):
+    TradingCalendar.from_rules("2028-01-01", "2028-12-31")
+    assert "2028년 휴장일이 없어" in capsys.readouterr().out
+
+
+def test_covered_range_stops_at_missing_year(monkeypatch, capsys):
+    monkeypatch.setattr(trading_calendar, "today_kst", lambda: date(2027, 6, 1))
+    start, end = covered_range(date(2024, 1, 1), date(2028, 12, 31), {2025, 2026, 2027})
+    assert (start, end) == (date(2025, 1, 1), date(2027, 12, 31))
+    assert "2028년 휴장일이 없어" in capsys.readouterr().out
+
+
+def test_build_without_pykrx_is_limited_to_covered_years(monkeypatch):
+    monkeypatch.setattr(trading_calendar, "PYKRX_AVAILABLE", False)
+    monkeypatch.setattr(trading_calendar, "today_kst", lambda: date(2027, 6, 1))
+    calendar = TradingCalendar.build(years_back=3, years_ahead=1)
+    assert calendar.end == to_day("2027-12-31")
+    assert calendar.start == to_day("2024-01-01")
+    assert not calendar.is_session("2027-02-08")
+
+
+def test_get_calendar_is_rebuilt_when_the_day_changes(monkeypatch):
+    built = []
+
+    def fake_calendar_for(day):
+        built.append(day)
+        return day
+
+    monkeypatch.setattr(trading_calendar, "_calendar_for", fake_calendar_for)
+    monkeypatch.setattr(trading_calendar, "today_kst", lambda: date(2026, 12, 31))
+    assert trading_calendar.get_calendar() == "2026-12-31"
+    monkeypatch.setattr(trading_calendar, "today_kst", lambda: date(2027, 1, 1))
+    assert trading_calendar.get_calendar() == "2027-01-01"
+    assert built == ["2026-12-31", "2027-01-01"]
+
+
+def test_now_kst_is_nine_hours_ahead_of_utc():
+    from datetime import datetime, timezone
+    utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    delta = trading_calendar.now_kst() - utc
+    assert abs(delta.total_seconds() - 9 * 3600) < 5